@@ -52,9 +52,11 @@ from sickrage.core.helpers import findCertainShow, generate_secret, makeDir, get
     getDiskSpaceUsage, getFreeSpace, launch_browser, torrent_webui_url
 from sickrage.core.helpers.encoding import get_sys_encoding, ek, patch_modules
 from sickrage.core.logger import Logger
+from sickrage.core.nameparser.resolver import ShowNameResolver
 from sickrage.core.nameparser.validator import check_force_season_folders
 from sickrage.core.processors import auto_postprocessor
 from sickrage.core.processors.auto_postprocessor import AutoPostProcessor
+from sickrage.core.processors.download_watcher import DownloadWatcher
 from sickrage.core.queues.postprocessor import PostProcessorQueue
 from sickrage.core.queues.search import SearchQueue
 from sickrage.core.queues.show import ShowQueue
@@ -66,14 +68,18 @@ from sickrage.core.searchers.proper_searcher import ProperSearcher
 from sickrage.core.searchers.subtitle_searcher import SubtitleSearcher
 from sickrage.core.searchers.trakt_searcher import TraktSearcher
 from sickrage.core.tv.show import TVShow
+from sickrage.core.tv.show.registry import ShowRegistry
+from sickrage.core.tv.show.stats import ShowStats
 from sickrage.core.ui import Notifications
 from sickrage.core.updaters.show_updater import ShowUpdater
 from sickrage.core.updaters.tz_updater import update_network_dict
 from sickrage.core.upnp import UPNPClient
 from sickrage.core.version_updater import VersionUpdater
 from sickrage.core.webserver import WebServer
+from sickrage.core.websession import session_manager
 from sickrage.metadata import MetadataProviders
 from sickrage.notifiers import NotifierProviders
+from sickrage.notifiers.dispatcher import NotificationDispatcher
 from sickrage.providers import SearchProviders
 
 
@@ -83,7 +89,8 @@ class Core(object):
         self.daemon = None
         self.io_loop = IOLoop()
         self.pid = os.getpid()
-        self.showlist = []
+        self.show_stats = ShowStats()
+        self.showlist = ShowRegistry()
 
         self.tz = tz.tzwinlocal() if tz.tzwinlocal else tz.tzlocal()
 
@@ -123,6 +130,7 @@ class Core(object):
 
         self.adba_connection = None
         self.notifier_providers = None
+        self.notification_dispatcher = None
         self.metadata_providers = {}
         self.search_providers = None
         self.log = None
@@ -134,6 +142,7 @@ class Core(object):
         self.wserver = None
         self.google_auth = None
         self.name_cache = None
+        self.show_resolver = None
         self.show_queue = None
         self.search_queue = None
         self.postprocessor_queue = None
@@ -145,6 +154,7 @@ class Core(object):
         self.trakt_searcher = None
         self.subtitle_searcher = None
         self.auto_postprocessor = None
+        self.download_watcher = None
         self.upnp_client = None
         self.oidc_client = None
         self.quicksearch_cache = None
@@ -160,6 +170,7 @@ class Core(object):
 
         # init core classes
         self.notifier_providers = NotifierProviders()
+        self.notification_dispatcher = NotificationDispatcher()
         self.metadata_providers = MetadataProviders()
         self.search_providers = SearchProviders()
         self.log = Logger()
@@ -170,6 +181,7 @@ class Core(object):
         self.scheduler = TornadoScheduler()
         self.wserver = WebServer()
         self.name_cache = NameCache()
+        self.show_resolver = ShowNameResolver()
         self.show_queue = ShowQueue()
         self.search_queue = SearchQueue()
         self.postprocessor_queue = PostProcessorQueue()
@@ -182,6 +194,7 @@ class Core(object):
         self.trakt_searcher = TraktSearcher()
         self.subtitle_searcher = SubtitleSearcher()
         self.auto_postprocessor = AutoPostProcessor()
+        self.download_watcher = DownloadWatcher()
         self.upnp_client = UPNPClient()
         self.quicksearch_cache = QuicksearchCache()
 
@@ -223,6 +236,7 @@ class Core(object):
         self.log.logNr = self.config.log_nr
         self.log.logFile = os.path.join(self.data_dir, 'logs', 'sickrage.log')
         self.log.debugLogging = self.config.debug
+        self.log.backgroundLogging = self.config.log_background
         self.log.consoleLogging = not self.quite
 
         # start logger
@@ -280,7 +294,7 @@ class Core(object):
             self.config.default_page = 'home'
 
         # cleanup cache folder
-        for folder in ['mako', 'sessions', 'indexers']:
+        for folder in ['mako', 'sessions']:
             try:
                 shutil.rmtree(os.path.join(sickrage.app.cache_dir, folder), ignore_errors=True)
             except Exception:
@@ -403,7 +417,7 @@ class Core(object):
             id=self.backlog_searcher.name
         )
 
-        # add auto-postprocessing job
+        # add auto-postprocessing job, sweeps the download folder for anything the watcher missed
         self.scheduler.add_job(
             self.auto_postprocessor.run,
             IntervalTrigger(
@@ -462,6 +476,15 @@ class Core(object):
         self.show_queue.start()
         self.postprocessor_queue.start()
 
+        # start sending notifications in the background
+        self.notification_dispatcher.start()
+
+        # start looking up deferred show names
+        self.show_resolver.start()
+
+        # start watching the download folder
+        self.download_watcher.start()
+
         # start webserver
         self.wserver.start()
 
@@ -488,17 +511,35 @@ class Core(object):
                 self.search_queue.shutdown()
                 del self.search_queue
 
+            # stop looking up deferred show names
+            if self.show_resolver:
+                self.log.debug("Shutting down show name resolver")
+                self.show_resolver.shutdown()
+
+            # stop watching the download folder
+            if self.download_watcher:
+                self.log.debug("Shutting down download folder watcher")
+                self.download_watcher.shutdown()
+
             # shutdown post-processor queue
             if self.postprocessor_queue:
                 self.log.debug("Shutting down post-processor queue")
                 self.postprocessor_queue.shutdown()
                 del self.postprocessor_queue
 
+            # send notifications still waiting
+            if self.notification_dispatcher:
+                self.log.debug("Shutting down notification dispatcher")
+                self.notification_dispatcher.shutdown()
+
             # log out of ADBA
             if self.adba_connection:
                 self.log.debug("Shutting down ANIDB connection")
                 self.adba_connection.stop()
 
+            # close pooled web connections
+            session_manager.clear()
+
             # save all show and config settings
             self.save_all()
 
@@ -522,6 +563,15 @@ class Core(object):
 
         self.io_loop.stop()
 
+    @property
+    def showlist(self):
+        return self._showlist
+
+    @showlist.setter
+    def showlist(self, value):
+        self._showlist = value if isinstance(value, ShowRegistry) else ShowRegistry(value)
+        self.show_stats.clear()
+
     def save_all(self):
         # write all shows
         self.log.info("Saving all shows to the database")
@@ -34,6 +34,7 @@ class NameCache(object):
         self.min_time = 10
         self.last_update = {}
         self.cache = {}
+        self.expires = {}
 
     def should_update(self, show):
         # if we've updated recently then skip the update
@@ -46,7 +47,8 @@ class NameCache(object):
         Adds the show & tvdb id to the scene_names table in cache db
 
         :param name: The show name to cache
-        :param indexer_id: the TVDB id that this show should be cached with (can be None/0 for unknown)
+        :param indexer_id: the TVDB id that this show should be cached with (can be None/0 for unknown), names
+                           cached as unknown expire after name_cache_negative_ttl seconds
         """
 
         # standardize the name we're using to account for small differences in providers
@@ -54,22 +56,41 @@ class NameCache(object):
 
         self.cache[name] = int(indexer_id)
 
+        if indexer_id:
+            self.expires.pop(name, None)
+        else:
+            self.expires[name] = time.time() + sickrage.app.config.name_cache_negative_ttl
+
+        self._store(name, int(indexer_id))
+
+    def _store(self, name, indexer_id):
         try:
-            if not len([x for x in sickrage.app.cache_db.get_many('scene_names', name)
-                        if x['indexer_id'] == indexer_id]):
-                # insert name into cache
-                sickrage.app.cache_db.insert({
-                    '_t': 'scene_names',
-                    'indexer_id': indexer_id,
-                    'name': name
-                })
+            rows = list(sickrage.app.cache_db.get_many('scene_names', name))
         except RecordNotFound:
-            # insert name into cache
-            sickrage.app.cache_db.insert({
-                '_t': 'scene_names',
-                'indexer_id': indexer_id,
-                'name': name
-            })
+            rows = []
+
+        for x in rows:
+            if x['indexer_id'] == indexer_id:
+                if not indexer_id and x.get('expires') != self.expires.get(name):
+                    x['expires'] = self.expires.get(name)
+                    sickrage.app.cache_db.update(x)
+                return
+
+            # a name that resolved no longer needs its unknown entry
+            if indexer_id and not x['indexer_id']:
+                sickrage.app.cache_db.delete(x)
+
+        # insert name into cache
+        row = {
+            '_t': 'scene_names',
+            'indexer_id': indexer_id,
+            'name': name
+        }
+
+        if not indexer_id:
+            row['expires'] = self.expires.get(name)
+
+        sickrage.app.cache_db.insert(row)
 
     def get(self, name):
         """
@@ -80,6 +101,12 @@ class NameCache(object):
         """
         name = full_sanitizeSceneName(name)
         if name in self.cache:
+            if not self.cache[name] and self.expires.get(name, 0) < time.time():
+                # unknown long enough to try looking it up again
+                del self.cache[name]
+                self.expires.pop(name, None)
+                return None
+
             return int(self.cache[name])
 
     def clear(self, indexerid):
@@ -90,28 +117,33 @@ class NameCache(object):
          sickrage.app.cache_db.all('scene_names')
          if x['indexer_id'] == indexerid]
 
-        for item in [self.cache[key] for key, value in self.cache.items() if value == indexerid]:
-            del item
+        for name in [key for key, value in self.cache.items() if value == indexerid]:
+            del self.cache[name]
+            self.expires.pop(name, None)
 
     def load(self):
-        self.cache = dict([(x['name'], x['indexer_id']) for x in sickrage.app.cache_db.all('scene_names')])
+        self.cache = {}
+        self.expires = {}
+
+        stale = []
+        for x in sickrage.app.cache_db.all('scene_names'):
+            if x['indexer_id']:
+                self.cache[x['name']] = x['indexer_id']
+                self.expires.pop(x['name'], None)
+            elif (x.get('expires') or 0) <= time.time():
+                # expired unknown names and ones stored before they could expire
+                stale.append(x)
+            elif x['name'] not in self.cache:
+                self.cache[x['name']] = 0
+                self.expires[x['name']] = x['expires']
+
+        for x in stale:
+            sickrage.app.cache_db.delete(x)
 
     def save(self):
         """Commit cache to database file"""
         for name, indexer_id in self.cache.items():
-            try:
-                if len([x for x in sickrage.app.cache_db.get_many('scene_names', name)
-                        if x['indexer_id'] == indexer_id]):
-                    continue
-            except RecordNotFound:
-                pass
-
-            # insert name into cache
-            sickrage.app.cache_db.insert({
-                '_t': 'scene_names',
-                'indexer_id': indexer_id,
-                'name': name
-            })
+            self._store(name, indexer_id)
 
     def build(self, show):
         """Build internal name cache
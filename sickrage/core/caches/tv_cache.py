@@ -29,7 +29,8 @@ import sickrage
 from sickrage.core.api.cache import ProviderCacheAPI
 from sickrage.core.common import Quality
 from sickrage.core.exceptions import AuthException, EpisodeNotFoundException
-from sickrage.core.helpers import findCertainShow, show_names, validate_url, is_ip_private
+from sickrage.core.helpers import findCertainShow, show_names
+from sickrage.core.helpers.urls import download_urls, is_download_url
 from sickrage.core.nameparser import InvalidNameException, NameParser, InvalidShowException
 from sickrage.core.websession import WebSession
 
@@ -185,25 +186,22 @@ class TVCache(object):
 
     def addCacheEntry(self, name, url, seeders, leechers, size):
         # check for existing entry in cache
-        if len([x for x in sickrage.app.cache_db.get_many('providers', self.providerID) if x['url'] == url]):
+        if len(list(sickrage.app.cache_db.get_many('providers_url', (self.providerID, url)))):
             return
 
         # ignore invalid urls
-        if not validate_url(url) and not url.startswith('magnet') \
-                or is_ip_private(url.split(r'//')[-1].split(r'/')[0]):
+        if not is_download_url(url):
             return
 
         try:
             # parse release name
-            parse_result = NameParser(validate_show=sickrage.app.config.enable_rss_cache_valid_shows).parse(name)
+            parse_result = NameParser(validate_show=sickrage.app.config.enable_rss_cache_valid_shows,
+                                      remote_lookups=not sickrage.app.config.defer_show_lookups).parse(name)
             if parse_result.series_name and parse_result.quality != Quality.UNKNOWN:
                 season = parse_result.season_number if parse_result.season_number else 1
                 episodes = parse_result.episode_numbers
 
                 if season and episodes:
-                    # store episodes as a seperated string
-                    episodeText = "|" + "|".join(map(str, episodes)) + "|"
-
                     # get quality of release
                     quality = parse_result.quality
 
@@ -218,7 +216,7 @@ class TVCache(object):
                         'provider': self.providerID,
                         'name': name,
                         'season': season,
-                        'episodes': episodeText,
+                        'episodes': episodes,
                         'indexerid': parse_result.indexerid,
                         'url': url,
                         'time': int(time.mktime(datetime.datetime.today().timetuple())),
@@ -236,7 +234,8 @@ class TVCache(object):
                     # add to external provider cache database
                     if sickrage.app.config.enable_api_providers_cache and not self.provider.private:
                         try:
-                            ProviderCacheAPI().add(dbData)
+                            # external provider cache stores episodes as a seperated string
+                            ProviderCacheAPI().add(dict(dbData, episodes="|" + "|".join(map(str, episodes)) + "|"))
                         except Exception:
                             pass
 
@@ -251,23 +250,28 @@ class TVCache(object):
         # get data from external database
         if sickrage.app.config.enable_api_providers_cache and not self.provider.private:
             try:
-                dbData += ProviderCacheAPI().get(self.providerID,
-                                                 ep_obj.show.indexerid,
-                                                 ep_obj.season, ep_obj.episode)['data']
+                for x in ProviderCacheAPI().get(self.providerID,
+                                                ep_obj.show.indexerid,
+                                                ep_obj.season, ep_obj.episode)['data']:
+                    x['episodes'] = [int(e) for e in filter(None, x['episodes'].split("|"))]
+                    if x['indexerid'] == ep_obj.show.indexerid and x['season'] == ep_obj.season \
+                            and ep_obj.episode in x['episodes']:
+                        dbData += [x]
             except Exception:
                 pass
 
         # get data from internal database
-        dbData += [x for x in sickrage.app.cache_db.get_many('providers', self.providerID)]
+        dbData += [x for x in sickrage.app.cache_db.get_many('providers_episodes', (self.providerID,
+                                                                                    ep_obj.show.indexerid,
+                                                                                    ep_obj.season,
+                                                                                    ep_obj.episode))]
 
         # for each cache entry
-        for curResult in (x for x in dbData if x['indexerid'] == ep_obj.show.indexerid and x['season'] == ep_obj.season
-                                               and "|" + str(ep_obj.episode) + "|" in x['episodes']):
+        for curResult, usable_url in zip(dbData, download_urls([x["url"] for x in dbData])):
             result = self.provider.getResult()
 
             # ignore invalid urls
-            if not validate_url(curResult["url"]) and not curResult["url"].startswith('magnet') \
-                    or is_ip_private(curResult["url"].split(r'//')[-1].split(r'/')[0]):
+            if not usable_url:
                 continue
 
             # ignored/required words, and non-tv junk
@@ -290,8 +294,7 @@ class TVCache(object):
                 continue
 
             try:
-                result.episodes = [result.show.getEpisode(curSeason, int(curEp)) for curEp in
-                                   filter(None, curResult["episodes"].split("|"))]
+                result.episodes = [result.show.getEpisode(curSeason, int(curEp)) for curEp in curResult["episodes"]]
             except EpisodeNotFoundException:
                 continue
 
@@ -256,86 +256,19 @@ class Quality(object):
         :return: Quality prefix
         """
 
-        # pylint: disable=R0912
+        return sceneQualityClassifier.classify(name, anime)
 
-        ret = Quality.UNKNOWN
-        if not name:
-            return ret
-
-        name = os.path.basename(name)
+    @staticmethod
+    def sceneQualities(names, anime=False):
+        """
+        Return the quality of each scene episode file in names
 
-        check_name = lambda l, func: func([re.search(x, name, re.I) for x in l])
+        :param names: list of episode filenames to analyse
+        :param anime: Boolean to indicate if the show we're resolving is Anime
+        :return: list of quality prefixes, in the same order as names
+        """
 
-        if anime:
-            dvdOptions = check_name([r"dvd", r"dvdrip"], any)
-            blueRayOptions = check_name([r"BD", r"blue?-?ray"], any)
-            sdOptions = check_name([r"360p", r"480p", r"848x480", r"XviD"], any)
-            hdOptions = check_name([r"720p", r"1280x720", r"960x720"], any)
-            fullHD = check_name([r"1080p", r"1920x1080"], any)
-
-            if sdOptions and not blueRayOptions and not dvdOptions:
-                ret = Quality.SDTV
-            elif dvdOptions:
-                ret = Quality.SDDVD
-            elif hdOptions and not blueRayOptions and not fullHD:
-                ret = Quality.HDTV
-            elif fullHD and not blueRayOptions and not hdOptions:
-                ret = Quality.FULLHDTV
-            elif hdOptions and not blueRayOptions and not fullHD:
-                ret = Quality.HDWEBDL
-            elif blueRayOptions and hdOptions and not fullHD:
-                ret = Quality.HDBLURAY
-            elif blueRayOptions and fullHD and not hdOptions:
-                ret = Quality.FULLHDBLURAY
-
-            return ret
-
-        if (check_name(
-                [r"480p|\bweb\b|web.?dl|web(rip|mux|hd)|[sph]d.?tv|dsr|tv(rip|mux)|satrip", r"xvid|divx|[xh].?26[45]"],
-                all)
-                and not check_name([r"(720|1080)[pi]"], all)
-                and not check_name([r"hr.ws.pdtv.[xh].?26[45]"], any)):
-            ret = Quality.SDTV
-        elif (check_name([r"dvd(rip|mux)|b[rd](rip|mux)|blue?-?ray", r"xvid|divx|[xh].?26[45]"], all)
-              and not check_name([r"(720|1080)[pi]"], all)
-              and not check_name([r"hr.ws.pdtv.[xh].?26[45]"], any)):
-            ret = Quality.SDDVD
-        elif (check_name([r"720p", r"hd.?tv", r"[xh].?26[45]"], all)
-              or check_name([r"720p", r"hevc", r"[xh].?26[45]"], all)
-              or check_name([r"hr.ws.pdtv.[xh].?26[45]"], any) and not check_name([r"1080[pi]"], all)):
-            ret = Quality.HDTV
-        elif (check_name([r"720p|1080i", r"hd.?tv", r"mpeg-?2"], all)
-              or check_name([r"1080[pi].hdtv", r"h.?26[45]"], all)):
-            ret = Quality.RAWHDTV
-        elif (check_name([r"1080p", r"hd.?tv", r"[xh].?26[45]"], all)
-              or check_name([r"1080p", r"hevc", r"[xh].?26[45]"], all)):
-            ret = Quality.FULLHDTV
-        elif (check_name([r"720p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
-              or check_name([r"720p", r"itunes", r"[xh].?26[45]"], all)):
-            ret = Quality.HDWEBDL
-        elif (check_name([r"1080p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
-              or check_name([r"1080p", r"itunes", r"[xh].?26[45]"], all)):
-            ret = Quality.FULLHDWEBDL
-        elif check_name([r"720p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
-            ret = Quality.HDBLURAY
-        elif check_name([r"1080p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
-            ret = Quality.FULLHDBLURAY
-        elif check_name([r"2160p", r"hd.?tv", r"[xh].?26[45]"], all):
-            ret = Quality.UHD_4K_TV
-        elif check_name([r"4320p", r"hd.?tv", r"[xh].?26[45]"], all):
-            ret = Quality.UHD_8K_TV
-        elif (check_name([r"2160p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
-              or check_name([r"2160p", r"itunes", r"[xh].?26[45]"], all)):
-            ret = Quality.UHD_4K_WEBDL
-        elif (check_name([r"4320p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
-              or check_name([r"4320p", r"itunes", r"[xh].?26[45]"], all)):
-            ret = Quality.UHD_8K_WEBDL
-        elif check_name([r"2160p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
-            ret = Quality.UHD_4K_BLURAY
-        elif check_name([r"4320p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
-            ret = Quality.UHD_8K_BLURAY
-
-        return ret
+        return sceneQualityClassifier.classify_all(names, anime)
 
     @staticmethod
     def compositeStatus(status, quality):
@@ -507,6 +440,143 @@ Quality.SNATCHED_PROPER.sort()
 Quality.FAILED.sort()
 Quality.ARCHIVED.sort()
 
+class SceneQualityClassifier(object):
+    """
+    Compiled release name quality classifier used by Quality.sceneQuality
+
+    Each feature regex is compiled once and searched at most once per name, only when a rule needs it. The rules
+    are checked in order, the first rule with a matching clause decides the quality. A clause matches when all of
+    its required features and none of its excluded features are found in the name.
+    """
+
+    features = {
+        'sd_source': r"480p|\bweb\b|web.?dl|web(rip|mux|hd)|[sph]d.?tv|dsr|tv(rip|mux)|satrip",
+        'sd_codec': r"xvid|divx|[xh].?26[45]",
+        'hd_res': r"(720|1080)[pi]",
+        'hr_ws_pdtv': r"hr.ws.pdtv.[xh].?26[45]",
+        'dvd': r"dvd(rip|mux)|b[rd](rip|mux)|blue?-?ray",
+        '720p': r"720p",
+        '720p_1080i': r"720p|1080i",
+        '1080p': r"1080p",
+        '1080pi': r"1080[pi]",
+        '1080pi_hdtv': r"1080[pi].hdtv",
+        '2160p': r"2160p",
+        '4320p': r"4320p",
+        'hdtv': r"hd.?tv",
+        'web': r"\bweb\b|web.?dl|web(rip|mux|hd)",
+        'itunes': r"itunes",
+        'bluray': r"blue?-?ray|hddvd|b[rd](rip|mux)",
+        'x26x': r"[xh].?26[45]",
+        'h26x': r"h.?26[45]",
+        'hevc': r"hevc",
+        'mpeg2': r"mpeg-?2",
+    }
+
+    rules = [
+        (Quality.SDTV, [(('sd_source', 'sd_codec'), ('hd_res', 'hr_ws_pdtv'))]),
+        (Quality.SDDVD, [(('dvd', 'sd_codec'), ('hd_res', 'hr_ws_pdtv'))]),
+        (Quality.HDTV, [(('720p', 'hdtv', 'x26x'), ()),
+                        (('720p', 'hevc', 'x26x'), ()),
+                        (('hr_ws_pdtv',), ('1080pi',))]),
+        (Quality.RAWHDTV, [(('720p_1080i', 'hdtv', 'mpeg2'), ()),
+                           (('1080pi_hdtv', 'h26x'), ())]),
+        (Quality.FULLHDTV, [(('1080p', 'hdtv', 'x26x'), ()),
+                            (('1080p', 'hevc', 'x26x'), ())]),
+        (Quality.HDWEBDL, [(('720p', 'web'), ()),
+                           (('720p', 'itunes', 'x26x'), ())]),
+        (Quality.FULLHDWEBDL, [(('1080p', 'web'), ()),
+                               (('1080p', 'itunes', 'x26x'), ())]),
+        (Quality.HDBLURAY, [(('720p', 'bluray', 'x26x'), ())]),
+        (Quality.FULLHDBLURAY, [(('1080p', 'bluray', 'x26x'), ())]),
+        (Quality.UHD_4K_TV, [(('2160p', 'hdtv', 'x26x'), ())]),
+        (Quality.UHD_8K_TV, [(('4320p', 'hdtv', 'x26x'), ())]),
+        (Quality.UHD_4K_WEBDL, [(('2160p', 'web'), ()),
+                                (('2160p', 'itunes', 'x26x'), ())]),
+        (Quality.UHD_8K_WEBDL, [(('4320p', 'web'), ()),
+                                (('4320p', 'itunes', 'x26x'), ())]),
+        (Quality.UHD_4K_BLURAY, [(('2160p', 'bluray', 'x26x'), ())]),
+        (Quality.UHD_8K_BLURAY, [(('4320p', 'bluray', 'x26x'), ())]),
+    ]
+
+    anime_features = {
+        'dvd': r"dvd",
+        'bluray': r"BD|blue?-?ray",
+        'sd': r"360p|480p|848x480|XviD",
+        'hd': r"720p|1280x720|960x720",
+        'fullhd': r"1080p|1920x1080",
+    }
+
+    anime_rules = [
+        (Quality.SDTV, [(('sd',), ('bluray', 'dvd'))]),
+        (Quality.SDDVD, [(('dvd',), ())]),
+        (Quality.HDTV, [(('hd',), ('bluray', 'fullhd'))]),
+        (Quality.FULLHDTV, [(('fullhd',), ('bluray', 'hd'))]),
+        (Quality.HDBLURAY, [(('bluray', 'hd'), ('fullhd',))]),
+        (Quality.FULLHDBLURAY, [(('bluray', 'fullhd'), ('hd',))]),
+    ]
+
+    def __init__(self):
+        self.patterns = self._compile(self.features)
+        self.anime_patterns = self._compile(self.anime_features)
+
+        # every rule needs at least one feature, names matching none of them are unknown
+        self.any_feature = re.compile('|'.join('(?:{})'.format(x) for x in self.features.values()), re.I)
+        self.any_anime_feature = re.compile('|'.join('(?:{})'.format(x) for x in self.anime_features.values()), re.I)
+
+    @staticmethod
+    def _compile(features):
+        return dict((k, re.compile(v, re.I)) for k, v in features.items())
+
+    def classify(self, name, anime=False):
+        """
+        Return the quality from the scene episode file
+
+        :param name: Episode filename to analyse
+        :param anime: Boolean to indicate if the show we're resolving is Anime
+        :return: Quality prefix
+        """
+
+        if not name:
+            return Quality.UNKNOWN
+
+        name = os.path.basename(name)
+
+        if anime:
+            any_feature, patterns, rules = self.any_anime_feature, self.anime_patterns, self.anime_rules
+        else:
+            any_feature, patterns, rules = self.any_feature, self.patterns, self.rules
+
+        if not any_feature.search(name):
+            return Quality.UNKNOWN
+
+        found = {}
+
+        def has(feature):
+            if feature not in found:
+                found[feature] = patterns[feature].search(name) is not None
+            return found[feature]
+
+        for quality, clauses in rules:
+            for required, excluded in clauses:
+                if all(has(x) for x in required) and not any(has(x) for x in excluded):
+                    return quality
+
+        return Quality.UNKNOWN
+
+    def classify_all(self, names, anime=False):
+        """
+        Return the quality of each scene episode file in names
+
+        :param names: list of episode filenames to analyse
+        :param anime: Boolean to indicate if the show we're resolving is Anime
+        :return: list of quality prefixes
+        """
+
+        return [self.classify(name, anime) for name in names]
+
+
+sceneQualityClassifier = SceneQualityClassifier()
+
 HD720p = Quality.combineQualities([Quality.HDTV, Quality.HDWEBDL, Quality.HDBLURAY], [])
 HD1080p = Quality.combineQualities([Quality.FULLHDTV, Quality.FULLHDWEBDL, Quality.FULLHDBLURAY], [])
 UHD_4K = Quality.combineQualities([Quality.UHD_4K_TV, Quality.UHD_4K_WEBDL, Quality.UHD_4K_BLURAY], [])
@@ -62,6 +62,7 @@ class Config(object):
 
         self.log_size = 1048576
         self.log_nr = 5
+        self.log_background = False
 
         self.enable_api_providers_cache = False
 
@@ -70,6 +71,9 @@ class Config(object):
         self.auto_update = True
         self.notify_on_update = True
         self.notify_on_login = False
+        self.notifier_timeout = 60
+        self.notifier_retries = 3
+        self.library_update_delay = 30
         self.pip_path = ""
         self.git_reset = True
         self.git_username = ""
@@ -86,10 +90,17 @@ class Config(object):
         self.web_ipv6 = False
         self.web_cookie_secret = ""
         self.web_use_gzip = True
+        self.web_workers = 10
+        self.web_production_mode = False
         self.handle_reverse_proxy = False
         self.proxy_setting = ""
         self.proxy_indexers = True
         self.ssl_verify = True
+        self.web_pool_connections = 10
+        self.web_pool_maxsize = 10
+        self.web_max_retries = 3
+        self.web_retry_backoff = 0.3
+        self.web_disk_cache = False
         self.enable_https = False
         self.https_cert = os.path.abspath(os.path.join(sickrage.PROG_DIR, 'server.crt'))
         self.https_key = os.path.abspath(os.path.join(sickrage.PROG_DIR, 'server.key'))
@@ -116,6 +127,7 @@ class Config(object):
         self.subtitles_default = False
         self.indexer_default = 0
         self.indexer_timeout = 120
+        self.indexer_workers = 4
         self.scene_default = False
         self.anime_default = False
         self.skip_downloaded_default = False
@@ -147,6 +159,18 @@ class Config(object):
         self.allow_high_priority = False
         self.sab_forced = False
         self.randomize_providers = False
+        self.concurrent_provider_search = False
+        self.provider_search_workers = 4
+        self.provider_search_timeout = 60
+        self.show_queue_workers = 1
+        self.search_queue_workers = 1
+        self.postprocessor_queue_workers = 1
+        self.postprocessor_workers = 1
+        self.postprocessor_device_limit = 2
+        self.name_parser_cache_size = 2000
+        self.name_parser_cache_ttl = 0
+        self.name_cache_negative_ttl = 86400
+        self.defer_show_lookups = False
         self.min_autopostprocessor_freq = 1
         self.min_daily_searcher_freq = 10
         self.min_backlog_searcher_freq = 10
@@ -160,6 +184,8 @@ class Config(object):
         self.airdate_episodes = False
         self.file_timestamp_timezone = ""
         self.process_automatically = False
+        self.autopostprocessor_watch = True
+        self.autopostprocessor_settle = 60
         self.no_delete = False
         self.keep_processed_dir = False
         self.process_method = ""
@@ -693,12 +719,16 @@ class Config(object):
                 'app_oauth_token': '',
                 'enable_api_providers_cache': True,
                 'log_size': 1048576,
+                'log_background': False,
                 'calendar_unprotected': False,
                 'https_key': os.path.abspath(os.path.join(sickrage.PROG_DIR, 'server.key')),
                 'allow_high_priority': True,
                 'anon_redirect': 'http://nullrefer.com/?',
                 'indexer_timeout': 120,
+                'indexer_workers': 4,
                 'web_use_gzip': True,
+                'web_workers': 10,
+                'web_production_mode': False,
                 'dailysearch_frequency': 40,
                 'ignore_words': 'german,french,core2hd,dutch,swedish,reenc,MrLss',
                 'api_key': self.api_key or generateApiKey(),
@@ -706,6 +736,11 @@ class Config(object):
                 'nzb_method': 'blackhole',
                 'web_cookie_secret': self.web_cookie_secret or generate_secret(),
                 'ssl_verify': True,
+                'web_pool_connections': 10,
+                'web_pool_maxsize': 10,
+                'web_max_retries': 3,
+                'web_retry_backoff': 0.3,
+                'web_disk_cache': False,
                 'encryption_secret': self.encryption_secret or generate_secret(),
                 'enable_upnp': True,
                 'version_notify': True,
@@ -759,9 +794,23 @@ class Config(object):
                 'naming_anime_pattern': 'Season %0S/%SN - S%0SE%0E - %EN',
                 'naming_custom_anime': False,
                 'randomize_providers': False,
+                'concurrent_provider_search': False,
+                'provider_search_workers': 4,
+                'provider_search_timeout': 60,
+                'show_queue_workers': 1,
+                'search_queue_workers': 1,
+                'postprocessor_queue_workers': 1,
+                'postprocessor_workers': 1,
+                'postprocessor_device_limit': 2,
+                'name_parser_cache_size': 2000,
+                'name_parser_cache_ttl': 0,
+                'name_cache_negative_ttl': 86400,
+                'defer_show_lookups': False,
                 'web_host': get_lan_ip(),
                 'config_version': self.config_version,
                 'process_automatically': False,
+                'autopostprocessor_watch': True,
+                'autopostprocessor_settle': 60,
                 'git_path': 'git',
                 'sync_files': '!sync,lftp-pget-status,part,bts,!qb',
                 'web_port': 8081,
@@ -783,6 +832,9 @@ class Config(object):
                 'proxy_setting': '',
                 'backlog_frequency': 21,
                 'notify_on_login': False,
+                'notifier_timeout': 60,
+                'notifier_retries': 3,
+                'library_update_delay': 30,
                 'rename_episodes': True,
                 'quality_default': SD,
                 'git_username': '',
@@ -1391,6 +1443,7 @@ class Config(object):
         self.last_db_compact = self.check_setting_int('General', 'last_db_compact')
         self.log_nr = self.check_setting_int('General', 'log_nr')
         self.log_size = self.check_setting_int('General', 'log_size')
+        self.log_background = self.check_setting_bool('General', 'log_background')
         self.socket_timeout = self.check_setting_int('General', 'socket_timeout')
         self.default_page = self.check_setting_str('General', 'default_page')
         self.pip_path = self.check_setting_str('General', 'pip_path')
@@ -1408,7 +1461,14 @@ class Config(object):
         self.web_log = self.check_setting_bool('General', 'web_log')
         self.web_cookie_secret = self.check_setting_str('General', 'web_cookie_secret')
         self.web_use_gzip = self.check_setting_bool('General', 'web_use_gzip')
+        self.web_workers = self.check_setting_int('General', 'web_workers')
+        self.web_production_mode = self.check_setting_bool('General', 'web_production_mode')
         self.ssl_verify = self.check_setting_bool('General', 'ssl_verify')
+        self.web_pool_connections = self.check_setting_int('General', 'web_pool_connections')
+        self.web_pool_maxsize = self.check_setting_int('General', 'web_pool_maxsize')
+        self.web_max_retries = self.check_setting_int('General', 'web_max_retries')
+        self.web_retry_backoff = self.check_setting_float('General', 'web_retry_backoff')
+        self.web_disk_cache = self.check_setting_bool('General', 'web_disk_cache')
         self.launch_browser = self.check_setting_bool('General', 'launch_browser')
         self.indexer_default_language = self.check_setting_str('General', 'indexerDefaultLang')
         self.ep_default_deleted_status = self.check_setting_int('General', 'ep_default_deleted_status')
@@ -1434,9 +1494,13 @@ class Config(object):
         self.auto_update = self.check_setting_bool('General', 'auto_update')
         self.notify_on_update = self.check_setting_bool('General', 'notify_on_update')
         self.notify_on_login = self.check_setting_bool('General', 'notify_on_login')
+        self.notifier_timeout = self.check_setting_int('General', 'notifier_timeout')
+        self.notifier_retries = self.check_setting_int('General', 'notifier_retries')
+        self.library_update_delay = self.check_setting_int('General', 'library_update_delay')
         self.flatten_folders_default = self.check_setting_bool('General', 'flatten_folders_default')
         self.indexer_default = self.check_setting_int('General', 'indexer_default')
         self.indexer_timeout = self.check_setting_int('General', 'indexer_timeout')
+        self.indexer_workers = self.check_setting_int('General', 'indexer_workers')
         self.anime_default = self.check_setting_bool('General', 'anime_default')
         self.scene_default = self.check_setting_bool('General', 'scene_default')
         self.skip_downloaded_default = self.check_setting_bool('General', 'skip_downloaded_default')
@@ -1462,6 +1526,18 @@ class Config(object):
         self.download_unverified_magnet_link = self.check_setting_bool('General', 'download_unverified_magnet_link')
         self.proper_searcher_interval = self.check_setting_str('General', 'check_propers_interval')
         self.randomize_providers = self.check_setting_bool('General', 'randomize_providers')
+        self.concurrent_provider_search = self.check_setting_bool('General', 'concurrent_provider_search')
+        self.provider_search_workers = self.check_setting_int('General', 'provider_search_workers')
+        self.provider_search_timeout = self.check_setting_int('General', 'provider_search_timeout')
+        self.show_queue_workers = self.check_setting_int('General', 'show_queue_workers')
+        self.search_queue_workers = self.check_setting_int('General', 'search_queue_workers')
+        self.postprocessor_queue_workers = self.check_setting_int('General', 'postprocessor_queue_workers')
+        self.postprocessor_workers = self.check_setting_int('General', 'postprocessor_workers')
+        self.postprocessor_device_limit = self.check_setting_int('General', 'postprocessor_device_limit')
+        self.name_parser_cache_size = self.check_setting_int('General', 'name_parser_cache_size')
+        self.name_parser_cache_ttl = self.check_setting_int('General', 'name_parser_cache_ttl')
+        self.name_cache_negative_ttl = self.check_setting_int('General', 'name_cache_negative_ttl')
+        self.defer_show_lookups = self.check_setting_bool('General', 'defer_show_lookups')
         self.allow_high_priority = self.check_setting_bool('General', 'allow_high_priority')
         self.skip_removed_files = self.check_setting_bool('General', 'skip_removed_files')
         self.usenet_retention = self.check_setting_int('General', 'usenet_retention')
@@ -1474,6 +1550,8 @@ class Config(object):
         self.autopostprocessor_freq = self.check_setting_int('General', 'autopostprocessor_frequency')
         self.tv_download_dir = self.check_setting_str('General', 'tv_download_dir')
         self.process_automatically = self.check_setting_bool('General', 'process_automatically')
+        self.autopostprocessor_watch = self.check_setting_bool('General', 'autopostprocessor_watch')
+        self.autopostprocessor_settle = self.check_setting_int('General', 'autopostprocessor_settle')
         self.no_delete = self.check_setting_bool('General', 'no_delete')
         self.unpack = self.check_setting_bool('General', 'unpack')
         self.unpack_dir = self.check_setting_str('General', 'unpack_dir')
@@ -1889,6 +1967,7 @@ class Config(object):
                 'git_newver': int(self.git_newver),
                 'log_nr': int(self.log_nr),
                 'log_size': int(self.log_size),
+                'log_background': int(self.log_background),
                 'socket_timeout': self.socket_timeout,
                 'web_port': self.web_port,
                 'web_external_port': self.web_external_port,
@@ -1898,7 +1977,14 @@ class Config(object):
                 'web_root': self.web_root,
                 'web_cookie_secret': self.web_cookie_secret,
                 'web_use_gzip': int(self.web_use_gzip),
+                'web_workers': int(self.web_workers),
+                'web_production_mode': int(self.web_production_mode),
                 'ssl_verify': int(self.ssl_verify),
+                'web_pool_connections': int(self.web_pool_connections),
+                'web_pool_maxsize': int(self.web_pool_maxsize),
+                'web_max_retries': int(self.web_max_retries),
+                'web_retry_backoff': self.web_retry_backoff,
+                'web_disk_cache': int(self.web_disk_cache),
                 'download_url': self.download_url,
                 'cpu_preset': self.cpu_preset,
                 'anon_redirect': self.anon_redirect,
@@ -1926,6 +2012,18 @@ class Config(object):
                 'torrent_file_to_magnet': int(self.torrent_file_to_magnet),
                 'download_unverified_magnet_link': int(self.download_unverified_magnet_link),
                 'randomize_providers': int(self.randomize_providers),
+                'concurrent_provider_search': int(self.concurrent_provider_search),
+                'provider_search_workers': int(self.provider_search_workers),
+                'provider_search_timeout': int(self.provider_search_timeout),
+                'show_queue_workers': int(self.show_queue_workers),
+                'search_queue_workers': int(self.search_queue_workers),
+                'postprocessor_queue_workers': int(self.postprocessor_queue_workers),
+                'postprocessor_workers': int(self.postprocessor_workers),
+                'postprocessor_device_limit': int(self.postprocessor_device_limit),
+                'name_parser_cache_size': int(self.name_parser_cache_size),
+                'name_parser_cache_ttl': int(self.name_parser_cache_ttl),
+                'name_cache_negative_ttl': int(self.name_cache_negative_ttl),
+                'defer_show_lookups': int(self.defer_show_lookups),
                 'check_propers_interval': self.proper_searcher_interval,
                 'allow_high_priority': int(self.allow_high_priority),
                 'skip_removed_files': int(self.skip_removed_files),
@@ -1935,6 +2033,7 @@ class Config(object):
                 'flatten_folders_default': int(self.flatten_folders_default),
                 'indexer_default': int(self.indexer_default),
                 'indexer_timeout': int(self.indexer_timeout),
+                'indexer_workers': int(self.indexer_workers),
                 'anime_default': int(self.anime_default),
                 'scene_default': int(self.scene_default),
                 'skip_downloaded_default': int(self.skip_downloaded_default),
@@ -1943,6 +2042,9 @@ class Config(object):
                 'auto_update': int(self.auto_update),
                 'notify_on_update': int(self.notify_on_update),
                 'notify_on_login': int(self.notify_on_login),
+                'notifier_timeout': int(self.notifier_timeout),
+                'notifier_retries': int(self.notifier_retries),
+                'library_update_delay': int(self.library_update_delay),
                 'naming_strip_year': int(self.naming_strip_year),
                 'naming_pattern': self.naming_pattern,
                 'naming_custom_abd': int(self.naming_custom_abd),
@@ -1974,6 +2076,8 @@ class Config(object):
                 'postpone_if_sync_files': int(self.postpone_if_sync_files),
                 'nfo_rename': int(self.nfo_rename),
                 'process_automatically': int(self.process_automatically),
+                'autopostprocessor_watch': int(self.autopostprocessor_watch),
+                'autopostprocessor_settle': int(self.autopostprocessor_settle),
                 'no_delete': int(self.no_delete),
                 'unpack': int(self.unpack),
                 'unpack_dir': self.unpack_dir,
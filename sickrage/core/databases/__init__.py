@@ -22,10 +22,14 @@ import os
 import re
 import shutil
 import tarfile
+import threading
 import time
 import traceback
+from collections import OrderedDict
+from contextlib import contextmanager
 from sqlite3 import OperationalError
 
+from CodernityDB.database import RecordDeleted, RecordNotFound
 from CodernityDB.database_super_thread_safe import SuperThreadSafeDatabase
 from CodernityDB.index import IndexNotFoundException, IndexConflict, IndexException
 from CodernityDB.storage import IU_Storage
@@ -42,6 +46,79 @@ def Custom_IU_Storage_get(self, start, size, status='c'):
         return self.data_from(self._f.read(size))
 
 
+class srDatabaseBatch(object):
+    """
+    Unit of work for a database, queues inserts, updates and deletes and applies them under a single lock
+    acquisition when flushed. Writing the same document more than once only writes it once.
+
+    cache is for callers to keep documents they looked up during the batch, so they don't have to read them
+    back for every write.
+    """
+
+    def __init__(self, database):
+        self.database = database
+        self.pending = OrderedDict()
+        self.cache = {}
+        self.callbacks = OrderedDict()
+
+    def on_flush(self, key, func):
+        """
+        Calls func once the writes queued so far have been applied, a callback is only added once per key and flush.
+
+        :return: True if the callback was added
+        """
+        if key in self.callbacks:
+            return False
+
+        self.callbacks[key] = func
+        return True
+
+    def insert(self, doc):
+        self.pending[id(doc)] = ('insert', doc)
+
+    def update(self, doc):
+        if '_id' not in doc:
+            # document inserted in this batch, still waiting for its id
+            self.pending.setdefault(id(doc), ('insert', doc))
+        elif doc['_id'] not in self.pending:
+            self.pending[doc['_id']] = ('update', doc)
+
+    def delete(self, doc):
+        if '_id' not in doc:
+            self.pending.pop(id(doc), None)
+        else:
+            self.pending[doc['_id']] = ('delete', doc)
+
+    def flush(self):
+        if not self.pending and not self.callbacks:
+            return
+
+        with self.database.db.super_lock:
+            while self.pending:
+                __, (action, doc) = self.pending.popitem(last=False)
+
+                try:
+                    self._write(action, doc)
+                except Exception as e:
+                    sickrage.app.log.error(
+                        'Failed to {} document in {} database: {}'.format(action, self.database.name, e))
+                    sickrage.app.log.debug(traceback.format_exc())
+
+        while self.callbacks:
+            __, func = self.callbacks.popitem(last=False)
+            func()
+
+    def _write(self, action, doc):
+        try:
+            getattr(self.database.db, action)(doc)
+        except (RecordNotFound, RecordDeleted):
+            # removed from under the batch, write updates back as a new document
+            if action == 'update':
+                doc.pop('_id', None)
+                doc.pop('_rev', None)
+                self.database.db.insert(doc)
+
+
 class srDatabase(object):
     _indexes = {}
     _migrate_list = {}
@@ -49,6 +126,7 @@ class srDatabase(object):
     def __init__(self, name=''):
         self.name = name
         self.old_db_path = ''
+        self._local = threading.local()
 
         self.db_path = os.path.join(sickrage.app.data_dir, 'database', self.name)
         self.db = SuperThreadSafeDatabase(self.db_path)
@@ -314,6 +392,31 @@ class srDatabase(object):
                 if os.path.isfile(self.old_db_path + '-shm'):
                     os.rename(self.old_db_path + '-shm', '{}-shm.{}_old'.format(self.old_db_path, random))
 
+    @contextmanager
+    def batch(self):
+        """
+        Queues writes made through the yielded srDatabaseBatch and applies them when the block exits, batches
+        opened inside it on the same thread share it.
+        """
+        batch = self.current_batch
+        if batch is not None:
+            try:
+                yield batch
+            finally:
+                batch.flush()
+            return
+
+        batch = self._local.batch = srDatabaseBatch(self)
+        try:
+            yield batch
+        finally:
+            self._local.batch = None
+            batch.flush()
+
+    @property
+    def current_batch(self):
+        return getattr(self._local, 'batch', None)
+
     def all(self, *args, **kwargs):
         return (x['doc'] for x in self.db.all(with_doc=True, *args, **kwargs))
 
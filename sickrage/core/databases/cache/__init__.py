@@ -25,8 +25,8 @@ from sickrage.core.common import Quality
 from sickrage.core.databases import srDatabase
 from sickrage.core.databases.cache.index import CacheLastUpdateIndex, CacheLastSearchIndex, CacheSceneExceptionsIndex, \
     CacheSceneNamesIndex, CacheNetworkTimezonesIndex, CacheSceneExceptionsRefreshIndex, CacheProvidersIndex, \
-    CacheQuicksearchIndex
-from sickrage.core.helpers import validate_url, is_ip_private
+    CacheQuicksearchIndex, CacheProvidersURLIndex, CacheProvidersEpisodesIndex
+from sickrage.core.helpers.urls import is_download_url
 
 
 class CacheDB(srDatabase):
@@ -38,6 +38,8 @@ class CacheDB(srDatabase):
         'network_timezones': CacheNetworkTimezonesIndex,
         'scene_exceptions_refresh': CacheSceneExceptionsRefreshIndex,
         'providers': CacheProvidersIndex,
+        'providers_url': CacheProvidersURLIndex,
+        'providers_episodes': CacheProvidersEpisodesIndex,
         'quicksearch': CacheQuicksearchIndex
     }
 
@@ -61,6 +63,8 @@ class CacheDB(srDatabase):
         for item in self.all('providers'):
             if int(item["quality"]) == Quality.UNKNOWN:
                 self.delete(item)
-            elif not validate_url(item["url"]) and not item["url"].startswith("magnet") \
-                    or is_ip_private(item["url"].split(r'//')[-1].split(r'/')[0]):
+            elif not isinstance(item["episodes"], list):
+                # pre-index cache entries stored episodes as a pipe seperated string
+                self.delete(item)
+            elif not is_download_url(item["url"]):
                 self.delete(item)
@@ -20,7 +20,7 @@ from __future__ import unicode_literals
 
 from hashlib import md5
 
-from CodernityDB.hash_index import HashIndex
+from CodernityDB.hash_index import HashIndex, MultiHashIndex
 
 
 class CacheLastUpdateIndex(HashIndex):
@@ -128,6 +128,39 @@ class CacheProvidersIndex(HashIndex):
         return md5(key.encode('utf-8')).hexdigest()
 
 
+class CacheProvidersURLIndex(HashIndex):
+    _version = 1
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = '32s'
+        super(CacheProvidersURLIndex, self).__init__(*args, **kwargs)
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'providers' and data.get('provider') and data.get('url'):
+            return md5('{}-{}'.format(data.get('provider'), data.get('url')).encode('utf-8')).hexdigest(), None
+
+    def make_key(self, key):
+        return md5('{}-{}'.format(*key).encode('utf-8')).hexdigest()
+
+
+class CacheProvidersEpisodesIndex(MultiHashIndex):
+    _version = 1
+    custom_header = 'from CodernityDB.hash_index import MultiHashIndex'
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = '32s'
+        super(CacheProvidersEpisodesIndex, self).__init__(*args, **kwargs)
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'providers' and data.get('provider') and isinstance(data.get('episodes'), list):
+            return set(md5('{}-{}-{}-{}'.format(data.get('provider'), data.get('indexerid'), data.get('season'),
+                                                episode).encode('utf-8')).hexdigest()
+                       for episode in data.get('episodes')), None
+
+    def make_key(self, key):
+        return md5('{}-{}-{}-{}'.format(*key).encode('utf-8')).hexdigest()
+
+
 class CacheQuicksearchIndex(HashIndex):
     _version = 1
 
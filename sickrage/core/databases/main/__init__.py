@@ -24,7 +24,8 @@ import sickrage
 from sickrage.core.databases import srDatabase
 from sickrage.core.databases.main.index import MainTVShowsIndex, MainTVEpisodesIndex, MainIMDBInfoIndex, \
     MainXEMRefreshIndex, MainSceneNumberingIndex, MainIndexerMappingIndex, MainHistoryIndex, \
-    MainBlacklistIndex, MainWhitelistIndex, MainFailedSnatchHistoryIndex, MainFailedSnatchesIndex, MainVersionIndex
+    MainBlacklistIndex, MainWhitelistIndex, MainFailedSnatchHistoryIndex, MainFailedSnatchesIndex, MainVersionIndex, \
+    MainTVEpisodesSeasonEpisodeIndex, MainTVEpisodesAirdateIndex, MainTVEpisodesStatusAirdateIndex
 
 
 class MainDB(srDatabase):
@@ -34,6 +35,9 @@ class MainDB(srDatabase):
         'version': MainVersionIndex,
         'tv_shows': MainTVShowsIndex,
         'tv_episodes': MainTVEpisodesIndex,
+        'tv_episodes_season_episode': MainTVEpisodesSeasonEpisodeIndex,
+        'tv_episodes_airdate': MainTVEpisodesAirdateIndex,
+        'tv_episodes_status_airdate': MainTVEpisodesStatusAirdateIndex,
         'imdb_info': MainIMDBInfoIndex,
         'xem_refresh': MainXEMRefreshIndex,
         'scene_numbering': MainSceneNumberingIndex,
@@ -95,6 +99,26 @@ class MainDB(srDatabase):
                 del show['archive_firstmatch']
                 self.update(show)
 
+    def get_episodes_by_status(self, statuses, start=None, end=None):
+        """
+        Yields episodes with one of the given statuses that aired between start and end, both inclusive.
+
+        :param statuses: list of (composite) episode statuses
+        :param start: first airdate ordinal, None for no lower bound
+        :param end: last airdate ordinal, None for no upper bound
+        """
+        start = max(start or 0, 0)
+        end = 0xFFFFFFFF if end is None else end
+        if start > end:
+            return
+
+        for status in sorted(set(statuses)):
+            if status < 0:
+                continue
+
+            for dbData in self.get_many('tv_episodes_status_airdate', start=(status, start), end=(status, end)):
+                yield dbData
+
     def cleanup(self):
         self.fix_show_none_types()
         self.fix_episode_none_types()
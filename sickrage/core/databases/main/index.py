@@ -21,6 +21,7 @@ from __future__ import unicode_literals
 from hashlib import md5
 
 from CodernityDB.hash_index import HashIndex
+from CodernityDB.tree_index import TreeBasedIndex
 
 
 class MainVersionIndex(HashIndex):
@@ -68,6 +69,59 @@ class MainTVEpisodesIndex(HashIndex):
             return data.get('showid'), None
 
 
+class MainTVEpisodesSeasonEpisodeIndex(HashIndex):
+    _version = 1
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = '32s'
+        super(MainTVEpisodesSeasonEpisodeIndex, self).__init__(*args, **kwargs)
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'tv_episodes' and data.get('showid') \
+                and data.get('season') is not None and data.get('episode') is not None:
+            key = '{}-{}-{}'.format(data.get('showid'), data.get('season'), data.get('episode'))
+            return md5(key).hexdigest(), None
+
+    def make_key(self, key):
+        return md5('{}-{}-{}'.format(*key).encode('utf-8')).hexdigest()
+
+
+class MainTVEpisodesAirdateIndex(HashIndex):
+    _version = 1
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = '32s'
+        super(MainTVEpisodesAirdateIndex, self).__init__(*args, **kwargs)
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'tv_episodes' and data.get('showid') and data.get('airdate') is not None:
+            return md5('{}-{}'.format(data.get('showid'), data.get('airdate'))).hexdigest(), None
+
+    def make_key(self, key):
+        return md5('{}-{}'.format(*key).encode('utf-8')).hexdigest()
+
+
+class MainTVEpisodesStatusAirdateIndex(TreeBasedIndex):
+    """
+    Ordered on (status, airdate), packed into one 64bit key so a status can be range queried by airdate
+    """
+    _version = 1
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = 'Q'
+        super(MainTVEpisodesStatusAirdateIndex, self).__init__(*args, **kwargs)
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'tv_episodes' and data.get('showid'):
+            status, airdate = data.get('status'), data.get('airdate')
+            if isinstance(status, (int, long)) and isinstance(airdate, (int, long)) \
+                    and 0 <= status < 1 << 32 and 0 <= airdate < 1 << 32:
+                return status << 32 | airdate, None
+
+    def make_key(self, key):
+        return int(key[0]) << 32 | int(key[1])
+
+
 class MainIMDBInfoIndex(HashIndex):
     _version = 1
 
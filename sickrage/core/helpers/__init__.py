@@ -48,8 +48,8 @@ from bs4 import BeautifulSoup
 from configobj import ConfigObj
 
 import sickrage
-from sickrage.core.common import Quality, SKIPPED, WANTED, FAILED, UNAIRED
 from sickrage.core.exceptions import MultipleShowObjectsException
+from sickrage.core.helpers.urls import is_ip_private, validate_url
 
 
 def safe_getattr(object, name, default=None):
@@ -380,7 +380,7 @@ def findCertainShow(indexerid, return_show_object=True):
         return None
 
     indexer_ids = [indexerid] if not isinstance(indexerid, list) else indexerid
-    results = [show for show in sickrage.app.showlist if show.indexerid in indexer_ids]
+    results = [show for indexer_id in indexer_ids for show in sickrage.app.showlist.find(indexer_id)]
 
     if not results:
         return None
@@ -1440,6 +1440,27 @@ def bs4_parser(markup, features="html5lib", *args, **kwargs):
         _soup.clear(True)
 
 
+@contextmanager
+def lxml_parser(markup, *args, **kwargs):
+    """
+    Same as bs4_parser but backed by lxml, which is several times faster than html5lib.
+
+    lxml does not add the elements html5lib implies (e.g. tbody), so providers are switched over one at a time.
+    Falls back to bs4_parser if lxml is unable to handle the markup.
+    """
+    try:
+        _soup = BeautifulSoup(markup, features="lxml", *args, **kwargs)
+    except Exception:
+        with bs4_parser(markup, *args, **kwargs) as _soup:
+            yield _soup
+        return
+
+    try:
+        yield _soup
+    finally:
+        _soup.clear(True)
+
+
 def getFileSize(file):
     try:
         return os.path.getsize(file) / 1024 / 1024
@@ -1526,77 +1547,12 @@ def clean_url(url):
 
 
 def app_statistics():
-    show_stat = {}
-
-    overall_stats = {
-        'episodes': {
-            'downloaded': 0,
-            'snatched': 0,
-            'total': 0,
-        },
-        'shows': {
-            'active': len([show for show in sickrage.app.showlist
-                           if show.paused == 0 and show.status.lower() == 'continuing']),
-            'total': len(sickrage.app.showlist),
-        },
-        'total_size': 0
-    }
-
-    today = datetime.date.today().toordinal()
-
-    status_quality = Quality.SNATCHED + Quality.SNATCHED_PROPER + Quality.SNATCHED_BEST
-    status_download = Quality.DOWNLOADED + Quality.ARCHIVED
-
-    max_download_count = 1000
-
-    for show in sickrage.app.showlist:
-        if sickrage.app.show_queue.is_being_added(show) or sickrage.app.show_queue.is_being_removed(show):
-            continue
-
-        for epData in sickrage.app.main_db.get_many('tv_episodes', show.indexerid):
-            if show.indexerid not in show_stat:
-                show_stat[show.indexerid] = {}
-                show_stat[show.indexerid]['ep_snatched'] = 0
-                show_stat[show.indexerid]['ep_downloaded'] = 0
-                show_stat[show.indexerid]['ep_total'] = 0
-                show_stat[show.indexerid]['ep_airs_next'] = None
-                show_stat[show.indexerid]['ep_airs_prev'] = None
-                show_stat[show.indexerid]['total_size'] = 0
-
-            season = epData['season']
-            episode = epData['episode']
-            airdate = epData['airdate']
-            status = epData['status']
-
-            if season > 0 and episode > 0 and airdate > 1:
-                if status in status_quality:
-                    show_stat[show.indexerid]['ep_snatched'] += 1
-                    overall_stats['episodes']['snatched'] += 1
-
-                if status in status_download:
-                    show_stat[show.indexerid]['ep_downloaded'] += 1
-                    overall_stats['episodes']['downloaded'] += 1
-
-                if (airdate <= today and status in [SKIPPED, WANTED, FAILED]) or (
-                        status in status_quality + status_download):
-                    show_stat[show.indexerid]['ep_total'] += 1
-
-                if show_stat[show.indexerid]['ep_total'] > max_download_count:
-                    max_download_count = show_stat[show.indexerid]['ep_total']
-
-                if airdate >= today and status in [WANTED, UNAIRED] and not show_stat[show.indexerid]['ep_airs_next']:
-                    show_stat[show.indexerid]['ep_airs_next'] = airdate
-                elif airdate < today > show_stat[show.indexerid]['ep_airs_prev'] and status != UNAIRED:
-                    show_stat[show.indexerid]['ep_airs_prev'] = airdate
-
-                show_stat[show.indexerid]['total_size'] += epData['file_size']
-
-                overall_stats['episodes']['total'] += 1
-                overall_stats['total_size'] += epData['file_size']
-
-    max_download_count *= 100
+    """
+    Per-show and overall episode statistics, served from the incrementally maintained show stats store.
 
-    return show_stat, overall_stats, max_download_count
+    :return: tuple of (show_stat, overall_stats, max_download_count)
+    """
+    return sickrage.app.show_stats.statistics()
 
 
 def launch_browser(protocol=None, host=None, startport=None):
@@ -1613,28 +1569,6 @@ def launch_browser(protocol=None, host=None, startport=None):
         print("Unable to launch a browser")
 
 
-def is_ip_private(ip):
-    priv_lo = re.compile(r"^127\.\d{1,3}\.\d{1,3}\.\d{1,3}$")
-    priv_24 = re.compile(r"^10\.\d{1,3}\.\d{1,3}\.\d{1,3}$")
-    priv_20 = re.compile(r"^192\.168\.\d{1,3}.\d{1,3}$")
-    priv_16 = re.compile(r"^172.(1[6-9]|2[0-9]|3[0-1]).[0-9]{1,3}.[0-9]{1,3}$")
-    return priv_lo.match(ip) or priv_24.match(ip) or priv_20.match(ip) or priv_16.match(ip)
-
-
-def validate_url(value):
-    """
-    Return whether or not given value is a valid URL.
-    :param value: URL address string to validate
-    """
-
-    regex = (
-        r'^[a-z]+://([^/:]+{tld}|([0-9]{{1,3}}\.)'
-        r'{{3}}[0-9]{{1,3}})(:[0-9]+)?(\/.*)?$'
-    )
-
-    return (True, False)[not re.compile(regex.format(tld=r'\.[a-z]{2,10}')).match(value)]
-
-
 def torrent_webui_url(reset=False):
     if not reset:
         return sickrage.app.client_web_urls.get('torrent', '')
@@ -0,0 +1,105 @@
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import io
+import re
+
+from lxml import etree
+
+XML_DECLARATION = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+
+class FeedParseError(Exception):
+    """The feed is not well-formed xml, parse it with bs4_parser instead"""
+
+
+class RSSFeed(object):
+    """
+    Streaming reader for rss, newznab and torznab feeds using lxml iterparse.
+
+    Items are handed out as dicts while the feed is being parsed and their elements are freed right after, so memory
+    use stays flat however many items a provider returns. Namespaces, the api error and whether the feed holds
+    categories are filled in as they are seen.
+    """
+
+    def __init__(self, markup):
+        if isinstance(markup, unicode):
+            # lxml refuses unicode strings that carry an encoding declaration
+            markup = XML_DECLARATION.sub('', markup, 1).encode('utf-8')
+
+        self.markup = markup or b''
+        self.namespaces = {}
+        self.error = None
+        self.categories = False
+
+    @property
+    def torznab(self):
+        return 'torznab' in self.namespaces
+
+    def __iter__(self):
+        context = etree.iterparse(io.BytesIO(self.markup), events=('start-ns', 'end'), resolve_entities=False,
+                                  no_network=True, huge_tree=True)
+
+        try:
+            for event, elem in context:
+                if event == 'start-ns':
+                    self.namespaces[elem[0]] = elem[1]
+                    continue
+
+                tag = etree.QName(elem).localname
+                if tag == 'item':
+                    yield self._item(elem)
+
+                    # drop the item and everything parsed before it
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+                elif tag == 'error':
+                    self.error = elem.get('description')
+                elif tag == 'categories':
+                    self.categories = True
+        except (etree.XMLSyntaxError, ValueError) as e:
+            raise FeedParseError(e)
+
+    @staticmethod
+    def _text(elem):
+        return ''.join(x.strip() for x in elem.itertext())
+
+    def _item(self, elem):
+        item = {'title': '', 'link': '', 'enclosure': '', 'size': None, 'description': '', 'attrs': []}
+        newznab_attrs, torznab_attrs = [], []
+
+        for child in elem.iterchildren(tag=etree.Element):
+            tag = etree.QName(child).localname
+
+            if tag == 'attr' and child.prefix in ('newznab', 'torznab'):
+                attrs = (newznab_attrs, torznab_attrs)[child.prefix == 'torznab']
+                attrs.append((child.get('name'), child.get('value')))
+            elif child.prefix:
+                continue
+            elif tag in ('title', 'link', 'size'):
+                item[tag] = self._text(child)
+            elif tag == 'description':
+                item[tag] = ''.join(child.itertext())
+            elif tag == 'enclosure':
+                item[tag] = (child.get('url') or '').strip()
+
+        item['attrs'] = newznab_attrs + torznab_attrs
+        return item
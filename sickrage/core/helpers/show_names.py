@@ -399,7 +399,7 @@ def searchDBForShow(regShowName, log=False):
     yearRegex = r"([^()]+?)\s*(\()?(\d{4})(?(2)\))$"
 
     for showName in showNames:
-        dbData = [x for x in sickrage.app.showlist if x.name == showName]
+        dbData = [x for x in sickrage.app.showlist.find_by_name(showName) if x.name == showName]
         if len(dbData) == 1:
             return int(dbData[0].indexerid)
         else:
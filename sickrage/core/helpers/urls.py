@@ -0,0 +1,107 @@
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import re
+
+import ipaddress
+
+URL_REGEX = re.compile(r'^[a-z]+://([^/:]+\.[a-z]{2,10}|([0-9]{1,3}\.){3}[0-9]{1,3})(:[0-9]+)?(/.*)?$')
+
+PRIVATE_NETWORKS = tuple(ipaddress.ip_network(x) for x in ('127.0.0.0/8', '10.0.0.0/8', '172.16.0.0/12',
+                                                           '192.168.0.0/16'))
+
+# hosts seen so far and whether they are private, bounded so junk feeds can't grow it forever
+HOST_CACHE_SIZE = 10000
+_private_hosts = {}
+
+
+def validate_url(value):
+    """
+    Return whether or not given value is a valid URL.
+    :param value: URL address string to validate
+    """
+    return URL_REGEX.match(value) is not None
+
+
+def is_ip_private(ip):
+    """
+    Return whether or not given host is an ip address in a loopback or private range, memoised per host.
+    :param ip: ip address or host name
+    """
+    try:
+        return _private_hosts[ip]
+    except KeyError:
+        pass
+
+    try:
+        address = ipaddress.ip_address(ip.decode('utf-8') if isinstance(ip, bytes) else ip)
+        private = any(address in network for network in PRIVATE_NETWORKS)
+    except (ValueError, UnicodeDecodeError):
+        private = False
+
+    if len(_private_hosts) >= HOST_CACHE_SIZE:
+        _private_hosts.clear()
+    _private_hosts[ip] = private
+
+    return private
+
+
+def is_download_url(url):
+    """
+    Return whether or not given url can be used to download a result, either a magnet link or a valid url
+    that does not point at a private address.
+    :param url: result url
+    """
+    if url.startswith('magnet'):
+        return True
+
+    match = URL_REGEX.match(url)
+    return match is not None and not is_ip_private(match.group(1))
+
+
+def download_urls(urls):
+    """
+    Batch version of is_download_url for a whole feed or cache lookup.
+    :param urls: list of result urls
+    :return: list of bools, in the same order as urls
+    """
+    usable = []
+    add = usable.append
+    match = URL_REGEX.match
+
+    private_hosts = {}
+    for url in urls:
+        if url.startswith('magnet'):
+            add(True)
+            continue
+
+        m = match(url)
+        if m is None:
+            add(False)
+            continue
+
+        host = m.group(1)
+        private = private_hosts.get(host)
+        if private is None:
+            private = private_hosts[host] = is_ip_private(host)
+
+        add(not private)
+
+    return usable
@@ -18,12 +18,14 @@
 
 from __future__ import unicode_literals
 
+import Queue
 import logging
 import os
 import pkgutil
 import platform
 import re
-from logging import FileHandler, CRITICAL, DEBUG, ERROR, INFO, WARNING
+import threading
+from logging import CRITICAL, DEBUG, ERROR, INFO, WARNING
 from logging.handlers import RotatingFileHandler
 
 import raven
@@ -32,6 +34,117 @@ from unidecode import unidecode
 
 import sickrage
 from sickrage.core import makeDir
+from sickrage.core.classes import ErrorViewer, WarningViewer
+from sickrage.core.logindex import IndexedFileHandler, IndexedRotatingFileHandler
+
+# needed because Newznab apikey isn't stored as key=value in a section.
+APIKEY_REGEX = re.compile(r"([&?]r|[&?]apikey|[&?]api_key)=[^&]*([&\w]?)")
+
+
+class CensoredItems(dict):
+    """
+    Config values that must never show up in the logs, keyed by (section, key).
+
+    The pattern matching them is compiled on first use after the values change instead of for every record.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(CensoredItems, self).__init__(*args, **kwargs)
+        self._regex = None
+
+    def _changed(self):
+        self._regex = None
+
+    def __setitem__(self, key, value):
+        if self.get(key) != value:
+            super(CensoredItems, self).__setitem__(key, value)
+            self._changed()
+
+    def __delitem__(self, key):
+        super(CensoredItems, self).__delitem__(key)
+        self._changed()
+
+    def clear(self):
+        super(CensoredItems, self).clear()
+        self._changed()
+
+    def pop(self, *args):
+        self._changed()
+        return super(CensoredItems, self).pop(*args)
+
+    def popitem(self):
+        self._changed()
+        return super(CensoredItems, self).popitem()
+
+    def setdefault(self, key, default=None):
+        self._changed()
+        return super(CensoredItems, self).setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        super(CensoredItems, self).update(*args, **kwargs)
+        self._changed()
+
+    @property
+    def regex(self):
+        """
+        Compiled pattern of all censored values, or None when there is nothing to censor.
+        """
+        if self._regex is None:
+            values = sorted(set('{}'.format(x) for x in self.values() if x), key=len, reverse=True)
+            self._regex = re.compile(r'(?<!\w)(?:{})(?!\w)'.format('|'.join(re.escape(x) for x in values))) \
+                if values else False
+
+        return self._regex or None
+
+
+class BackgroundHandler(logging.Handler):
+    """
+    Passes records on to the wrapped handlers from a worker thread, so slow file and sentry writes don't hold up
+    the thread that logged. Falls back to handling the record in the calling thread when the queue is full.
+    """
+
+    def __init__(self, handlers, max_size=10000):
+        super(BackgroundHandler, self).__init__()
+        self.handlers = handlers
+        self.queue = Queue.Queue(max_size)
+        self.formatter = logging.Formatter()
+
+        self.thread = threading.Thread(target=self._run, name='LOGGER')
+        self.thread.setDaemon(True)
+        self.thread.start()
+
+    def _handle(self, record):
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def _run(self):
+        while True:
+            record = self.queue.get()
+            if record is None:
+                break
+
+            self._handle(record)
+
+    def emit(self, record):
+        # render the traceback now, the frames it points at keep changing after we return
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatter.formatException(record.exc_info)
+
+        try:
+            self.queue.put_nowait(record)
+        except Queue.Full:
+            self._handle(record)
+
+    def close(self):
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join(10)
+
+        for handler in self.handlers:
+            handler.close()
+
+        super(BackgroundHandler, self).close()
 
 
 class Logger(logging.getLoggerClass()):
@@ -46,6 +159,7 @@ class Logger(logging.getLoggerClass()):
         self.consoleLogging = consoleLogging
         self.fileLogging = fileLogging
         self.debugLogging = debugLogging
+        self.backgroundLogging = False
 
         self.logFile = logFile
         self.logSize = logSize
@@ -58,7 +172,7 @@ class Logger(logging.getLoggerClass()):
         self.INFO = INFO
         self.DB = 5
 
-        self.CENSORED_ITEMS = {}
+        self.CENSORED_ITEMS = CensoredItems()
 
         self.logLevels = {
             'CRITICAL': self.CRITICAL,
@@ -84,7 +198,10 @@ class Logger(logging.getLoggerClass()):
         self.start()
 
     def start(self):
-        # remove all handlers
+        # stop background logging thread and remove all handlers
+        for handler in self.handlers:
+            if isinstance(handler, BackgroundHandler):
+                handler.close()
         self.handlers = []
 
         # sentry log handler
@@ -95,7 +212,7 @@ class Logger(logging.getLoggerClass()):
         sentry_handler = SentryHandler(client=sentry_client, tags={'platform': platform.platform()})
         sentry_handler.setLevel(self.logLevels['ERROR'])
         sentry_handler.set_name('sentry')
-        self.addHandler(sentry_handler)
+        background_handlers = [sentry_handler]
 
         # console log handler
         if self.consoleLogging:
@@ -107,18 +224,13 @@ class Logger(logging.getLoggerClass()):
             self.addHandler(console_handler)
 
         # file log handlers
-        if self.logFile:
-            # make logs folder if it doesn't exist
-            if not os.path.exists(os.path.dirname(self.logFile)):
-                if not makeDir(os.path.dirname(self.logFile)):
-                    return
-
+        if self.logFile and (os.path.exists(os.path.dirname(self.logFile)) or makeDir(os.path.dirname(self.logFile))):
             if sickrage.app.developer:
-                rfh = FileHandler(
+                rfh = IndexedFileHandler(
                     filename=self.logFile,
                 )
             else:
-                rfh = RotatingFileHandler(
+                rfh = IndexedRotatingFileHandler(
                     filename=self.logFile,
                     maxBytes=self.logSize,
                     backupCount=self.logNr
@@ -134,32 +246,53 @@ class Logger(logging.getLoggerClass()):
 
             rfh.setFormatter(formatter)
             rfh.setLevel(self.logLevels['INFO'] if not self.debugLogging else self.logLevels['DEBUG'])
-            self.addHandler(rfh)
+            background_handlers.append(rfh)
 
             rfh_errors.setFormatter(formatter)
             rfh_errors.setLevel(self.logLevels['ERROR'])
-            self.addHandler(rfh_errors)
+            background_handlers.append(rfh_errors)
+
+        # sentry and file writes, optionally from a background thread
+        if self.backgroundLogging:
+            background_handler = BackgroundHandler(background_handlers)
+            background_handler.set_name('background')
+            self.addHandler(background_handler)
+        else:
+            for handler in background_handlers:
+                self.addHandler(handler)
+
+        # don't create records no handler is going to write, warnings always go to the UI
+        self.setLevel(min([x.level for x in background_handlers + self.handlers if x.level] + [WARNING]))
+
+    def censor(self, msg):
+        """
+        Strips censored config values and api keys from a log message.
+        """
+        censored_regex = self.CENSORED_ITEMS.regex
+        if censored_regex:
+            msg = censored_regex.sub('', msg)
+
+        msg = APIKEY_REGEX.sub(r"\1=**********\2", msg)
+
+        try:
+            msg.encode('ascii')
+        except UnicodeError:
+            msg = unidecode(msg)
+
+        return msg
 
     def makeRecord(self, name, level, fn, lno, msg, args, exc_info, func=None, extra=None):
         if (False, True)[name in self.loggers]:
             record = super(Logger, self).makeRecord(name, level, fn, lno, msg, args, exc_info, func, extra)
 
             try:
-                record.msg = re.sub(
-                    r"(.*)\b({})\b(.*)".format(
-                        '|'.join([x for x in self.CENSORED_ITEMS.values() if len(x)])), r"\1\3",
-                    record.msg)
-
-                # needed because Newznab apikey isn't stored as key=value in a section.
-                record.msg = re.sub(r"([&?]r|[&?]apikey|[&?]api_key)=[^&]*([&\w]?)", r"\1=**********\2", record.msg)
-                record.msg = unidecode(record.msg)
+                record.msg = self.censor(record.getMessage())
+                record.args = ()
             except:
                 pass
 
             # sending record to UI
             if record.levelno in [WARNING, ERROR]:
-                from sickrage.core.classes import WarningViewer
-                from sickrage.core.classes import ErrorViewer
                 (WarningViewer(), ErrorViewer())[record.levelno == ERROR].add(
                     "{}::{}".format(record.threadName, record.msg), True)
 
@@ -171,8 +304,9 @@ class Logger(logging.getLoggerClass()):
         for __, logger in self.loggers.items():
             logger.setLevel(level)
             for handler in logger.handlers:
-                if not handler.name == 'sentry':
-                    handler.setLevel(level)
+                for handler in getattr(handler, 'handlers', [handler]):
+                    if handler.name not in ('sentry', 'background'):
+                        handler.setLevel(level)
 
     def list_modules(self, package):
         """Return all sub-modules for the specified package.
@@ -0,0 +1,389 @@
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import io
+import logging
+import os
+import re
+import struct
+import time
+from logging import FileHandler
+from logging.handlers import RotatingFileHandler
+
+# start of every record written with the '%(asctime)s %(levelname)s::%(threadName)s::%(message)s' format
+HEADER_REGEX = re.compile(br'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) ([A-Z]+)::(.*?)::')
+
+# byte offset, created timestamp, level and thread name of a record
+THREAD_SIZE = 32
+ENTRY = struct.Struct(b'<QdB%ds' % THREAD_SIZE)
+
+# most records a single query or tail call will return
+MAX_LINES = 5000
+
+
+def parse_records(lines, offset=0):
+    """
+    Splits log lines into records, a record being a header line followed by any lines without one (tracebacks).
+    Stops at the first incomplete line, the handler might still be writing it.
+
+    :param lines: iterable of byte lines, newlines included
+    :param offset: byte offset of the first line
+    :return: generator of (start, end, created, level, thread) tuples
+    """
+    record = None
+    last_stamp = created = None
+
+    for line in lines:
+        if not line.endswith(b'\n'):
+            break
+
+        match = HEADER_REGEX.match(line)
+        if match:
+            if record:
+                yield tuple(record[:1] + [offset] + record[1:])
+
+            stamp, level, thread = match.groups()
+            if stamp != last_stamp:
+                last_stamp = stamp
+                created = time.mktime(time.strptime(stamp.decode('ascii'), '%Y-%m-%d %H:%M:%S'))
+
+            level = logging.getLevelName(level.decode('ascii'))
+            record = [offset, created, level if isinstance(level, int) else 0, thread[:THREAD_SIZE]]
+
+        offset += len(line)
+
+    if record:
+        yield tuple(record[:1] + [offset] + record[1:])
+
+
+class LogIndex(object):
+    """
+    Offset index of a log file, stored next to it as <log file>.idx with a fixed size entry per record.
+
+    The index handlers append an entry for every record they write, records the index doesn't know about yet are
+    found by parsing the log from the last indexed record, and a missing or stale index is rebuilt from the log.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.path = self.index_path(filename)
+        self.stream = None
+
+    @staticmethod
+    def index_path(filename):
+        return filename + '.idx'
+
+    def _read_entries(self, start, count):
+        with io.open(self.path, 'rb') as f:
+            f.seek(start * ENTRY.size)
+            data = f.read(count * ENTRY.size)
+
+        return [ENTRY.unpack_from(data, i * ENTRY.size) for i in range(len(data) // ENTRY.size)]
+
+    def _count(self):
+        try:
+            return os.path.getsize(self.path) // ENTRY.size
+        except OSError:
+            return 0
+
+    def _unindexed(self):
+        """
+        Records written to the log after the last indexed one.
+
+        :return: count of usable index entries and list of (start, end, created, level, thread) tuples, count is
+                 0 when the index doesn't match the log
+        """
+        count = self._count()
+        last = self._read_entries(count - 1, 1) if count else []
+        start = last[0][0] if last else 0
+
+        with io.open(self.filename, 'rb') as f:
+            f.seek(start)
+            records = list(parse_records(f, start))
+
+        if not last:
+            return 0, records
+
+        if not records or records[0][0] != start:
+            # log was replaced or truncated under the index
+            return self._unindexed_from_scratch()
+
+        return count, records[1:]
+
+    def _unindexed_from_scratch(self):
+        with io.open(self.filename, 'rb') as f:
+            return 0, list(parse_records(f))
+
+    def rebuild(self):
+        """
+        Brings the index up to date with the log, rewriting it when it doesn't match.
+        """
+        count, records = self._unindexed()
+
+        with io.open(self.path, 'r+b' if count and os.path.exists(self.path) else 'wb') as f:
+            f.seek(count * ENTRY.size)
+            f.truncate()
+            for start, __, created, level, thread in records:
+                f.write(ENTRY.pack(start, created, level, thread))
+
+    def open(self):
+        """
+        Opens the index for appending, catching up on records written without it first.
+        """
+        self.rebuild()
+        self.stream = io.open(self.path, 'ab')
+
+    def append(self, offset, record):
+        self.stream.write(ENTRY.pack(offset, record.created, record.levelno,
+                                     record.threadName.encode('utf-8', 'replace')[:THREAD_SIZE]))
+
+    def close(self):
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+    def entries(self, rebuild=False):
+        """
+        Walks the records of the log from newest to oldest.
+
+        :param rebuild: write the index when it is missing or stale, only safe for logs nothing writes to anymore
+        :return: generator of (start, end, created, level, thread) tuples
+        """
+        if rebuild:
+            self.rebuild()
+
+        count, records = self._unindexed()
+        for record in reversed(records):
+            yield record
+
+        end = records[0][0] if records else None
+        while count:
+            block = self._read_entries(max(0, count - 1024), min(count, 1024))
+            count -= len(block)
+
+            for start, created, level, thread in reversed(block):
+                if end is None:
+                    end = self._record_end(start)
+                yield start, end, created, level, thread.rstrip(b'\0')
+                end = start
+
+    def _record_end(self, start):
+        with io.open(self.filename, 'rb') as f:
+            f.seek(start)
+            for record in parse_records(f, start):
+                return record[1]
+
+        return start
+
+
+class LogIndexHandlerMixin(object):
+    """
+    Keeps a LogIndex next to the log file of a FileHandler.
+    """
+
+    index = None
+
+    def _open(self):
+        stream = super(LogIndexHandlerMixin, self)._open()
+
+        if self.index:
+            self.index.close()
+        self.index = LogIndex(self.baseFilename)
+
+        try:
+            self.index.open()
+        except (IOError, OSError):
+            self.index = None
+
+        return stream
+
+    def _emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+
+        self.stream.seek(0, os.SEEK_END)
+        offset = self.stream.tell()
+
+        logging.StreamHandler.emit(self, record)
+
+        if self.index:
+            self.index.append(offset, record)
+
+    def flush(self):
+        super(LogIndexHandlerMixin, self).flush()
+        if self.index and self.index.stream:
+            self.index.stream.flush()
+
+    def close(self):
+        self.acquire()
+        try:
+            if self.index:
+                self.index.close()
+        finally:
+            self.release()
+
+        super(LogIndexHandlerMixin, self).close()
+
+
+class IndexedFileHandler(LogIndexHandlerMixin, FileHandler):
+    def emit(self, record):
+        try:
+            self._emit(record)
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except:
+            self.handleError(record)
+
+
+class IndexedRotatingFileHandler(LogIndexHandlerMixin, RotatingFileHandler):
+    def emit(self, record):
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            self._emit(record)
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except:
+            self.handleError(record)
+
+    def doRollover(self):
+        if self.index:
+            self.index.close()
+
+        # rotate the indexes along with the log files they belong to
+        if self.backupCount > 0:
+            for i in range(self.backupCount - 1, 0, -1):
+                sfn = LogIndex.index_path("%s.%d" % (self.baseFilename, i))
+                dfn = LogIndex.index_path("%s.%d" % (self.baseFilename, i + 1))
+                if os.path.exists(sfn):
+                    if os.path.exists(dfn):
+                        os.remove(dfn)
+                    os.rename(sfn, dfn)
+
+            dfn = LogIndex.index_path(self.baseFilename + ".1")
+            if os.path.exists(dfn):
+                os.remove(dfn)
+            if os.path.exists(self.index.path):
+                os.rename(self.index.path, dfn)
+
+        RotatingFileHandler.doRollover(self)
+
+
+class LogQuery(object):
+    """
+    Answers log viewer queries from the log file and its rotated backups, newest record first.
+
+    Level and thread filters are checked against the index, so only records that pass them are read from the logs.
+    """
+
+    def __init__(self, log_file, log_nr=0):
+        self.log_file = log_file
+        self.log_files = [log_file] + ["{}.{}".format(log_file, x) for x in range(1, int(log_nr) + 1)]
+
+    @staticmethod
+    def _match(record, min_level, thread):
+        return record[3] >= min_level and (not thread or thread in record[4])
+
+    @staticmethod
+    def _text(data, search):
+        text = data.decode('utf-8', 'replace').rstrip('\n')
+        if text and (not search or search.lower() in text.lower()):
+            return text
+
+    def query(self, min_level=logging.INFO, thread='', search='', max_lines=500):
+        """
+        :param min_level: lowest level to return
+        :param thread: only return records from threads with this in their name
+        :param search: only return records containing this, case insensitive
+        :param max_lines: most records to return, capped at MAX_LINES
+        :return: list of records, newest first
+        """
+        min_level, max_lines = int(min_level), min(int(max_lines), MAX_LINES)
+        thread = thread.encode('utf-8')
+
+        lines = []
+        for log_file in [x for x in self.log_files if os.path.isfile(x)]:
+            with io.open(log_file, 'rb') as f:
+                for start, end, created, level, name in LogIndex(log_file).entries(log_file != self.log_file):
+                    if not self._match((start, end, created, level, name), min_level, thread):
+                        continue
+
+                    f.seek(start)
+                    text = self._text(f.read(end - start), search)
+                    if text:
+                        lines.append(text)
+                        if len(lines) >= max_lines:
+                            return lines
+
+        return lines
+
+    def cursor(self):
+        """
+        Position of the end of the log, for tail to continue from.
+        """
+        try:
+            stat = os.stat(self.log_file)
+            return '{}:{}'.format(stat.st_ino, stat.st_size)
+        except OSError:
+            return '0:0'
+
+    def tail(self, cursor='', min_level=logging.INFO, thread='', search='', max_lines=500):
+        """
+        Records written since cursor, following the log across a rollover.
+
+        :param cursor: value returned by cursor or a previous tail call
+        :return: list of new records, newest first, and the cursor to continue from
+        """
+        min_level, max_lines = int(min_level), min(int(max_lines), MAX_LINES)
+        thread = thread.encode('utf-8')
+
+        try:
+            inode, offset = [int(x) for x in cursor.split(':')]
+        except ValueError:
+            return [], self.cursor()
+
+        try:
+            stat = os.stat(self.log_file)
+        except OSError:
+            return [], self.cursor()
+
+        sources = []
+        if stat.st_ino != inode or stat.st_size < offset:
+            backup = self.log_files[1] if len(self.log_files) > 1 else None
+            if backup and os.path.isfile(backup) and os.stat(backup).st_ino == inode:
+                sources.append((backup, offset))
+            offset = 0
+        sources.append((self.log_file, offset))
+
+        lines = []
+        for log_file, offset in sources:
+            with io.open(log_file, 'rb') as f:
+                f.seek(offset)
+                data = f.read()
+
+            end = offset
+            for record in parse_records(data.splitlines(True), offset):
+                end = record[1]
+                if self._match(record, min_level, thread):
+                    text = self._text(data[record[0] - offset:record[1] - offset], search)
+                    if text:
+                        lines.append(text)
+
+        return list(reversed(lines[-max_lines:])), '{}:{}'.format(stat.st_ino, end)
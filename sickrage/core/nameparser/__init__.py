@@ -37,24 +37,38 @@ from sickrage.core.traktapi import srTraktAPI
 from sickrage.indexers import IndexerApi
 from sickrage.indexers.exceptions import indexer_episodenotfound, indexer_error
 
+compiled_hints = [(re.compile(hint, re.IGNORECASE), pattern_names) for hint, pattern_names in regexes.hints]
+
 
 class NameParser(object):
     ALL_REGEX = 0
     NORMAL_REGEX = 1
     ANIME_REGEX = 2
 
-    def __init__(self, file_name=True, showObj=None, naming_pattern=False, validate_show=True):
+    # compiled once per regex mode and shared by every parser
+    regex_sets = {}
+    regex_orders = {}
+    regex_lock = Lock()
+
+    def __init__(self, file_name=True, showObj=None, naming_pattern=False, validate_show=True, remote_lookups=True):
+        """
+        :param remote_lookups: look names that aren't cached up on the indexers right away, when False they are left
+                               to the show name resolver and the name goes unmatched for now
+        """
         self.file_name = file_name
         self.showObj = showObj
         self.naming_pattern = naming_pattern
         self.validate_show = validate_show
+        self.remote_lookups = remote_lookups
 
         if self.showObj and not self.showObj.is_anime:
-            self._compile_regexes(self.NORMAL_REGEX)
+            self.regex_mode = self.NORMAL_REGEX
         elif self.showObj and self.showObj.is_anime:
-            self._compile_regexes(self.ANIME_REGEX)
+            self.regex_mode = self.ANIME_REGEX
         else:
-            self._compile_regexes(self.ALL_REGEX)
+            self.regex_mode = self.ALL_REGEX
+
+        self._compile_regexes(self.regex_mode)
 
     def get_show(self, name):
         show = None
@@ -64,15 +78,18 @@ class NameParser(object):
             return show, show_id
 
         def cache_lookup(name):
-            return sickrage.app.name_cache.get(name)
+            return show_lookup_stats.timed('name_cache', lambda: sickrage.app.name_cache.get(name))
 
         def scene_exception_lookup(name):
-            return get_scene_exception_by_name(name)[0]
+            return show_lookup_stats.timed('scene_exceptions', lambda: get_scene_exception_by_name(name)[0])
 
         def indexer_lookup(name):
-            show_id1 = int(IndexerApi().searchForShowID(full_sanitizeSceneName(name))[2])
-            show_id2 = int(srTraktAPI()['search'].query(full_sanitizeSceneName(name), 'show')[0].ids['tvdb'])
-            return (None, show_id1)[show_id1 == show_id2]
+            if self.remote_lookups:
+                return remote_show_lookup(name)
+
+            if sickrage.app.show_resolver:
+                sickrage.app.show_resolver.put(name)
+            show_lookup_stats.defer()
 
         lookup_list = [
             lambda: cache_lookup(name),
@@ -99,7 +116,7 @@ class NameParser(object):
             except Exception:
                 pass
 
-        if show_id is None:
+        if show_id is None and self.remote_lookups:
             # ignore show name by caching it with a indexerid of 0
             sickrage.app.name_cache.put(name, 0)
 
@@ -124,17 +141,30 @@ class NameParser(object):
         return series_name.strip()
 
     def _compile_regexes(self, regexMode):
-        if regexMode == self.ANIME_REGEX:
+        with self.regex_lock:
+            if regexMode not in self.regex_sets:
+                self.regex_sets[regexMode] = self._build_regex_set(regexMode)
+
+        self.compiled_regexes = self.regex_sets[regexMode]
+
+    @staticmethod
+    def _build_regex_set(regexMode):
+        """
+        Compiles the patterns of a regex mode along with the highest score a match of each can get
+
+        :return: list of (pattern number, pattern name, compiled regex, max score)
+        """
+        if regexMode == NameParser.ANIME_REGEX:
             dbg_str = "ANIME"
             uncompiled_regex = [regexes.anime_regexes]
-        elif regexMode == self.NORMAL_REGEX:
+        elif regexMode == NameParser.NORMAL_REGEX:
             dbg_str = "NORMAL"
             uncompiled_regex = [regexes.normal_regexes]
         else:
             dbg_str = "ALL"
             uncompiled_regex = [regexes.normal_regexes, regexes.anime_regexes]
 
-        self.compiled_regexes = []
+        compiled_regexes = []
         for regexItem in uncompiled_regex:
             for cur_pattern_num, (cur_pattern_name, cur_pattern) in enumerate(regexItem):
                 try:
@@ -144,16 +174,51 @@ class NameParser(object):
                         "WARNING: Invalid episode_pattern using %s regexs, %s. %s" % (
                             dbg_str, errormsg, cur_pattern))
                 else:
-                    self.compiled_regexes.append((cur_pattern_num, cur_pattern_name, cur_regex))
+                    max_score = sum(score for group, score in regexes.group_scores.items()
+                                    if group in cur_regex.groupindex) - cur_pattern_num
+                    compiled_regexes.append((cur_pattern_num, cur_pattern_name, cur_regex, max_score))
 
-    def _parse_string(self, name, skip_scene_detection=False):
-        if not name:
-            return
+        return compiled_regexes
 
-        matches = []
+    def _regex_order(self, name):
+        """
+        Orders the positions in compiled_regexes so the patterns the tokens of name point at come first, followed
+        by the rest from the highest possible score down
+        """
+        hints = tuple(i for i, (hint, __) in enumerate(compiled_hints) if hint.search(name))
+
+        try:
+            return self.regex_orders[(self.regex_mode, hints)]
+        except KeyError:
+            pass
+
+        hinted = []
+        for i in hints:
+            hinted += [x for x, regex in enumerate(self.compiled_regexes)
+                       if regex[1] in compiled_hints[i][1] and x not in hinted]
+
+        order = hinted + sorted((x for x in range(len(self.compiled_regexes)) if x not in hinted),
+                                key=lambda x: -self.compiled_regexes[x][3])
+
+        self.regex_orders[(self.regex_mode, hints)] = order
+        return order
+
+    def _match(self, name):
+        """
+        Runs the regexes over name, skipping those that can no longer beat the best match found
+
+        :return: ParseResult of the highest scoring match, the first of them in pattern order on a tie
+        """
         bestResult = None
+        bestPosition = None
+
+        for position in self._regex_order(name):
+            cur_regex_num, cur_regex_name, cur_regex, max_score = self.compiled_regexes[position]
+
+            if bestResult and (max_score < bestResult.score or
+                               max_score == bestResult.score and position > bestPosition):
+                continue
 
-        for (cur_regex_num, cur_regex_name, cur_regex) in self.compiled_regexes:
             match = cur_regex.match(name)
 
             if not match:
@@ -239,12 +304,19 @@ class NameParser(object):
             else:
                 result.version = -1
 
-            matches.append(result)
+            if not bestResult or result.score > bestResult.score or \
+                    result.score == bestResult.score and position < bestPosition:
+                bestResult, bestPosition = result, position
 
-        if len(matches):
-            # pick best match with highest score based on placement
-            bestResult = max(sorted(matches, reverse=True, key=lambda x: x.which_regex), key=lambda x: x.score)
+        return bestResult
 
+    def _parse_string(self, name, skip_scene_detection=False):
+        if not name:
+            return
+
+        bestResult = self._match(name)
+
+        if bestResult:
             bestResult.show = self.showObj
             bestResult.indexerid = self.showObj.indexerid if self.showObj else 0
 
@@ -275,8 +347,9 @@ class NameParser(object):
             if bestResult.is_air_by_date:
                 airdate = bestResult.air_date.toordinal()
 
-                dbData = [x for x in sickrage.app.main_db.get_many('tv_episodes', bestResult.show.indexerid)
-                          if x['indexer'] == bestResult.show.indexer and x['airdate'] == airdate]
+                dbData = [x for x in sickrage.app.main_db.get_many('tv_episodes_airdate',
+                                                                   (bestResult.show.indexerid, airdate))
+                          if x['indexer'] == bestResult.show.indexer]
 
                 season_number = None
                 episode_numbers = []
@@ -451,7 +524,11 @@ class NameParser(object):
         if self.naming_pattern:
             cache_result = False
 
-        cached = name_parser_cache.get(name)
+        parse_mode = (self.regex_mode, self.showObj.indexerid if self.showObj else None, self.file_name,
+                      skip_scene_detection)
+        cache_key = (name, parse_mode, self.validate_show)
+
+        cached = name_parser_cache.get(cache_key)
         if cached:
             return cached
 
@@ -514,12 +591,74 @@ class NameParser(object):
             raise InvalidNameException("Unable to parse {} to a valid episode. Parser result: {}".format(name, final_result))
 
         if cache_result and final_result.show:
-            name_parser_cache.add(name, final_result)
+            name_parser_cache.add(cache_key, final_result)
 
         sickrage.app.log.debug("Parsed {} into {}".format(name, final_result))
         return final_result
 
 
+def remote_show_lookup(name):
+    """
+    Looks a show name up on the indexer and on trakt
+
+    :return: indexer id of the show when both agree on it, None otherwise
+    """
+    show_id1 = int(show_lookup_stats.timed(
+        'indexer', lambda: IndexerApi().searchForShowID(full_sanitizeSceneName(name))[2]))
+    show_id2 = int(show_lookup_stats.timed(
+        'trakt', lambda: srTraktAPI()['search'].query(full_sanitizeSceneName(name), 'show')[0].ids['tvdb']))
+    return (None, show_id1)[show_id1 == show_id2]
+
+
+class ShowLookupStats(object):
+    """
+    Lookup counts and time spent per source of NameParser.get_show
+    """
+
+    def __init__(self):
+        self.lock = Lock()
+        self.sources = {}
+        self.deferred = 0
+
+    def timed(self, source, func):
+        """
+        Calls func and records how long it took, a lookup that returns something other than None answered
+        """
+        start = time.time()
+        result = None
+        try:
+            result = func()
+            return result
+        finally:
+            self.record(source, time.time() - start, result is not None)
+
+    def record(self, source, seconds, answered):
+        with self.lock:
+            stats = self.sources.setdefault(source, {'lookups': 0, 'answered': 0, 'time': 0.0, 'max_time': 0.0})
+            stats['lookups'] += 1
+            stats['answered'] += int(answered)
+            stats['time'] += seconds
+            stats['max_time'] = max(stats['max_time'], seconds)
+
+    def defer(self):
+        with self.lock:
+            self.deferred += 1
+
+    def clear(self):
+        with self.lock:
+            self.sources.clear()
+            self.deferred = 0
+
+    def stats(self):
+        with self.lock:
+            return {'deferred': self.deferred,
+                    'sources': dict((source, dict(stats, avg_time=stats['time'] / stats['lookups']))
+                                    for source, stats in self.sources.items())}
+
+
+show_lookup_stats = ShowLookupStats()
+
+
 class ParseResult(object):
     def __init__(self,
                  original_name,
@@ -607,23 +746,65 @@ class ParseResult(object):
 
 
 class NameParserCache(object):
-    def __init__(self):
+    """
+    LRU cache of parse results keyed on (name, parse mode, validate_show), with an optional time to live
+    """
+
+    def __init__(self, max_size=None, ttl=None):
         self.lock = Lock()
         self.data = OrderedDict()
-        self.max_size = 200
+        self._max_size = max_size
+        self._ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_size(self):
+        return max(self._max_size or sickrage.app.config.name_parser_cache_size, 1)
+
+    @property
+    def ttl(self):
+        return self._ttl if self._ttl is not None else sickrage.app.config.name_parser_cache_ttl
 
     def get(self, key):
         with self.lock:
-            value = self.data.get(key)
-            if value:
-                sickrage.app.log.debug("Using cached parse result for: {}".format(key))
+            try:
+                value, expires = self.data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return None
+
+            if expires and expires < time.time():
+                self.evictions += 1
+                self.misses += 1
+                return None
+
+            self.data[key] = (value, expires)
+            self.hits += 1
             return value
 
     def add(self, key, value):
         with self.lock:
-            self.data.update({key: value})
+            self.data.pop(key, None)
+            self.data[key] = (value, time.time() + self.ttl if self.ttl > 0 else None)
+
             while len(self.data) > self.max_size:
-                self.data.pop(list(self.data.keys())[0], None)
+                self.data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+
+    def stats(self):
+        with self.lock:
+            return {'size': len(self.data),
+                    'max_size': self.max_size,
+                    'ttl': self.ttl,
+                    'hits': self.hits,
+                    'misses': self.misses,
+                    'evictions': self.evictions}
 
 
 name_parser_cache = NameParserCache()
@@ -21,6 +21,27 @@ from __future__ import unicode_literals
 
 # all regexes are case insensitive
 
+# score a match gets at most for each named group, a match scores these minus the pattern number
+group_scores = {
+    'series_name': 1,
+    'series_num': 1,
+    'season_num': 1,
+    'ep_num': 3,
+    'ep_ab_num': 1,
+    'extra_ab_ep_num': 1,
+    'air_date': 1,
+    'extra_info': 1,
+    'release_group': 1,
+}
+
+# tokens that point at the patterns to try first, patterns only go first and are never skipped because of these
+hints = [
+    (r's\d+[. _-]*e\d+', ['standard_repeat', 'standard', 'stupid_with_denotative', 'anime_SxxExx',
+                          'anime_and_normal', 'anime_and_normal_reverse', 'anime_and_normal_front']),
+    (r'\d+x\d+', ['fov_repeat', 'fov', 'anime SxEE', 'anime_and_normal_x']),
+    (r'\d{4}[. _-]\d{2}[. _-]\d{2}', ['scene_date_format', 'scene_sports_format']),
+]
+
 normal_regexes = [
     ('standard_repeat',
      # Show.Name.S01E02.S01E03.Source.Quality.Etc-Group
@@ -0,0 +1,92 @@
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import threading
+from Queue import Queue
+
+import sickrage
+from sickrage.core.nameparser import remote_show_lookup
+
+
+class ShowNameResolver(object):
+    """
+    Looks up the show names the RSS and search paths skipped on the indexers in the background, so the next time a
+    name comes along it is answered from the name cache.
+    """
+
+    def __init__(self):
+        self.name = "RESOLVER"
+        self.thread = None
+        self.stop = threading.Event()
+
+        self.lock = threading.Lock()
+        self.queue = Queue()
+        self.pending = set()
+
+    def start(self):
+        self.stop.clear()
+        self.thread = threading.Thread(target=self.run, name=self.name)
+        self.thread.setDaemon(True)
+        self.thread.start()
+
+    def shutdown(self):
+        self.stop.set()
+        self.queue.put(None)
+        if self.thread and self.thread.is_alive():
+            self.thread.join(10)
+
+    def put(self, name):
+        """
+        :return: False when the name is already waiting to be looked up
+        """
+        with self.lock:
+            if name in self.pending:
+                return False
+            self.pending.add(name)
+
+        self.queue.put(name)
+        return True
+
+    def resolve(self, name):
+        # answered meanwhile, by a show being added or a lookup that didn't wait
+        if sickrage.app.name_cache.get(name) is not None:
+            return
+
+        try:
+            show_id = remote_show_lookup(name)
+        except Exception as e:
+            sickrage.app.log.debug("Unable to look up show name {}: {}".format(name, e))
+            show_id = None
+
+        sickrage.app.name_cache.put(name, show_id or 0)
+
+    def run(self):
+        while not self.stop.is_set():
+            name = self.queue.get()
+            if name is None:
+                continue
+
+            try:
+                self.resolve(name)
+            except Exception as e:
+                sickrage.app.log.warning("Show name resolver error: {}".format(e))
+            finally:
+                with self.lock:
+                    self.pending.discard(name)
@@ -21,8 +21,12 @@ from __future__ import unicode_literals
 import os
 import shutil
 import stat
+import threading
+import time
+from contextlib import contextmanager
 
 import rarfile
+from concurrent.futures import ThreadPoolExecutor
 
 import sickrage
 from sickrage.core.common import Quality
@@ -41,10 +45,61 @@ class ProcessResult(object):
         self.output = ''
         self.missed_files = []
         self.agg_result = True
+        self.start_time = time.time()
+        self.processed_files = 0
+        self.processed_bytes = 0
 
     def __unicode__(self):
         return self.output
 
+    def merge(self, other):
+        """
+        Adds the outcome of a job that ran with its own result to this one
+        """
+        self.output += other.output
+        self.missed_files += other.missed_files
+        self.result = self.result and other.result
+        self.agg_result = self.agg_result and other.agg_result
+        self.processed_files += other.processed_files
+        self.processed_bytes += other.processed_bytes
+
+    def throughput(self):
+        elapsed = max(time.time() - self.start_time, 0.001)
+        return "Processed {} files ({:.1f} MB) in {:.1f}s, {:.1f} files/min, {:.1f} MB/s".format(
+            self.processed_files, self.processed_bytes / 1048576.0, elapsed,
+            self.processed_files * 60 / elapsed, self.processed_bytes / 1048576.0 / elapsed)
+
+
+class ProcessLimits(object):
+    """
+    Limits concurrent post-processing jobs to one per show, so two files for the same episode never race, and to
+    postprocessor_device_limit per destination filesystem.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.shows = {}
+        self.devices = {}
+
+    @contextmanager
+    def slot(self, show, device):
+        """
+        :param show: indexer id of the show the job is for, None when unknown
+        :param device: st_dev of the show folder, None when unknown
+        """
+        with self.lock:
+            show_lock = self.shows.setdefault(show, threading.Lock())
+            device_lock = self.devices.setdefault(device, threading.BoundedSemaphore(
+                max(sickrage.app.config.postprocessor_device_limit, 1)))
+
+        # always in this order, a job waiting for its device never holds up another show
+        with show_lock:
+            with device_lock:
+                yield
+
+
+process_limits = ProcessLimits()
+
 
 def delete_folder(folder, check_empty=True):
     """
@@ -257,6 +312,8 @@ def processDir(dirName, nzbName=None, process_method=None, force=False, is_prior
 
     result.output += logHelper(("Processing Failed", "Successfully processed")[result.agg_result],
                                (sickrage.app.log.WARNING, sickrage.app.log.INFO)[result.agg_result])
+    if result.processed_files:
+        result.output += logHelper(result.throughput())
     if result.missed_files:
         result.output += logHelper("Some items were not processed.")
         for missed_file in result.missed_files:
@@ -360,97 +417,123 @@ def unrar(path, rar_files, force, result):
 
     if sickrage.app.config.unpack == 1 and rar_files:
         result.output += logHelper("Packed Releases detected: {0}".format(rar_files), sickrage.app.log.DEBUG)
-        for archive in rar_files:
-            failure = None
-            rar_handle = None
-            try:
-                archive_path = os.path.join(path, archive)
-                if already_postprocessed(path, archive, force, result):
-                    result.output += logHelper("Archive file already post-processed, extraction skipped: {}".format
-                                               (archive_path), sickrage.app.log.DEBUG)
-                    continue
 
-                if not is_rar_file(archive_path):
-                    continue
+        # unrar runs in a process of its own for every archive, so the archives are extracted side by side
+        executor = ThreadPoolExecutor(max(sickrage.app.config.postprocessor_workers, 1))
 
-                result.output += logHelper("Checking if archive is valid and contains a video: {}".format(archive_path),
-                                           sickrage.app.log.DEBUG)
-                rar_handle = rarfile.RarFile(archive_path)
-                if rar_handle.needs_password():
-                    # TODO: Add support in settings for a list of passwords to try here with rar_handle.set_password(x)
-                    result.output += logHelper('Archive needs a password, skipping: {0}'.format(archive_path))
-                    continue
-
-                # If there are no video files in the rar, don't extract it
-                rar_media_files = filter(is_media_file, rar_handle.namelist())
-                if not rar_media_files:
-                    continue
-
-                rar_release_name = archive.rpartition('.')[0]
-
-                # Choose the directory we'll unpack to:
-                if sickrage.app.config.unpack_dir and os.path.isdir(sickrage.app.config.unpack_dir):
-                    unpack_base_dir = sickrage.app.config.unpack_dir
-                else:
-                    unpack_base_dir = path
-                    if sickrage.app.config.unpack_dir:  # Let user know if we can't unpack there
-                        result.output += logHelper('Unpack directory cannot be verified. Using {}'.format(path),
-                                                   sickrage.app.log.DEBUG)
-
-                # Fix up the list for checking if already processed
-                rar_media_files = [os.path.join(unpack_base_dir, rar_release_name, rar_media_file) for rar_media_file in
-                                   rar_media_files]
-
-                skip_rar = False
-                for rar_media_file in rar_media_files:
-                    check_path, check_file = os.path.split(rar_media_file)
-                    if already_postprocessed(check_path, check_file, force, result):
-                        result.output += logHelper(
-                            "Archive file already post-processed, extraction skipped: {0}".format
-                            (rar_media_file), sickrage.app.log.DEBUG)
-                        skip_rar = True
-                        break
-
-                if skip_rar:
-                    continue
-
-                rar_extract_path = os.path.join(unpack_base_dir, rar_release_name)
-                result.output += logHelper("Unpacking archive: {0}".format(archive), sickrage.app.log.DEBUG)
-                rar_handle.extractall(path=rar_extract_path)
-                unpacked_dirs.append(rar_extract_path)
-
-            except rarfile.RarCRCError:
-                failure = ('Archive Broken', 'Unpacking failed because of a CRC error')
-            except rarfile.RarWrongPassword:
-                failure = ('Incorrect RAR Password', 'Unpacking failed because of an Incorrect Rar Password')
-            except rarfile.PasswordRequired:
-                failure = ('Rar is password protected', 'Unpacking failed because it needs a password')
-            except rarfile.RarOpenError:
-                failure = ('Rar Open Error, check the parent folder and destination file permissions.',
-                           'Unpacking failed with a File Open Error (file permissions?)')
-            except rarfile.RarExecError:
-                failure = ('Invalid Rar Archive Usage',
-                           'Unpacking Failed with Invalid Rar Archive Usage. Is unrar installed and on the system PATH?')
-            except rarfile.BadRarFile:
-                failure = ('Invalid Rar Archive', 'Unpacking Failed with an Invalid Rar Archive Error')
-            except rarfile.NeedFirstVolume:
-                continue
-            except (Exception, rarfile.Error) as e:
-                failure = (e, 'Unpacking failed')
-            finally:
-                if rar_handle:
-                    del rar_handle
-
-            if failure:
-                result.output += logHelper('Failed to extract the archive {}: {}'.format(archive, failure[0]),
-                                           sickrage.app.log.WARNING)
-                result.missed_files.append('{} : Unpacking failed: {}'.format(archive, failure[1]))
-                result.result = False
-                continue
+        try:
+            for archive_result, rar_extract_path in [x.result() for x in [
+                executor.submit(unrar_archive, path, archive, force) for archive in rar_files]]:
+                result.merge(archive_result)
+                if rar_extract_path:
+                    unpacked_dirs.append(rar_extract_path)
+        finally:
+            executor.shutdown(wait=False)
 
     return unpacked_dirs
 
 
+def unrar_archive(path, archive, force):
+    """
+    Extracts a RAR file
+
+    :param path: Path the archive is in
+    :param archive: Name of the RAR file
+    :param force: process currently processing items
+    :return: Result of the extraction and the folder it was unpacked to, None if it wasn't
+    """
+
+    result = ProcessResult()
+
+    failure = None
+    rar_handle = None
+    try:
+        archive_path = os.path.join(path, archive)
+        if already_postprocessed(path, archive, force, result):
+            result.output += logHelper("Archive file already post-processed, extraction skipped: {}".format
+                                       (archive_path), sickrage.app.log.DEBUG)
+            return result, None
+
+        if not is_rar_file(archive_path):
+            return result, None
+
+        result.output += logHelper("Checking if archive is valid and contains a video: {}".format(archive_path),
+                                   sickrage.app.log.DEBUG)
+        rar_handle = rarfile.RarFile(archive_path)
+        if rar_handle.needs_password():
+            # TODO: Add support in settings for a list of passwords to try here with rar_handle.set_password(x)
+            result.output += logHelper('Archive needs a password, skipping: {0}'.format(archive_path))
+            return result, None
+
+        # If there are no video files in the rar, don't extract it
+        rar_media_files = filter(is_media_file, rar_handle.namelist())
+        if not rar_media_files:
+            return result, None
+
+        rar_release_name = archive.rpartition('.')[0]
+
+        # Choose the directory we'll unpack to:
+        if sickrage.app.config.unpack_dir and os.path.isdir(sickrage.app.config.unpack_dir):
+            unpack_base_dir = sickrage.app.config.unpack_dir
+        else:
+            unpack_base_dir = path
+            if sickrage.app.config.unpack_dir:  # Let user know if we can't unpack there
+                result.output += logHelper('Unpack directory cannot be verified. Using {}'.format(path),
+                                           sickrage.app.log.DEBUG)
+
+        # Fix up the list for checking if already processed
+        rar_media_files = [os.path.join(unpack_base_dir, rar_release_name, rar_media_file) for rar_media_file in
+                           rar_media_files]
+
+        skip_rar = False
+        for rar_media_file in rar_media_files:
+            check_path, check_file = os.path.split(rar_media_file)
+            if already_postprocessed(check_path, check_file, force, result):
+                result.output += logHelper(
+                    "Archive file already post-processed, extraction skipped: {0}".format
+                    (rar_media_file), sickrage.app.log.DEBUG)
+                skip_rar = True
+                break
+
+        if skip_rar:
+            return result, None
+
+        rar_extract_path = os.path.join(unpack_base_dir, rar_release_name)
+        result.output += logHelper("Unpacking archive: {0}".format(archive), sickrage.app.log.DEBUG)
+        rar_handle.extractall(path=rar_extract_path)
+        return result, rar_extract_path
+
+    except rarfile.RarCRCError:
+        failure = ('Archive Broken', 'Unpacking failed because of a CRC error')
+    except rarfile.RarWrongPassword:
+        failure = ('Incorrect RAR Password', 'Unpacking failed because of an Incorrect Rar Password')
+    except rarfile.PasswordRequired:
+        failure = ('Rar is password protected', 'Unpacking failed because it needs a password')
+    except rarfile.RarOpenError:
+        failure = ('Rar Open Error, check the parent folder and destination file permissions.',
+                   'Unpacking failed with a File Open Error (file permissions?)')
+    except rarfile.RarExecError:
+        failure = ('Invalid Rar Archive Usage',
+                   'Unpacking Failed with Invalid Rar Archive Usage. Is unrar installed and on the system PATH?')
+    except rarfile.BadRarFile:
+        failure = ('Invalid Rar Archive', 'Unpacking Failed with an Invalid Rar Archive Error')
+    except rarfile.NeedFirstVolume:
+        return result, None
+    except (Exception, rarfile.Error) as e:
+        failure = (e, 'Unpacking failed')
+    finally:
+        if rar_handle:
+            del rar_handle
+
+    if failure:
+        result.output += logHelper('Failed to extract the archive {}: {}'.format(archive, failure[0]),
+                                   sickrage.app.log.WARNING)
+        result.missed_files.append('{} : Unpacking failed: {}'.format(archive, failure[1]))
+        result.result = False
+
+    return result, None
+
+
 def already_postprocessed(dirName, videofile, force, result):
     """
     Check if we already post processed a file
@@ -509,34 +592,120 @@ def process_media(processPath, videoFiles, nzbName, process_method, force, is_pr
     :param result: Previous results
     """
 
-    processor = None
+    video_files = []
     for cur_video_file in videoFiles:
-        cur_video_file_path = os.path.join(processPath, cur_video_file)
-
         if already_postprocessed(processPath, cur_video_file, force, result):
             result.output += logHelper("Skipping already processed file: {0}".format(cur_video_file),
                                        sickrage.app.log.DEBUG)
             continue
+        video_files.append(cur_video_file)
+
+    if sickrage.app.config.postprocessor_workers <= 1 or len(video_files) <= 1:
+        for cur_video_file in video_files:
+            file_result = process_media_file(processPath, cur_video_file, nzbName, process_method, is_priority)
+            result.merge(file_result)
+            result.result = file_result.result
+        return
 
+    executor = ThreadPoolExecutor(sickrage.app.config.postprocessor_workers)
+
+    try:
+        futures = [executor.submit(process_media_file, processPath, cur_video_file, nzbName, process_method,
+                                   is_priority) for cur_video_file in video_files]
+    finally:
+        executor.shutdown(wait=False)
+
+    # results are added in the order of the files so the output reads the same as a serial run
+    no_free_space = None
+    for future in futures:
         try:
-            processor = post_processor.PostProcessor(cur_video_file_path, nzbName, process_method, is_priority)
+            file_result = future.result()
+        except NoFreeSpaceException as e:
+            no_free_space = e
+            continue
+
+        result.merge(file_result)
+        result.result = file_result.result
+
+    if no_free_space:
+        raise no_free_space
+
+
+def process_media_file(processPath, videoFile, nzbName, process_method, is_priority):
+    """
+    Postprocess a mediafile
+
+    :param processPath: Path to postprocess in
+    :param videoFile: Filename to postprocess
+    :param nzbName: Name of NZB file related
+    :param process_method: auto/manual
+    :param is_priority: Boolean, is this a priority download
+    :return: ProcessResult of the file
+    """
+
+    result = ProcessResult()
+    cur_video_file_path = os.path.join(processPath, videoFile)
+
+    try:
+        size = os.path.getsize(cur_video_file_path)
+    except OSError:
+        size = 0
+
+    processor = None
+    try:
+        processor = post_processor.PostProcessor(cur_video_file_path, nzbName, process_method, is_priority)
+
+        # post-processor queue items and the files of one download run side by side, wait for the show and volume
+        with process_limits.slot(*destination(processPath, videoFile, nzbName)):
             result.result = processor.process
-            process_fail_message = ""
-        except EpisodePostProcessingFailedException as e:
-            result.result = False
-            process_fail_message = "{}".format(e)
+        process_fail_message = ""
+    except EpisodePostProcessingFailedException as e:
+        result.result = False
+        process_fail_message = "{}".format(e)
 
-        if processor:
-            result.output += processor.log
+    if processor:
+        result.output += processor.log
 
-        if result.result:
-            result.output += logHelper("Processing succeeded for " + cur_video_file_path)
-        else:
-            result.output += logHelper(
-                "Processing failed for {0}: {1}".format(cur_video_file_path, process_fail_message),
-                sickrage.app.log.WARNING)
-            result.missed_files.append("{0} : Processing failed: {1}".format(cur_video_file_path, process_fail_message))
-            result.agg_result = False
+    if result.result:
+        result.output += logHelper("Processing succeeded for " + cur_video_file_path)
+        result.processed_files += 1
+        result.processed_bytes += size
+    else:
+        result.output += logHelper(
+            "Processing failed for {0}: {1}".format(cur_video_file_path, process_fail_message),
+            sickrage.app.log.WARNING)
+        result.missed_files.append("{0} : Processing failed: {1}".format(cur_video_file_path, process_fail_message))
+        result.agg_result = False
+
+    return result
+
+
+def destination(processPath, videoFile, nzbName):
+    """
+    Finds out where a mediafile will be moved to ahead of processing it, from the same names the post-processor
+    tries.
+
+    :return: tuple of the show indexer id and the device of the show folder, None for what couldn't be found
+    """
+
+    for name in (videoFile, os.path.basename(processPath), nzbName):
+        if not name:
+            continue
+
+        try:
+            parse_result = NameParser().parse(name, cache_result=False)
+        except (InvalidNameException, InvalidShowException):
+            continue
+
+        if not parse_result.show:
+            continue
+
+        try:
+            return parse_result.show.indexerid, os.stat(parse_result.show.location).st_dev
+        except OSError:
+            return parse_result.show.indexerid, None
+
+    return None, None
 
 
 def process_failed(dirName, nzbName, result):
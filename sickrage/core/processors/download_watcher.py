@@ -0,0 +1,342 @@
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import threading
+import time
+
+import sickrage
+from sickrage.core.helpers import is_sync_file, is_media_file, is_rar_file
+
+# seconds between scans of the download folder when inotify isn't available
+POLL_INTERVAL = 30
+
+
+class Inotify(object):
+    """
+    Watches a directory tree with the Linux inotify api, new sub folders are watched as they show up.
+    """
+
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    IN_CLOEXEC = 0x00080000
+
+    MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | \
+           IN_DELETE_SELF | IN_MOVE_SELF
+
+    EVENT = struct.Struct(b'iIII')
+
+    def __init__(self, path):
+        """
+        :raises OSError: when inotify isn't available or the tree can't be watched
+        """
+        self.path = path
+        self.watches = {}
+
+        libc_name = ctypes.util.find_library(b'c')
+        if not libc_name:
+            raise OSError(errno.ENOSYS, 'libc not found')
+
+        try:
+            libc = ctypes.CDLL(libc_name, use_errno=True)
+            self._inotify_add_watch = libc.inotify_add_watch
+            self._inotify_init1 = libc.inotify_init1
+        except (OSError, AttributeError):
+            raise OSError(errno.ENOSYS, 'inotify not supported')
+
+        self._inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+
+        self.fd = self._inotify_init1(self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), os.strerror(ctypes.get_errno()))
+
+        try:
+            self._watch_tree(path)
+        except OSError:
+            self.close()
+            raise
+
+    def _watch_tree(self, path):
+        """
+        :return: files found in the tree, for folders moved in or created before their watch was added
+        """
+        files = []
+
+        for root, dirs, file_names in os.walk(path, followlinks=sickrage.app.config.processor_follow_symlinks):
+            wd = self._inotify_add_watch(self.fd, root.encode('utf-8') if isinstance(root, unicode) else root,
+                                         self.MASK)
+            if wd < 0:
+                if root == path:
+                    raise OSError(ctypes.get_errno(), os.strerror(ctypes.get_errno()))
+                continue
+
+            self.watches[wd] = root
+            files += [os.path.join(root, x) for x in file_names]
+
+        return files
+
+    def read(self, timeout):
+        """
+        Waits up to timeout seconds for changes.
+
+        :return: list of changed paths, None when the watched folder itself is gone or events were lost
+        """
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return []
+
+        data = os.read(self.fd, 65536)
+
+        paths = []
+        offset = 0
+        while offset + self.EVENT.size <= len(data):
+            wd, mask, __, length = self.EVENT.unpack_from(data, offset)
+            name = data[offset + self.EVENT.size:offset + self.EVENT.size + length].rstrip(b'\0')
+            offset += self.EVENT.size + length
+
+            if mask & self.IN_Q_OVERFLOW:
+                return None
+
+            if mask & self.IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+
+            root = self.watches.get(wd)
+            if root is None:
+                continue
+
+            if mask & (self.IN_DELETE_SELF | self.IN_MOVE_SELF):
+                if root == self.path:
+                    return None
+                continue
+
+            path = os.path.join(root, name.decode('utf-8', 'replace')) if name else root
+            paths.append(path)
+
+            if mask & self.IN_ISDIR and mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                paths += self._watch_tree(path)
+
+        return paths
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class Poller(object):
+    """
+    Fallback for Inotify, compares the size and modification time of every file in the tree between scans.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.files = self._scan()
+        self.last_scan = time.time()
+
+    def _scan(self):
+        files = {}
+
+        for root, __, file_names in os.walk(self.path, followlinks=sickrage.app.config.processor_follow_symlinks):
+            for file_name in file_names:
+                try:
+                    st = os.stat(os.path.join(root, file_name))
+                except OSError:
+                    continue
+                files[os.path.join(root, file_name)] = (st.st_size, st.st_mtime)
+
+        return files
+
+    def read(self, timeout):
+        time.sleep(timeout)
+
+        if time.time() - self.last_scan < POLL_INTERVAL:
+            return []
+
+        if not os.path.isdir(self.path):
+            return None
+
+        files = self._scan()
+        self.last_scan = time.time()
+        paths = [x for x in set(files) | set(self.files) if files.get(x) != self.files.get(x)]
+        self.files = files
+
+        return paths
+
+    def close(self):
+        self.files = {}
+
+
+class DownloadWatcher(object):
+    """
+    Queues post-processing of downloads as they complete instead of waiting for the next AutoPostProcessor run.
+
+    A download is a folder or a media/archive file directly inside the download folder. It is queued once nothing
+    in it has changed for autopostprocessor_settle seconds and it holds no sync files, the AutoPostProcessor keeps
+    running as a sweep for anything the watcher missed.
+    """
+
+    def __init__(self):
+        self.name = "WATCHER"
+        self.thread = None
+        self.stop = threading.Event()
+
+        self.path = None
+        self.backend = None
+        self.pending = {}
+
+    @property
+    def enabled(self):
+        return sickrage.app.config.process_automatically and sickrage.app.config.autopostprocessor_watch and \
+               os.path.isdir(sickrage.app.config.tv_download_dir or '')
+
+    def start(self):
+        self.stop.clear()
+        self.thread = threading.Thread(target=self.run, name=self.name)
+        self.thread.setDaemon(True)
+        self.thread.start()
+
+    def shutdown(self):
+        self.stop.set()
+        if self.thread and self.thread.is_alive():
+            self.thread.join(10)
+        self.unwatch()
+
+    def watch(self, path):
+        self.unwatch()
+
+        try:
+            self.backend = Inotify(path)
+            sickrage.app.log.debug("Watching {} for completed downloads".format(path))
+        except OSError as e:
+            self.backend = Poller(path)
+            sickrage.app.log.debug("Unable to watch {} with inotify, scanning it every {}s instead: {}".format(
+                path, POLL_INTERVAL, e))
+
+        self.path = path
+
+    def unwatch(self):
+        if self.backend:
+            self.backend.close()
+        self.backend = self.path = None
+        self.pending.clear()
+
+    def download(self, path):
+        """
+        :return: the folder or file directly inside the download folder path belongs to, None for the folder itself
+        """
+        relpath = os.path.relpath(path, self.path)
+        if relpath == os.curdir or relpath.startswith(os.pardir):
+            return None
+
+        return os.path.join(self.path, relpath.split(os.sep)[0])
+
+    def changed(self, paths, now=None):
+        now = now or time.time()
+
+        for path in paths:
+            if is_sync_file(os.path.basename(path)):
+                continue
+
+            download = self.download(path)
+            if download:
+                self.pending[download] = now
+
+    def ready(self, now=None):
+        """
+        Takes the pending downloads that have settled out of the pending list.
+
+        :return: list of (dirName, nzbName) to post-process
+        """
+        now = now or time.time()
+
+        items = []
+        files = []
+        for download, last_change in self.pending.items():
+            if now - last_change < sickrage.app.config.autopostprocessor_settle:
+                continue
+
+            if os.path.isdir(download):
+                if sickrage.app.config.postpone_if_sync_files and self._has_sync_files(download):
+                    self.pending[download] = now
+                    continue
+                items.append((download, None))
+            elif os.path.isfile(download) and (is_media_file(download) or is_rar_file(download)):
+                files.append(os.path.basename(download))
+
+            del self.pending[download]
+
+        # queue items are unique per folder, several files in the download folder itself are processed together
+        if len(files) == 1:
+            items.append((self.path, files[0]))
+        elif files:
+            items.append((self.path, None))
+
+        return items
+
+    @staticmethod
+    def _has_sync_files(path):
+        for __, __, file_names in os.walk(path, followlinks=sickrage.app.config.processor_follow_symlinks):
+            if any(is_sync_file(x) for x in file_names):
+                return True
+
+        return False
+
+    def run(self):
+        while not self.stop.is_set():
+            if not self.enabled:
+                self.unwatch()
+                self.stop.wait(10)
+                continue
+
+            try:
+                if self.path != sickrage.app.config.tv_download_dir:
+                    self.watch(sickrage.app.config.tv_download_dir)
+
+                paths = self.backend.read(1)
+                if paths is None:
+                    # lost track of the folder, start over and leave what happened meanwhile to the sweep
+                    self.unwatch()
+                    continue
+
+                self.changed(paths)
+
+                for dirName, nzbName in self.ready():
+                    sickrage.app.log.info("Download completed in {}, queueing it for post-processing".format(
+                        os.path.join(dirName, nzbName or '')))
+                    sickrage.app.postprocessor_queue.put(dirName, nzbName=nzbName)
+            except Exception as e:
+                sickrage.app.log.warning("Download folder watcher error: {}".format(e))
+                self.unwatch()
+                self.stop.wait(10)
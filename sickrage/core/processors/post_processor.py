@@ -717,16 +717,16 @@ class PostProcessor(object):
                 airdate = episodes[0].toordinal()
 
                 # Ignore season 0 when searching for episode(Conflict between special and regular episode, same air date)
-                dbData = [x for x in sickrage.app.main_db.get_many('tv_episodes', show.indexerid)
-                          if x['indexer'] == show.indexer and x['airdate'] == airdate and x['season'] != 0]
+                dbData = [x for x in sickrage.app.main_db.get_many('tv_episodes_airdate', (show.indexerid, airdate))
+                          if x['indexer'] == show.indexer and x['season'] != 0]
 
                 if dbData:
                     season = int(dbData[0]['season'])
                     episodes = [int(dbData[0]['episode'])]
                 else:
                     # Found no result, try with season 0
-                    dbData = [x for x in sickrage.app.main_db.get_many('tv_episodes', show.indexerid)
-                              if x['indexer'] == show.indexer and x['airdate'] == airdate]
+                    dbData = [x for x in sickrage.app.main_db.get_many('tv_episodes_airdate', (show.indexerid, airdate))
+                              if x['indexer'] == show.indexer]
 
                     if dbData:
                         season = int(dbData[0]['season'])
@@ -1183,33 +1183,32 @@ class PostProcessor(object):
         # log it to history
         History.logDownload(ep_obj, self.file_path, new_ep_quality, self.release_group, new_ep_version)
 
-        # If any notification fails, don't stop postProcessor
-        try:
-            # send notifications
-            Notifiers.mass_notify_download(ep_obj._format_pattern('%SN - %Sx%0E - %EN - %QN'))
+        # send notifications, they run in the background so a slow server doesn't hold up post-processing
+        Notifiers.mass_notify_download(ep_obj._format_pattern('%SN - %Sx%0E - %EN - %QN'))
 
-            # do the library update for KODI
-            sickrage.app.notifier_providers['kodi'].update_library(ep_obj.show.name)
+        # do the library update for KODI
+        Notifiers.dispatch('kodi', sickrage.app.notifier_providers['kodi'].update_library, (ep_obj.show.name,),
+                           key=ep_obj.show.indexerid, failed=lambda x: x is False)
 
-            # do the library update for Plex
-            sickrage.app.notifier_providers['plex'].update_library(ep_obj)
+        # do the library update for Plex
+        Notifiers.dispatch('plex', sickrage.app.notifier_providers['plex'].update_library, (ep_obj,),
+                           key=ep_obj.show.indexerid, failed=lambda x: x not in (None, False))
 
-            # do the library update for EMBY
-            sickrage.app.notifier_providers['emby'].update_library(ep_obj.show)
+        # do the library update for EMBY
+        Notifiers.dispatch('emby', sickrage.app.notifier_providers['emby'].update_library, (ep_obj.show,),
+                           key=ep_obj.show.indexerid, failed=lambda x: x is False)
 
-            # do the library update for NMJ
-            # nmj_notifier kicks off its library update when the notify_download is issued (inside notifiers)
+        # do the library update for NMJ
+        # nmj_notifier kicks off its library update when the notify_download is issued (inside notifiers)
 
-            # do the library update for Synology Indexer
-            sickrage.app.notifier_providers['synoindex'].addFile(ep_obj.location)
+        # do the library update for Synology Indexer
+        Notifiers.dispatch('synoindex', sickrage.app.notifier_providers['synoindex'].addFile, (ep_obj.location,))
 
-            # do the library update for pyTivo
-            sickrage.app.notifier_providers['pytivo'].update_library(ep_obj)
+        # do the library update for pyTivo
+        Notifiers.dispatch('pytivo', sickrage.app.notifier_providers['pytivo'].update_library, (ep_obj,))
 
-            # do the library update for Trakt
-            sickrage.app.notifier_providers['trakt'].update_library(ep_obj)
-        except Exception:
-            sickrage.app.log.info("Some notifications could not be sent. Continuing with post-processing...")
+        # do the library update for Trakt
+        Notifiers.dispatch('trakt', sickrage.app.notifier_providers['trakt'].update_library, (ep_obj,))
 
         self._run_extra_scripts(ep_obj)
 
@@ -20,13 +20,15 @@
 from __future__ import unicode_literals
 
 try:
-    from Queue import PriorityQueue, Empty, Queue
+    from Queue import Queue
 except ImportError:
-    from queue import PriorityQueue, Empty, Queue
+    from queue import Queue
 
-import time
 import datetime
+import heapq
 import threading
+import time
+import traceback
 
 import sickrage
 
@@ -39,63 +41,182 @@ class srQueuePriorities(object):
     PAUSED = 99
 
 
+class srQueueStats(object):
+    """
+    Wait and run time totals per queue item type
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.data = {}
+
+    def _entry(self, item_type):
+        return self.data.setdefault(item_type, {'completed': 0,
+                                                'total_wait': 0.0, 'max_wait': 0.0,
+                                                'total_run': 0.0, 'max_run': 0.0})
+
+    def add(self, item):
+        wait_time = item.start_time - item.queue_time
+        run_time = item.stop_time - item.start_time
+
+        with self.lock:
+            entry = self._entry(item.__class__.__name__)
+            entry['completed'] += 1
+            entry['total_wait'] += wait_time
+            entry['max_wait'] = max(entry['max_wait'], wait_time)
+            entry['total_run'] += run_time
+            entry['max_run'] = max(entry['max_run'], run_time)
+
+    def get(self, queued=None, running=None):
+        """
+        Returns the totals per item type along with how many items of each type are queued and running
+
+        :param queued: item type names currently queued
+        :param running: item type names currently running
+        :return: dict of item type to stats
+        """
+        queued = queued or []
+        running = running or []
+
+        with self.lock:
+            for item_type in set(queued + running):
+                self._entry(item_type)
+            stats = dict((k, dict(v)) for k, v in self.data.items())
+
+        for item_type, entry in stats.items():
+            entry['queued'] = queued.count(item_type)
+            entry['running'] = running.count(item_type)
+            entry['avg_wait'] = entry['total_wait'] / entry['completed'] if entry['completed'] else 0.0
+            entry['avg_run'] = entry['total_run'] / entry['completed'] if entry['completed'] else 0.0
+
+        return stats
+
+
 class srQueue(threading.Thread):
     def __init__(self, name="QUEUE"):
         super(srQueue, self).__init__(name=name)
         self.daemon = True
-        self._queue = PriorityQueue()
+        self._queue = []
         self._result_queue = Queue()
-        self.currentItem = None
+        self.running = []
         self.min_priority = srQueuePriorities.EXTREME
         self.amActive = False
-        self.lock = threading.Lock()
+        self.lock = threading.RLock()
+        self.condition = threading.Condition(self.lock)
         self.stop = threading.Event()
+        self.stats = srQueueStats()
 
     def run(self):
         """
-        Process items in this queue
+        Process items in this queue, sleeps until an item is added or a running item finishes
         """
 
-        while not self.stop.is_set():
-            with self.lock:
-                self.amActive = True
-
-                if not self.is_paused:
-                    if self.currentItem:
-                        if self.next_item_priority < self.currentItem.priority:
-                            __ = self.currentItem
-                            self.currentItem = self.get()
-                            self.currentItem.start()
-                            self.currentItem.join()
-                            self.currentItem = __
-
-                    if not self.currentItem or not self.currentItem.isAlive():
-                        if self.currentItem:
-                            self.currentItem = None
+        with self.condition:
+            while not self.stop.is_set():
+                item = self._next_item()
+                if item is None:
+                    self.amActive = False
+                    self.condition.wait()
+                    continue
 
-                        self.currentItem = self.get()
-                        self.currentItem.start()
+                self.amActive = True
+                self._start_item(item)
 
-                self.amActive = False
+    @property
+    def workers(self):
+        """
+        Number of items allowed to run at the same time
+        """
+        return 1
 
-            time.sleep(1)
+    @property
+    def currentItem(self):
+        try:
+            return self.running[0]
+        except IndexError:
+            return None
 
     @property
     def queue(self):
-        return self._queue.queue
+        return self._queue
+
+    @property
+    def all_items(self):
+        """
+        Queued items followed by running items
+        """
+        with self.condition:
+            return [x for __, __, x in self._queue] + list(self.running)
 
     @property
     def next_item_priority(self):
         try:
-            priority, __, __ = self._queue.queue[0]
+            priority, __, __ = self._queue[0]
         except IndexError:
             priority = srQueuePriorities.LOW
 
         return priority
 
-    def get(self, *args, **kwargs):
-        __, __, item = self._queue.get(*args, **kwargs)
-        return item
+    @staticmethod
+    def _show_keys(item):
+        """
+        Keys of the show an item works on, add items have no show until they ran so they are keyed on the indexer
+        id and folder of the show they add
+        """
+        keys = {getattr(getattr(item, 'show', None), 'indexerid', None),
+                getattr(item, 'indexer_id', None),
+                getattr(item, 'showDir', None)}
+
+        return keys - {None}
+
+    def _next_item(self):
+        """
+        Pops the highest priority item that may start now.
+
+        Items for a show that already has a running item are skipped, once all workers are busy only an item with
+        a higher priority than every running item may start.
+        """
+
+        if self.is_paused or not self._queue:
+            return None
+
+        running_shows = set()
+        for x in self.running:
+            running_shows |= self._show_keys(x)
+
+        for entry in sorted(self._queue):
+            __, __, item = entry
+
+            if self._show_keys(item) & running_shows:
+                continue
+
+            if len(self.running) >= self.workers:
+                if len(self.running) > self.workers or item.priority >= min(x.priority for x in self.running):
+                    return None
+
+            self._queue.remove(entry)
+            heapq.heapify(self._queue)
+            return item
+
+    def _start_item(self, item):
+        item.start_time = time.time()
+        self.running.append(item)
+
+        thread = threading.Thread(target=self._run_item, args=(item,), name=item.name)
+        thread.daemon = True
+        thread.start()
+
+    def _run_item(self, item):
+        try:
+            item.run()
+        except Exception:
+            sickrage.app.log.debug(traceback.format_exc())
+        finally:
+            with self.condition:
+                item.stop_time = time.time()
+                self.running.remove(item)
+                self.stats.add(item)
+                self.condition.notify_all()
 
     def put(self, item, *args, **kwargs):
         """
@@ -105,11 +226,38 @@ class srQueue(threading.Thread):
         :return: item
         """
         item.added = datetime.datetime.now()
+        item.queue_time = time.time()
         item.name = "{}-{}".format(self.name, item.name)
         item.result_queue = self._result_queue
-        self._queue.put((item.priority, time.time(), item), *args, **kwargs)
+
+        with self.condition:
+            heapq.heappush(self._queue, (item.priority, item.queue_time, item))
+            self.condition.notify_all()
+
         return item
 
+    def remove(self, item):
+        """
+        Removes a queued item that has not started yet
+
+        :param item: Queue object to remove
+        """
+        with self.condition:
+            self._queue[:] = [x for x in self._queue if x[2] is not item]
+            heapq.heapify(self._queue)
+
+    def get_stats(self):
+        """
+        Returns depth, wait time and run time per item type
+
+        :return: dict of item type to stats
+        """
+        with self.condition:
+            queued = [x.__class__.__name__ for __, __, x in self._queue]
+            running = [x.__class__.__name__ for x in self.running]
+
+        return self.stats.get(queued, running)
+
     @property
     def is_paused(self):
         return self.min_priority == srQueuePriorities.PAUSED
@@ -122,24 +270,39 @@ class srQueue(threading.Thread):
     def unpause(self):
         """Unpauses this queue"""
         sickrage.app.log.info("Unpausing queue")
-        self.min_priority = srQueuePriorities.EXTREME
+        with self.condition:
+            self.min_priority = srQueuePriorities.EXTREME
+            self.condition.notify_all()
 
     def shutdown(self):
-        self.stop.set()
+        with self.condition:
+            self.stop.set()
+            self.condition.notify_all()
+
         try:
             self.join(1)
         except:
             pass
 
 
-class srQueueItem(threading.Thread):
+class srQueueItem(object):
     def __init__(self, name, action_id=0):
-        super(srQueueItem, self).__init__(name=name.replace(" ", "-").upper())
-        self.daemon = True
+        self.name = name.replace(" ", "-").upper()
         self.lock = threading.Lock()
         self.stop = threading.Event()
         self.priority = srQueuePriorities.NORMAL
         self.action_id = action_id
         self.added = None
+        self.queue_time = None
+        self.start_time = None
+        self.stop_time = None
         self.result = None
         self.result_queue = None
+
+    def run(self):
+        pass
+
+    def is_alive(self):
+        return self.start_time is not None and self.stop_time is None
+
+    isAlive = is_alive
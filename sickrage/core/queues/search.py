@@ -22,6 +22,8 @@ import threading
 import time
 import traceback
 
+from concurrent.futures import ThreadPoolExecutor
+
 import sickrage
 from sickrage.core.common import cpu_presets
 from sickrage.core.queues import srQueue, srQueueItem, srQueuePriorities
@@ -48,6 +50,21 @@ def fifo(my_list, item, max_size=100):
 class SearchQueue(srQueue):
     def __init__(self):
         srQueue.__init__(self, "SEARCHQUEUE")
+        self.provider_executor = None
+
+    def start(self):
+        # provider searches of all search queue items share these workers
+        self.provider_executor = ThreadPoolExecutor(max(sickrage.app.config.provider_search_workers, 1))
+        super(SearchQueue, self).start()
+
+    def shutdown(self):
+        super(SearchQueue, self).shutdown()
+        if self.provider_executor:
+            self.provider_executor.shutdown(wait=False)
+
+    @property
+    def workers(self):
+        return max(sickrage.app.config.search_queue_workers, 1)
 
     def is_in_queue(self, show, segment):
         for __, __, cur_item in self.queue:
@@ -94,20 +111,20 @@ class SearchQueue(srQueue):
 
     def is_manualsearch_in_progress(self):
         # Only referenced in webviews.py, only current running manualsearch or failedsearch is needed!!
-        if isinstance(self.currentItem, (ManualSearchQueueItem, FailedQueueItem)):
-            return True
+        return len(self.get_running_manual_searches()) > 0
 
-        return False
+    def get_running_manual_searches(self):
+        return [x for x in list(self.running) if isinstance(x, (ManualSearchQueueItem, FailedQueueItem))]
 
     def is_backlog_in_progress(self):
-        for __, __, cur_item in self.queue + [(None, None, self.currentItem)]:
+        for cur_item in self.all_items:
             if isinstance(cur_item, BacklogQueueItem):
                 return True
 
         return False
 
     def is_dailysearch_in_progress(self):
-        for __, __, cur_item in self.queue + [(None, None, self.currentItem)]:
+        for cur_item in self.all_items:
             if isinstance(cur_item, DailySearchQueueItem):
                 return True
 
@@ -115,7 +132,7 @@ class SearchQueue(srQueue):
 
     def queue_length(self):
         length = {'backlog': 0, 'daily': 0, 'manual': 0, 'failed': 0}
-        for __, __, cur_item in self.queue + [(None, None, self.currentItem)]:
+        for cur_item in self.all_items:
             if isinstance(cur_item, DailySearchQueueItem):
                 length['daily'] += 1
             elif isinstance(cur_item, BacklogQueueItem):
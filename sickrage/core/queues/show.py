@@ -43,6 +43,10 @@ class ShowQueue(srQueue):
     def __init__(self):
         srQueue.__init__(self, "SHOWQUEUE")
 
+    @property
+    def workers(self):
+        return max(sickrage.app.config.show_queue_workers, 1)
+
     @property
     def loading_show_list(self):
         return self._get_loading_show_list()
@@ -52,7 +56,7 @@ class ShowQueue(srQueue):
                                   x.action_id in actions] if show else False
 
     def _is_being(self, show, actions):
-        return self.currentItem is not None and show == self.currentItem.show and self.currentItem.action_id in actions
+        return any(show == x.show and x.action_id in actions for x in list(self.running))
 
     def is_in_update_queue(self, show):
         return self._is_in_queue(show, (ShowQueueActions.UPDATE, ShowQueueActions.FORCEUPDATE))
@@ -85,7 +89,7 @@ class ShowQueue(srQueue):
         return self._is_being(show, (ShowQueueActions.SUBTITLE,))
 
     def _get_loading_show_list(self):
-        return [x for __, __, x in self.queue + [(None, None, self.currentItem)] if x and x.is_loading]
+        return [x for x in self.all_items if x and x.is_loading]
 
     def updateShow(self, show, force=False):
         if self.is_being_added(show):
@@ -154,9 +158,9 @@ class ShowQueue(srQueue):
             raise CantRemoveShowException("{} is already queued to be removed".format(show))
 
         # remove other queued actions for this show.
-        for __, __, x in self.queue:
-            if x and x.show and x != self.currentItem and show.indexerid == x.show.indexerid:
-                self.queue.remove(x)
+        for __, __, x in list(self.queue):
+            if x and x.show and show.indexerid == x.show.indexerid:
+                self.remove(x)
 
         return self.put(QueueItemRemove(show=show, full=full))
 
@@ -204,7 +208,7 @@ class ShowQueueItem(srQueueItem):
         self.show.flushEpisodes()
 
     def is_in_queue(self):
-        return self in sickrage.app.show_queue.queue + [sickrage.app.show_queue.currentItem]
+        return self in sickrage.app.show_queue.all_items
 
     @property
     def show_name(self):
@@ -576,40 +580,48 @@ class QueueItemUpdate(ShowQueueItem):
         except Exception as e:
             sickrage.app.log.warning("Error loading IMDb info for {}: {}".format(IndexerApi(self.show.indexer).name, e))
 
-        # get episode list from DB
-        DBEpList = self.show.loadEpisodesFromDB()
-        IndexerEpList = None
-
-        # get episode list from TVDB
-        try:
-            IndexerEpList = self.show.loadEpisodesFromIndexer()
-        except indexer_exception as e:
-            sickrage.app.log.error("Unable to get info from " + IndexerApi(
-                self.show.indexer).name + ", the show info will not be refreshed: {}".format(e))
-
-        if not IndexerEpList:
-            sickrage.app.log.error("No data returned from " + IndexerApi(
-                self.show.indexer).name + ", unable to update this show")
+        if not self.force:
+            # only write what changed on the indexer, a forced update reloads every episode
+            try:
+                self.show.updateEpisodesFromIndexer()
+            except indexer_exception as e:
+                sickrage.app.log.error("Unable to get info from " + IndexerApi(
+                    self.show.indexer).name + ", the show info will not be refreshed: {}".format(e))
         else:
-            # for each ep we found on indexer delete it from the DB list
-            for curSeason in IndexerEpList:
-                for curEpisode in IndexerEpList[curSeason]:
-                    if curSeason in DBEpList and curEpisode in DBEpList[curSeason]:
-                        del DBEpList[curSeason][curEpisode]
-
-            # remaining episodes in the DB list are not on the indexer, just delete them from the DB
-            for curSeason in DBEpList:
-                for curEpisode in DBEpList[curSeason]:
-                    sickrage.app.log.info(
-                        "Permanently deleting episode " + str(curSeason) + "x" + str(curEpisode) + " from the database")
-                    try:
-                        self.show.getEpisode(curSeason, curEpisode).deleteEpisode()
-                    except EpisodeDeletedException:
-                        pass
-
-        # cleanup
-        scrub(DBEpList)
-        scrub(IndexerEpList)
+            # get episode list from DB
+            DBEpList = self.show.loadEpisodesFromDB()
+            IndexerEpList = None
+
+            # get episode list from TVDB
+            try:
+                IndexerEpList = self.show.loadEpisodesFromIndexer()
+            except indexer_exception as e:
+                sickrage.app.log.error("Unable to get info from " + IndexerApi(
+                    self.show.indexer).name + ", the show info will not be refreshed: {}".format(e))
+
+            if not IndexerEpList:
+                sickrage.app.log.error("No data returned from " + IndexerApi(
+                    self.show.indexer).name + ", unable to update this show")
+            else:
+                # for each ep we found on indexer delete it from the DB list
+                for curSeason in IndexerEpList:
+                    for curEpisode in IndexerEpList[curSeason]:
+                        if curSeason in DBEpList and curEpisode in DBEpList[curSeason]:
+                            del DBEpList[curSeason][curEpisode]
+
+                # remaining episodes in the DB list are not on the indexer, just delete them from the DB
+                for curSeason in DBEpList:
+                    for curEpisode in DBEpList[curSeason]:
+                        sickrage.app.log.info(
+                            "Permanently deleting episode " + str(curSeason) + "x" + str(curEpisode) + " from the database")
+                        try:
+                            self.show.getEpisode(curSeason, curEpisode).deleteEpisode()
+                        except EpisodeDeletedException:
+                            pass
+
+            # cleanup
+            scrub(DBEpList)
+            scrub(IndexerEpList)
 
         sickrage.app.quicksearch_cache.update_show(self.show.indexerid)
 
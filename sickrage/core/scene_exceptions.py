@@ -39,6 +39,11 @@ xem_exception_dict = {}
 exceptionsCache = {}
 exceptionsSeasonCache = {}
 
+# lowercased and sanitized exception names mapped to [(indexer_id, season)], built from the cache db on first lookup
+exceptionsNameCache = {}
+exceptionsSanitizedNameCache = {}
+exceptionsNameCacheDB = []
+
 exceptionLock = threading.Lock()
 
 
@@ -139,6 +144,7 @@ def retrieve_exceptions(get_xem=True, get_anidb=True):
                     'show_name': cur_exception,
                     'season': curSeason
                 })
+                _add_exception_name(cur_exception, cur_indexer_id, curSeason)
 
     if updated_exceptions:
         sickrage.app.log.debug("Updated scene exceptions")
@@ -225,37 +231,90 @@ def get_scene_exception_by_name_multiple(show_name):
     is present.
     """
 
-    out = []
+    _load_exception_names()
 
     # try the obvious case first
-    exception_result = [x for x in sorted(sickrage.app.cache_db.all('scene_exceptions'), key=lambda d: d['season']) if
-                        x['show_name'].lower() == show_name.lower()]
+    exception_result = exceptionsNameCache.get(show_name.lower())
     if exception_result:
-        return [(int(x['indexer_id']), int(x['season'])) for x in exception_result]
-
-    for cur_exception in sorted(sickrage.app.cache_db.all('scene_exceptions'), key=lambda d: d['season']):
-        cur_exception_name = cur_exception['show_name']
-        cur_indexer_id = int(cur_exception['indexer_id'])
-        cur_season = int(cur_exception['season'])
-
-        if show_name.lower() in (
-                cur_exception_name.lower(),
-                sanitizeSceneName(cur_exception_name).lower().replace('.', ' ')):
-            sickrage.app.log.debug(
-                "Scene exception lookup got indexer id " + str(cur_indexer_id) + ", using that")
-            out.append((cur_indexer_id, cur_season))
+        return list(exception_result)
 
+    out = exceptionsSanitizedNameCache.get(show_name.lower())
     if out:
-        return out
+        sickrage.app.log.debug(
+            "Scene exception lookup got indexer id " + str(out[0][0]) + ", using that")
+        return list(out)
+
     return [(None, None)]
 
 
+def _load_exception_names():
+    """
+    Builds the exception name lookups from the cache db, once per opened cache db
+
+    :return: True if the lookups were just (re)built
+    """
+
+    if exceptionsNameCacheDB and exceptionsNameCacheDB[0] is sickrage.app.cache_db:
+        return False
+
+    with exceptionLock:
+        if exceptionsNameCacheDB and exceptionsNameCacheDB[0] is sickrage.app.cache_db:
+            return False
+
+        exceptionsNameCache.clear()
+        exceptionsSanitizedNameCache.clear()
+        del exceptionsNameCacheDB[:]
+
+        for cur_exception in sickrage.app.cache_db.all('scene_exceptions'):
+            _add_exception_name(cur_exception['show_name'], cur_exception['indexer_id'], cur_exception['season'],
+                                load=False)
+
+        exceptionsNameCacheDB.append(sickrage.app.cache_db)
+
+    _exception_names_changed()
+    return True
+
+
+def _exception_names_changed():
+    # cached parse results may resolve to a different show now
+    from sickrage.core.nameparser import name_parser_cache
+    name_parser_cache.clear()
+
+
+def _add_exception_name(show_name, indexer_id, season, load=True):
+    # a fresh build already picked up the exception from the cache db
+    if load and _load_exception_names():
+        return
+
+    for cache, name in [(exceptionsNameCache, show_name.lower()),
+                        (exceptionsSanitizedNameCache, sanitizeSceneName(show_name).lower().replace('.', ' '))]:
+        cache.setdefault(name, []).append((int(indexer_id), int(season)))
+        cache[name].sort(key=lambda x: x[1])
+
+    if load:
+        _exception_names_changed()
+
+
+def _remove_exception_name(show_name, indexer_id, season):
+    _load_exception_names()
+
+    for cache, name in [(exceptionsNameCache, show_name.lower()),
+                        (exceptionsSanitizedNameCache, sanitizeSceneName(show_name).lower().replace('.', ' '))]:
+        cache[name] = [x for x in cache.get(name, []) if x != (int(indexer_id), int(season))]
+        if not cache[name]:
+            del cache[name]
+
+    _exception_names_changed()
+
+
 def update_scene_exceptions(indexer_id, scene_exceptions, season=-1):
     """
     Given a indexer_id, and a list of all show scene exceptions, update the db.
     """
-    [sickrage.app.cache_db.delete(x) for x in sickrage.app.cache_db.get_many('scene_exceptions', indexer_id)
-     if x['season'] == season]
+    for x in list(sickrage.app.cache_db.get_many('scene_exceptions', indexer_id)):
+        if x['season'] == season:
+            sickrage.app.cache_db.delete(x)
+            _remove_exception_name(x['show_name'], indexer_id, season)
 
     sickrage.app.log.info("Updating scene exceptions")
 
@@ -271,6 +330,7 @@ def update_scene_exceptions(indexer_id, scene_exceptions, season=-1):
             'show_name': cur_exception,
             'season': season
         })
+        _add_exception_name(cur_exception, indexer_id, season)
 
 
 def _anidb_exceptions_fetcher():
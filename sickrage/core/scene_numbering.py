@@ -267,10 +267,8 @@ def find_xem_numbering(indexer_id, indexer, season, episode):
 
     xem_refresh(indexer_id, indexer)
 
-    dbData = [x for x in sickrage.app.main_db.get_many('tv_episodes', indexer_id)
+    dbData = [x for x in sickrage.app.main_db.get_many('tv_episodes_season_episode', (indexer_id, season, episode))
               if x['indexer'] == indexer
-              and x['season'] == season
-              and x['episode'] == episode
               and x['scene_season'] != 0
               and x['scene_episode'] != 0]
 
@@ -531,9 +529,11 @@ def xem_refresh(indexer_id, indexer, force=False):
 
             for entry in parsedJSON['data']:
                 try:
-                    dbData = [x for x in sickrage.app.main_db.get_many('tv_episodes', indexer_id)
-                              if x['season'] == entry[IndexerApi(indexer).config['xem_origin']]['season']
-                              and x['episode'] == entry[IndexerApi(indexer).config['xem_origin']]['episode']][0]
+                    dbData = sickrage.app.main_db.get('tv_episodes_season_episode', (
+                        indexer_id,
+                        entry[IndexerApi(indexer).config['xem_origin']]['season'],
+                        entry[IndexerApi(indexer).config['xem_origin']]['episode']
+                    ))
                 except:
                     continue
 
@@ -569,8 +569,7 @@ def get_absolute_number_from_season_and_episode(show, season, episode):
     absolute_number = None
 
     if season and episode:
-        dbData = [x for x in sickrage.app.main_db.get_many('tv_episodes', show.indexerid)
-                  if x['season'] == season and x['episode'] == episode]
+        dbData = list(sickrage.app.main_db.get_many('tv_episodes_season_episode', (show.indexerid, season, episode)))
 
         if len(dbData) == 1:
             absolute_number = try_int(dbData[0].get("absolute_number"))
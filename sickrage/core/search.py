@@ -21,8 +21,11 @@ from __future__ import unicode_literals
 
 import re
 import threading
+import time
 from datetime import date, timedelta
 
+from concurrent.futures import CancelledError, wait
+
 import sickrage
 from sickrage.clients import getClientIstance
 from sickrage.clients.nzbget import NZBGet
@@ -33,6 +36,7 @@ from sickrage.core.exceptions import AuthException
 from sickrage.core.helpers import show_names
 from sickrage.core.nzbSplitter import splitNZBResult
 from sickrage.core.tv.show.history import FailedHistory, History
+from sickrage.core.websession import deadline
 from sickrage.notifiers import Notifiers
 from sickrage.providers import NZBProvider, NewznabProvider, TorrentProvider, TorrentRssProvider
 
@@ -328,11 +332,137 @@ def searchProviders(show, episodes, manualSearch=False, downCurQuality=False, up
 
     origThreadName = threading.currentThread().getName()
 
+    def search_provider(providerObj, cancel=None):
+        provider_results = {}
+
+        search_count = 0
+        search_mode = providerObj.search_mode
+
+        # Always search for episode when manually searching when in sponly
+        if search_mode == 'sponly' and manualSearch == True:
+            search_mode = 'eponly'
+
+        threadName = threading.currentThread().getName()
+        start_time = time.time()
+
+        while not (cancel and cancel.is_set()):
+            search_count += 1
+
+            try:
+                threading.currentThread().setName(origThreadName + "::[" + providerObj.name + "]")
+
+                # update provider RSS cache
+                if sickrage.app.config.enable_rss_cache and updateCache:
+                    providerObj.cache.update()
+
+                if len(episodes):
+                    if search_mode == 'eponly':
+                        sickrage.app.log.info("Performing episode search for " + show.name)
+                    else:
+                        sickrage.app.log.info("Performing season pack search for " + show.name)
+
+                # search provider for episodes
+                search_results = providerObj.findSearchResults(show,
+                                                               episodes,
+                                                               search_mode,
+                                                               manualSearch,
+                                                               downCurQuality,
+                                                               cacheOnly)
+            except AuthException as e:
+                sickrage.app.log.warning("Authentication error: {}".format(e))
+                break
+            except Exception as e:
+                sickrage.app.log.error(
+                    "Error while searching " + providerObj.name + ", skipping: {}".format(e))
+                break
+            finally:
+                threading.currentThread().setName(threadName)
+
+            if len(search_results):
+                # make a list of all the results for this provider
+                for curEp in search_results:
+                    if curEp in provider_results:
+                        provider_results[curEp] += search_results[curEp]
+                    else:
+                        provider_results[curEp] = search_results[curEp]
+
+                    # Sort results by seeders if available
+                    if providerObj.type == 'torrent' or getattr(providerObj, 'torznab', False):
+                        provider_results[curEp].sort(key=lambda k: int(k.seeders), reverse=True)
+
+                break
+            elif not providerObj.search_fallback or search_count == 2:
+                break
+
+            if search_mode == 'sponly':
+                sickrage.app.log.debug("Fallback episode search initiated")
+                search_mode = 'eponly'
+            else:
+                sickrage.app.log.debug("Fallback season pack search initiate")
+                search_mode = 'sponly'
+
+        sickrage.app.log.info("Searching {} took {:.2f}s".format(providerObj.name, time.time() - start_time))
+
+        return provider_results
+
+    def search_providers_concurrently(providers):
+        """
+        Searches the providers on the workers of the search queue, results are handed back in provider order and
+        each provider gets provider_search_timeout seconds from the moment its search starts, which also bounds the
+        requests it makes so a timed out search doesn't keep a worker busy
+        """
+
+        timeout = max(sickrage.app.config.provider_search_timeout, 1)
+        executor = sickrage.app.search_queue.provider_executor if sickrage.app.search_queue else None
+
+        if not executor:
+            for providerObj in providers:
+                with deadline(timeout):
+                    provider_results = search_provider(providerObj)
+                yield providerObj, provider_results
+            return
+
+        jobs = []
+        for providerObj in providers:
+            job = {'provider': providerObj, 'started': None, 'cancel': threading.Event()}
+
+            def run(job=job):
+                job['started'] = time.time()
+                with deadline(timeout):
+                    return search_provider(job['provider'], job['cancel'])
+
+            job['future'] = executor.submit(run)
+            jobs.append(job)
+
+        try:
+            for job in jobs:
+                while not job['future'].done():
+                    remaining = (job['started'] or time.time()) + timeout - time.time()
+                    if remaining <= 0:
+                        break
+                    wait([job['future']], timeout=remaining)
+
+                if not job['future'].done():
+                    sickrage.app.log.warning(
+                        "Searching {} took longer than {}s, skipping it".format(job['provider'].name, timeout))
+                    job['cancel'].set()
+                    job['future'].cancel()
+                    yield job['provider'], {}
+                else:
+                    try:
+                        yield job['provider'], job['future'].result()
+                    except CancelledError:
+                        yield job['provider'], {}
+        finally:
+            for job in jobs:
+                job['cancel'].set()
+                job['future'].cancel()
+
     def perform_searches():
-        search_results = {}
         found_results = {}
         final_results = []
 
+        providers = []
         for providerID, providerObj in sickrage.app.search_providers.sort(
                 randomize=sickrage.app.config.randomize_providers).items():
 
@@ -351,70 +481,15 @@ def searchProviders(show, episodes, manualSearch=False, downCurQuality=False, up
                 sickrage.app.log.debug("" + str(show.name) + " is not an anime, skiping")
                 continue
 
-            found_results[providerObj.name] = {}
-
-            search_count = 0
-            search_mode = providerObj.search_mode
-
-            # Always search for episode when manually searching when in sponly
-            if search_mode == 'sponly' and manualSearch == True:
-                search_mode = 'eponly'
-
-            while True:
-                search_count += 1
+            providers.append(providerObj)
 
-                try:
-                    threading.currentThread().setName(origThreadName + "::[" + providerObj.name + "]")
-
-                    # update provider RSS cache
-                    if sickrage.app.config.enable_rss_cache and updateCache:
-                        providerObj.cache.update()
-
-                    if len(episodes):
-                        if search_mode == 'eponly':
-                            sickrage.app.log.info("Performing episode search for " + show.name)
-                        else:
-                            sickrage.app.log.info("Performing season pack search for " + show.name)
-
-                    # search provider for episodes
-                    search_results = providerObj.findSearchResults(show,
-                                                                   episodes,
-                                                                   search_mode,
-                                                                   manualSearch,
-                                                                   downCurQuality,
-                                                                   cacheOnly)
-                except AuthException as e:
-                    sickrage.app.log.warning("Authentication error: {}".format(e))
-                    break
-                except Exception as e:
-                    sickrage.app.log.error(
-                        "Error while searching " + providerObj.name + ", skipping: {}".format(e))
-                    break
-                finally:
-                    threading.currentThread().setName(origThreadName)
-
-                if len(search_results):
-                    # make a list of all the results for this provider
-                    for curEp in search_results:
-                        if curEp in found_results:
-                            found_results[providerObj.name][curEp] += search_results[curEp]
-                        else:
-                            found_results[providerObj.name][curEp] = search_results[curEp]
-
-                        # Sort results by seeders if available
-                        if providerObj.type == 'torrent' or getattr(providerObj, 'torznab', False):
-                            found_results[providerObj.name][curEp].sort(key=lambda k: int(k.seeders), reverse=True)
-
-                    break
-                elif not providerObj.search_fallback or search_count == 2:
-                    break
+        if sickrage.app.config.concurrent_provider_search and len(providers) > 1:
+            provider_searches = search_providers_concurrently(providers)
+        else:
+            provider_searches = ((providerObj, search_provider(providerObj)) for providerObj in providers)
 
-                if search_mode == 'sponly':
-                    sickrage.app.log.debug("Fallback episode search initiated")
-                    search_mode = 'eponly'
-                else:
-                    sickrage.app.log.debug("Fallback season pack search initiate")
-                    search_mode = 'sponly'
+        for providerObj, provider_results in provider_searches:
+            found_results[providerObj.name] = provider_results
 
             # skip to next provider if we have no results to process
             if not len(found_results[providerObj.name]):
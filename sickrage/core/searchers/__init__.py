@@ -23,7 +23,7 @@ import datetime
 
 import sickrage
 from sickrage.core import helpers
-from sickrage.core.common import UNAIRED, SKIPPED, statusStrings
+from sickrage.core.common import Quality, UNAIRED, SKIPPED, statusStrings
 from sickrage.core.updaters import tz_updater
 
 
@@ -37,8 +37,9 @@ def new_episode_finder():
     show = None
     curTime = datetime.datetime.now(sickrage.app.tz)
 
-    for episode in sickrage.app.main_db.all('tv_episodes'):
-        if not all([episode['status'] == UNAIRED, episode['season'] > 0, episode['airdate'] > 1]):
+    # statuses get changed below, so take the matching rows out of the index before walking them
+    for episode in list(sickrage.app.main_db.get_episodes_by_status([UNAIRED], 2, curDate.toordinal())):
+        if not episode['season'] > 0:
             continue
 
         if not show or int(episode["showid"]) != show.indexerid:
@@ -75,5 +76,24 @@ def new_episode_finder():
 
             ep_obj.saveToDB()
 
+
+def episodes_by_status(statuses, start=None, end=None):
+    """
+    Looks up the episodes in any of the given base statuses, at any quality, grouped by show.
+
+    :param statuses: base episode statuses, e.g. WANTED or DOWNLOADED
+    :param start: first airdate ordinal
+    :param end: last airdate ordinal
+    :return: dict of show indexer id to list of episode rows
+    """
+    composite = [Quality.compositeStatus(status, quality) for status in statuses for quality in Quality.qualityStrings]
+
+    episodes = {}
+    for episode in sickrage.app.main_db.get_episodes_by_status(composite, start, end):
+        episodes.setdefault(int(episode['showid']), []).append(episode)
+
+    return episodes
+
+
 def get_backlog_cycle_time():
     return max([sickrage.app.config.daily_searcher_freq * 4, 30])
\ No newline at end of file
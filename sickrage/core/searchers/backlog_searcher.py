@@ -24,10 +24,12 @@ import threading
 import sickrage
 from sickrage.core.common import Quality, DOWNLOADED, SNATCHED, SNATCHED_PROPER, WANTED
 from sickrage.core.queues.search import BacklogQueueItem
-from sickrage.core.searchers import new_episode_finder
+from sickrage.core.searchers import new_episode_finder, episodes_by_status
 
 
 class BacklogSearcher(object):
+    statuses = (WANTED, DOWNLOADED, SNATCHED, SNATCHED_PROPER)
+
     def __init__(self, *args, **kwargs):
         self.name = "BACKLOG"
         self.lock = threading.Lock()
@@ -89,6 +91,8 @@ class BacklogSearcher(object):
         # find new released episodes and update their statuses
         new_episode_finder()
 
+        episodes = episodes_by_status(self.statuses, from_date.toordinal(), cur_date - 1)
+
         # go through non air-by-date shows and see if they need any episodes
         for curShow in show_list:
             if curShow.paused:
@@ -97,7 +101,7 @@ class BacklogSearcher(object):
 
             self._last_backlog_search = self._get_last_backlog_search(curShow.indexerid)
 
-            segments = self._get_segments(curShow, from_date)
+            segments = self._get_segments(curShow, from_date, episodes.get(curShow.indexerid, []))
             sickrage.app.search_queue.put(BacklogQueueItem(curShow, segments))
 
             if not segments:
@@ -111,15 +115,19 @@ class BacklogSearcher(object):
         self.amActive = False
 
     @staticmethod
-    def _get_segments(show, from_date):
+    def _get_segments(show, from_date, episodes=None):
+        today = datetime.date.today().toordinal()
+        if episodes is None:
+            episodes = episodes_by_status(BacklogSearcher.statuses, from_date.toordinal(), today - 1).get(
+                show.indexerid, [])
+
         anyQualities, bestQualities = Quality.splitQuality(show.quality)
 
         sickrage.app.log.debug("Seeing if we need anything from {}".format(show.name))
 
         # check through the list of statuses to see if we want any
         wanted = []
-        for result in (x for x in sickrage.app.main_db.get_many('tv_episodes', show.indexerid) if
-                       x['season'] > 0 and datetime.date.today().toordinal() > x['airdate'] >= from_date.toordinal()):
+        for result in (x for x in episodes if x['season'] > 0 and today > x['airdate'] >= from_date.toordinal()):
 
             curStatus, curQuality = Quality.splitCompositeStatus(int(result["status"] or -1))
 
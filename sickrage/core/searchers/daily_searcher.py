@@ -25,10 +25,12 @@ import threading
 import sickrage
 from sickrage.core.common import Quality, WANTED, DOWNLOADED, SNATCHED, SNATCHED_PROPER
 from sickrage.core.queues.search import DailySearchQueueItem
-from sickrage.core.searchers import new_episode_finder
+from sickrage.core.searchers import new_episode_finder, episodes_by_status
 
 
 class DailySearcher(object):
+    statuses = (WANTED, DOWNLOADED, SNATCHED, SNATCHED_PROPER)
+
     def __init__(self):
         self.name = "DAILYSEARCHER"
         self.lock = threading.Lock()
@@ -50,12 +52,15 @@ class DailySearcher(object):
         # find new released episodes and update their statuses
         new_episode_finder()
 
+        from_date = datetime.date.today()
+        episodes = episodes_by_status(self.statuses, from_date.toordinal())
+
         for curShow in sickrage.app.showlist:
             if curShow.paused:
                 sickrage.app.log.debug("Skipping search for {} because the show is paused".format(curShow.name))
                 continue
 
-            segments = self._get_segments(curShow, datetime.date.today())
+            segments = self._get_segments(curShow, from_date, episodes.get(curShow.indexerid, []))
             sickrage.app.search_queue.put(DailySearchQueueItem(curShow, segments))
 
             if not segments:
@@ -64,14 +69,18 @@ class DailySearcher(object):
         self.amActive = False
 
     @staticmethod
-    def _get_segments(show, fromDate):
+    def _get_segments(show, fromDate, episodes=None):
         """
         Get a list of episodes that we want to download
         :param show: Show these episodes are from
         :param fromDate: Search from a certain date
+        :param episodes: episode rows of this show already looked up by status, fetched when not given
         :return: list of wanted episodes
         """
 
+        if episodes is None:
+            episodes = episodes_by_status(DailySearcher.statuses, fromDate.toordinal()).get(show.indexerid, [])
+
         wanted = []
 
         anyQualities, bestQualities = Quality.splitQuality(show.quality)
@@ -80,7 +89,7 @@ class DailySearcher(object):
         sickrage.app.log.debug("Seeing if we need anything from {}".format(show.name))
 
         # check through the list of statuses to see if we want any
-        for dbData in sickrage.app.main_db.get_many('tv_episodes', show.indexerid):
+        for dbData in episodes:
             if dbData['season'] > 0 and dbData['airdate'] >= fromDate.toordinal():
                 curStatus, curQuality = Quality.splitCompositeStatus(int(dbData["status"] or -1))
 
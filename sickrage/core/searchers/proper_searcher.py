@@ -27,11 +27,12 @@ import time
 import traceback
 
 import sickrage
-from sickrage.core.common import DOWNLOADED, Quality, SNATCHED, SNATCHED_PROPER, cpu_presets
+from sickrage.core.common import DOWNLOADED, Quality, SNATCHED, SNATCHED_BEST, SNATCHED_PROPER, cpu_presets
 from sickrage.core.exceptions import AuthException
 from sickrage.core.helpers import remove_non_release_groups
 from sickrage.core.nameparser import InvalidNameException, InvalidShowException, NameParser
 from sickrage.core.search import pickBestResult, snatchEpisode
+from sickrage.core.searchers import episodes_by_status
 from sickrage.core.tv.show.history import History
 from sickrage.providers import NZBProvider, NewznabProvider, TorrentProvider, TorrentRssProvider
 
@@ -75,13 +76,12 @@ class ProperSearcher(object):
         origThreadName = threading.currentThread().getName()
 
         recently_aired = []
+        episodes = episodes_by_status((DOWNLOADED, SNATCHED, SNATCHED_BEST), search_date.toordinal())
+
         for show in sickrage.app.showlist:
             self._lastProperSearch = self._get_lastProperSearch(show.indexerid)
 
-            for episode in sickrage.app.main_db.get_many('tv_episodes', show.indexerid):
-                if episode['airdate'] >= str(search_date.toordinal()):
-                    if episode['status'] in Quality.DOWNLOADED + Quality.SNATCHED + Quality.SNATCHED_BEST:
-                        recently_aired += [episode]
+            recently_aired += episodes.get(show.indexerid, [])
 
             self._set_lastProperSearch(show.indexerid, datetime.datetime.today().toordinal())
 
@@ -137,7 +137,7 @@ class ProperSearcher(object):
 
         for curProper in sortedPropers:
             try:
-                myParser = NameParser(False)
+                myParser = NameParser(False, remote_lookups=not sickrage.app.config.defer_show_lookups)
                 parse_result = myParser.parse(curProper.name)
             except InvalidNameException:
                 sickrage.app.log.debug(
@@ -65,10 +65,9 @@ class SubtitleSearcher(object):
         today = datetime.date.today().toordinal()
 
         results = []
-        for s in sickrage.app.showlist:
+        for s in (s for s in sickrage.app.showlist if s.subtitles == 1):
             for e in (e for e in sickrage.app.main_db.get_many('tv_episodes', s.indexerid)
-                      if s.subtitles == 1
-                         and e['location'] != ''
+                      if e['location'] != ''
                          and e['subtitles'] not in sickrage.subtitles.wanted_languages()
                          and (e['subtitles_searchcount'] <= 2 or (
                         e['subtitles_searchcount'] <= 7 and (today - e['airdate'])))):
@@ -19,6 +19,9 @@
 from __future__ import unicode_literals
 
 import datetime
+import hashlib
+import itertools
+import json
 import os
 import re
 import threading
@@ -76,6 +79,7 @@ class TVEpisode(object):
         self.scene_season = 0
         self.scene_episode = 0
         self.scene_absolute_number = 0
+        self.indexer_fingerprint = ""
 
         self.populateEpisode(self.season, self.episode)
 
@@ -379,12 +383,13 @@ class TVEpisode(object):
         sickrage.app.log.debug("%s: Loading episode details from DB for episode %s S%02dE%02d" % (
             self.show.indexerid, self.show.name, season or 0, episode or 0))
 
-        dbData = [x for x in sickrage.app.main_db.get_many('tv_episodes', self.show.indexerid)
-                  if x['season'] == season and x['episode'] == episode]
+        dbData = list(sickrage.app.main_db.get_many('tv_episodes_season_episode',
+                                                    (self.show.indexerid, season, episode)))
 
         if len(dbData) > 1:
             for ep in dbData:
-                sickrage.app.main_db.delete(ep)
+                sickrage.app.show_stats.update_episode(self.show.indexerid, old=ep,
+                                                       write=lambda: sickrage.app.main_db.delete(ep))
             return False
         elif len(dbData) == 0:
             sickrage.app.log.debug("%s: Episode S%02dE%02d not found in the database" % (
@@ -413,6 +418,7 @@ class TVEpisode(object):
             self.scene_season = try_int(dbData[0]["scene_season"], self.scene_season)
             self.scene_episode = try_int(dbData[0]["scene_episode"], self.scene_episode)
             self.scene_absolute_number = try_int(dbData[0]["scene_absolute_number"], self.scene_absolute_number)
+            self.indexer_fingerprint = dbData[0].get("indexer_fingerprint", self.indexer_fingerprint)
 
             if self.scene_absolute_number == 0:
                 self.scene_absolute_number = get_scene_absolute_numbering(
@@ -430,6 +436,18 @@ class TVEpisode(object):
 
             return True
 
+    @staticmethod
+    def fingerprint(data):
+        """
+        Hash of the indexer data loadFromIndexer uses, tells whether an episode changed on the indexer since it was
+        last loaded.
+
+        :param data: indexer episode
+        """
+        return hashlib.sha1(json.dumps([safe_getattr(data, x) for x in (
+            'id', 'episodename', 'absolutenumber', 'overview', 'firstaired'
+        )]).encode('utf-8')).hexdigest()
+
     def loadFromIndexer(self, season=None, episode=None, cache=True, tvapi=None, cachedSeason=None):
         indexer_name = IndexerApi(self.indexer).name
 
@@ -532,6 +550,11 @@ class TVEpisode(object):
                 self.deleteEpisode()
             return False
 
+        fingerprint = self.fingerprint(myEp)
+        if self.indexer_fingerprint != fingerprint:
+            self.dirty = True
+        self.indexer_fingerprint = fingerprint
+
         # don't update show status if show dir is missing, unless it's missing on purpose
         if not os.path.isdir(
                 self.show.location) and not sickrage.app.config.create_missing_show_dirs and not sickrage.app.config.add_shows_wo_dir:
@@ -715,9 +738,16 @@ class TVEpisode(object):
         # delete myself from the DB
         sickrage.app.log.debug("Deleting myself from the database")
 
-        [sickrage.app.main_db.delete(x) for x in
-         sickrage.app.main_db.get_many('tv_episodes', self.show.indexerid)
-         if x['season'] == self.season and x['episode'] == self.episode]
+        # write out what is still queued so a pending insert doesn't bring us back
+        batch = sickrage.app.main_db.current_batch
+        if batch is not None:
+            batch.flush()
+            batch.cache.get(('tv_episodes', self.show.indexerid), {}).pop(self.indexerid, None)
+
+        for x in sickrage.app.main_db.get_many('tv_episodes_season_episode',
+                                               (self.show.indexerid, self.season, self.episode)):
+            sickrage.app.show_stats.update_episode(self.show.indexerid, old=x,
+                                                   write=lambda: sickrage.app.main_db.delete(x))
 
         data = sickrage.app.notifier_providers['trakt'].trakt_episode_data_generate([(self.season, self.episode)])
         if sickrage.app.config.use_trakt and sickrage.app.config.trakt_sync_watchlist and data:
@@ -771,18 +801,51 @@ class TVEpisode(object):
             "absolute_number": self.absolute_number,
             "scene_absolute_number": self.scene_absolute_number,
             "version": self.version,
-            "release_group": self.release_group
+            "release_group": self.release_group,
+            "indexer_fingerprint": self.indexer_fingerprint
         }
 
+        batch = sickrage.app.main_db.current_batch
+        if batch is not None:
+            # look up the rows of the show once per batch instead of once per episode
+            rows = batch.cache.get(('tv_episodes', self.show.indexerid))
+            if rows is None:
+                rows = batch.cache[('tv_episodes', self.show.indexerid)] = {}
+                for x in sickrage.app.main_db.get_many('tv_episodes', self.show.indexerid):
+                    rows.setdefault(x['indexerid'], x)
+
+            x = rows.get(self.indexerid)
+            if x is not None:
+                old = dict(x)
+                x.update(tv_episode)
+                sickrage.app.show_stats.update_episode(self.show.indexerid, old=old, new=x,
+                                                       write=lambda: batch.update(x), batch=batch)
+            else:
+                rows[self.indexerid] = tv_episode
+                sickrage.app.show_stats.update_episode(self.show.indexerid, new=tv_episode,
+                                                       write=lambda: batch.insert(tv_episode), batch=batch)
+
+            return
+
+        # check the row stored at our season/episode first, the rest of the show is only read when it isn't there,
+        # the episode may have been stored at another season/episode before
+        rows = itertools.chain(
+            sickrage.app.main_db.get_many('tv_episodes_season_episode',
+                                          (self.show.indexerid, self.season, self.episode)),
+            sickrage.app.main_db.get_many('tv_episodes', self.show.indexerid))
+
         try:
-            for x in sickrage.app.main_db.get_many('tv_episodes', self.show.indexerid):
+            for x in rows:
                 if x['indexerid'] == self.indexerid:
+                    old = dict(x)
                     x.update(tv_episode)
-                    sickrage.app.main_db.update(x)
+                    sickrage.app.show_stats.update_episode(self.show.indexerid, old=old, new=x,
+                                                           write=lambda: sickrage.app.main_db.update(x))
                     return
             raise RecordNotFound
         except RecordNotFound:
-            sickrage.app.main_db.insert(tv_episode)
+            sickrage.app.show_stats.update_episode(self.show.indexerid, new=tv_episode,
+                                                   write=lambda: sickrage.app.main_db.insert(tv_episode))
 
     def fullPath(self):
         if self.location is None or self.location == "":
@@ -103,7 +103,8 @@ class TVShow(object):
     def name(self, value):
         if self._name != value:
             self.dirty = True
-        self._name = value
+            self._name = value
+            sickrage.app.showlist.reindex(self)
 
     @property
     def indexerid(self):
@@ -113,7 +114,8 @@ class TVShow(object):
     def indexerid(self, value):
         if self._indexerid != value:
             self.dirty = True
-        self._indexerid = value
+            self._indexerid = value
+            sickrage.app.showlist.reindex(self)
 
     @property
     def indexer(self):
@@ -123,7 +125,8 @@ class TVShow(object):
     def indexer(self, value):
         if self._indexer != value:
             self.dirty = True
-        self._indexer = value
+            self._indexer = value
+            sickrage.app.showlist.reindex(self)
 
     @property
     def imdbid(self):
@@ -493,10 +496,9 @@ class TVShow(object):
                            and r['location'] != '' and r['location'] == cur_result['location']
                            and r['episode'] != cur_result['episode']]) > 0:
 
-                    related_eps_result = sorted([x for x in sickrage.app.main_db.get_many('tv_episodes', self.indexerid)
-                                                 if x['season'] == cur_ep.season
-                                                 and x['location'] == cur_ep.location
-                                                 and x['episode'] == cur_ep.episode], key=lambda d: d['episode'])
+                    related_eps_result = sorted([x for x in sickrage.app.main_db.get_many(
+                        'tv_episodes_season_episode', (self.indexerid, cur_ep.season, cur_ep.episode))
+                                                 if x['location'] == cur_ep.location], key=lambda d: d['episode'])
 
                     for cur_related_ep in related_eps_result:
                         related_ep = self.getEpisode(int(cur_related_ep["season"]), int(cur_related_ep["episode"]))
@@ -640,45 +642,46 @@ class TVShow(object):
         # get file list
         mediaFiles = list_media_files(self.location)
 
-        # create TVEpisodes from each media file (if possible)
-        for mediaFile in mediaFiles:
-            curEpisode = None
+        # create TVEpisodes from each media file (if possible), saving them in one batch
+        with sickrage.app.main_db.batch():
+            for mediaFile in mediaFiles:
+                curEpisode = None
 
-            sickrage.app.log.debug(str(self.indexerid) + ": Creating episode from " + mediaFile)
-            try:
-                curEpisode = self.make_ep_from_file(os.path.join(self.location, mediaFile))
-            except (ShowNotFoundException, EpisodeNotFoundException) as e:
-                sickrage.app.log.warning("Episode " + mediaFile + " returned an exception: {}".format(e))
-            except EpisodeDeletedException:
-                sickrage.app.log.debug("The episode deleted itself when I tried making an object for it")
+                sickrage.app.log.debug(str(self.indexerid) + ": Creating episode from " + mediaFile)
+                try:
+                    curEpisode = self.make_ep_from_file(os.path.join(self.location, mediaFile))
+                except (ShowNotFoundException, EpisodeNotFoundException) as e:
+                    sickrage.app.log.warning("Episode " + mediaFile + " returned an exception: {}".format(e))
+                except EpisodeDeletedException:
+                    sickrage.app.log.debug("The episode deleted itself when I tried making an object for it")
+
+                # skip to next episode?
+                if not curEpisode:
+                    continue
 
-            # skip to next episode?
-            if not curEpisode:
-                continue
+                # see if we should save the release name in the db
+                ep_file_name = os.path.basename(curEpisode.location)
+                ep_file_name = os.path.splitext(ep_file_name)[0]
 
-            # see if we should save the release name in the db
-            ep_file_name = os.path.basename(curEpisode.location)
-            ep_file_name = os.path.splitext(ep_file_name)[0]
+                try:
+                    parse_result = NameParser(False, showObj=self).parse(ep_file_name)
+                except (InvalidNameException, InvalidShowException):
+                    parse_result = None
 
-            try:
-                parse_result = NameParser(False, showObj=self).parse(ep_file_name)
-            except (InvalidNameException, InvalidShowException):
-                parse_result = None
+                if ' ' not in ep_file_name and parse_result and parse_result.release_group:
+                    sickrage.app.log.debug("Name " + ep_file_name + " gave release group of " +
+                                           parse_result.release_group + ", seems valid")
+                    curEpisode.release_name = ep_file_name
 
-            if ' ' not in ep_file_name and parse_result and parse_result.release_group:
-                sickrage.app.log.debug(
-                    "Name " + ep_file_name + " gave release group of " + parse_result.release_group + ", seems valid")
-                curEpisode.release_name = ep_file_name
-
-            # store the reference in the show
-            if self.subtitles and sickrage.app.config.use_subtitles:
-                try:
-                    curEpisode.refreshSubtitles()
-                except Exception:
-                    sickrage.app.log.error("%s: Could not refresh subtitles" % self.indexerid)
-                    sickrage.app.log.debug(traceback.format_exc())
+                # store the reference in the show
+                if self.subtitles and sickrage.app.config.use_subtitles:
+                    try:
+                        curEpisode.refreshSubtitles()
+                    except Exception:
+                        sickrage.app.log.error("%s: Could not refresh subtitles" % self.indexerid)
+                        sickrage.app.log.debug(traceback.format_exc())
 
-            curEpisode.saveToDB()
+                curEpisode.saveToDB()
 
     def loadEpisodesFromDB(self):
         scannedEps = {}
@@ -725,35 +728,36 @@ class TVShow(object):
             str(self.indexerid) + ": Loading all episodes from " + IndexerApi(
                 self.indexer).name + "..")
 
-        for season in showObj:
-            scannedEps[season] = {}
-            for episode in showObj[season]:
-                # need some examples of wtf episode 0 means to decide if we want it or not
-                if episode == 0:
-                    continue
+        with sickrage.app.main_db.batch():
+            for season in showObj:
+                scannedEps[season] = {}
+                for episode in showObj[season]:
+                    # need some examples of wtf episode 0 means to decide if we want it or not
+                    if episode == 0:
+                        continue
 
-                try:
-                    curEp = self.getEpisode(season, episode)
-                except EpisodeNotFoundException:
-                    sickrage.app.log.info(
-                        "%s: %s object for S%02dE%02d is incomplete, skipping this episode" % (
-                            self.indexerid, IndexerApi(self.indexer).name, season or 0, episode or 0))
-                    continue
-                else:
                     try:
-                        curEp.loadFromIndexer(tvapi=t)
-                    except EpisodeDeletedException:
-                        sickrage.app.log.info("The episode was deleted, skipping the rest of the load")
+                        curEp = self.getEpisode(season, episode)
+                    except EpisodeNotFoundException:
+                        sickrage.app.log.info(
+                            "%s: %s object for S%02dE%02d is incomplete, skipping this episode" % (
+                                self.indexerid, IndexerApi(self.indexer).name, season or 0, episode or 0))
                         continue
+                    else:
+                        try:
+                            curEp.loadFromIndexer(tvapi=t)
+                        except EpisodeDeletedException:
+                            sickrage.app.log.info("The episode was deleted, skipping the rest of the load")
+                            continue
 
-                with curEp.lock:
-                    sickrage.app.log.debug("%s: Loading info from %s for episode S%02dE%02d" % (
-                        self.indexerid, IndexerApi(self.indexer).name, season or 0, episode or 0))
+                    with curEp.lock:
+                        sickrage.app.log.debug("%s: Loading info from %s for episode S%02dE%02d" % (
+                            self.indexerid, IndexerApi(self.indexer).name, season or 0, episode or 0))
 
-                    curEp.loadFromIndexer(season, episode, tvapi=t)
-                    curEp.saveToDB()
+                        curEp.loadFromIndexer(season, episode, tvapi=t)
+                        curEp.saveToDB()
 
-                scannedEps[season][episode] = True
+                    scannedEps[season][episode] = True
 
         # Done updating save last update date
         self.last_update = datetime.date.today().toordinal()
@@ -761,6 +765,105 @@ class TVShow(object):
 
         return scannedEps
 
+    def updateEpisodesFromIndexer(self, cache=True, tvapi=None):
+        """
+        Differential version of loadEpisodesFromIndexer for show updates, only loads and writes the episodes whose
+        indexer data changed since they were stored and only deletes the episodes that are gone from the indexer.
+
+        Episodes still unaired or of unknown status are always loaded, their status depends on the current date.
+
+        :return: dict of unchanged, updated, added and removed episode counts
+        """
+        from sickrage.core.tv.episode import TVEpisode
+
+        t = tvapi
+        if not t:
+            lINDEXER_API_PARMS = IndexerApi(self.indexer).api_params.copy()
+            lINDEXER_API_PARMS['cache'] = cache
+
+            lINDEXER_API_PARMS['language'] = self.lang or sickrage.app.config.indexer_default_language
+
+            if self.dvdorder != 0:
+                lINDEXER_API_PARMS['dvdorder'] = True
+
+            t = IndexerApi(self.indexer).indexer(**lINDEXER_API_PARMS)
+        showObj = t[self.indexerid]
+
+        sickrage.app.log.debug("{}: Updating changed episodes from {}..".format(
+            self.indexerid, IndexerApi(self.indexer).name))
+
+        counts = {'unchanged': 0, 'updated': 0, 'added': 0, 'removed': 0}
+        returned = False
+
+        rows = {}
+        for x in sickrage.app.main_db.get_many('tv_episodes', self.indexerid):
+            rows.setdefault((int(x['season']), int(x['episode'])), x)
+
+        with sickrage.app.main_db.batch():
+            for season in showObj:
+                for episode in showObj[season]:
+                    # need some examples of wtf episode 0 means to decide if we want it or not
+                    if episode == 0:
+                        continue
+
+                    returned = True
+                    row = rows.pop((season, episode), None)
+                    if row and row['status'] not in [UNAIRED, UNKNOWN] and row.get(
+                            'indexer_fingerprint') == TVEpisode.fingerprint(showObj[season][episode]):
+                        counts['unchanged'] += 1
+                        continue
+
+                    try:
+                        curEp = self.getEpisode(season, episode)
+                    except EpisodeNotFoundException:
+                        sickrage.app.log.info(
+                            "%s: %s object for S%02dE%02d is incomplete, skipping this episode" % (
+                                self.indexerid, IndexerApi(self.indexer).name, season or 0, episode or 0))
+                        continue
+
+                    with curEp.lock:
+                        try:
+                            curEp.loadFromIndexer(season, episode, tvapi=t)
+                        except EpisodeDeletedException:
+                            sickrage.app.log.info("The episode was deleted, skipping the rest of the load")
+                            continue
+
+                        if not row:
+                            counts['added'] += 1
+                        elif row.get('indexer_fingerprint') != curEp.indexer_fingerprint \
+                                or row['status'] != curEp.status:
+                            counts['updated'] += 1
+                        else:
+                            counts['unchanged'] += 1
+                            continue
+
+                        curEp.saveToDB()
+
+        if not returned:
+            # an empty or incomplete answer from the indexer would otherwise remove every episode of the show
+            sickrage.app.log.error("No data returned from " + IndexerApi(
+                self.indexer).name + ", unable to update this show")
+            rows.clear()
+
+        # remaining episodes in the DB are not on the indexer anymore
+        for season, episode in sorted(rows):
+            sickrage.app.log.info(
+                "Permanently deleting episode " + str(season) + "x" + str(episode) + " from the database")
+            try:
+                self.getEpisode(season, episode).deleteEpisode()
+            except EpisodeDeletedException:
+                counts['removed'] += 1
+
+        sickrage.app.log.info(
+            "{}: {unchanged} unchanged, {updated} updated, {added} added and {removed} removed episodes".format(
+                self.indexerid, **counts))
+
+        # Done updating save last update date
+        self.last_update = datetime.date.today().toordinal()
+        self.saveToDB()
+
+        return counts
+
     def getImages(self, fanart=None, poster=None):
         fanart_result = poster_result = banner_result = False
         season_posters_result = season_banners_result = season_all_poster_result = season_all_banner_result = False
@@ -1057,6 +1160,7 @@ class TVShow(object):
         # remove from tv episodes table
         for x in sickrage.app.main_db.get_many('tv_episodes', self.indexerid):
             sickrage.app.main_db.delete(x)
+        sickrage.app.show_stats.remove_show(self.indexerid)
 
         # remove from tv shows table
         for x in sickrage.app.main_db.get_many('tv_shows', self.indexerid):
@@ -1075,7 +1179,8 @@ class TVShow(object):
             sickrage.app.main_db.delete(x)
 
         # remove self from show list
-        sickrage.app.showlist = [x for x in sickrage.app.showlist if int(x.indexerid) != self.indexerid]
+        for show in sickrage.app.showlist.find(self.indexerid):
+            sickrage.app.showlist.remove(show)
 
         # clear the cache
         image_cache_dir = os.path.join(sickrage.app.cache_dir, 'images')
@@ -1321,8 +1426,7 @@ class TVShow(object):
             sickrage.app.log.debug("Don't want this quality, ignoring found episode")
             return False
 
-        dbData = [x for x in sickrage.app.main_db.get_many('tv_episodes', self.indexerid)
-                  if x['season'] == season and x['episode'] == episode]
+        dbData = list(sickrage.app.main_db.get_many('tv_episodes_season_episode', (self.indexerid, season, episode)))
 
         if not dbData or not len(dbData):
             sickrage.app.log.debug("Unable to find a matching episode in database, ignoring found episode")
@@ -0,0 +1,149 @@
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import threading
+
+from sickrage.core.helpers import full_sanitizeSceneName, try_int
+
+
+class ShowRegistry(list):
+    """
+    Ordered list of loaded shows, indexed by indexer id, (indexer, indexer id) and normalised show name
+    """
+
+    def __init__(self, shows=()):
+        super(ShowRegistry, self).__init__(shows)
+        self.lock = threading.RLock()
+        self._keys = {}
+        self._indexerids = {}
+        self._indexers = {}
+        self._names = {}
+        self._rebuild()
+
+    def _add(self, show):
+        keys = (show.indexerid, (show.indexer, show.indexerid), full_sanitizeSceneName(show.name))
+        self._keys[id(show)] = keys
+
+        self._indexerids.setdefault(keys[0], []).append(show)
+        self._indexers.setdefault(keys[1], []).append(show)
+        self._names.setdefault(keys[2], []).append(show)
+        self._changed()
+
+    def _discard(self, show):
+        keys = self._keys.pop(id(show), None)
+        if not keys:
+            return
+
+        for index, key in zip((self._indexerids, self._indexers, self._names), keys):
+            shows = [x for x in index.get(key, []) if x is not show]
+            if shows:
+                index[key] = shows
+            else:
+                index.pop(key, None)
+
+        self._changed()
+
+    def _rebuild(self):
+        with self.lock:
+            self._keys.clear()
+            self._indexerids.clear()
+            self._indexers.clear()
+            self._names.clear()
+
+            for show in self:
+                self._add(show)
+
+            self._changed()
+
+    @staticmethod
+    def _changed():
+        # cached parse results may point at shows that were removed or renamed
+        from sickrage.core.nameparser import name_parser_cache
+        name_parser_cache.clear()
+
+    def reindex(self, show):
+        """
+        Refreshes the index entries of a show already in the registry, called when its ids or name change
+        """
+        with self.lock:
+            if id(show) in self._keys:
+                self._discard(show)
+                self._add(show)
+
+    def find(self, indexerid):
+        return list(self._indexerids.get(try_int(indexerid), []))
+
+    def find_by_indexer(self, indexer, indexerid):
+        return list(self._indexers.get((try_int(indexer), try_int(indexerid)), []))
+
+    def find_by_name(self, name):
+        return list(self._names.get(full_sanitizeSceneName(name), []))
+
+    def append(self, show):
+        with self.lock:
+            super(ShowRegistry, self).append(show)
+            self._add(show)
+
+    def extend(self, shows):
+        with self.lock:
+            shows = list(shows)
+            super(ShowRegistry, self).extend(shows)
+            for show in shows:
+                self._add(show)
+
+    def insert(self, index, show):
+        with self.lock:
+            super(ShowRegistry, self).insert(index, show)
+            self._add(show)
+
+    def remove(self, show):
+        with self.lock:
+            super(ShowRegistry, self).remove(show)
+            self._discard(show)
+
+    def pop(self, index=-1):
+        with self.lock:
+            show = super(ShowRegistry, self).pop(index)
+            self._discard(show)
+            return show
+
+    def __iadd__(self, shows):
+        self.extend(shows)
+        return self
+
+    def __setitem__(self, index, value):
+        with self.lock:
+            super(ShowRegistry, self).__setitem__(index, value)
+            self._rebuild()
+
+    def __delitem__(self, index):
+        with self.lock:
+            super(ShowRegistry, self).__delitem__(index)
+            self._rebuild()
+
+    def __setslice__(self, i, j, shows):
+        with self.lock:
+            super(ShowRegistry, self).__setslice__(i, j, shows)
+            self._rebuild()
+
+    def __delslice__(self, i, j):
+        with self.lock:
+            super(ShowRegistry, self).__delslice__(i, j)
+            self._rebuild()
@@ -0,0 +1,293 @@
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import bisect
+import datetime
+import threading
+
+import sickrage
+from sickrage.core.common import FAILED, Quality, SKIPPED, UNAIRED, WANTED
+
+STATUS_SNATCHED = frozenset(Quality.SNATCHED + Quality.SNATCHED_PROPER + Quality.SNATCHED_BEST)
+STATUS_DOWNLOADED = frozenset(Quality.DOWNLOADED + Quality.ARCHIVED)
+STATUS_PENDING = frozenset([SKIPPED, WANTED, FAILED])
+STATUS_UPCOMING = frozenset([WANTED, UNAIRED])
+
+
+def _counted(row):
+    return row['season'] > 0 and row['episode'] > 0 and row['airdate'] > 1
+
+
+class ShowStatsEntry(object):
+    """
+    Episode counters of a single show, adjusted by +1/-1 per episode row.
+
+    Values that depend on the current date are kept as sorted airdate lists and resolved when served.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.episodes = 0
+        self.snatched = 0
+        self.downloaded = 0
+        self.quality_total = 0
+        self.total_size = 0
+        self.pending = []
+        self.upcoming = []
+        self.aired = []
+        self.stale = False
+
+    @staticmethod
+    def _change(airdates, airdate, sign):
+        if sign > 0:
+            bisect.insort(airdates, airdate)
+        else:
+            i = bisect.bisect_left(airdates, airdate)
+            if i < len(airdates) and airdates[i] == airdate:
+                del airdates[i]
+
+    def apply(self, row, sign=1):
+        self.rows += sign
+
+        if not _counted(row):
+            return
+
+        airdate, status = row['airdate'], row['status']
+
+        if status in STATUS_SNATCHED:
+            self.snatched += sign
+        if status in STATUS_DOWNLOADED:
+            self.downloaded += sign
+
+        if status in STATUS_SNATCHED or status in STATUS_DOWNLOADED:
+            self.quality_total += sign
+        elif status in STATUS_PENDING:
+            self._change(self.pending, airdate, sign)
+
+        if status in STATUS_UPCOMING:
+            self._change(self.upcoming, airdate, sign)
+        if status != UNAIRED:
+            self._change(self.aired, airdate, sign)
+
+        self.episodes += sign
+        self.total_size += (row['file_size'] or 0) * sign
+
+    def to_dict(self, today):
+        upcoming = bisect.bisect_left(self.upcoming, today)
+        aired = bisect.bisect_left(self.aired, today)
+
+        return {
+            'ep_snatched': self.snatched,
+            'ep_downloaded': self.downloaded,
+            'ep_total': self.quality_total + bisect.bisect_right(self.pending, today),
+            'ep_airs_next': self.upcoming[upcoming] if upcoming < len(self.upcoming) else None,
+            'ep_airs_prev': self.aired[aired - 1] if aired else None,
+            'total_size': self.total_size
+        }
+
+
+class ShowStats(object):
+    """
+    Materialised per-show episode statistics.
+
+    A show is loaded from the database the first time it is asked for, after that episode saves and deletes keep it
+    up to date with deltas so the home page and api do not have to scan every episode on each request.
+
+    A show loaded while some of its episode writes wait in a database batch is loaded again once they are flushed.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.shows = {}
+        self.unflushed = {}
+
+    def get(self, indexerid):
+        with self.lock:
+            entry = self.shows.get(indexerid)
+            if entry is None:
+                entry = self.shows[indexerid] = ShowStatsEntry()
+                for dbData in sickrage.app.main_db.get_many('tv_episodes', indexerid):
+                    entry.apply(dbData)
+                entry.stale = indexerid in self.unflushed
+            return entry
+
+    def update_episode(self, showid, old=None, new=None, write=None, batch=None):
+        """
+        Applies an episode change to the show it belongs to.
+
+        :param showid: indexer id of the show
+        :param old: episode row before the change, None for new episodes
+        :param new: episode row after the change, None for deleted episodes
+        :param write: function that stores the change, called under the stats lock so a show loaded at the same time
+                      doesn't count it twice
+        :param batch: database batch the change is queued in
+        """
+        with self.lock:
+            if write:
+                write()
+
+            if batch is not None and batch.on_flush(('show_stats', showid), lambda: self._flushed(showid)):
+                self.unflushed[showid] = self.unflushed.get(showid, 0) + 1
+
+            entry = self.shows.get(showid)
+            if entry is None:
+                return
+
+            if old:
+                entry.apply(old, -1)
+            if new:
+                entry.apply(new, 1)
+
+    def _flushed(self, showid):
+        with self.lock:
+            count = self.unflushed.pop(showid, 1) - 1
+            if count:
+                self.unflushed[showid] = count
+                return
+
+            entry = self.shows.get(showid)
+            if entry is not None and entry.stale:
+                del self.shows[showid]
+
+    def remove_show(self, indexerid):
+        with self.lock:
+            self.shows.pop(indexerid, None)
+
+    def clear(self):
+        with self.lock:
+            self.shows.clear()
+
+    def statistics(self):
+        """
+        Returns the same (show_stat, overall_stats, max_download_count) tuple as a full episode scan.
+        """
+        show_stat = {}
+
+        overall_stats = {
+            'episodes': {
+                'downloaded': 0,
+                'snatched': 0,
+                'total': 0,
+            },
+            'shows': {
+                'active': len([show for show in sickrage.app.showlist
+                               if show.paused == 0 and show.status.lower() == 'continuing']),
+                'total': len(sickrage.app.showlist),
+            },
+            'total_size': 0
+        }
+
+        today = datetime.date.today().toordinal()
+
+        max_download_count = 1000
+
+        for show in sickrage.app.showlist:
+            if sickrage.app.show_queue.is_being_added(show) or sickrage.app.show_queue.is_being_removed(show):
+                continue
+
+            with self.lock:
+                entry = self.get(show.indexerid)
+                if not entry.rows:
+                    continue
+
+                show_stat[show.indexerid] = entry.to_dict(today)
+
+                overall_stats['episodes']['snatched'] += entry.snatched
+                overall_stats['episodes']['downloaded'] += entry.downloaded
+                overall_stats['episodes']['total'] += entry.episodes
+                overall_stats['total_size'] += entry.total_size
+
+            max_download_count = max(max_download_count, show_stat[show.indexerid]['ep_total'])
+
+        max_download_count *= 100
+
+        return show_stat, overall_stats, max_download_count
+
+    @staticmethod
+    def scan(indexerid):
+        """
+        Computes the statistics of a show straight from its episode rows.
+
+        :param indexerid: indexer id of the show
+        :return: stats dict or None if the show has no episodes
+        """
+        stats = None
+        today = datetime.date.today().toordinal()
+
+        for dbData in sickrage.app.main_db.get_many('tv_episodes', indexerid):
+            if stats is None:
+                stats = {'ep_snatched': 0, 'ep_downloaded': 0, 'ep_total': 0, 'ep_airs_next': None,
+                         'ep_airs_prev': None, 'total_size': 0}
+
+            airdate = dbData['airdate']
+            status = dbData['status']
+
+            if not _counted(dbData):
+                continue
+
+            if status in STATUS_SNATCHED:
+                stats['ep_snatched'] += 1
+
+            if status in STATUS_DOWNLOADED:
+                stats['ep_downloaded'] += 1
+
+            if (airdate <= today and status in STATUS_PENDING) or (
+                    status in STATUS_SNATCHED or status in STATUS_DOWNLOADED):
+                stats['ep_total'] += 1
+
+            if airdate >= today and status in STATUS_UPCOMING:
+                if not stats['ep_airs_next'] or airdate < stats['ep_airs_next']:
+                    stats['ep_airs_next'] = airdate
+            elif airdate < today and status != UNAIRED:
+                if not stats['ep_airs_prev'] or airdate > stats['ep_airs_prev']:
+                    stats['ep_airs_prev'] = airdate
+
+            stats['total_size'] += dbData['file_size'] or 0
+
+        return stats
+
+    def check_consistency(self, repair=True):
+        """
+        Compares every loaded show against a full scan of its episodes.
+
+        :param repair: reload shows that drifted
+        :return: list of indexer ids whose stats did not match
+        """
+        today = datetime.date.today().toordinal()
+
+        mismatched = []
+        for indexerid in list(self.shows):
+            with self.lock:
+                entry = self.shows.get(indexerid)
+                if entry is None:
+                    continue
+
+                if (entry.to_dict(today) if entry.rows else None) == self.scan(indexerid):
+                    continue
+
+                mismatched.append(indexerid)
+                if repair:
+                    self.shows.pop(indexerid, None)
+
+        if mismatched:
+            sickrage.app.log.warning("Show statistics out of sync for {} show(s), {}".format(
+                len(mismatched), ('left as is', 'reloading')[repair]))
+
+        return mismatched
@@ -172,7 +172,7 @@ class QueueProgressIndicator():
         return len([x for x in self.queueItemList if x.is_in_queue()])
 
     def nextName(self):
-        for curItem in [sickrage.app.show_queue.currentItem] + sickrage.app.show_queue.queue:
+        for curItem in list(sickrage.app.show_queue.running) + [x for __, __, x in sickrage.app.show_queue.queue]:
             if curItem in self.queueItemList:
                 return curItem.name
 
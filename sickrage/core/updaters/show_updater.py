@@ -89,6 +89,9 @@ class ShowUpdater(object):
 
         ProgressIndicators.setIndicator('dailyShowUpdates', QueueProgressIndicator("Daily Show Updates", pi_list))
 
+        # catch any drift between the show statistics store and the episodes table
+        sickrage.app.show_stats.check_consistency()
+
         dbData['time'] = update_timestamp
         sickrage.app.cache_db.update(dbData)
 
@@ -24,6 +24,8 @@ import socket
 import threading
 
 import tornado.locale
+from concurrent.futures import ThreadPoolExecutor
+from mako.lookup import TemplateLookup
 from tornado.httpserver import HTTPServer
 from tornado.web import Application, RedirectHandler, StaticFileHandler
 
@@ -63,6 +65,8 @@ class WebServer(object):
         self.api_root = None
         self.app = None
         self.server = None
+        self.executor = None
+        self.mako_lookup = None
 
     def start(self):
         self.started = True
@@ -75,6 +79,22 @@ class WebServer(object):
         if os.path.isdir(mako_cache):
             shutil.rmtree(mako_cache)
 
+        # worker threads shared by all web handlers
+        self.executor = ThreadPoolExecutor(max(sickrage.app.config.web_workers, 1))
+
+        # template lookup shared by all web handlers, compiled templates are kept in memory and in the mako cache
+        # folder, production mode skips checking template files for changes on every render
+        self.mako_lookup = TemplateLookup(
+            directories=[sickrage.app.config.gui_views_dir],
+            module_directory=mako_cache,
+            filesystem_checks=not sickrage.app.config.web_production_mode,
+            strict_undefined=True,
+            input_encoding='utf-8',
+            output_encoding='utf-8',
+            encoding_errors='replace',
+            future_imports=['unicode_literals']
+        )
+
         # video root
         if sickrage.app.config.root_dirs:
             root_dirs = sickrage.app.config.root_dirs.split('|')
@@ -107,7 +127,7 @@ class WebServer(object):
 
         # Load the app
         self.app = Application(
-            debug=True,
+            debug=not sickrage.app.config.web_production_mode,
             autoreload=False,
             gzip=sickrage.app.config.web_use_gzip,
             cookie_secret=sickrage.app.config.web_cookie_secret,
@@ -214,3 +234,4 @@ class WebServer(object):
             self.started = False
             self.server.close_all_connections()
             self.server.stop()
+            self.executor.shutdown(wait=False)
@@ -22,7 +22,6 @@ from __future__ import unicode_literals
 import collections
 import datetime
 import os
-import re
 import threading
 import time
 import traceback
@@ -48,11 +47,13 @@ from sickrage.core.common import ARCHIVED, DOWNLOADED, IGNORED, \
     timeFormat
 from sickrage.core.exceptions import CantUpdateShowException, CantRemoveShowException, CantRefreshShowException
 from sickrage.core.helpers import chmodAsParent, findCertainShow, makeDir, \
-    pretty_filesize, sanitizeFileName, srdatetime, try_int, readFileBuffered, app_statistics
+    pretty_filesize, sanitizeFileName, srdatetime, try_int, app_statistics
+from sickrage.core.logindex import LogQuery
 from sickrage.core.media.banner import Banner
 from sickrage.core.media.fanart import FanArt
 from sickrage.core.media.network import Network
 from sickrage.core.media.poster import Poster
+from sickrage.core.nameparser import name_parser_cache, show_lookup_stats
 from sickrage.core.queues.search import BacklogQueueItem, ManualSearchQueueItem
 from sickrage.core.tv.show.coming_episodes import ComingEpisodes
 from sickrage.core.tv.show.history import History
@@ -1157,33 +1158,10 @@ class CMD_Logs(ApiCall):
 
     def run(self):
         """ Get the logs """
-        maxLines = 50
+        logLines = LogQuery(sickrage.app.config.log_file).query(
+            sickrage.app.log.logLevels[str(self.min_level).upper()], max_lines=50)
 
-        levelsFiltered = '|'.join(
-            [x for x in sickrage.app.log.logLevels.keys() if
-             sickrage.app.log.logLevels[x] >= int(
-                 sickrage.app.log.logLevels[str(self.min_level).upper()])])
-
-        logRegex = re.compile(
-            r"(?P<entry>^\d+\-\d+\-\d+\s+\d+\:\d+\:\d+\s+(?:{})[\s\S]+?(?:{})[\s\S]+?$)".format(levelsFiltered, ""),
-            re.S + re.M)
-
-        data = []
-        try:
-            if os.path.isfile(sickrage.app.config.log_file):
-                data += list(reversed(re.findall("((?:^.+?{}.+?$))".format(""),
-                                                 "\n".join(next(readFileBuffered(sickrage.app.config.log_file,
-                                                                                 reverse=True)).splitlines()),
-                                                 re.S + re.M + re.I)))
-                maxLines -= len(data)
-                if len(data) == maxLines:
-                    raise StopIteration
-        except StopIteration:
-            pass
-        except Exception as e:
-            pass
-
-        return _responds(RESULT_SUCCESS, "\n".join(logRegex.findall("\n".join(data))))
+        return _responds(RESULT_SUCCESS, "\n".join(logLines))
 
 
 class CMD_PostProcess(ApiCall):
@@ -1450,6 +1428,30 @@ class CMD_SiCKRAGEGetRootDirs(ApiCall):
         return _responds(RESULT_SUCCESS, _getRootDirs())
 
 
+class CMD_SiCKRAGENameParserCache(ApiCall):
+    _cmd = "sr.nameparsercache"
+    _help = {"desc": "Get size, hit, miss and eviction counters of the name parser result cache"}
+
+    def __init__(self, application, request, *args, **kwargs):
+        super(CMD_SiCKRAGENameParserCache, self).__init__(application, request, *args, **kwargs)
+
+    def run(self):
+        """ Get size, hit, miss and eviction counters of the name parser result cache """
+        return _responds(RESULT_SUCCESS, name_parser_cache.stats())
+
+
+class CMD_SiCKRAGEShowLookups(ApiCall):
+    _cmd = "sr.showlookups"
+    _help = {"desc": "Get lookup counts and time spent per source of show name lookups"}
+
+    def __init__(self, application, request, *args, **kwargs):
+        super(CMD_SiCKRAGEShowLookups, self).__init__(application, request, *args, **kwargs)
+
+    def run(self):
+        """ Get lookup counts and time spent per source of show name lookups """
+        return _responds(RESULT_SUCCESS, show_lookup_stats.stats())
+
+
 class CMD_SiCKRAGEPauseDaily(ApiCall):
     _cmd = "sr.pausedaily"
     _help = {
@@ -1511,6 +1513,22 @@ class CMD_SiCKRAGEPing(ApiCall):
             return _responds(RESULT_SUCCESS, msg="Pong")
 
 
+class CMD_SiCKRAGEQueueStats(ApiCall):
+    _cmd = "sr.queuestats"
+    _help = {"desc": "Get depth, wait time and run time per item type for the show, search and post-processor queues"}
+
+    def __init__(self, application, request, *args, **kwargs):
+        super(CMD_SiCKRAGEQueueStats, self).__init__(application, request, *args, **kwargs)
+
+    def run(self):
+        """ Get depth, wait time and run time per item type for the show, search and post-processor queues """
+        data = {"show": sickrage.app.show_queue.get_stats(),
+                "search": sickrage.app.search_queue.get_stats(),
+                "postprocessor": sickrage.app.postprocessor_queue.get_stats()}
+
+        return _responds(RESULT_SUCCESS, data)
+
+
 class CMD_SiCKRAGERestart(ApiCall):
     _cmd = "sr.restart"
     _help = {"desc": "Restart SiCKRAGE"}
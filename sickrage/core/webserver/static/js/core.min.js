@@ -356,4 +356,4 @@ var n="undefined"!=typeof window&&"undefined"!=typeof document,i=["Edge","Triden
   * Copyright 2011-2018 The Bootstrap Authors (https://github.com/twbs/bootstrap/graphs/contributors)
   * Licensed under MIT (https://github.com/twbs/bootstrap/blob/master/LICENSE)
   */
-!function(e,t,n){"use strict";function i(e,t){for(var n=0;n<t.length;n++){var i=t[n];i.enumerable=i.enumerable||!1,i.configurable=!0,"value"in i&&(i.writable=!0),Object.defineProperty(e,i.key,i)}}function a(e,t,n){return t&&i(e.prototype,t),n&&i(e,n),e}function o(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function s(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{},i=Object.keys(n);"function"==typeof Object.getOwnPropertySymbols&&(i=i.concat(Object.getOwnPropertySymbols(n).filter(function(e){return Object.getOwnPropertyDescriptor(n,e).enumerable}))),i.forEach(function(t){o(e,t,n[t])})}return e}t=t&&t.hasOwnProperty("default")?t.default:t,n=n&&n.hasOwnProperty("default")?n.default:n;var r=function(e){var t="transitionend";function n(e){return{}.toString.call(e).match(/\s([a-z]+)/i)[1].toLowerCase()}function i(t){var n=this,i=!1;return e(this).one(a.TRANSITION_END,function(){i=!0}),setTimeout(function(){i||a.triggerTransitionEnd(n)},t),this}var a={TRANSITION_END:"bsTransitionEnd",getUID:function(e){do{e+=~~(1e6*Math.random())}while(document.getElementById(e));return e},getSelectorFromElement:function(t){var n=t.getAttribute("data-target");n&&"#"!==n||(n=t.getAttribute("href")||"");try{var i=e(document).find(n);return i.length>0?n:null}catch(e){return null}},getTransitionDurationFromElement:function(t){if(!t)return 0;var n=e(t).css("transition-duration"),i=parseFloat(n);return i?(n=n.split(",")[0],1e3*parseFloat(n)):0},reflow:function(e){return e.offsetHeight},triggerTransitionEnd:function(n){e(n).trigger(t)},supportsTransitionEnd:function(){return Boolean(t)},isElement:function(e){return(e[0]||e).nodeType},typeCheckConfig:function(e,t,i){for(var o in i)if(Object.prototype.hasOwnProperty.call(i,o)){var s=i[o],r=t[o],l=r&&a.isElement(r)?"element":n(r);if(!new RegExp(s).test(l))throw new Error(e.toUpperCase()+': Option "'+o+'" provided type "'+l+'" but expected type "'+s+'".')}}};return e.fn.emulateTransitionEnd=i,e.event.special[a.TRANSITION_END]={bindType:t,delegateType:t,handle:function(t){if(e(t.target).is(this))return t.handleObj.handler.apply(this,arguments)}},a}(t),l=function(e){var t=e.fn.alert,n={CLOSE:"close.bs.alert",CLOSED:"closed.bs.alert",CLICK_DATA_API:"click.bs.alert.data-api"},i={ALERT:"alert",FADE:"fade",SHOW:"show"},o=function(){function t(e){this._element=e}var o=t.prototype;return o.close=function(e){var t=this._element;e&&(t=this._getRootElement(e));var n=this._triggerCloseEvent(t);n.isDefaultPrevented()||this._removeElement(t)},o.dispose=function(){e.removeData(this._element,"bs.alert"),this._element=null},o._getRootElement=function(t){var n=r.getSelectorFromElement(t),a=!1;return n&&(a=e(n)[0]),a||(a=e(t).closest("."+i.ALERT)[0]),a},o._triggerCloseEvent=function(t){var i=e.Event(n.CLOSE);return e(t).trigger(i),i},o._removeElement=function(t){var n=this;if(e(t).removeClass(i.SHOW),e(t).hasClass(i.FADE)){var a=r.getTransitionDurationFromElement(t);e(t).one(r.TRANSITION_END,function(e){return n._destroyElement(t,e)}).emulateTransitionEnd(a)}else this._destroyElement(t)},o._destroyElement=function(t){e(t).detach().trigger(n.CLOSED).remove()},t._jQueryInterface=function(n){return this.each(function(){var i=e(this),a=i.data("bs.alert");a||(a=new t(this),i.data("bs.alert",a)),"close"===n&&a[n](this)})},t._handleDismiss=function(e){return function(t){t&&t.preventDefault(),e.close(this)}},a(t,null,[{key:"VERSION",get:function(){return"4.1.1"}}]),t}();return e(document).on(n.CLICK_DATA_API,'[data-dismiss="alert"]',o._handleDismiss(new o)),e.fn.alert=o._jQueryInterface,e.fn.alert.Constructor=o,e.fn.alert.noConflict=function(){return e.fn.alert=t,o._jQueryInterface},o}(t),c=function(e){var t="button",n=e.fn[t],i={ACTIVE:"active",BUTTON:"btn",FOCUS:"focus"},o={DATA_TOGGLE_CARROT:'[data-toggle^="button"]',DATA_TOGGLE:'[data-toggle="buttons"]',INPUT:"input",ACTIVE:".active",BUTTON:".btn"},s={CLICK_DATA_API:"click.bs.button.data-api",FOCUS_BLUR_DATA_API:"focus.bs.button.data-api blur.bs.button.data-api"},r=function(){function t(e){this._element=e}var n=t.prototype;return n.toggle=function(){var t=!0,n=!0,a=e(this._element).closest(o.DATA_TOGGLE)[0];if(a){var s=e(this._element).find(o.INPUT)[0];if(s){if("radio"===s.type)if(s.checked&&e(this._element).hasClass(i.ACTIVE))t=!1;else{var r=e(a).find(o.ACTIVE)[0];r&&e(r).removeClass(i.ACTIVE)}if(t){if(s.hasAttribute("disabled")||a.hasAttribute("disabled")||s.classList.contains("disabled")||a.classList.contains("disabled"))return;s.checked=!e(this._element).hasClass(i.ACTIVE),e(s).trigger("change")}s.focus(),n=!1}}n&&this._element.setAttribute("aria-pressed",!e(this._element).hasClass(i.ACTIVE)),t&&e(this._element).toggleClass(i.ACTIVE)},n.dispose=function(){e.removeData(this._element,"bs.button"),this._element=null},t._jQueryInterface=function(n){return this.each(function(){var i=e(this).data("bs.button");i||(i=new t(this),e(this).data("bs.button",i)),"toggle"===n&&i[n]()})},a(t,null,[{key:"VERSION",get:function(){return"4.1.1"}}]),t}();return e(document).on(s.CLICK_DATA_API,o.DATA_TOGGLE_CARROT,function(t){t.preventDefault();var n=t.target;e(n).hasClass(i.BUTTON)||(n=e(n).closest(o.BUTTON)),r._jQueryInterface.call(e(n),"toggle")}).on(s.FOCUS_BLUR_DATA_API,o.DATA_TOGGLE_CARROT,function(t){var n=e(t.target).closest(o.BUTTON)[0];e(n).toggleClass(i.FOCUS,/^focus(in)?$/.test(t.type))}),e.fn[t]=r._jQueryInterface,e.fn[t].Constructor=r,e.fn[t].noConflict=function(){return e.fn[t]=n,r._jQueryInterface},r}(t),d=function(e){var t="carousel",n="bs.carousel",i="."+n,o=e.fn[t],l={interval:5e3,keyboard:!0,slide:!1,pause:"hover",wrap:!0},c={interval:"(number|boolean)",keyboard:"boolean",slide:"(boolean|string)",pause:"(string|boolean)",wrap:"boolean"},d={NEXT:"next",PREV:"prev",LEFT:"left",RIGHT:"right"},u={SLIDE:"slide"+i,SLID:"slid"+i,KEYDOWN:"keydown"+i,MOUSEENTER:"mouseenter"+i,MOUSELEAVE:"mouseleave"+i,TOUCHEND:"touchend"+i,LOAD_DATA_API:"load.bs.carousel.data-api",CLICK_DATA_API:"click.bs.carousel.data-api"},h={CAROUSEL:"carousel",ACTIVE:"active",SLIDE:"slide",RIGHT:"carousel-item-right",LEFT:"carousel-item-left",NEXT:"carousel-item-next",PREV:"carousel-item-prev",ITEM:"carousel-item"},f={ACTIVE:".active",ACTIVE_ITEM:".active.carousel-item",ITEM:".carousel-item",NEXT_PREV:".carousel-item-next, .carousel-item-prev",INDICATORS:".carousel-indicators",DATA_SLIDE:"[data-slide], [data-slide-to]",DATA_RIDE:'[data-ride="carousel"]'},m=function(){function o(t,n){this._items=null,this._interval=null,this._activeElement=null,this._isPaused=!1,this._isSliding=!1,this.touchTimeout=null,this._config=this._getConfig(n),this._element=e(t)[0],this._indicatorsElement=e(this._element).find(f.INDICATORS)[0],this._addEventListeners()}var m=o.prototype;return m.next=function(){this._isSliding||this._slide(d.NEXT)},m.nextWhenVisible=function(){!document.hidden&&e(this._element).is(":visible")&&"hidden"!==e(this._element).css("visibility")&&this.next()},m.prev=function(){this._isSliding||this._slide(d.PREV)},m.pause=function(t){t||(this._isPaused=!0),e(this._element).find(f.NEXT_PREV)[0]&&(r.triggerTransitionEnd(this._element),this.cycle(!0)),clearInterval(this._interval),this._interval=null},m.cycle=function(e){e||(this._isPaused=!1),this._interval&&(clearInterval(this._interval),this._interval=null),this._config.interval&&!this._isPaused&&(this._interval=setInterval((document.visibilityState?this.nextWhenVisible:this.next).bind(this),this._config.interval))},m.to=function(t){var n=this;this._activeElement=e(this._element).find(f.ACTIVE_ITEM)[0];var i=this._getItemIndex(this._activeElement);if(!(t>this._items.length-1||t<0))if(this._isSliding)e(this._element).one(u.SLID,function(){return n.to(t)});else{if(i===t)return this.pause(),void this.cycle();var a=t>i?d.NEXT:d.PREV;this._slide(a,this._items[t])}},m.dispose=function(){e(this._element).off(i),e.removeData(this._element,n),this._items=null,this._config=null,this._element=null,this._interval=null,this._isPaused=null,this._isSliding=null,this._activeElement=null,this._indicatorsElement=null},m._getConfig=function(e){return e=s({},l,e),r.typeCheckConfig(t,e,c),e},m._addEventListeners=function(){var t=this;this._config.keyboard&&e(this._element).on(u.KEYDOWN,function(e){return t._keydown(e)}),"hover"===this._config.pause&&(e(this._element).on(u.MOUSEENTER,function(e){return t.pause(e)}).on(u.MOUSELEAVE,function(e){return t.cycle(e)}),"ontouchstart"in document.documentElement&&e(this._element).on(u.TOUCHEND,function(){t.pause(),t.touchTimeout&&clearTimeout(t.touchTimeout),t.touchTimeout=setTimeout(function(e){return t.cycle(e)},500+t._config.interval)}))},m._keydown=function(e){if(!/input|textarea/i.test(e.target.tagName))switch(e.which){case 37:e.preventDefault(),this.prev();break;case 39:e.preventDefault(),this.next()}},m._getItemIndex=function(t){return this._items=e.makeArray(e(t).parent().find(f.ITEM)),this._items.indexOf(t)},m._getItemByDirection=function(e,t){var n=e===d.NEXT,i=e===d.PREV,a=this._getItemIndex(t),o=this._items.length-1,s=i&&0===a||n&&a===o;if(s&&!this._config.wrap)return t;var r=e===d.PREV?-1:1,l=(a+r)%this._items.length;return-1===l?this._items[this._items.length-1]:this._items[l]},m._triggerSlideEvent=function(t,n){var i=this._getItemIndex(t),a=this._getItemIndex(e(this._element).find(f.ACTIVE_ITEM)[0]),o=e.Event(u.SLIDE,{relatedTarget:t,direction:n,from:a,to:i});return e(this._element).trigger(o),o},m._setActiveIndicatorElement=function(t){if(this._indicatorsElement){e(this._indicatorsElement).find(f.ACTIVE).removeClass(h.ACTIVE);var n=this._indicatorsElement.children[this._getItemIndex(t)];n&&e(n).addClass(h.ACTIVE)}},m._slide=function(t,n){var i,a,o,s=this,l=e(this._element).find(f.ACTIVE_ITEM)[0],c=this._getItemIndex(l),m=n||l&&this._getItemByDirection(t,l),p=this._getItemIndex(m),g=Boolean(this._interval);if(t===d.NEXT?(i=h.LEFT,a=h.NEXT,o=d.LEFT):(i=h.RIGHT,a=h.PREV,o=d.RIGHT),m&&e(m).hasClass(h.ACTIVE))this._isSliding=!1;else{var b=this._triggerSlideEvent(m,o);if(!b.isDefaultPrevented()&&l&&m){this._isSliding=!0,g&&this.pause(),this._setActiveIndicatorElement(m);var v=e.Event(u.SLID,{relatedTarget:m,direction:o,from:c,to:p});if(e(this._element).hasClass(h.SLIDE)){e(m).addClass(a),r.reflow(m),e(l).addClass(i),e(m).addClass(i);var y=r.getTransitionDurationFromElement(l);e(l).one(r.TRANSITION_END,function(){e(m).removeClass(i+" "+a).addClass(h.ACTIVE),e(l).removeClass(h.ACTIVE+" "+a+" "+i),s._isSliding=!1,setTimeout(function(){return e(s._element).trigger(v)},0)}).emulateTransitionEnd(y)}else e(l).removeClass(h.ACTIVE),e(m).addClass(h.ACTIVE),this._isSliding=!1,e(this._element).trigger(v);g&&this.cycle()}}},o._jQueryInterface=function(t){return this.each(function(){var i=e(this).data(n),a=s({},l,e(this).data());"object"==typeof t&&(a=s({},a,t));var r="string"==typeof t?t:a.slide;if(i||(i=new o(this,a),e(this).data(n,i)),"number"==typeof t)i.to(t);else if("string"==typeof r){if(void 0===i[r])throw new TypeError('No method named "'+r+'"');i[r]()}else a.interval&&(i.pause(),i.cycle())})},o._dataApiClickHandler=function(t){var i=r.getSelectorFromElement(this);if(i){var a=e(i)[0];if(a&&e(a).hasClass(h.CAROUSEL)){var l=s({},e(a).data(),e(this).data()),c=this.getAttribute("data-slide-to");c&&(l.interval=!1),o._jQueryInterface.call(e(a),l),c&&e(a).data(n).to(c),t.preventDefault()}}},a(o,null,[{key:"VERSION",get:function(){return"4.1.1"}},{key:"Default",get:function(){return l}}]),o}();return e(document).on(u.CLICK_DATA_API,f.DATA_SLIDE,m._dataApiClickHandler),e(window).on(u.LOAD_DATA_API,function(){e(f.DATA_RIDE).each(function(){var t=e(this);m._jQueryInterface.call(t,t.data())})}),e.fn[t]=m._jQueryInterface,e.fn[t].Constructor=m,e.fn[t].noConflict=function(){return e.fn[t]=o,m._jQueryInterface},m}(t),u=function(e){var t="collapse",n="bs.collapse",i=e.fn[t],o={toggle:!0,parent:""},l={toggle:"boolean",parent:"(string|element)"},c={SHOW:"show.bs.collapse",SHOWN:"shown.bs.collapse",HIDE:"hide.bs.collapse",HIDDEN:"hidden.bs.collapse",CLICK_DATA_API:"click.bs.collapse.data-api"},d={SHOW:"show",COLLAPSE:"collapse",COLLAPSING:"collapsing",COLLAPSED:"collapsed"},u={WIDTH:"width",HEIGHT:"height"},h={ACTIVES:".show, .collapsing",DATA_TOGGLE:'[data-toggle="collapse"]'},f=function(){function i(t,n){this._isTransitioning=!1,this._element=t,this._config=this._getConfig(n),this._triggerArray=e.makeArray(e('[data-toggle="collapse"][href="#'+t.id+'"],[data-toggle="collapse"][data-target="#'+t.id+'"]'));for(var i=e(h.DATA_TOGGLE),a=0;a<i.length;a++){var o=i[a],s=r.getSelectorFromElement(o);null!==s&&e(s).filter(t).length>0&&(this._selector=s,this._triggerArray.push(o))}this._parent=this._config.parent?this._getParent():null,this._config.parent||this._addAriaAndCollapsedClass(this._element,this._triggerArray),this._config.toggle&&this.toggle()}var f=i.prototype;return f.toggle=function(){e(this._element).hasClass(d.SHOW)?this.hide():this.show()},f.show=function(){var t,a,o=this;if(!(this._isTransitioning||e(this._element).hasClass(d.SHOW)||(this._parent&&0===(t=e.makeArray(e(this._parent).find(h.ACTIVES).filter('[data-parent="'+this._config.parent+'"]'))).length&&(t=null),t&&(a=e(t).not(this._selector).data(n))&&a._isTransitioning))){var s=e.Event(c.SHOW);if(e(this._element).trigger(s),!s.isDefaultPrevented()){t&&(i._jQueryInterface.call(e(t).not(this._selector),"hide"),a||e(t).data(n,null));var l=this._getDimension();e(this._element).removeClass(d.COLLAPSE).addClass(d.COLLAPSING),this._element.style[l]=0,this._triggerArray.length>0&&e(this._triggerArray).removeClass(d.COLLAPSED).attr("aria-expanded",!0),this.setTransitioning(!0);var u=l[0].toUpperCase()+l.slice(1),f="scroll"+u,m=r.getTransitionDurationFromElement(this._element);e(this._element).one(r.TRANSITION_END,function(){e(o._element).removeClass(d.COLLAPSING).addClass(d.COLLAPSE).addClass(d.SHOW),o._element.style[l]="",o.setTransitioning(!1),e(o._element).trigger(c.SHOWN)}).emulateTransitionEnd(m),this._element.style[l]=this._element[f]+"px"}}},f.hide=function(){var t=this;if(!this._isTransitioning&&e(this._element).hasClass(d.SHOW)){var n=e.Event(c.HIDE);if(e(this._element).trigger(n),!n.isDefaultPrevented()){var i=this._getDimension();if(this._element.style[i]=this._element.getBoundingClientRect()[i]+"px",r.reflow(this._element),e(this._element).addClass(d.COLLAPSING).removeClass(d.COLLAPSE).removeClass(d.SHOW),this._triggerArray.length>0)for(var a=0;a<this._triggerArray.length;a++){var o=this._triggerArray[a],s=r.getSelectorFromElement(o);if(null!==s){var l=e(s);l.hasClass(d.SHOW)||e(o).addClass(d.COLLAPSED).attr("aria-expanded",!1)}}this.setTransitioning(!0),this._element.style[i]="";var u=r.getTransitionDurationFromElement(this._element);e(this._element).one(r.TRANSITION_END,function(){t.setTransitioning(!1),e(t._element).removeClass(d.COLLAPSING).addClass(d.COLLAPSE).trigger(c.HIDDEN)}).emulateTransitionEnd(u)}}},f.setTransitioning=function(e){this._isTransitioning=e},f.dispose=function(){e.removeData(this._element,n),this._config=null,this._parent=null,this._element=null,this._triggerArray=null,this._isTransitioning=null},f._getConfig=function(e){return(e=s({},o,e)).toggle=Boolean(e.toggle),r.typeCheckConfig(t,e,l),e},f._getDimension=function(){var t=e(this._element).hasClass(u.WIDTH);return t?u.WIDTH:u.HEIGHT},f._getParent=function(){var t=this,n=null;r.isElement(this._config.parent)?(n=this._config.parent,void 0!==this._config.parent.jquery&&(n=this._config.parent[0])):n=e(this._config.parent)[0];var a='[data-toggle="collapse"][data-parent="'+this._config.parent+'"]';return e(n).find(a).each(function(e,n){t._addAriaAndCollapsedClass(i._getTargetFromElement(n),[n])}),n},f._addAriaAndCollapsedClass=function(t,n){if(t){var i=e(t).hasClass(d.SHOW);n.length>0&&e(n).toggleClass(d.COLLAPSED,!i).attr("aria-expanded",i)}},i._getTargetFromElement=function(t){var n=r.getSelectorFromElement(t);return n?e(n)[0]:null},i._jQueryInterface=function(t){return this.each(function(){var a=e(this),r=a.data(n),l=s({},o,a.data(),"object"==typeof t&&t?t:{});if(!r&&l.toggle&&/show|hide/.test(t)&&(l.toggle=!1),r||(r=new i(this,l),a.data(n,r)),"string"==typeof t){if(void 0===r[t])throw new TypeError('No method named "'+t+'"');r[t]()}})},a(i,null,[{key:"VERSION",get:function(){return"4.1.1"}},{key:"Default",get:function(){return o}}]),i}();return e(document).on(c.CLICK_DATA_API,h.DATA_TOGGLE,function(t){"A"===t.currentTarget.tagName&&t.preventDefault();var i=e(this),a=r.getSelectorFromElement(this);e(a).each(function(){var t=e(this),a=t.data(n),o=a?"toggle":i.data();f._jQueryInterface.call(t,o)})}),e.fn[t]=f._jQueryInterface,e.fn[t].Constructor=f,e.fn[t].noConflict=function(){return e.fn[t]=i,f._jQueryInterface},f}(t),h=function(e){var t="dropdown",i="bs.dropdown",o="."+i,l=e.fn[t],c=new RegExp("38|40|27"),d={HIDE:"hide"+o,HIDDEN:"hidden"+o,SHOW:"show"+o,SHOWN:"shown"+o,CLICK:"click"+o,CLICK_DATA_API:"click.bs.dropdown.data-api",KEYDOWN_DATA_API:"keydown.bs.dropdown.data-api",KEYUP_DATA_API:"keyup.bs.dropdown.data-api"},u={DISABLED:"disabled",SHOW:"show",DROPUP:"dropup",DROPRIGHT:"dropright",DROPLEFT:"dropleft",MENURIGHT:"dropdown-menu-right",MENULEFT:"dropdown-menu-left",POSITION_STATIC:"position-static"},h={DATA_TOGGLE:'[data-toggle="dropdown"]',FORM_CHILD:".dropdown form",MENU:".dropdown-menu",NAVBAR_NAV:".navbar-nav",VISIBLE_ITEMS:".dropdown-menu .dropdown-item:not(.disabled):not(:disabled)"},f={TOP:"top-start",TOPEND:"top-end",BOTTOM:"bottom-start",BOTTOMEND:"bottom-end",RIGHT:"right-start",RIGHTEND:"right-end",LEFT:"left-start",LEFTEND:"left-end"},m={offset:0,flip:!0,boundary:"scrollParent",reference:"toggle",display:"dynamic"},p={offset:"(number|string|function)",flip:"boolean",boundary:"(string|element)",reference:"(string|element)",display:"string"},g=function(){function l(e,t){this._element=e,this._popper=null,this._config=this._getConfig(t),this._menu=this._getMenuElement(),this._inNavbar=this._detectNavbar(),this._addEventListeners()}var g=l.prototype;return g.toggle=function(){if(!this._element.disabled&&!e(this._element).hasClass(u.DISABLED)){var t=l._getParentFromElement(this._element),i=e(this._menu).hasClass(u.SHOW);if(l._clearMenus(),!i){var a={relatedTarget:this._element},o=e.Event(d.SHOW,a);if(e(t).trigger(o),!o.isDefaultPrevented()){if(!this._inNavbar){if(void 0===n)throw new TypeError("Bootstrap dropdown require Popper.js (https://popper.js.org)");var s=this._element;"parent"===this._config.reference?s=t:r.isElement(this._config.reference)&&(s=this._config.reference,void 0!==this._config.reference.jquery&&(s=this._config.reference[0])),"scrollParent"!==this._config.boundary&&e(t).addClass(u.POSITION_STATIC),this._popper=new n(s,this._menu,this._getPopperConfig())}"ontouchstart"in document.documentElement&&0===e(t).closest(h.NAVBAR_NAV).length&&e(document.body).children().on("mouseover",null,e.noop),this._element.focus(),this._element.setAttribute("aria-expanded",!0),e(this._menu).toggleClass(u.SHOW),e(t).toggleClass(u.SHOW).trigger(e.Event(d.SHOWN,a))}}}},g.dispose=function(){e.removeData(this._element,i),e(this._element).off(o),this._element=null,this._menu=null,null!==this._popper&&(this._popper.destroy(),this._popper=null)},g.update=function(){this._inNavbar=this._detectNavbar(),null!==this._popper&&this._popper.scheduleUpdate()},g._addEventListeners=function(){var t=this;e(this._element).on(d.CLICK,function(e){e.preventDefault(),e.stopPropagation(),t.toggle()})},g._getConfig=function(n){return n=s({},this.constructor.Default,e(this._element).data(),n),r.typeCheckConfig(t,n,this.constructor.DefaultType),n},g._getMenuElement=function(){if(!this._menu){var t=l._getParentFromElement(this._element);this._menu=e(t).find(h.MENU)[0]}return this._menu},g._getPlacement=function(){var t=e(this._element).parent(),n=f.BOTTOM;return t.hasClass(u.DROPUP)?(n=f.TOP,e(this._menu).hasClass(u.MENURIGHT)&&(n=f.TOPEND)):t.hasClass(u.DROPRIGHT)?n=f.RIGHT:t.hasClass(u.DROPLEFT)?n=f.LEFT:e(this._menu).hasClass(u.MENURIGHT)&&(n=f.BOTTOMEND),n},g._detectNavbar=function(){return e(this._element).closest(".navbar").length>0},g._getPopperConfig=function(){var e=this,t={};"function"==typeof this._config.offset?t.fn=function(t){return t.offsets=s({},t.offsets,e._config.offset(t.offsets)||{}),t}:t.offset=this._config.offset;var n={placement:this._getPlacement(),modifiers:{offset:t,flip:{enabled:this._config.flip},preventOverflow:{boundariesElement:this._config.boundary}}};return"static"===this._config.display&&(n.modifiers.applyStyle={enabled:!1}),n},l._jQueryInterface=function(t){return this.each(function(){var n=e(this).data(i),a="object"==typeof t?t:null;if(n||(n=new l(this,a),e(this).data(i,n)),"string"==typeof t){if(void 0===n[t])throw new TypeError('No method named "'+t+'"');n[t]()}})},l._clearMenus=function(t){if(!t||3!==t.which&&("keyup"!==t.type||9===t.which))for(var n=e.makeArray(e(h.DATA_TOGGLE)),a=0;a<n.length;a++){var o=l._getParentFromElement(n[a]),s=e(n[a]).data(i),r={relatedTarget:n[a]};if(s){var c=s._menu;if(e(o).hasClass(u.SHOW)&&!(t&&("click"===t.type&&/input|textarea/i.test(t.target.tagName)||"keyup"===t.type&&9===t.which)&&e.contains(o,t.target))){var f=e.Event(d.HIDE,r);e(o).trigger(f),f.isDefaultPrevented()||("ontouchstart"in document.documentElement&&e(document.body).children().off("mouseover",null,e.noop),n[a].setAttribute("aria-expanded","false"),e(c).removeClass(u.SHOW),e(o).removeClass(u.SHOW).trigger(e.Event(d.HIDDEN,r)))}}}},l._getParentFromElement=function(t){var n,i=r.getSelectorFromElement(t);return i&&(n=e(i)[0]),n||t.parentNode},l._dataApiKeydownHandler=function(t){if((/input|textarea/i.test(t.target.tagName)?!(32===t.which||27!==t.which&&(40!==t.which&&38!==t.which||e(t.target).closest(h.MENU).length)):c.test(t.which))&&(t.preventDefault(),t.stopPropagation(),!this.disabled&&!e(this).hasClass(u.DISABLED))){var n=l._getParentFromElement(this),i=e(n).hasClass(u.SHOW);if((i||27===t.which&&32===t.which)&&(!i||27!==t.which&&32!==t.which)){var a=e(n).find(h.VISIBLE_ITEMS).get();if(0!==a.length){var o=a.indexOf(t.target);38===t.which&&o>0&&o--,40===t.which&&o<a.length-1&&o++,o<0&&(o=0),a[o].focus()}}else{if(27===t.which){var s=e(n).find(h.DATA_TOGGLE)[0];e(s).trigger("focus")}e(this).trigger("click")}}},a(l,null,[{key:"VERSION",get:function(){return"4.1.1"}},{key:"Default",get:function(){return m}},{key:"DefaultType",get:function(){return p}}]),l}();return e(document).on(d.KEYDOWN_DATA_API,h.DATA_TOGGLE,g._dataApiKeydownHandler).on(d.KEYDOWN_DATA_API,h.MENU,g._dataApiKeydownHandler).on(d.CLICK_DATA_API+" "+d.KEYUP_DATA_API,g._clearMenus).on(d.CLICK_DATA_API,h.DATA_TOGGLE,function(t){t.preventDefault(),t.stopPropagation(),g._jQueryInterface.call(e(this),"toggle")}).on(d.CLICK_DATA_API,h.FORM_CHILD,function(e){e.stopPropagation()}),e.fn[t]=g._jQueryInterface,e.fn[t].Constructor=g,e.fn[t].noConflict=function(){return e.fn[t]=l,g._jQueryInterface},g}(t),f=function(e){var t="modal",n=".bs.modal",i=e.fn.modal,o={backdrop:!0,keyboard:!0,focus:!0,show:!0},l={backdrop:"(boolean|string)",keyboard:"boolean",focus:"boolean",show:"boolean"},c={HIDE:"hide.bs.modal",HIDDEN:"hidden.bs.modal",SHOW:"show.bs.modal",SHOWN:"shown.bs.modal",FOCUSIN:"focusin.bs.modal",RESIZE:"resize.bs.modal",CLICK_DISMISS:"click.dismiss.bs.modal",KEYDOWN_DISMISS:"keydown.dismiss.bs.modal",MOUSEUP_DISMISS:"mouseup.dismiss.bs.modal",MOUSEDOWN_DISMISS:"mousedown.dismiss.bs.modal",CLICK_DATA_API:"click.bs.modal.data-api"},d={SCROLLBAR_MEASURER:"modal-scrollbar-measure",BACKDROP:"modal-backdrop",OPEN:"modal-open",FADE:"fade",SHOW:"show"},u={DIALOG:".modal-dialog",DATA_TOGGLE:'[data-toggle="modal"]',DATA_DISMISS:'[data-dismiss="modal"]',FIXED_CONTENT:".fixed-top, .fixed-bottom, .is-fixed, .sticky-top",STICKY_CONTENT:".sticky-top",NAVBAR_TOGGLER:".navbar-toggler"},h=function(){function i(t,n){this._config=this._getConfig(n),this._element=t,this._dialog=e(t).find(u.DIALOG)[0],this._backdrop=null,this._isShown=!1,this._isBodyOverflowing=!1,this._ignoreBackdropClick=!1,this._scrollbarWidth=0}var h=i.prototype;return h.toggle=function(e){return this._isShown?this.hide():this.show(e)},h.show=function(t){var n=this;if(!this._isTransitioning&&!this._isShown){e(this._element).hasClass(d.FADE)&&(this._isTransitioning=!0);var i=e.Event(c.SHOW,{relatedTarget:t});e(this._element).trigger(i),this._isShown||i.isDefaultPrevented()||(this._isShown=!0,this._checkScrollbar(),this._setScrollbar(),this._adjustDialog(),e(document.body).addClass(d.OPEN),this._setEscapeEvent(),this._setResizeEvent(),e(this._element).on(c.CLICK_DISMISS,u.DATA_DISMISS,function(e){return n.hide(e)}),e(this._dialog).on(c.MOUSEDOWN_DISMISS,function(){e(n._element).one(c.MOUSEUP_DISMISS,function(t){e(t.target).is(n._element)&&(n._ignoreBackdropClick=!0)})}),this._showBackdrop(function(){return n._showElement(t)}))}},h.hide=function(t){var n=this;if(t&&t.preventDefault(),!this._isTransitioning&&this._isShown){var i=e.Event(c.HIDE);if(e(this._element).trigger(i),this._isShown&&!i.isDefaultPrevented()){this._isShown=!1;var a=e(this._element).hasClass(d.FADE);if(a&&(this._isTransitioning=!0),this._setEscapeEvent(),this._setResizeEvent(),e(document).off(c.FOCUSIN),e(this._element).removeClass(d.SHOW),e(this._element).off(c.CLICK_DISMISS),e(this._dialog).off(c.MOUSEDOWN_DISMISS),a){var o=r.getTransitionDurationFromElement(this._element);e(this._element).one(r.TRANSITION_END,function(e){return n._hideModal(e)}).emulateTransitionEnd(o)}else this._hideModal()}}},h.dispose=function(){e.removeData(this._element,"bs.modal"),e(window,document,this._element,this._backdrop).off(n),this._config=null,this._element=null,this._dialog=null,this._backdrop=null,this._isShown=null,this._isBodyOverflowing=null,this._ignoreBackdropClick=null,this._scrollbarWidth=null},h.handleUpdate=function(){this._adjustDialog()},h._getConfig=function(e){return e=s({},o,e),r.typeCheckConfig(t,e,l),e},h._showElement=function(t){var n=this,i=e(this._element).hasClass(d.FADE);this._element.parentNode&&this._element.parentNode.nodeType===Node.ELEMENT_NODE||document.body.appendChild(this._element),this._element.style.display="block",this._element.removeAttribute("aria-hidden"),this._element.scrollTop=0,i&&r.reflow(this._element),e(this._element).addClass(d.SHOW),this._config.focus&&this._enforceFocus();var a=e.Event(c.SHOWN,{relatedTarget:t}),o=function(){n._config.focus&&n._element.focus(),n._isTransitioning=!1,e(n._element).trigger(a)};if(i){var s=r.getTransitionDurationFromElement(this._element);e(this._dialog).one(r.TRANSITION_END,o).emulateTransitionEnd(s)}else o()},h._enforceFocus=function(){var t=this;e(document).off(c.FOCUSIN).on(c.FOCUSIN,function(n){document!==n.target&&t._element!==n.target&&0===e(t._element).has(n.target).length&&t._element.focus()})},h._setEscapeEvent=function(){var t=this;this._isShown&&this._config.keyboard?e(this._element).on(c.KEYDOWN_DISMISS,function(e){27===e.which&&(e.preventDefault(),t.hide())}):this._isShown||e(this._element).off(c.KEYDOWN_DISMISS)},h._setResizeEvent=function(){var t=this;this._isShown?e(window).on(c.RESIZE,function(e){return t.handleUpdate(e)}):e(window).off(c.RESIZE)},h._hideModal=function(){var t=this;this._element.style.display="none",this._element.setAttribute("aria-hidden",!0),this._isTransitioning=!1,this._showBackdrop(function(){e(document.body).removeClass(d.OPEN),t._resetAdjustments(),t._resetScrollbar(),e(t._element).trigger(c.HIDDEN)})},h._removeBackdrop=function(){this._backdrop&&(e(this._backdrop).remove(),this._backdrop=null)},h._showBackdrop=function(t){var n=this,i=e(this._element).hasClass(d.FADE)?d.FADE:"";if(this._isShown&&this._config.backdrop){if(this._backdrop=document.createElement("div"),this._backdrop.className=d.BACKDROP,i&&e(this._backdrop).addClass(i),e(this._backdrop).appendTo(document.body),e(this._element).on(c.CLICK_DISMISS,function(e){n._ignoreBackdropClick?n._ignoreBackdropClick=!1:e.target===e.currentTarget&&("static"===n._config.backdrop?n._element.focus():n.hide())}),i&&r.reflow(this._backdrop),e(this._backdrop).addClass(d.SHOW),!t)return;if(!i)return void t();var a=r.getTransitionDurationFromElement(this._backdrop);e(this._backdrop).one(r.TRANSITION_END,t).emulateTransitionEnd(a)}else if(!this._isShown&&this._backdrop){e(this._backdrop).removeClass(d.SHOW);var o=function(){n._removeBackdrop(),t&&t()};if(e(this._element).hasClass(d.FADE)){var s=r.getTransitionDurationFromElement(this._backdrop);e(this._backdrop).one(r.TRANSITION_END,o).emulateTransitionEnd(s)}else o()}else t&&t()},h._adjustDialog=function(){var e=this._element.scrollHeight>document.documentElement.clientHeight;!this._isBodyOverflowing&&e&&(this._element.style.paddingLeft=this._scrollbarWidth+"px"),this._isBodyOverflowing&&!e&&(this._element.style.paddingRight=this._scrollbarWidth+"px")},h._resetAdjustments=function(){this._element.style.paddingLeft="",this._element.style.paddingRight=""},h._checkScrollbar=function(){var e=document.body.getBoundingClientRect();this._isBodyOverflowing=e.left+e.right<window.innerWidth,this._scrollbarWidth=this._getScrollbarWidth()},h._setScrollbar=function(){var t=this;if(this._isBodyOverflowing){e(u.FIXED_CONTENT).each(function(n,i){var a=e(i)[0].style.paddingRight,o=e(i).css("padding-right");e(i).data("padding-right",a).css("padding-right",parseFloat(o)+t._scrollbarWidth+"px")}),e(u.STICKY_CONTENT).each(function(n,i){var a=e(i)[0].style.marginRight,o=e(i).css("margin-right");e(i).data("margin-right",a).css("margin-right",parseFloat(o)-t._scrollbarWidth+"px")}),e(u.NAVBAR_TOGGLER).each(function(n,i){var a=e(i)[0].style.marginRight,o=e(i).css("margin-right");e(i).data("margin-right",a).css("margin-right",parseFloat(o)+t._scrollbarWidth+"px")});var n=document.body.style.paddingRight,i=e(document.body).css("padding-right");e(document.body).data("padding-right",n).css("padding-right",parseFloat(i)+this._scrollbarWidth+"px")}},h._resetScrollbar=function(){e(u.FIXED_CONTENT).each(function(t,n){var i=e(n).data("padding-right");void 0!==i&&e(n).css("padding-right",i).removeData("padding-right")}),e(u.STICKY_CONTENT+", "+u.NAVBAR_TOGGLER).each(function(t,n){var i=e(n).data("margin-right");void 0!==i&&e(n).css("margin-right",i).removeData("margin-right")});var t=e(document.body).data("padding-right");void 0!==t&&e(document.body).css("padding-right",t).removeData("padding-right")},h._getScrollbarWidth=function(){var e=document.createElement("div");e.className=d.SCROLLBAR_MEASURER,document.body.appendChild(e);var t=e.getBoundingClientRect().width-e.clientWidth;return document.body.removeChild(e),t},i._jQueryInterface=function(t,n){return this.each(function(){var a=e(this).data("bs.modal"),r=s({},o,e(this).data(),"object"==typeof t&&t?t:{});if(a||(a=new i(this,r),e(this).data("bs.modal",a)),"string"==typeof t){if(void 0===a[t])throw new TypeError('No method named "'+t+'"');a[t](n)}else r.show&&a.show(n)})},a(i,null,[{key:"VERSION",get:function(){return"4.1.1"}},{key:"Default",get:function(){return o}}]),i}();return e(document).on(c.CLICK_DATA_API,u.DATA_TOGGLE,function(t){var n,i=this,a=r.getSelectorFromElement(this);a&&(n=e(a)[0]);var o=e(n).data("bs.modal")?"toggle":s({},e(n).data(),e(this).data());"A"!==this.tagName&&"AREA"!==this.tagName||t.preventDefault();var l=e(n).one(c.SHOW,function(t){t.isDefaultPrevented()||l.one(c.HIDDEN,function(){e(i).is(":visible")&&i.focus()})});h._jQueryInterface.call(e(n),o,this)}),e.fn.modal=h._jQueryInterface,e.fn.modal.Constructor=h,e.fn.modal.noConflict=function(){return e.fn.modal=i,h._jQueryInterface},h}(t),m=function(e){var t="tooltip",i=".bs.tooltip",o=e.fn[t],l=new RegExp("(^|\\s)bs-tooltip\\S+","g"),c={animation:"boolean",template:"string",title:"(string|element|function)",trigger:"string",delay:"(number|object)",html:"boolean",selector:"(string|boolean)",placement:"(string|function)",offset:"(number|string)",container:"(string|element|boolean)",fallbackPlacement:"(string|array)",boundary:"(string|element)"},d={AUTO:"auto",TOP:"top",RIGHT:"right",BOTTOM:"bottom",LEFT:"left"},u={animation:!0,template:'<div class="tooltip" role="tooltip"><div class="arrow"></div><div class="tooltip-inner"></div></div>',trigger:"hover focus",title:"",delay:0,html:!1,selector:!1,placement:"top",offset:0,container:!1,fallbackPlacement:"flip",boundary:"scrollParent"},h={SHOW:"show",OUT:"out"},f={HIDE:"hide"+i,HIDDEN:"hidden"+i,SHOW:"show"+i,SHOWN:"shown"+i,INSERTED:"inserted"+i,CLICK:"click"+i,FOCUSIN:"focusin"+i,FOCUSOUT:"focusout"+i,MOUSEENTER:"mouseenter"+i,MOUSELEAVE:"mouseleave"+i},m={FADE:"fade",SHOW:"show"},p={TOOLTIP:".tooltip",TOOLTIP_INNER:".tooltip-inner",ARROW:".arrow"},g={HOVER:"hover",FOCUS:"focus",CLICK:"click",MANUAL:"manual"},b=function(){function o(e,t){if(void 0===n)throw new TypeError("Bootstrap tooltips require Popper.js (https://popper.js.org)");this._isEnabled=!0,this._timeout=0,this._hoverState="",this._activeTrigger={},this._popper=null,this.element=e,this.config=this._getConfig(t),this.tip=null,this._setListeners()}var b=o.prototype;return b.enable=function(){this._isEnabled=!0},b.disable=function(){this._isEnabled=!1},b.toggleEnabled=function(){this._isEnabled=!this._isEnabled},b.toggle=function(t){if(this._isEnabled)if(t){var n=this.constructor.DATA_KEY,i=e(t.currentTarget).data(n);i||(i=new this.constructor(t.currentTarget,this._getDelegateConfig()),e(t.currentTarget).data(n,i)),i._activeTrigger.click=!i._activeTrigger.click,i._isWithActiveTrigger()?i._enter(null,i):i._leave(null,i)}else{if(e(this.getTipElement()).hasClass(m.SHOW))return void this._leave(null,this);this._enter(null,this)}},b.dispose=function(){clearTimeout(this._timeout),e.removeData(this.element,this.constructor.DATA_KEY),e(this.element).off(this.constructor.EVENT_KEY),e(this.element).closest(".modal").off("hide.bs.modal"),this.tip&&e(this.tip).remove(),this._isEnabled=null,this._timeout=null,this._hoverState=null,this._activeTrigger=null,null!==this._popper&&this._popper.destroy(),this._popper=null,this.element=null,this.config=null,this.tip=null},b.show=function(){var t=this;if("none"===e(this.element).css("display"))throw new Error("Please use show on visible elements");var i=e.Event(this.constructor.Event.SHOW);if(this.isWithContent()&&this._isEnabled){e(this.element).trigger(i);var a=e.contains(this.element.ownerDocument.documentElement,this.element);if(i.isDefaultPrevented()||!a)return;var o=this.getTipElement(),s=r.getUID(this.constructor.NAME);o.setAttribute("id",s),this.element.setAttribute("aria-describedby",s),this.setContent(),this.config.animation&&e(o).addClass(m.FADE);var l="function"==typeof this.config.placement?this.config.placement.call(this,o,this.element):this.config.placement,c=this._getAttachment(l);this.addAttachmentClass(c);var d=!1===this.config.container?document.body:e(this.config.container);e(o).data(this.constructor.DATA_KEY,this),e.contains(this.element.ownerDocument.documentElement,this.tip)||e(o).appendTo(d),e(this.element).trigger(this.constructor.Event.INSERTED),this._popper=new n(this.element,o,{placement:c,modifiers:{offset:{offset:this.config.offset},flip:{behavior:this.config.fallbackPlacement},arrow:{element:p.ARROW},preventOverflow:{boundariesElement:this.config.boundary}},onCreate:function(e){e.originalPlacement!==e.placement&&t._handlePopperPlacementChange(e)},onUpdate:function(e){t._handlePopperPlacementChange(e)}}),e(o).addClass(m.SHOW),"ontouchstart"in document.documentElement&&e(document.body).children().on("mouseover",null,e.noop);var u=function(){t.config.animation&&t._fixTransition();var n=t._hoverState;t._hoverState=null,e(t.element).trigger(t.constructor.Event.SHOWN),n===h.OUT&&t._leave(null,t)};if(e(this.tip).hasClass(m.FADE)){var f=r.getTransitionDurationFromElement(this.tip);e(this.tip).one(r.TRANSITION_END,u).emulateTransitionEnd(f)}else u()}},b.hide=function(t){var n=this,i=this.getTipElement(),a=e.Event(this.constructor.Event.HIDE),o=function(){n._hoverState!==h.SHOW&&i.parentNode&&i.parentNode.removeChild(i),n._cleanTipClass(),n.element.removeAttribute("aria-describedby"),e(n.element).trigger(n.constructor.Event.HIDDEN),null!==n._popper&&n._popper.destroy(),t&&t()};if(e(this.element).trigger(a),!a.isDefaultPrevented()){if(e(i).removeClass(m.SHOW),"ontouchstart"in document.documentElement&&e(document.body).children().off("mouseover",null,e.noop),this._activeTrigger[g.CLICK]=!1,this._activeTrigger[g.FOCUS]=!1,this._activeTrigger[g.HOVER]=!1,e(this.tip).hasClass(m.FADE)){var s=r.getTransitionDurationFromElement(i);e(i).one(r.TRANSITION_END,o).emulateTransitionEnd(s)}else o();this._hoverState=""}},b.update=function(){null!==this._popper&&this._popper.scheduleUpdate()},b.isWithContent=function(){return Boolean(this.getTitle())},b.addAttachmentClass=function(t){e(this.getTipElement()).addClass("bs-tooltip-"+t)},b.getTipElement=function(){return this.tip=this.tip||e(this.config.template)[0],this.tip},b.setContent=function(){var t=e(this.getTipElement());this.setElementContent(t.find(p.TOOLTIP_INNER),this.getTitle()),t.removeClass(m.FADE+" "+m.SHOW)},b.setElementContent=function(t,n){var i=this.config.html;"object"==typeof n&&(n.nodeType||n.jquery)?i?e(n).parent().is(t)||t.empty().append(n):t.text(e(n).text()):t[i?"html":"text"](n)},b.getTitle=function(){var e=this.element.getAttribute("data-original-title");return e||(e="function"==typeof this.config.title?this.config.title.call(this.element):this.config.title),e},b._getAttachment=function(e){return d[e.toUpperCase()]},b._setListeners=function(){var t=this,n=this.config.trigger.split(" ");n.forEach(function(n){if("click"===n)e(t.element).on(t.constructor.Event.CLICK,t.config.selector,function(e){return t.toggle(e)});else if(n!==g.MANUAL){var i=n===g.HOVER?t.constructor.Event.MOUSEENTER:t.constructor.Event.FOCUSIN,a=n===g.HOVER?t.constructor.Event.MOUSELEAVE:t.constructor.Event.FOCUSOUT;e(t.element).on(i,t.config.selector,function(e){return t._enter(e)}).on(a,t.config.selector,function(e){return t._leave(e)})}e(t.element).closest(".modal").on("hide.bs.modal",function(){return t.hide()})}),this.config.selector?this.config=s({},this.config,{trigger:"manual",selector:""}):this._fixTitle()},b._fixTitle=function(){var e=typeof this.element.getAttribute("data-original-title");(this.element.getAttribute("title")||"string"!==e)&&(this.element.setAttribute("data-original-title",this.element.getAttribute("title")||""),this.element.setAttribute("title",""))},b._enter=function(t,n){var i=this.constructor.DATA_KEY;(n=n||e(t.currentTarget).data(i))||(n=new this.constructor(t.currentTarget,this._getDelegateConfig()),e(t.currentTarget).data(i,n)),t&&(n._activeTrigger["focusin"===t.type?g.FOCUS:g.HOVER]=!0),e(n.getTipElement()).hasClass(m.SHOW)||n._hoverState===h.SHOW?n._hoverState=h.SHOW:(clearTimeout(n._timeout),n._hoverState=h.SHOW,n.config.delay&&n.config.delay.show?n._timeout=setTimeout(function(){n._hoverState===h.SHOW&&n.show()},n.config.delay.show):n.show())},b._leave=function(t,n){var i=this.constructor.DATA_KEY;(n=n||e(t.currentTarget).data(i))||(n=new this.constructor(t.currentTarget,this._getDelegateConfig()),e(t.currentTarget).data(i,n)),t&&(n._activeTrigger["focusout"===t.type?g.FOCUS:g.HOVER]=!1),n._isWithActiveTrigger()||(clearTimeout(n._timeout),n._hoverState=h.OUT,n.config.delay&&n.config.delay.hide?n._timeout=setTimeout(function(){n._hoverState===h.OUT&&n.hide()},n.config.delay.hide):n.hide())},b._isWithActiveTrigger=function(){for(var e in this._activeTrigger)if(this._activeTrigger[e])return!0;return!1},b._getConfig=function(n){return"number"==typeof(n=s({},this.constructor.Default,e(this.element).data(),"object"==typeof n&&n?n:{})).delay&&(n.delay={show:n.delay,hide:n.delay}),"number"==typeof n.title&&(n.title=n.title.toString()),"number"==typeof n.content&&(n.content=n.content.toString()),r.typeCheckConfig(t,n,this.constructor.DefaultType),n},b._getDelegateConfig=function(){var e={};if(this.config)for(var t in this.config)this.constructor.Default[t]!==this.config[t]&&(e[t]=this.config[t]);return e},b._cleanTipClass=function(){var t=e(this.getTipElement()),n=t.attr("class").match(l);null!==n&&n.length>0&&t.removeClass(n.join(""))},b._handlePopperPlacementChange=function(e){this._cleanTipClass(),this.addAttachmentClass(this._getAttachment(e.placement))},b._fixTransition=function(){var t=this.getTipElement(),n=this.config.animation;null===t.getAttribute("x-placement")&&(e(t).removeClass(m.FADE),this.config.animation=!1,this.hide(),this.show(),this.config.animation=n)},o._jQueryInterface=function(t){return this.each(function(){var n=e(this).data("bs.tooltip"),i="object"==typeof t&&t;if((n||!/dispose|hide/.test(t))&&(n||(n=new o(this,i),e(this).data("bs.tooltip",n)),"string"==typeof t)){if(void 0===n[t])throw new TypeError('No method named "'+t+'"');n[t]()}})},a(o,null,[{key:"VERSION",get:function(){return"4.1.1"}},{key:"Default",get:function(){return u}},{key:"NAME",get:function(){return t}},{key:"DATA_KEY",get:function(){return"bs.tooltip"}},{key:"Event",get:function(){return f}},{key:"EVENT_KEY",get:function(){return i}},{key:"DefaultType",get:function(){return c}}]),o}();return e.fn[t]=b._jQueryInterface,e.fn[t].Constructor=b,e.fn[t].noConflict=function(){return e.fn[t]=o,b._jQueryInterface},b}(t),p=function(e){var t="popover",n=".bs.popover",i=e.fn[t],o=new RegExp("(^|\\s)bs-popover\\S+","g"),r=s({},m.Default,{placement:"right",trigger:"click",content:"",template:'<div class="popover" role="tooltip"><div class="arrow"></div><h3 class="popover-header"></h3><div class="popover-body"></div></div>'}),l=s({},m.DefaultType,{content:"(string|element|function)"}),c={FADE:"fade",SHOW:"show"},d={TITLE:".popover-header",CONTENT:".popover-body"},u={HIDE:"hide"+n,HIDDEN:"hidden"+n,SHOW:"show"+n,SHOWN:"shown"+n,INSERTED:"inserted"+n,CLICK:"click"+n,FOCUSIN:"focusin"+n,FOCUSOUT:"focusout"+n,MOUSEENTER:"mouseenter"+n,MOUSELEAVE:"mouseleave"+n},h=function(i){function s(){return i.apply(this,arguments)||this}!function(e,t){e.prototype=Object.create(t.prototype),e.prototype.constructor=e,e.__proto__=t}(s,i);var h=s.prototype;return h.isWithContent=function(){return this.getTitle()||this._getContent()},h.addAttachmentClass=function(t){e(this.getTipElement()).addClass("bs-popover-"+t)},h.getTipElement=function(){return this.tip=this.tip||e(this.config.template)[0],this.tip},h.setContent=function(){var t=e(this.getTipElement());this.setElementContent(t.find(d.TITLE),this.getTitle());var n=this._getContent();"function"==typeof n&&(n=n.call(this.element)),this.setElementContent(t.find(d.CONTENT),n),t.removeClass(c.FADE+" "+c.SHOW)},h._getContent=function(){return this.element.getAttribute("data-content")||this.config.content},h._cleanTipClass=function(){var t=e(this.getTipElement()),n=t.attr("class").match(o);null!==n&&n.length>0&&t.removeClass(n.join(""))},s._jQueryInterface=function(t){return this.each(function(){var n=e(this).data("bs.popover"),i="object"==typeof t?t:null;if((n||!/destroy|hide/.test(t))&&(n||(n=new s(this,i),e(this).data("bs.popover",n)),"string"==typeof t)){if(void 0===n[t])throw new TypeError('No method named "'+t+'"');n[t]()}})},a(s,null,[{key:"VERSION",get:function(){return"4.1.1"}},{key:"Default",get:function(){return r}},{key:"NAME",get:function(){return t}},{key:"DATA_KEY",get:function(){return"bs.popover"}},{key:"Event",get:function(){return u}},{key:"EVENT_KEY",get:function(){return n}},{key:"DefaultType",get:function(){return l}}]),s}(m);return e.fn[t]=h._jQueryInterface,e.fn[t].Constructor=h,e.fn[t].noConflict=function(){return e.fn[t]=i,h._jQueryInterface},h}(t),g=function(e){var t="scrollspy",n=e.fn[t],i={offset:10,method:"auto",target:""},o={offset:"number",method:"string",target:"(string|element)"},l={ACTIVATE:"activate.bs.scrollspy",SCROLL:"scroll.bs.scrollspy",LOAD_DATA_API:"load.bs.scrollspy.data-api"},c={DROPDOWN_ITEM:"dropdown-item",DROPDOWN_MENU:"dropdown-menu",ACTIVE:"active"},d={DATA_SPY:'[data-spy="scroll"]',ACTIVE:".active",NAV_LIST_GROUP:".nav, .list-group",NAV_LINKS:".nav-link",NAV_ITEMS:".nav-item",LIST_ITEMS:".list-group-item",DROPDOWN:".dropdown",DROPDOWN_ITEMS:".dropdown-item",DROPDOWN_TOGGLE:".dropdown-toggle"},u={OFFSET:"offset",POSITION:"position"},h=function(){function n(t,n){var i=this;this._element=t,this._scrollElement="BODY"===t.tagName?window:t,this._config=this._getConfig(n),this._selector=this._config.target+" "+d.NAV_LINKS+","+this._config.target+" "+d.LIST_ITEMS+","+this._config.target+" "+d.DROPDOWN_ITEMS,this._offsets=[],this._targets=[],this._activeTarget=null,this._scrollHeight=0,e(this._scrollElement).on(l.SCROLL,function(e){return i._process(e)}),this.refresh(),this._process()}var h=n.prototype;return h.refresh=function(){var t=this,n=this._scrollElement===this._scrollElement.window?u.OFFSET:u.POSITION,i="auto"===this._config.method?n:this._config.method,a=i===u.POSITION?this._getScrollTop():0;this._offsets=[],this._targets=[],this._scrollHeight=this._getScrollHeight();var o=e.makeArray(e(this._selector));o.map(function(t){var n,o=r.getSelectorFromElement(t);if(o&&(n=e(o)[0]),n){var s=n.getBoundingClientRect();if(s.width||s.height)return[e(n)[i]().top+a,o]}return null}).filter(function(e){return e}).sort(function(e,t){return e[0]-t[0]}).forEach(function(e){t._offsets.push(e[0]),t._targets.push(e[1])})},h.dispose=function(){e.removeData(this._element,"bs.scrollspy"),e(this._scrollElement).off(".bs.scrollspy"),this._element=null,this._scrollElement=null,this._config=null,this._selector=null,this._offsets=null,this._targets=null,this._activeTarget=null,this._scrollHeight=null},h._getConfig=function(n){if("string"!=typeof(n=s({},i,"object"==typeof n&&n?n:{})).target){var a=e(n.target).attr("id");a||(a=r.getUID(t),e(n.target).attr("id",a)),n.target="#"+a}return r.typeCheckConfig(t,n,o),n},h._getScrollTop=function(){return this._scrollElement===window?this._scrollElement.pageYOffset:this._scrollElement.scrollTop},h._getScrollHeight=function(){return this._scrollElement.scrollHeight||Math.max(document.body.scrollHeight,document.documentElement.scrollHeight)},h._getOffsetHeight=function(){return this._scrollElement===window?window.innerHeight:this._scrollElement.getBoundingClientRect().height},h._process=function(){var e=this._getScrollTop()+this._config.offset,t=this._getScrollHeight(),n=this._config.offset+t-this._getOffsetHeight();if(this._scrollHeight!==t&&this.refresh(),e>=n){var i=this._targets[this._targets.length-1];this._activeTarget!==i&&this._activate(i)}else{if(this._activeTarget&&e<this._offsets[0]&&this._offsets[0]>0)return this._activeTarget=null,void this._clear();for(var a=this._offsets.length;a--;){var o=this._activeTarget!==this._targets[a]&&e>=this._offsets[a]&&(void 0===this._offsets[a+1]||e<this._offsets[a+1]);o&&this._activate(this._targets[a])}}},h._activate=function(t){this._activeTarget=t,this._clear();var n=this._selector.split(",");n=n.map(function(e){return e+'[data-target="'+t+'"],'+e+'[href="'+t+'"]'});var i=e(n.join(","));i.hasClass(c.DROPDOWN_ITEM)?(i.closest(d.DROPDOWN).find(d.DROPDOWN_TOGGLE).addClass(c.ACTIVE),i.addClass(c.ACTIVE)):(i.addClass(c.ACTIVE),i.parents(d.NAV_LIST_GROUP).prev(d.NAV_LINKS+", "+d.LIST_ITEMS).addClass(c.ACTIVE),i.parents(d.NAV_LIST_GROUP).prev(d.NAV_ITEMS).children(d.NAV_LINKS).addClass(c.ACTIVE)),e(this._scrollElement).trigger(l.ACTIVATE,{relatedTarget:t})},h._clear=function(){e(this._selector).filter(d.ACTIVE).removeClass(c.ACTIVE)},n._jQueryInterface=function(t){return this.each(function(){var i=e(this).data("bs.scrollspy"),a="object"==typeof t&&t;if(i||(i=new n(this,a),e(this).data("bs.scrollspy",i)),"string"==typeof t){if(void 0===i[t])throw new TypeError('No method named "'+t+'"');i[t]()}})},a(n,null,[{key:"VERSION",get:function(){return"4.1.1"}},{key:"Default",get:function(){return i}}]),n}();return e(window).on(l.LOAD_DATA_API,function(){for(var t=e.makeArray(e(d.DATA_SPY)),n=t.length;n--;){var i=e(t[n]);h._jQueryInterface.call(i,i.data())}}),e.fn[t]=h._jQueryInterface,e.fn[t].Constructor=h,e.fn[t].noConflict=function(){return e.fn[t]=n,h._jQueryInterface},h}(t),b=function(e){var t=e.fn.tab,n={HIDE:"hide.bs.tab",HIDDEN:"hidden.bs.tab",SHOW:"show.bs.tab",SHOWN:"shown.bs.tab",CLICK_DATA_API:"click.bs.tab.data-api"},i={DROPDOWN_MENU:"dropdown-menu",ACTIVE:"active",DISABLED:"disabled",FADE:"fade",SHOW:"show"},o={DROPDOWN:".dropdown",NAV_LIST_GROUP:".nav, .list-group",ACTIVE:".active",ACTIVE_UL:"> li > .active",DATA_TOGGLE:'[data-toggle="tab"], [data-toggle="pill"], [data-toggle="list"]',DROPDOWN_TOGGLE:".dropdown-toggle",DROPDOWN_ACTIVE_CHILD:"> .dropdown-menu .active"},s=function(){function t(e){this._element=e}var s=t.prototype;return s.show=function(){var t=this;if(!(this._element.parentNode&&this._element.parentNode.nodeType===Node.ELEMENT_NODE&&e(this._element).hasClass(i.ACTIVE)||e(this._element).hasClass(i.DISABLED))){var a,s,l=e(this._element).closest(o.NAV_LIST_GROUP)[0],c=r.getSelectorFromElement(this._element);if(l){var d="UL"===l.nodeName?o.ACTIVE_UL:o.ACTIVE;s=(s=e.makeArray(e(l).find(d)))[s.length-1]}var u=e.Event(n.HIDE,{relatedTarget:this._element}),h=e.Event(n.SHOW,{relatedTarget:s});if(s&&e(s).trigger(u),e(this._element).trigger(h),!h.isDefaultPrevented()&&!u.isDefaultPrevented()){c&&(a=e(c)[0]),this._activate(this._element,l);var f=function(){var i=e.Event(n.HIDDEN,{relatedTarget:t._element}),a=e.Event(n.SHOWN,{relatedTarget:s});e(s).trigger(i),e(t._element).trigger(a)};a?this._activate(a,a.parentNode,f):f()}}},s.dispose=function(){e.removeData(this._element,"bs.tab"),this._element=null},s._activate=function(t,n,a){var s=this,l=("UL"===n.nodeName?e(n).find(o.ACTIVE_UL):e(n).children(o.ACTIVE))[0],c=a&&l&&e(l).hasClass(i.FADE),d=function(){return s._transitionComplete(t,l,a)};if(l&&c){var u=r.getTransitionDurationFromElement(l);e(l).one(r.TRANSITION_END,d).emulateTransitionEnd(u)}else d()},s._transitionComplete=function(t,n,a){if(n){e(n).removeClass(i.SHOW+" "+i.ACTIVE);var s=e(n.parentNode).find(o.DROPDOWN_ACTIVE_CHILD)[0];s&&e(s).removeClass(i.ACTIVE),"tab"===n.getAttribute("role")&&n.setAttribute("aria-selected",!1)}if(e(t).addClass(i.ACTIVE),"tab"===t.getAttribute("role")&&t.setAttribute("aria-selected",!0),r.reflow(t),e(t).addClass(i.SHOW),t.parentNode&&e(t.parentNode).hasClass(i.DROPDOWN_MENU)){var l=e(t).closest(o.DROPDOWN)[0];l&&e(l).find(o.DROPDOWN_TOGGLE).addClass(i.ACTIVE),t.setAttribute("aria-expanded",!0)}a&&a()},t._jQueryInterface=function(n){return this.each(function(){var i=e(this),a=i.data("bs.tab");if(a||(a=new t(this),i.data("bs.tab",a)),"string"==typeof n){if(void 0===a[n])throw new TypeError('No method named "'+n+'"');a[n]()}})},a(t,null,[{key:"VERSION",get:function(){return"4.1.1"}}]),t}();return e(document).on(n.CLICK_DATA_API,o.DATA_TOGGLE,function(t){t.preventDefault(),s._jQueryInterface.call(e(this),"show")}),e.fn.tab=s._jQueryInterface,e.fn.tab.Constructor=s,e.fn.tab.noConflict=function(){return e.fn.tab=t,s._jQueryInterface},s}(t);(function(e){if(void 0===e)throw new TypeError("Bootstrap's JavaScript requires jQuery. jQuery must be included before Bootstrap's JavaScript.");var t=e.fn.jquery.split(" ")[0].split(".");if(t[0]<2&&t[1]<9||1===t[0]&&9===t[1]&&t[2]<1||t[0]>=4)throw new Error("Bootstrap's JavaScript requires at least jQuery v1.9.1 but less than v4.0.0")})(t),e.Util=r,e.Alert=l,e.Button=c,e.Carousel=d,e.Collapse=u,e.Dropdown=h,e.Modal=f,e.Popover=p,e.Scrollspy=g,e.Tab=b,e.Tooltip=m,Object.defineProperty(e,"__esModule",{value:!0})}(t,n(0),n(131))},function(e,t,n){"use strict";(function(e){var t="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e};n(132),n(130),n(129),n(128),n(127),n(126),n(125),n(124),n(48),n(123),n(122),n(121),n(111),n(109),n(108),n(107);var i=n(106),a=n(103),o=h(n(61)),s=h(n(2)),r=h(n(60)),l=h(n(59)),c=h(n(52)),d=h(n(51)),u=h(n(50));function h(e){return e&&e.__esModule?e:{default:e}}(0,r.default)("isotope",l.default,e),(0,r.default)("imagesLoaded",c.default,e);var f=function(e){return(0,i.gettext)(e)};e(document).ready(function(e){var n={ws_notifications:function(){var e="https:"===window.location.protocol?"wss:":"ws:";new WebSocket(e+"//"+window.location.hostname+":"+window.location.port+n.srWebRoot+"/ws/ui").onmessage=function(e){var t=JSON.parse(e.data);"notification"===t.event&&n.notify(t.data.type,t.data.title,t.data.body)}},notify:function(e,t,i){s.default.modules.Desktop.permission(),new s.default({stack:{dir1:"up",dir2:"left",firstpos1:25,firstpos2:25},icons:"fontawesome5",styling:"bootstrap4",addclass:"stack-bottomright",delay:5e3,hide:!0,history:!1,shadow:!1,width:"340px",target:document.body,data:{modules:{Desktop:{desktop:!0,icon:n.srWebRoot+"/images/logo-badge.png"}},type:e,title:t,text:i.replace(/<br[\s/]*(?:\s[^>]*)?>/gi,"\n").replace(/<[/]?b(?:\s[^>]*)?>/gi,"*").replace(/<i(?:\s[^>]*)?>/gi,"[").replace(/<[/]i>/gi,"]").replace(/<(?:[/]?ul|\/li)(?:\s[^>]*)?>/gi,"").replace(/<li(?:\s[^>]*)?>/gi,"\n* ")}})},isMeta:function(t,n){return new RegExp(n.length>1?n.join("|"):n).test(e('meta[data-var="'+t+'"]').data("content"))},getMeta:function(t){return e('meta[data-var="'+t+'"]').data("content")},metaToBool:function(t){var n=e('meta[data-var="'+t+'"]').data("content");return void 0===n?n:!("false"===(n=isNaN(n)?n.toLowerCase():n.toString())||"none"===n||"0"===n)},showHideRows:function(t,n){e("tr."+t).each(function(){n?e(this).show():e(this).hide()})},updateUrlParameter:function(e,t,n){var i=e.indexOf("#"),a=-1===i?"":e.substr(i);e=-1===i?e:e.substr(0,i);var o=new RegExp("([?&])"+t+"=.*?(&|$)","i"),s=-1!==e.indexOf("?")?"&":"?";return n?e=e.match(o)?e.replace(o,"$1"+t+"="+n+"$2"):e+s+t+"="+n:("?"===(e=e.replace(new RegExp("([?&]?)"+t+"=[^&]*","i"),"")).slice(-1)&&(e=e.slice(0,-1)),-1===e.indexOf("?")&&(e=e.replace(/&/,"?"))),e+a},quicksearch:function(){e.widget("custom.catcomplete",e.ui.autocomplete,{_create:function(){this._super(),this.widget().menu("option","items","> :not(.ui-autocomplete-category)")},_renderMenu:function(t,n){var i=this,a="";e.each(n,function(e,n){var o;n.category!=a&&(t.append("<li class='ui-autocomplete-category text-warning p-1'><strong class='text-uppercase'>"+n.category+"</strong></li>"),a=n.category),o=i._renderItemData(t,n),n.category&&o.attr("aria-label",n.category+" : "+n.name)})},_renderItem:function(t,i){var a=e('<li class="bg-transparent m-1">'),o=e("<img>"),s=e("<a>");return a.attr("data-value",i.name),o.attr({src:i.img,alt:i.name,class:"img-fluid w-100"}),"shows"===i.category?(s.attr({href:n.srWebRoot+"/home/displayShow?show="+i.showid,class:"btn btn-dark btn-block d-inline-block text-left"}),a.append(s),a.find("a").append(e('<div class="row"><div class="col-2"><div id="show-img"></div></div><div class="col-10"><div class="row"><strong id="show-name" class="text-white text-truncate"></strong></div><div class="row"><strong id="show-seasons" class="text-secondary"></strong></div></div></div>')),a.find("#show-img").append(o),a.find("#show-name").append(i.name),a.find("#show-seasons").append(i.seasons+" seasons")):(s.attr({href:n.srWebRoot+"/home/displayShow?show="+i.showid+"#S"+i.season+"E"+i.episode,class:"btn btn-dark btn-block d-inline-block text-left"}),a.append(s),a.find("a").append(e('<div class="row"><div class="col-2"><div id="show-img"></div></div><div class="col-10"><div class="row"><strong id="ep-name" class="text-white"></strong></div><div class="row"><strong id="show-name" class="text-secondary text-truncate"></strong></div></div></div>')),a.find("#show-img").append(o),a.find("#ep-name").append(i.name),a.find("#show-name").append(i.showname)),a.appendTo(t)}}),e("#quicksearch").catcomplete({delay:1e3,minLength:1,source:n.srWebRoot+"/quicksearch.json",focus:function(t,n){return e("#quicksearch").val(n.item.name),!1},open:function(){e("#quicksearch-icon").addClass("fas fa-times"),e("ul.ui-menu").width(e(this).innerWidth()),e("ul.ui-menu").css("border","none"),e("ul.ui-menu").css("outline","none"),e("ul.ui-menu").addClass("bg-dark shadow rounded")}}),e("#quicksearch-icon").click(function(){e("#quicksearch").catcomplete("close").val(""),e("#quicksearch-icon").removeClass()})},common:{init:function(){n.srPID=n.getMeta("srPID"),n.srWebRoot=n.getMeta("srWebRoot"),n.srDefaultPage=n.getMeta("srDefaultPage"),n.loadingHTML='<i class="fas fa-spinner fa-spin fa-fw"></i>',n.anonURL=n.getMeta("anonURL"),n.ws_notifications(),e.get(n.srWebRoot+"/messages.po",function(e){e&&((0,i.addLocale)(n.getMeta("srLocale"),a.po.parse(e)),(0,i.useLocale)(n.getMeta("srLocale")))}),n.quicksearch(),e(window).scroll(function(){e(this).scrollTop()>50?e("#back-to-top").fadeIn():e("#back-to-top").fadeOut()}),e("#back-to-top").click(function(){return e("body,html").animate({scrollTop:0},800),!1}),e('[title!=""]').tooltipster();for(var t=document.getElementsByTagName("img"),s=0;s<t.length;s++)t[s].getAttribute("data-src")&&t[s].setAttribute("src",t[s].getAttribute("data-src"));(navigator.maxTouchPoints||0)<2&&e(".dropdown-toggle").on("click",function(){"true"===e(this).attr("aria-expanded")&&(window.location.href=e(this).attr("href"))}),n.metaToBool("sickrage.FUZZY_DATING")&&(e.timeago.settings.allowFuture=!0,e.timeago.settings.strings={prefixAgo:null,prefixFromNow:"In ",suffixAgo:"ago",suffixFromNow:"",seconds:"less than a minute",minute:"about a minute",minutes:"%d minutes",hour:"an hour",hours:"%d hours",day:"a day",days:"%d days",month:"a month",months:"%d months",year:"a year",years:"%d years",wordSeparator:" ",numbers:[]},e("[datetime]").timeago()),e.tablesorter.addParser({id:"loadingNames",is:function(){return!1},format:function(e){return 0===e.indexOf("Loading...")?e.replace("Loading...","000"):n.metaToBool("sickrage.SORT_ARTICLE")?e||"":(e||"").replace(/^(The|A|An)\s/i,"")},type:"text"}),e.tablesorter.addParser({id:"quality",is:function(){return!1},format:function(e){return e.replace("hd1080p",5).replace("hd720p",4).replace("hd",3).replace("sd",2).replace("any",1).replace("best",0).replace("custom",7)},type:"numeric"}),e.tablesorter.addParser({id:"realISODate",is:function(){return!1},format:function(e){return new Date(e).getTime()},type:"numeric"}),e.tablesorter.addParser({id:"cDate",is:function(){return!1},format:function(e){return e},type:"numeric"}),e.tablesorter.addParser({id:"eps",is:function(){return!1},format:function(e){var t=e.match(/^(.*)/);if(null===t||"?"===t[1])return-10;var i=t[1].split(" / ");if(-1!==i[0].indexOf("+")){var a=i[0].split("+");i[0]=a[0]}if(i[0]=parseInt(i[0]),i[1]=parseInt(i[1]),0===i[0])return i[1];var o=parseInt(n.getMeta("max_download_count")*i[0]/i[1]),s=Math.round(i[0]/i[1]*100)/1e3;return o>0&&(o+=i[0]),o+s},type:"numeric"}),o.default.defaults={theme:"dark",type:"blue",typeAnimated:!0,confirm:function(){location.href=this.$target.attr("href")}},e("a.shutdown").confirm({theme:"dark",title:f("Shutdown"),content:f("Are you sure you want to shutdown SiCKRAGE ?")}),e("a.restart").confirm({theme:"dark",title:f("Restart"),content:f("Are you sure you want to restart SiCKRAGE ?")}),e("a.submiterrors").confirm({theme:"dark",title:f("Submit Errors"),content:f("Are you sure you want to submit these errors ?")+'<br><br><span class="text-danger">'+f("Make sure SiCKRAGE is updated and trigger")+"<br>"+f("this error with debug enabled before submitting")+"</span>"}),e("#removeW").click(function(){e("#white option:selected").remove().appendTo("#pool")}),e("#addW").click(function(){e("#pool option:selected").remove().appendTo("#white")}),e("#addB").click(function(){e("#pool option:selected").remove().appendTo("#black")}),e("#removeP").click(function(){e("#pool option:selected").remove()}),e("#removeB").click(function(){e("#black option:selected").remove().appendTo("#pool")}),e("#addToWhite").click(function(){var t=e("#addToPoolText").val();if(""!==t){var n=e("<option>");n.attr("value",t),n.html(t),n.appendTo("#white"),e("#addToPoolText").val("")}}),e("#addToBlack").click(function(){var t=e("#addToPoolText").val();if(""!==t){var n=e("<option>");n.attr("value",t),n.html(t),n.appendTo("#black"),e("#addToPoolText").val("")}}),e("input:checkbox.enabler").each(function(){e(this).prop("checked")?e("#content_"+e(this).attr("id")).show():e("#content_"+e(this).attr("id")).hide()}),e("input:checkbox.enabler").on("click",function(){e(this).prop("checked")?e("#content_"+e(this).attr("id")).fadeIn("fast","linear"):e("#content_"+e(this).attr("id")).fadeOut("fast","linear")}),e(".modal").on("shown.bs.modal",function(){e("body").addClass("modal-open"),e("body").removeAttr("style")}),n.browser.init(),n.quality_chooser.init(),e("#changelog").on("click",function(t){t.preventDefault(),e("#changelogModal").find(".modal-body").load(n.srWebRoot+"/changes"),e("#changelogModal").modal()})}},ajax_search:{searchStatusUrl:"/home/getManualSearchStatus",failedDownload:!1,qualityDownload:!1,selectedEpisode:"",manualSearches:[],init:function(){n.ajax_search.searchStatusUrl=n.srWebRoot+n.ajax_search.searchStatusUrl,n.ajax_search.ajaxEpSearch({colorRow:!0}),n.ajax_search.checkManualSearches(),n.ajax_search.ajaxEpSubtitlesSearch()},enableLink:function(e){e.on("click.disabled",!1),e.prop("enableClick","1"),e.fadeTo("fast",1)},disableLink:function(e){e.off("click.disabled"),e.prop("enableClick","0"),e.fadeTo("fast",.5)},updateImages:function(t){e.each(t.episodes,function(t,i){var a="",o=e("a[id="+i.show+"x"+i.season+"x"+i.episode+"]"),s=o.children("i"),r=o.parent();if(o){var l="";"searching"===i.searchstatus.toLowerCase()?(s.prop("title",f("Searching")),s.prop("class","fas fa-spinner fa-spin fa-fw"),n.ajax_search.disableLink(o),a=i.searchstatus):"queued"===i.searchstatus.toLowerCase()?(s.prop("title",f("Queued")),s.prop("class","fas fa-clock"),n.ajax_search.disableLink(o),a=i.searchstatus):"finished"===i.searchstatus.toLowerCase()&&(s.prop("title",f("Searching")),s.parent().prop("class","epRetry"),s.prop("class","fas fa-search"),n.ajax_search.enableLink(o),l=/(\w+)\s\((.+?)\)/,a=i.status.replace(l,'$1 <span class="badge text-white '+i.quality+'">$2</span>'),r.closest("tr").prop("class",i.overview+" season-"+i.season+" seasonstyle font-weight-bold text-dark")),r.siblings(".col-status").html(a)}var c=e("a[id=forceUpdate-"+i.show+"x"+i.season+"x"+i.episode+"]"),d=c.children("i");c&&("searching"===i.searchstatus.toLowerCase()?(d.prop("title",f("Searching")),d.prop("alt","searching"),d.prop("class","fas fa-spinner fa-spin fa-fw"),n.ajax_search.disableLink(c)):"queued"===i.searchstatus.toLowerCase()?(d.prop("title",f("Queued")),d.prop("alt","queued"),d.prop("class","fas fa-clock")):"finished"===i.searchstatus.toLowerCase()&&(d.prop("title",f("Manual Search")),d.prop("alt","[search]"),d.prop("class","fas fa-search"),"snatched"===i.overview.toLowerCase()?c.closest("tr").remove():n.ajax_search.enableLink(c)))})},manualSearch:function(t){var i,a,o,s=n.ajax_search.selectedEpisode.parent(),r=n.ajax_search.selectedEpisode,l=n.ajax_search.selectedEpisode.children("i");l.prop("title",f("loading")),l.prop("class",t.loadingIcon);var c=n.ajax_search.selectedEpisode.prop("href");return!1===n.ajax_search.failedDownload&&(c=c.replace("retryEpisode","searchEpisode")),c=c+"&downCurQuality="+(n.ajax_search.qualityDownload?"1":"0"),e.getJSON(c,function(e){if("failure"===e.result.toLowerCase())i=t.noIcon,a="failed";else{i=t.loadingIcon,a="success",t.colorRow&&s.parent().removeClass("skipped wanted qual good unaired").addClass("snatched");o=e.result.replace(/(\w+)\s\((.+?)\)/,'$1 <span class="badge text-white '+e.quality+'">$2</span>'),s.siblings(".col-status").html(o),n.ajax_search.disableLink(r)}l.prop("title",a),l.prop("height",t.size),l.prop("class",i)}),!1},checkManualSearches:function(){var t=5e3,i=e("#showID").val(),a=void 0!==i?n.ajax_search.searchStatusUrl+"?show="+i:n.ajax_search.searchStatusUrl;e.ajax({url:a,success:function(e){t=e.episodes?5e3:15e3,n.ajax_search.updateImages(e)},error:function(){t=3e4},type:"GET",dataType:"json",complete:function(){setTimeout(n.ajax_search.checkManualSearches,t)},timeout:15e3})},ajaxEpSearch:function(t){t=e.extend({},{size:16,colorRow:!1,loadingIcon:"fas fa-spinner fa-spin fa-fw",queuedIcon:"fas fa-clock",noIcon:"fas fa-times",yesIcon:"fas fa-check"},t),e(".epRetry").click(function(t){if(t.preventDefault(),"0"===e(this).prop("enableClick"))return!1;n.ajax_search.selectedEpisode=e(this),e("#manualSearchModalFailed").modal()}),e(".epSearch").click(function(i){if(i.preventDefault(),"0"===e(this).prop("enableClick"))return!1;n.ajax_search.selectedEpisode=e(this),e(this).parent().parent().children(".col-status").children(".quality").length?e("#manualSearchModalQuality").modal():n.ajax_search.manualSearch(t)}),e("#manualSearchModalFailed .btn").click(function(){n.ajax_search.failedDownload="yes"===e(this).text().toLowerCase()}),e("#manualSearchModalQuality .btn").click(function(){n.ajax_search.qualityDownload="yes"===e(this).text().toLowerCase(),n.ajax_search.manualSearch(t)})},ajaxEpSubtitlesSearch:function(){e(".epSubtitlesSearch").click(function(){var t=e(this).parent().siblings(".col-subtitles"),n=e(this);return n.empty(),n.append(e("<i/>").attr({class:"fas fa-spinner fa-spin fa-fw",title:f("loading")})),e.getJSON(e(this).attr("href"),function(i){if("failure"!==i.result.toLowerCase()&&"no subtitles downloaded"!==i.result.toLowerCase()){var a=i.subtitles.split(",");t.empty(),e.each(a,function(n,i){""!==i&&"und"!==i&&(a.length,t.append(e("<i/>").attr({class:"sickrage-flags sickrage-flags-"+i})))}),n.remove()}else n.remove()}),!1})},ajaxEpMergeSubtitles:function(){e(".epMergeSubtitles").click(function(){var t=e(this);return t.empty(),t.append(e("<i/>").attr({class:"fas fa-spinner fa-spin fa-fw",title:f("loading")})),e.getJSON(e(this).attr("href"),function(){t.remove()}),!1})}},browser:{defaults:{title:f("Choose Directory"),url:"/browser/",autocompleteURL:"/browser/complete",includeFiles:0,fileTypes:[],showBrowseButton:!0},fileBrowserDialog:null,currentBrowserPath:null,currentRequest:null,init:function(){n.browser.defaults.url=n.srWebRoot+n.browser.defaults.url,n.browser.defaults.autocomplete=n.srWebRoot+n.browser.defaults.autocompleteURL,e.fn.fileBrowser=n.browser.fileBrowser,e.fn.nFileBrowser=n.browser.nFileBrowser},browse:function(t,i,a,o){n.browser.currentBrowserPath!==t&&(n.browser.currentBrowserPath=t,n.browser.currentRequest&&n.browser.currentRequest.abort(),n.browser.currentRequest=e.getJSON(i,{path:t,includeFiles:a,fileTypes:o.join(",")},function(t){n.browser.fileBrowserDialog.find(".modal-body").empty();var s,r=t[0],l=0,c=null;t=e.grep(t,function(){return 0!=l++}),e('<input class="form-control mb-1">').val(r.currentPath).on("keypress",function(e){13===e.which&&n.browser.browse(e.target.value,i,a,o)}).appendTo(n.browser.fileBrowserDialog.find(".modal-body")).fileBrowser({showBrowseButton:!1}).on("autocompleteselect",function(e,t){n.browser.browse(t.item.value,i,a,o)}),s=e('<div class="list-group">').appendTo(n.browser.fileBrowserDialog.find(".modal-body")),e.each(t,function(t,r){if(r.isFile&&o&&(!r.isAllowed||-1!==o.indexOf("images")&&!r.isImage))return!0;c=e('<a href="javascript:void(0)">').on("click",function(){r.isFile?(n.browser.currentBrowserPath=r.path,e('.browserDialog .ui-button:contains("Ok")').click()):n.browser.browse(r.path,i,a,o)}).text(r.name),r.isImage?c.prepend('<span class="fas fa-file-image ml-1 mr-1"></span>'):r.isFile?c.prepend('<span class="fas fa-file ml-1 mr-1"></span>'):c.prepend('<span class="fas fa-folder ml-1 mr-1"></span>').on("mouseenter",function(){e("span",this).addClass("fa-folder-open")}).on("mouseleave",function(){e("span",this).removeClass("fa-folder-open")}),c.appendTo(s)}),e("a",s).wrap('<div class="list-group-item list-group-item-action list-group-item-dark p-0">')}))},nFileBrowser:function(t,i){i=e.extend({},n.browser.defaults,i),n.browser.fileBrowserDialog?n.browser.fileBrowserDialog.find(".modal-title").text(i.title):(n.browser.fileBrowserDialog=e("#fileBrowserDialog").modal(),n.browser.fileBrowserDialog.find(".modal-body").addClass("ui-front"),n.browser.fileBrowserDialog.find(".modal-title").text(i.title),n.browser.fileBrowserDialog.find(".modal-footer .btn-success").click(function(){t(n.browser.currentBrowserPath,i),n.browser.fileBrowserDialog.modal("hide")}));var a="";return i.initialDir&&(a=i.initialDir),n.browser.browse(a,i.url,i.includeFiles,i.fileTypes),n.browser.fileBrowserDialog.modal(),!1},fileBrowser:function(t){if((t=e.extend({},n.browser.defaults,t)).field=e(this),t.field.autocomplete&&t.autocompleteURL){var i="";t.field.autocomplete({position:{my:"top",at:"bottom",collision:"flipfit"},source:function(n,a){i=e.ui.autocomplete.escapeRegex(n.term,t.includeFiles),e.ajax({url:t.autocompleteURL,data:n,dataType:"json",success:function(t){var n=new RegExp("^"+i,"i"),o=e.grep(t,function(e){return n.test(e)});a(o)}})},open:function(){e(".ui-autocomplete li.ui-menu-item a").removeClass("ui-corner-all")}}).data("ui-autocomplete")._renderItem=function(t,n){var a=n.label,o=new RegExp("(?![^&;]+;)(?!<[^<>]*)("+i+")(?![^<>]*>)(?![^&;]+;)","gi");return a=a.replace(o,function(e){return"<b>"+e+"</b>"}),e("<li></li>").data("ui-autocomplete-item",n).append("<a class='text-nowrap'>"+a+"</a>").appendTo(t)}}var a,o,s=!1;try{s=!!localStorage.getItem}catch(e){s=null}return s&&t.key&&(a=localStorage["fileBrowser-"+t.key]),t.key&&0===t.field.val().length&&a&&t.field.val(a),o=function(e,t){t.field.val(e),s&&t.key&&(localStorage["fileBrowser-"+t.key]=e)},t.field.addClass("fileBrowserField"),t.showBrowseButton&&t.field.after(e('<div class="input-group-append"><span class="input-group-text"><a href="#" class="fileBrowser fas fa-search""></a></span></div>').on("click",function(){var n=t.field.val()||t.key&&a||"",i=e.extend({},t,{initialDir:n});return e(this).nFileBrowser(o,i),!1})),t.field}},root_dirs:{init:function(){for(var t=["assert","clear","count","debug","dir","dirxml","error","exception","group","groupCollapsed","groupEnd","info","log","markTimeline","profile","profileEnd","table","time","timeEnd","timeStamp","trace","warn"],i=t.length,a=window.console=window.console||{};i--;){var o=t[i];a[o]||(a[o]=function(){})}e("#addRootDir").click(function(){e(this).nFileBrowser(n.root_dirs.addRootDir)}),e("#editRootDir").click(function(){e(this).nFileBrowser(n.root_dirs.editRootDir,{initialDir:e("#rootDirs option:selected").val()})}),e("#deleteRootDir").click(function(){if(e("#rootDirs option:selected").length){var t=e("#rootDirs option:selected"),i=t.attr("id")===e("#whichDefaultRootDir").val(),o=e("#rootDirs option:selected").attr("id").substr(3);if(t.remove(),n.root_dirs.syncOptionIDs(),i)a.log("new default when deleting"),e("#whichDefaultRootDir").val(""),e("#rootDirs option").length&&n.root_dirs.setDefault(e("#rootDirs option").attr("id"));else if(e("#whichDefaultRootDir").val().length){var s=e("#whichDefaultRootDir").val().substr(3);s>o&&e("#whichDefaultRootDir").val("rd-"+(s-1))}}n.root_dirs.refreshRootDirs(),e.get(n.srWebRoot+"/config/general/saveRootDirs",{rootDirString:e("#rootDirText").val()})}),e("#defaultRootDir").click(function(){e("#rootDirs option:selected").length&&n.root_dirs.setDefault(e("#rootDirs option:selected").attr("id")),n.root_dirs.refreshRootDirs(),e.get(n.srWebRoot+"/config/general/saveRootDirs",{rootDirString:e("#rootDirText").val()})}),e("#rootDirs").click(function(){n.root_dirs.refreshRootDirs()}),n.root_dirs.syncOptionIDs(),n.root_dirs.setDefault(e("#whichDefaultRootDir").val(),!0),n.root_dirs.refreshRootDirs()},addRootDir:function(t){if(t.length){var i=!1;return e("#whichDefaultRootDir").val().length||(i=!0),e("#rootDirs").append('<option value="'+t+'">'+t+"</option>"),n.root_dirs.syncOptionIDs(),i&&n.root_dirs.setDefault(e("#rootDirs option").attr("id")),n.root_dirs.refreshRootDirs(),e.get(n.srWebRoot+"/config/general/saveRootDirs",{rootDirString:e("#rootDirText").val()}),!1}},editRootDir:function(t){t.length&&(e("#rootDirs option:selected").length&&(e("#rootDirs option:selected").attr("id")===e("#whichDefaultRootDir").val()?e("#rootDirs option:selected").text("*"+t):e("#rootDirs option:selected").text(t),e("#rootDirs option:selected").val(t)),n.root_dirs.refreshRootDirs(),e.get(n.srWebRoot+"/config/general/saveRootDirs",{rootDirString:e("#rootDirText").val()}))},setDefault:function(t,n){if((void 0===t||t.length)&&(e("#whichDefaultRootDir").val()!==t||!0===n)){if("*"!==e("#"+t).text().charAt(0)&&e("#"+t).text("*"+e("#"+t).text()),e("#whichDefaultRootDir").val()&&!0!==n){var i=e("#"+e("#whichDefaultRootDir").val());i.text(i.text().substring(1))}e("#whichDefaultRootDir").val(t)}},syncOptionIDs:function(){var t=0;e("#rootDirs option").each(function(){e(this).attr("id","rd-"+t++)})},refreshRootDirs:function(){if(e("#rootDirs").length){var t="true";n.root_dirs.syncOptionIDs(),!e("#rootDirs option:selected").length&&e("#whichDefaultRootDir").val().length&&e("#"+e("#whichDefaultRootDir").val()).prop("selected",!0),e("#rootDirs option:selected").length&&(t=""),e("#deleteRootDir").prop("disabled",t),e("#defaultRootDir").prop("disabled",t),e("#editRootDir").prop("disabled",t);var i="";e("#whichDefaultRootDir").val().length>=4&&(i=e("#whichDefaultRootDir").val().substr(3)),e("#rootDirs option").each(function(){i.length&&(i+="|"+e(this).val())}),e("#rootDirText").val(i),e("#rootDirText").change()}}},quality_chooser:{init:function(){e("#qualityPreset").change(function(){n.quality_chooser.setFromPresets(e("#qualityPreset :selected").val())}),n.quality_chooser.setFromPresets(e("#qualityPreset :selected").val())},setFromPresets:function(t){if(0===parseInt(t))return e("#qualityPreset_label").hide(),void e("#customQuality").show();e("#customQuality").hide(),e("#qualityPreset_label").show(),e("#anyQualities option").each(function(){(t&e(this).val())>0?e(this).attr("selected","selected"):e(this).attr("selected",!1)}),e("#bestQualities option").each(function(){(t&e(this).val()<<16)>0?e(this).attr("selected","selected"):e(this).attr("selected",!1)})}},root:{init:function(){},schedule:function(){if(e.backstretch(n.srWebRoot+"/images/backdrops/schedule.jpg"),e(".backstretch").css("opacity",n.getMeta("sickrage.FANART_BACKGROUND_OPACITY")).fadeIn("500"),n.isMeta("sickrage.COMING_EPS_LAYOUT",["list"])){var t={date:0,show:2,network:5},i=n.getMeta("sickrage.COMING_EPS_SORT"),a=i in t?[[t[i],0]]:[[0,0]];e("#showListTable:has(tbody tr)").tablesorter({theme:"bootstrap",widgets:["stickyHeaders","filter","columnSelector","saveSort"],sortList:a,textExtraction:{0:function(t){return e(t).find("time").attr("datetime")},1:function(t){return e(t).find("time").attr("datetime")},7:function(t){return e(t).find("span").text().toLowerCase()}},headers:{0:{sorter:"realISODate"},1:{sorter:"realISODate"},2:{sorter:"loadingNames"},4:{sorter:"loadingNames"},7:{sorter:"quality"},8:{sorter:!1},9:{sorter:!1}},widgetOptions:n.metaToBool("sickrage.FILTER_ROW")?{filter_columnFilters:!0,filter_hideFilters:!0,filter_saveFilters:!0,columnSelector_mediaquery:!1}:{filter_columnFilters:!1,columnSelector_mediaquery:!1}}),n.ajax_search.ajaxEpSearch()}n.isMeta("sickrage.COMING_EPS_LAYOUT",["banner","poster"])&&(n.ajax_search.ajaxEpSearch({size:16,loadingIcon:"fas fa-spinner fa-spin fa-fw"}),e(".ep_summary").hide(),e(".ep_summaryTrigger").click(function(){e(this).next(".ep_summary").slideToggle("normal",function(){e.prev(".ep_summaryTrigger").attr("src",function(t,n){return e(this).next(".ep_summary").is(":visible")?n.replace("plus","minus"):n.replace("minus","plus")})})})),e("#popover").popover({placement:"bottom",html:!0,content:'<div id="popover-target"></div>'}).on("shown.bs.popover",function(){e.tablesorter.columnSelector.attachTo(e("#showListTable"),"#popover-target")})},history:function(){e.backstretch(n.srWebRoot+"/images/backdrops/history.jpg"),e(".backstretch").css("opacity",n.getMeta("sickrage.FANART_BACKGROUND_OPACITY")).fadeIn("500"),e("#historyTable:has(tbody tr)").tablesorter({theme:"bootstrap",widgets:["filter"],sortList:[[0,1]],textExtraction:n.isMeta("sickrage.HISTORY_LAYOUT",["detailed"])?{0:function(t){return e(t).find("time").attr("datetime")},4:function(t){return e(t).find("span").text().toLowerCase()}}:{0:function(t){return e(t).find("time").attr("datetime")},1:function(t){return e(t).find("span").text().toLowerCase()},2:function(t){return e(t).attr("data-provider").toLowerCase()},5:function(t){return e(t).attr("data-quality").toLowerCase()}},headers:n.isMeta("sickrage.HISTORY_LAYOUT",["detailed"])?{0:{sorter:"realISODate"},4:{sorter:"data-quality"}}:{0:{sorter:"realISODate"},4:{sorter:!1},5:{sorter:"data-quality"}}}),e("#history_limit").on("change",function(){window.location.href=n.srWebRoot+"/history/?limit="+e(this).val()}),e("a.clearhistory").confirm({theme:"dark",title:f("Clear History"),content:f("Are you sure you want to clear all download history ?")}),e("a.trimhistory").confirm({theme:"dark",title:f("Trim History"),content:f("Are you sure you want to trim all download history older than 30 days ?")})},api_builder:function(){e("[data-action=api-call]").on("click",function(){var t=e("[data-command="+e(this).data("command-name")+"]"),n=e("#option-profile").is(":checked"),i=e(this).data("target"),a=e(this).data("time"),o=e("#"+e(this).data("base-url")).text(),s=e(this).data("url");e.each(t,function(t,n){var i=e(n).attr("name"),a=e(n).val();void 0!==i&&void 0!==a&&i!==a&&a&&(e.isArray(a)&&(a=a.join("|")),o+="&"+i+"="+a)}),n&&(o+="&profile=1");var r=(new Date).getTime();e.get(o,function(t,n,l){var c=(new Date).getTime()-r,d=e("#option-jsonp").is(":checked"),u=l.getResponseHeader("content-type")||"",h=e(i);if(e(a).text(c+"ms"),e(s).text(o+(d?"&jsonp=foo":"")),"image/"===u.slice(0,6))h.html(e("<img/>").attr("src",o));else{var f=JSON.stringify(t,null,4);d?h.text("foo("+f+");"):h.text(f)}h.parents(".result-wrapper").removeClass("d-none")})}),e("[data-action=clear-result]").on("click",function(){e(e(this).data("target")).html("").parents(".result-wrapper").addClass("d-none")}),e("[data-action=update-episodes]").on("change",function(){var t=e(this).data("command"),n=e("[data-command="+t+"][name=episode]"),i=e(this).val(),a=e("[data-command="+t+"][name=indexerid]").val(),o=n.val();if(void 0!==n)for(var s in n.removeClass("d-none"),n.find("option:gt(0)").remove(),o[a][i])o[a][i].hasOwnProperty(s)&&n.append(e("<option>",{value:s,label:"Episode "+s}))}),e("[data-action=update-seasons]").on("change",function(){var t=e(this).data("command"),n=e("[data-command="+t+"][name=season]"),i=e(this).val(),a=n.val();if(void 0!==n)for(var o in n.removeClass("d-none"),n.find("option:gt(0)").remove(),a[i])a[i].hasOwnProperty(o)&&n.append(e("<option>",{value:o,label:0===o?"Specials":"Season "+o}))})},status:function(){e("#schedulerStatusTable").tablesorter({theme:"bootstrap",widgets:["saveSort"]}),e("#queueStatusTable").tablesorter({theme:"bootstrap",sortList:[[3,0],[4,0],[2,1]],widgets:["saveSort"]})}},home:{init:function(){e.backstretch(n.srWebRoot+"/images/backdrops/home.jpg"),e(".backstretch").css("opacity",n.getMeta("sickrage.FANART_BACKGROUND_OPACITY")).fadeIn("500")},index:function(){function t(t){var n,i,a;t<125?a=3:t<175?(n=9,i=.6,a=4):(n=11,i=1,a=6),e("#posterPopup").remove(),void 0===n?e(".show-details").hide():(e(".show-details").show(),e(".show-dlstats, .show-quality").css("fontSize",n),e(".show-network-image").css("transform","scale("+i+")")),e(".show-container").css({width:t,borderRadius:a})}e("#posterSizeSlider").slider({min:75,max:250,value:localStorage.posterSize||188,change:function(n,i){window.localStorage&&localStorage.setItem("posterSize",i.value),t(i.value),e(".show-grid").isotope("layout")}}),t(parseInt(localStorage.posterSize||188)),e(".progress-bar").each(function(){var t=e(this).data("progress-percentage"),n=100===t?100:t>80?80:t>60?60:t>40?40:20;e(this).data("progress-text")&&e(this).append('<div class="progressbarText" title="'+e(this).data("progress-tip")+'">'+e(this).data("progress-text")+"</div>"),e(this).addClass("progress-"+n)}),e("img#network").on("error",function(){e(this).parent().text(e(this).attr("alt")),e(this).remove()}),e("#showListTableShows:has(tbody tr), #showListTableAnime:has(tbody tr)").tablesorter({theme:"bootstrap",sortList:[[7,1],[2,0]],textExtraction:{0:function(t){return e(t).find("time").attr("datetime")},1:function(t){return e(t).find("time").attr("datetime")},3:function(t){return e(t).find("span").text().toLowerCase()},4:function(t){return e(t).find("span").text().toLowerCase()},5:function(t){return e(t).find("span:first").text()},6:function(t){return e(t).data("show-size")},7:function(t){return e(t).find("span").text().toLowerCase()}},widgets:["saveSort","stickyHeaders","filter","columnSelector"],headers:n.metaToBool("sickrage.FILTER_ROW")?{0:{sorter:"realISODate"},1:{sorter:"realISODate"},2:{sorter:"loadingNames"},4:{sorter:"quality"},5:{sorter:"eps"},6:{sorter:"digit"},7:{filter:"parsed"}}:{0:{sorter:"realISODate"},1:{sorter:"realISODate"},2:{sorter:"loadingNames"},4:{sorter:"quality"},5:{sorter:"eps"},6:{sorter:"digit"}},widgetOptions:n.metaToBool("sickrage.FILTER_ROW")?{filter_columnFilters:!0,filter_hideFilters:!0,filter_functions:{5:function(e,t,n){var i=!1,a=Math.floor(t%1*1e3);if(""===n)i=!0;else{var o=n.match(/(<|<=|>=|>)\s(\d+)/i);o&&("<"===o[1]?a<parseInt(o[2])&&(i=!0):"<="===o[1]?a<=parseInt(o[2])&&(i=!0):">="===o[1]?a>=parseInt(o[2])&&(i=!0):">"===o[1]&&a>parseInt(o[2])&&(i=!0)),(o=n.match(/(\d+)\s(-|to)\s(\d+)/i))&&("-"!==o[2]&&"to"!==o[2]||a>=parseInt(o[1])&&a<=parseInt(o[3])&&(i=!0)),(o=n.match(/(=)?\s?(\d+)\s?(=)?/i))&&("="!==o[1]&&"="!==o[3]||parseInt(o[2])===a&&(i=!0)),!isNaN(parseFloat(n))&&isFinite(n)&&parseInt(n)===a&&(i=!0)}return i}},columnSelector_mediaquery:!1}:{filter_columnFilters:!1},sortStable:!0,sortAppend:[[2,0]]}),e(".show-grid").imagesLoaded(function(){e(".show-grid").isotope({itemSelector:".show-container",sortBy:n.getMeta("sickrage.POSTER_SORTBY"),sortAscending:n.getMeta("sickrage.POSTER_SORTDIR"),layoutMode:"masonry",masonry:{isFitWidth:!0},getSortData:{name:function(t){var i=e(t).attr("data-name")||"";return(n.metaToBool("sickrage.SORT_ARTICLE")?i:i.replace(/^((?:The|A|An)\s)/i,"")).toLowerCase()},network:"[data-network]",date:function(t){var n=e(t).attr("data-date");return n.length&&parseInt(n,10)||Number.POSITIVE_INFINITY},progress:function(t){var n=e(t).attr("data-progress");return n.length&&parseInt(n,10)||Number.NEGATIVE_INFINITY}}});var t=null;e(".show-container").on("mouseenter",function(){var n=e(this);"none"===n.find(".show-details").css("display")&&(t=setTimeout(function(){t=null,e("#posterPopup").remove();var i=n.clone().attr({id:"posterPopup"}),a=n.offset().left,o=n.offset().top;i.css({position:"absolute",margin:0,top:o,left:a,zIndex:9999}),i.find(".show-details").show(),i.on("mouseleave",function(){e(this).remove()}),i.appendTo("body");var s=o+n.height()/2-219,r=a+n.width()/2-125,l=e(window).scrollTop(),c=e(window).scrollLeft(),d=l+e(window).innerHeight(),u=c+e(window).innerWidth();s<l+5&&(s=l+5),r<c+5&&(r=c+5),s+438+5>d&&(s=d-438-5),r+250+5>u&&(r=u-250-5),i.animate({top:s,left:r,width:250,height:438})},300))}).on("mouseleave",function(){null!==t&&clearTimeout(t)})}),e("#postersort").on("change",function(){var t=e(this).val();e(".show-grid").isotope({sortBy:t}),e.post(e(this).find("option[value="+e(this).val()+"]").attr("data-sort"))}),e("#postersortdirection").on("change",function(){var t="true"===e(this).val();e(".show-grid").isotope({sortAscending:t}),e.post(e(this).find("option[value="+e(this).val()+"]").attr("data-sort"))}),e("#popover").popover({placement:"bottom",html:!0,content:'<div id="popover-target"></div>'}).on("shown.bs.popover",function(){e.tablesorter.columnSelector.attachTo(e("#showListTableShows"),"#popover-target"),e("#showListTableAnime").length&&n.metaToBool("sickrage.ANIME_SPLIT_HOME")&&e.tablesorter.columnSelector.attachTo(e("#showListTableAnime"),"#popover-target")})},display_show:{init:function(){n.home.display_show.imdbRating(),n.metaToBool("sickrage.FANART_BACKGROUND")&&(e.backstretch(n.srWebRoot+"/images/"+e("#showID").attr("value")+".fanart.jpg"),e(".backstretch").css("opacity",n.getMeta("sickrage.FANART_BACKGROUND_OPACITY")).fadeIn("500")),e("#showTable, #animeTable").tablesorter({theme:"bootstrap",widgets:["saveSort","columnSelector"],widgetOptions:{columnSelector_saveColumns:!0,columnSelector_layout:'<br><label><input type="checkbox">{name}</label>',columnSelector_mediaquery:!1,columnSelector_cssChecked:"checked"}}),e("#popover").popover({placement:"bottom",html:!0,content:'<div id="popover-target"></div>'}).on("shown.bs.popover",function(){e(".displayShowTable").each(function(t,n){e.tablesorter.columnSelector.attachTo(n,"#popover-target")})}),e("#seasonJump").on("change",function(){var t=e("#seasonJump option:selected").val();if(t&&"jump"!==t){var n=e("#seasonJump option:selected").data("season");e("html,body").animate({scrollTop:e('[name ="'+t.substring(1)+'"]').offset().top-50},"slow"),e("#collapseSeason-"+n).collapse("show"),location.hash=t}e(this).val("jump")}),e("#prevShow").on("click",function(){e("#pickShow option:selected").prev("option").prop("selected","selected"),e("#pickShow").change()}),e("#nextShow").on("click",function(){e("#pickShow option:selected").next("option").prop("selected","selected"),e("#pickShow").change()}),e("#changeStatus").on("click",function(){var t=[];if(e(".epCheck").each(function(){e(this).prop("checked")&&t.push(e(this).attr("id"))}),0===t.length)return!1;window.location.href=n.srWebRoot+"/home/setStatus?show="+e("#showID").attr("value")+"&eps="+t.join("|")+"&status="+e("#statusSelect").val()}),e("#deleteEpisode").on("click",function(){var t=[];if(e(".epCheck").each(function(){e(this).prop("checked")&&t.push(e(this).attr("id"))}),0===t.length)return!1;window.location.href=n.srWebRoot+"/home/deleteEpisode?show="+e("#showID").attr("value")+"&eps="+t.join("|")}),e(".seasonCheck").on("click",function(){var t=this,n=e(this).attr("id");e("#collapseSeason-"+n).collapse("show"),e(".epCheck:visible").each(function(){e(this).attr("id").split("x")[0]===n&&e(this).prop("checked",t.checked)})});var t=null;e(".epCheck").on("click",function(n){if(t&&n.shiftKey){var i=this,a=0;e(".epCheck").each(function(){switch(a){case 2:return!1;case 1:e(this).prop("checked",t.checked)}e(this)!==i&&e(this)!==t||a++})}else t=this}),e(".seriesCheck").on("click",function(){e(".epCheck:visible").each(function(){e(this).prop("checked",!0)}),e(".seasonCheck:visible").each(function(){e(this).prop("checked",!0)})}),e(".clearAll").on("click",function(){e(".epCheck:visible").each(function(){e(this).prop("checked",!1)}),e(".seasonCheck:visible").each(function(){e(this).prop("checked",!1)})}),e("#pickShow").on("change",function(){var t=e(this).val();0!==t&&(window.location.href=n.srWebRoot+"/home/displayShow?show="+t)}),e("#checkboxControls input").change(function(){var t=e(this).attr("id"),i=e("#checkboxControls > input, #"+t).prop("checked");n.showHideRows(t,i)}),e("#checkboxControls input").each(function(){var t=e(this).prop("checked");e("tr."+e(this).attr("id")).each(function(){t?e(this).show():e(this).hide()})}),e("tr.seasonheader").each(function(){var t=0,n=e(this).attr("id");e("tr."+n+" :visible").each(function(){t++}),0===t?(e(this).hide(),e("#"+n+"-cols").hide()):(e(this).show(),e("#"+n+"-cols").show())}),e(".sceneSeasonXEpisode").on("change",function(){e(this).val(e(this).val().replace(/[^0-9xX]*/g,""));var t=e(this).attr("data-for-season"),i=e(this).attr("data-for-episode"),a=e(this).val().match(/^(\d+)x(\d+)$/i),o=null,s=null;a&&(o=a[1],s=a[2]),n.home.display_show.setEpisodeSceneNumbering(t,i,o,s)}),e(".sceneAbsolute").on("change",function(){e(this).val(e(this).val().replace(/[^0-9xX]*/g,""));var t=e(this).attr("data-for-absolute"),i=e(this).val().match(/^(\d{1,3})$/i),a=null;i&&(a=i[1]),n.home.display_show.setAbsoluteSceneNumbering(t,a)}),n.ajax_search.init(),e("a.removeshow").confirm({theme:"dark",title:f("Remove Show"),content:f("Are you sure you want to remove")+'<span class="footerhighlight">'+e("#showtitle").data("showname")+"</span>"+f(" from the database?")+'<br><br><input type="checkbox" id="deleteFiles" name="deleteFiles"/>&nbsp;<label for="deleteFiles" class="text-danger">'+f("Check to delete files as well. IRREVERSIBLE")+"</label>",buttons:{confirm:function(){var e=this.$content.find("#deleteFiles").prop("checked");location.href=this.$target.attr("href")+(e?"&full=1":"")},cancel:{action:function(){}}}})},imdbRating:function(){for(var t=e("#imdbstars"),n=t.data("imdb-rating"),i=e("<i>").addClass("fas fa-star text-warning"),a=0;a<n;a++)t.append(i.clone())},setEpisodeSceneNumbering:function(t,i,a,o){var s=e("#showID").val(),r=e("#indexer").val();""===a&&(a=null),""===o&&(o=null),e.getJSON(n.srWebRoot+"/home/setSceneNumbering",{show:s,indexer:r,forSeason:t,forEpisode:i,sceneSeason:a,sceneEpisode:o},function(n){null===n.sceneSeason||null===n.sceneEpisode?e("#sceneSeasonXEpisode_"+s+"_"+t+"_"+i).val(""):e("#sceneSeasonXEpisode_"+s+"_"+t+"_"+i).val(n.sceneSeason+"x"+n.sceneEpisode),n.success||(n.errorMessage?alert(n.errorMessage):alert(f("Update failed.")))})},setAbsoluteSceneNumbering:function(t,i){var a=e("#showID").val(),o=e("#indexer").val();""===i&&(i=null),e.getJSON(n.srWebRoot+"/home/setSceneNumbering",{show:a,indexer:o,forAbsolute:t,sceneAbsolute:i},function(n){null===n.sceneAbsolute?e("#sceneAbsolute_"+a+"_"+t).val(""):e("#sceneAbsolute_"+a+"_"+t).val(n.sceneAbsolute),n.success||(n.errorMessage?alert(n.errorMessage):alert(f("Update failed.")))})}},edit_show:{init:function(){var t=[];e("#location").fileBrowser({title:f("Select Show Location")}),e("#submit").click(function(){var t=[];e("#exceptions_list option").each(function(){t.push(e(this).val())}),e("#exceptions_list").val(t),n.metaToBool("show.is_anime")&&n.home.generate_bwlist()}),e("#addSceneName").click(function(){var n=e("#SceneName").val(),i=e("<option>");if(t=[],e("#exceptions_list option").each(function(){t.push(e(this).val())}),e("#SceneName").val(""),!(e.inArray(n,t)>-1||""===n))return e("#SceneException").show(),i.attr("value",n),i.html(n),i.appendTo("#exceptions_list")}),e("#removeSceneName").click(function(){e("#exceptions_list option:selected").remove(),n.home.edit_show.toggleSceneException()}),n.home.edit_show.toggleSceneException()},toggleSceneException:function(){var t=[];e("#exceptions_list option").each(function(){t.push(e(this).val())}),""===t?e("#SceneException").hide():e("#SceneException").show()}},add_shows:function(){e.backstretch(n.srWebRoot+"/images/backdrops/addshows.jpg"),e(".backstretch").css("opacity",n.getMeta("sickrage.FANART_BACKGROUND_OPACITY")).fadeIn("500")},add_existing_shows:{init:function(){n.home.add_show_options(),n.root_dirs.init(),e("#tableDiv").on("click","#checkAll",function(){e(".dirCheck").not(this).prop("checked",this.checked)}),e("#submitShowDirs").on("click",function(){var t=!1,n=e("#addShowForm");if(e(".dirCheck").each(function(){if(!0===this.checked){var i=e(this).attr("id"),a=e(this).closest("tr").find("select").val();e("<input>",{type:"hidden",name:"shows_to_add",value:a+"|"+i}).appendTo(n),t=!0}}),!1===t)return!1;e("<input>",{type:"hidden",name:"promptForSettings",value:e("#promptForSettings").prop("checked")?"on":"off"}).appendTo(n),n.submit()});var t="";e("#rootDirText").on("change",function(){if(t===e("#rootDirText").val())return!1;t=e("#rootDirText").val(),e("#rootDirStaticList").html(""),e("#rootDirs option").each(function(t,n){e("#rootDirStaticList").append('<div class="list-group-item-dark mb-1"><div class="align-middle m-1"><label class="form-check-label" for="\' + $(w).val() + \'"><input type="checkbox" class="dir_check" id="'+e(n).val()+'" checked=checked><b>'+e(n).val()+"</b></label></div></div>")}),n.home.add_existing_shows.loadContent()}),e("#rootDirStaticList").on("click",".dir_check",n.home.add_existing_shows.loadContent),e("#tableDiv").on("click",".showManage",function(t){t.preventDefault(),e("html,body").animate({scrollTop:0},1e3)}),e("#rootDirs option").attr("selected","selected").parent().focus(),e("#rootDirs option").click()},loadContent:function(){var t="";e(".dir_check").each(function(n,i){e(i).is(":checked")&&(t.length&&(t+="&"),t+="rootDir="+encodeURIComponent(e(i).attr("id")))}),e("#tableDiv").html("<span>"+n.loadingHTML+f("loading folders...")+"</span>"),e.get(n.srWebRoot+"/home/addShows/massAddTable/",t,function(t){e("#tableDiv").html(t),e("#addRootDirTable").tablesorter({theme:"bootstrap",sortList:[[1,0]],headers:{0:{sorter:!1}}})})}},postprocess:function(){e("#episodeDir").fileBrowser({title:f("Select Unprocessed Episode Folder"),key:"postprocessPath"})},trakt_shows:{init:function(){function t(t){var n,i;t<125?i=3:t<175?(n=9,i=4):(n=11,i=6),e("#posterPopup").remove(),void 0===n?e(".show-details").hide():e(".show-details").show(),e(".show-container").css({width:t,borderRadius:i})}e("#showsort").val("original"),e("#showsortdirection").val("asc"),e("#posterSizeSlider").slider({min:75,max:250,value:localStorage.traktPosterSize||188,change:function(n,i){window.localStorage&&localStorage.setItem("traktPosterSize",i.value),t(i.value),e(".show-grid").isotope("layout")}}),t(parseInt(localStorage.traktPosterSize||188)),e(".show-grid").imagesLoaded(function(){e(".show-grid").isotope({itemSelector:".show-container",sortBy:"original-order",layoutMode:"masonry",masonry:{isFitWidth:!0},getSortData:{name:function(t){var i=e(t).attr("data-name")||"";return(n.metaToBool("sickrage.SORT_ARTICLE")?i:i.replace(/^(The|A|An)\s/i,"")).toLowerCase()},rating:"[data-rating] parseInt",votes:"[data-votes] parseInt"}})}),e("#showsort").on("change",function(){var t;switch(e(this).value){case"original":t="original-order";break;case"rating":e(".show-grid").isotope({sortBy:"random"}),t="rating";break;case"rating_votes":t=["rating","votes"];break;case"votes":t="votes";break;default:t="name"}e(".show-grid").isotope({sortBy:t})}),e("#showsortdirection").on("change",function(){e(".show-grid").isotope({sortAscending:"asc"===e(this).value})}),e("#traktlist").on("change",function(e){document.location.href=n.updateUrlParameter(document.location.href,"list",e.target.value)}),e("#limit").on("change",function(e){document.location.href=n.updateUrlParameter(document.location.href,"limit",e.target.value)})}},popular_shows:function(){function t(t){var n,i;t<125?i=3:t<175?(n=9,i=4):(n=11,i=6),e("#posterPopup").remove(),void 0===n?e(".show-details").hide():e(".show-details").show(),e(".show-container").css({width:t,borderRadius:i})}e("#posterSizeSlider").slider({min:75,max:250,value:localStorage.imdbPosterSize||188,change:function(n,i){window.localStorage&&localStorage.setItem("imdbPosterSize",i.value),t(i.value),e(".show-grid").isotope("layout")}}),t(parseInt(localStorage.traktPosterSize||188)),e(".show-grid").imagesLoaded(function(){e(".show-grid").isotope({itemSelector:".show-container",sortBy:"original-order",layoutMode:"masonry",masonry:{isFitWidth:!0},getSortData:{name:function(t){var i=e(t).attr("data-name")||"";return(n.metaToBool("sickrage.SORT_ARTICLE")?i:i.replace(/^(The|A|An)\s/i,"")).toLowerCase()},rating:"[data-rating] parseInt",votes:"[data-votes] parseInt"}})}),e("#showsort").on("change",function(){var t;switch(e(this).value){case"original":t="original-order";break;case"rating":e(".show-grid").isotope({sortBy:"random"}),t="rating";break;case"rating_votes":t=["rating","votes"];break;case"votes":t="votes";break;default:t="name"}e(".show-grid").isotope({sortBy:t})}),e("#showsortdirection").on("change",function(){e(".show-grid").isotope({sortAscending:"asc"===e(this).value})})},test_renaming:function(){e(".seriesCheck").on("click",function(){var t=this;e(".seasonCheck:visible").each(function(){e(this).prop("checked",t.checked)}),e(".epCheck:visible").each(function(){e(this).prop("checked",t.checked)})}),e(".seasonCheck").click(function(){var t=this,n=e(t).attr("id");e(".epCheck:visible").each(function(){e(this).attr("id").split("x")[0]===n&&e(this).prop("checked",t.checked)})}),e("input[type=submit]").on("click",function(){var t=[];if(e(".epCheck").each(function(){e(this).prop("checked")&&t.push(e(this).attr("id"))}),0===t.length)return!1;window.location.href=n.srWebRoot+"/home/doRename?show="+e("#showID").attr("value")+"&eps="+t.join("|")})},new_show:{init:function(){var t=e("div.setup-panel div a"),i=e(".setup-content"),a=e(".nextBtn");i.hide(),n.root_dirs.init(),n.home.add_show_options(),n.quality_chooser.init(),e("input:hidden[name=whichSeries]").length&&e("#fullShowPath").length&&(e(".setup-content #step-1").hide(),e(".setup-content #step-2").show()),e("#searchName").click(function(){!0===e("#addShowForm")[0].checkValidity()&&(e("#addShowForm")[0].classList.add("was-validated"),e(".nextBtn").removeClass("disabled"))}),e("#addShowForm").submit(function(){n.home.generate_bwlist()}),t.click(function(n){n.preventDefault();var a=e(e(this).attr("href")),o=e(this);o.hasClass("disabled")||(t.removeClass("btn-success").addClass("btn-dark"),o.removeClass("btn-dark").addClass("btn-success"),i.hide(),a.show(),a.find("input:eq(0)").focus())}),a.click(function(){var t=e(this).closest(".setup-content").attr("id"),i=e('div.setup-panel div a[href="#'+t+'"]').parent().next().children("a"),a=!0,o="";"step-1"==t&&(e("input:radio[name=whichSeries]:checked").length?o=e("input:radio[name=whichSeries]:checked").val().split("|")[4]:e("input:hidden[name=whichSeries]").length&&e("input:hidden[name=whichSeries]").val().length&&(o=e("#providedName").val()),o.length?n.home.update_bwlist(o):a=!1),a&&i.removeClass("disabled").trigger("click")}),e("div.setup-panel div a.btn-success").trigger("click"),e("#searchName").on("click",function(){e("#searchName").prop("disabled",!0),n.home.new_show.searchIndexers(),e("#searchName").prop("disabled",!1)}),e("#skipShowButton").on("click",function(){e("#skipShow").val("1"),e("#addShowForm").submit()}),e("#nameToSearch").focus(),e("#nameToSearch").keypress(function(t){13===(t.keyCode?t.keyCode:t.which)&&(t.preventDefault(),e("#searchName").click())})},searchIndexers:function(){if(e("#nameToSearch").val().length){var t="<b>"+e("#nameToSearch").val().trim()+"</b> on "+e("#providedIndexer option:selected").text()+"<br/>";e("#messages").empty().html('<i id="searchingAnim" class="fas fa-spinner fa-spin fa-fw"></i> searching for '+t),e.ajax({url:n.srWebRoot+"/home/addShows/searchIndexersForShowName",data:{search_term:e("#nameToSearch").val().trim(),lang:e("#indexerLang").val(),indexer:e("#providedIndexer").val()},timeout:1e3*parseInt(e("#indexer_timeout").val(),10),dataType:"json",error:function(){e("#messages").empty().html(f("search timed out, try increasing timeout for indexer"))},success:function(t){var i=!0,a='<legend class="legend">'+f("Search Results:")+"</legend>\n",o="";0===t.results.length?a+="<b>"+f("No results found, try a different search or language.")+"</b>":(e.each(t.results,function(e,s){i?(o=" checked",i=!1):o="";var r=s.join("|");if(a+='<input type="radio" class="pull-left" id="whichSeries" name="whichSeries" value="'+r.replace(/"/g,"")+'"'+o+" "+s[6]+" /> ",a+='<a href="'+n.anonURL+s[2]+s[3]+"&lid="+t.langid+'" onclick="window.open(this.href, \'_blank\'); return false;" ><b>'+s[4]+"</b></a>",null!==s[5]){var l=new Date(s[5]),c=new Date;a+=l>c?f(" (will debut on ")+s[5]+")":f(" (started on ")+s[5]+")"}null!==s[0]&&(a+=" ["+s[0]+"]"),"disabled"==s[6]&&(a+='<div class="d-inline text-danger font-weight-bold">'+f(" already exists in show library")+"</div>"),a+="<br/>"}),a+="</ul>"),a+="<br/>",e("#messages").html(a)}})}}},add_show_options:function(){e("#saveDefaultsButton").on("click",function(){var t=[],i=[];e("#anyQualities option:selected").each(function(n,i){t.push(e(i).val())}),e("#bestQualities option:selected").each(function(t,n){i.push(e(n).val())}),e.get(n.srWebRoot+"/config/general/saveAddShowDefaults",{defaultStatus:e("#statusSelect").val(),anyQualities:t.join(","),bestQualities:i.join(","),defaultFlattenFolders:e("#flatten_folders").prop("checked"),subtitles:e("#subtitles").prop("checked"),anime:e("#anime").prop("checked"),scene:e("#scene").prop("checked"),defaultStatusAfter:e("#statusSelectAfter").val(),skip_downloaded:e("#skip_downloaded").prop("checked")}),e(this).attr("disabled",!0),n.notify("info",f("Saved Defaults"),f('Your "add show" defaults have been set to your current selections.'))}),e("#statusSelect, #qualityPreset, #flatten_folders, #anyQualities, #bestQualities, #subtitles, #scene, #anime, #statusSelectAfter, #skip_downloaded").change(function(){e("#saveDefaultsButton").attr("disabled",!1)})},generate_bwlist:function(){var t=[];e("#white option").each(function(n,i){t[n]=e(i).val()}),e("#whitelist").val(t.join(",")),t=[],e("#black option").each(function(n,i){t[n]=e(i).val()}),e("#blacklist").val(t.join(","))},update_bwlist:function(t){e("#white").children().remove(),e("#black").children().remove(),e("#pool").children().remove(),e("#anime").prop("checked")?(e("#blackwhitelist").show(),t&&e.getJSON(n.srWebRoot+"/home/fetch_releasegroups",{show_name:t},function(t){"success"===t.result&&e.each(t.groups,function(t,n){var i=e("<option>");i.attr("value",n.name),i.html(n.name+" | "+n.rating+" | "+n.range),i.appendTo("#pool")})})):e("#blackwhitelist").hide()}},config:{init:function(){e.backstretch(n.srWebRoot+"/images/backdrops/config.jpg"),e(".backstretch").css("opacity",n.getMeta("sickrage.FANART_BACKGROUND_OPACITY")).fadeIn("500"),e("#configForm").ajaxForm({beforeSubmit:function(){e(".config_submitter .config_submitter_refresh").each(function(){e(this).attr("disabled","disabled"),e(this).after("<span>"+n.loadingHTML+f(" Saving...")+"</span>"),e(this).hide()})},success:function(){setTimeout(function(){e(".config_submitter").each(function(){e(this).removeAttr("disabled"),e(this).next().remove(),e(this).show()}),e(".config_submitter_refresh").each(function(){e(this).removeAttr("disabled"),e(this).next().remove(),e(this).show(),window.location.reload()}),e("#email_show").trigger("notify")},2e3)}}),e("#config-menus a").click(function(t){t.preventDefault(),e(this).tab("show")}),e("ul.nav-pills > li > a").on("shown.bs.tab",function(t){window.location.hash=e(t.target).attr("href").substr(1)}),e('#config-menus a[href="'+window.location.hash+'"]').tab("show"),e("a.resetConfig").confirm({theme:"dark",title:f("Reset Config to Defaults"),content:f("Are you sure you want to reset config to defaults?")})},general:function(){n.root_dirs.init(),0===e("input[name='proxy_setting']").val().length&&(e("input[id='proxy_indexers']").prop("checked",!1),e("label[for='proxy_indexers']").hide()),e("input[name='proxy_setting']").on("input",function(){0===e(this).val().length?(e("input[id='proxy_indexers']").prop("checked",!1),e("label[for='proxy_indexers']").hide()):e("label[for='proxy_indexers']").show()}),e(".viewIf").on("click",function(){e(this).prop("checked")?(e(".hide_if_"+e(this).attr("id")).css("display","none"),e(".show_if_"+e(this).attr("id")).fadeIn("fast","linear")):(e(".show_if_"+e(this).attr("id")).css("display","none"),e(".hide_if_"+e(this).attr("id")).fadeIn("fast","linear"))}),e(".datePresets").on("click",function(){var t=e("#date_presets").val();e(this).prop("checked")&&"%x"===t?(t="%a, %b %d, %Y",e("#date_use_system_default").html("1")):e(this).prop("checked")||"1"!==e("#date_use_system_default").html()||(t="%x"),e("#date_presets").attr("name","date_preset_old"),e("#date_presets").attr("id","date_presets_old"),e("#date_presets_na").attr("name","date_preset"),e("#date_presets_na").attr("id","date_presets"),e("#date_presets_old").attr("name","date_preset_na"),e("#date_presets_old").attr("id","date_presets_na"),t&&e("#date_presets").val(t)}),e("#api_key").on("click",function(){e("#api_key").select()}),e("#generate_new_apikey").on("click",function(){e.get(n.srWebRoot+"/config/general/generateApiKey",function(t){void 0===t.error?e("#api_key").val(t):alert(t.error)})}),e("#syncRemote").click(function(){function t(){e.getJSON(n.srWebRoot+"/googleDrive/getProgress",function(t){e("#current_info").html(t.current_info)}).error(function(){clearInterval(window.progressInterval),e("#current_info").html("Uh oh, something went wrong")})}e.ajax({type:"GET",url:n.srWebRoot+"/googleDrive/syncRemote",beforeSend:function(){window.progressInterval=setInterval(t,100),e("#pleaseWaitDialog").modal()},success:function(){clearInterval(window.progressInterval),e("#pleaseWaitDialog").modal("hide")}})}),e("#pip_path").fileBrowser({title:f("Select path to pip"),key:"pip_path",includeFiles:1}),e("#git_path").fileBrowser({title:f("Select path to git"),key:"git_path",includeFiles:1}),e("#verifyPipPath").click(function(){var t=e.trim(e("#pip_path").val());if(!t)return e("#testPIP-result").html(f("Please fill out the necessary fields above.")),void e("#pip_path").addClass("warning");e("#pip_path").removeClass("warning"),e(this).prop("disabled",!0),e("#testPIP-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/verifyPath",{path:t}).done(function(t){e("#testPIP-result").html(t),e("#verifyPipPath").prop("disabled",!1)})}),e("#verifyGitPath").click(function(){var t=e.trim(e("#git_path").val());if(!t)return e("#testGIT-result").html(f("Please fill out the necessary fields above.")),void e("#git_path").addClass("warning");e("#git_path").removeClass("warning"),e(this).prop("disabled",!0),e("#testGIT-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/verifyPath",{path:t}).done(function(t){e("#testGIT-result").html(t),e("#verifyGitPath").prop("disabled",!1)})}),e("#installRequirements").on("click",function(){window.location.href=n.srWebRoot+"/home/installRequirements"}),e("#branchCheckout").on("click",function(){window.location.href=n.srWebRoot+"/home/branchCheckout?branch="+e("#branchVersion").val()})},subtitles:{init:function(){e.getJSON(n.srWebRoot+"/config/subtitles/wanted_languages",function(e){new d.default({el:document.querySelector("#subtitles_languages"),remote:{url:n.srWebRoot+"/config/subtitles/get_code"},setItems:e,itemName:"subtitles_languages",newitemName:"subtitles_languages_new"})}),e("#subtitles_dir").fileBrowser({title:f("Select Subtitles Download Directory")}),e("#editAService").change(function(){n.config.subtitles.showHideServices()}),e(".service_enabler").on("click",function(){n.config.subtitles.refreshServiceList()}),n.config.subtitles.showHideServices(),e("#service_order_list").sortable({placeholder:"ui-state-highlight",update:function(){n.config.subtitles.refreshServiceList()}}),e("#service_order_list").disableSelection()},showHideServices:function(){e(".serviceDiv").each(function(){var t=e(this).attr("id");e("#editAService :selected").val()+"Div"===t?e(this).show():e(this).hide()})},addService:function(t,i,a,o,s,r){if(null===a.match("/$")&&(a+="/"),0===e("#service_order_list > #"+t).length&&!1!==r){var l='<li class="ui-state-default" id="'+t+'"> <input type="checkbox" id="enable_'+t+'" class="service_enabler" CHECKED> <a href="'+n.anonURL+a+'" class="imgLink" target="_new"><img src="'+n.srWebRoot+'/images/providers/newznab.gif" alt="'+i+'" width="16" height="16"></a> '+i+"</li>";e("#service_order_list").append(l),e("#service_order_list").sortable("refresh")}},deleteService:function(t){e("#service_order_list > #"+t).remove()},refreshServiceList:function(){var t=e("#service_order_list").sortable("toArray"),n=[];e.each(t,function(t,i){var a=+e("#enable_"+i).prop("checked")?"1":"0";n.push(i+":"+a)}),e("#service_order").val(n.join(" "))}},search:{init:function(){e("#nzb_method").change(n.config.search.nzbMethodHandler),e("#torrent_method").change(n.config.search.torrentMethodHandler),n.config.search.nzbMethodHandler(),n.config.search.torrentMethodHandler(),e("#testSABnzbd").click(function(){e("#testSABnzbd_result").html(n.loadingHTML);var t=e("#sab_host").val(),i=e("#sab_username").val(),a=e("#sab_password").val(),o=e("#sab_apikey").val();e.get(n.srWebRoot+"/home/testSABnzbd",{host:t,username:i,password:a,apikey:o},function(t){e("#testSABnzbd_result").html(t)})}),e("#use_torrents").click(function(){n.config.search.toggleTorrentTitle()}),e("#test_torrent").click(function(){e("#test_torrent_result").html(n.loadingHTML);var t=e("#torrent_method :selected").val(),i=e("#torrent_host").val(),a=e("#torrent_username").val(),o=e("#torrent_password").val();e.get(n.srWebRoot+"/home/testTorrent",{torrent_method:t,host:i,username:a,password:o},function(t){e("#test_torrent_result").html(t)})}),n.config.search.rtorrentScgi(),e("#torrent_host").change(n.config.search.rtorrentScgi),e("#nzb_dir").fileBrowser({title:f("Select .nzb blackhole/watch location")}),e("#torrent_dir").fileBrowser({title:f("Select .torrent blackhole/watch location")}),e("#torrent_path").fileBrowser({title:f("Select .torrent download location")})},toggleTorrentTitle:function(){e("#use_torrents").prop("checked")?e("#no_torrents").show():e("#no_torrents").hide()},nzbMethodHandler:function(){e("#blackhole_settings").hide(),e("#sabnzbd_settings").hide(),e("#testSABnzbd").hide(),e("#testSABnzbd_result").hide(),e("#nzbget_settings").hide(),"blackhole"===e("#nzb_method").val().toLowerCase()?e("#blackhole_settings").show():"nzbget"===e("#nzb_method").val().toLowerCase()?e("#nzbget_settings").show():(e("#sabnzbd_settings").show(),e("#testSABnzbd").show(),e("#testSABnzbd_result").show())},torrentMethodHandler:function(){e("#options_torrent_clients").hide(),e("#options_torrent_blackhole").hide();var t=e("#torrent_method").val(),n="",i="#options_torrent_blackhole";e("#torrent_method_icon").removeClass(function(e,t){return(t.match(/(^|\s)add-client-icon-\S+/g)||[]).join(" ")}),e("#torrent_method_icon").addClass("add-client-icon-"+t.replace("_","-")),"blackhole"!==t.toLowerCase()&&(e("#label_warning_deluge").hide(),e("#label_anime_warning_deluge").hide(),e("#host_desc_torrent").show(),e("#torrent_verify_cert_option").hide(),e("#torrent_verify_deluge").hide(),e("#torrent_verify_rtorrent").hide(),e("#torrent_auth_type_option").hide(),e("#torrent_path_option").show(),e("#torrent_path_option").find(".fileBrowser").show(),e("#torrent_seed_time_option").hide(),e("#torrent_high_bandwidth_option").hide(),e("#torrent_label_option").show(),e("#torrent_label_anime_option").show(),e("#path_synology").hide(),e("#torrent_paused_option").show(),e("#torrent_rpcurl_option").hide(),"utorrent"===t.toLowerCase()?(n="uTorrent",e("#torrent_path_option").hide(),e("#torrent_seed_time_label").text(f("Minimum seeding time is")),e("#torrent_seed_time_option").show(),e("#host_desc_torrent").text(f("URL to your uTorrent client (e.g. http://localhost:8000)"))):"transmission"===t.toLowerCase()?(n="Transmission",e("#torrent_seed_time_label").text(f("Stop seeding when inactive for")),e("#torrent_seed_time_option").show(),e("#torrent_high_bandwidth_option").show(),e("#torrent_label_option").hide(),e("#torrent_label_anime_option").hide(),e("#torrent_rpcurl_option").show(),e("#host_desc_torrent").text(f("URL to your Transmission client (e.g. http://localhost:9091)"))):"deluge"===t.toLowerCase()?(n="Deluge",e("#torrent_verify_cert_option").show(),e("#torrent_verify_deluge").show(),e("#torrent_verify_rtorrent").hide(),e("#label_warning_deluge").show(),e("#label_anime_warning_deluge").show(),e("#torrent_username_option").hide(),e("#torrent_username").prop("value",""),e("#host_desc_torrent").text(f("URL to your Deluge client (e.g. http://localhost:8112)"))):"deluged"===t.toLowerCase()?(n="Deluge",e("#torrent_verify_cert_option").hide(),e("#torrent_verify_deluge").hide(),e("#torrent_verify_rtorrent").hide(),e("#label_warning_deluge").show(),e("#label_anime_warning_deluge").show(),e("#torrent_username_option").show(),e("#host_desc_torrent").text(f("IP or Hostname of your Deluge Daemon (e.g. scgi://localhost:58846)"))):"download_station"===t.toLowerCase()?(n="Synology DS",e("#torrent_label_option").hide(),e("#torrent_label_anime_option").hide(),e("#torrent_paused_option").hide(),e("#torrent_path_option").find(".fileBrowser").hide(),e("#host_desc_torrent").text(f("URL to your Synology DS client (e.g. http://localhost:5000)")),e("#path_synology").show()):"rtorrent"===t.toLowerCase()?(n="rTorrent",e("#torrent_paused_option").hide(),e("#host_desc_torrent").html(f("URL to your rTorrent client (e.g. scgi://localhost:5000")+"<br>"+f(" or https://localhost/rutorrent/plugins/httprpc/action.php)")),e("#torrent_verify_cert_option").show(),e("#torrent_verify_deluge").hide(),e("#torrent_verify_rtorrent").show(),e("#torrent_auth_type_option").show()):"qbittorrent"===t.toLowerCase()?(n="qbittorrent",e("#torrent_path_option").hide(),e("#label_warning_qbittorrent").show(),e("#label_anime_warning_qbittorrent").show(),e("#host_desc_torrent").text(f("URL to your qbittorrent client (e.g. http://localhost:8080)"))):"mlnet"===t.toLowerCase()?(n="mlnet",e("#torrent_path_option").hide(),e("#torrent_label_option").hide(),e("#torrent_verify_cert_option").hide(),e("#torrent_verify_deluge").hide(),e("#torrent_verify_rtorrent").hide(),e("#torrent_label_anime_option").hide(),e("#torrent_paused_option").hide(),e("#host_desc_torrent").text(f("URL to your MLDonkey (e.g. http://localhost:4080)"))):"putio"===t.toLowerCase()&&(n="putio",e("#torrent_path_option").hide(),e("#torrent_label_option").hide(),e("#torrent_verify_cert_option").hide(),e("#torrent_verify_deluge").hide(),e("#torrent_verify_rtorrent").hide(),e("#torrent_label_anime_option").hide(),e("#torrent_paused_option").hide(),e("#torrent_host_option").hide(),e("#host_desc_torrent").text(f("URL to your putio client (e.g. http://localhost:8080)"))),e("#host_title").text(n+" host:port"),e("#username_title").text(n+" username"),e("#password_title").text(n+" password"),e("#torrent_client").text(n),e("#rpcurl_title").text(n+" RPC URL"),i="#options_torrent_clients"),e(i).show()},rtorrentScgi:function(){"rtorrent"===e("#torrent_method :selected").val().toLowerCase()&&("scgi://"===e("#torrent_host").val().substr(0,7)?(e("#torrent_username_option").hide(),e("#torrent_username").prop("value",""),e("#torrent_password_option").hide(),e("#torrent_password").prop("value",""),e("#torrent_auth_type_option").hide(),e("#torrent_auth_type option[value=none]").attr("selected","selected")):(e("#torrent_username_option").show(),e("#torrent_password_option").show(),e("#torrent_auth_type_option").show()))}},postprocessing:{init:function(){e("#unpack").on("change",function(){e(this).prop("checked")?n.config.postprocessing.israr_supported():e("#unpack").tooltipster("close")}),e("#name_presets").on("change",function(){n.config.postprocessing.setup_naming()}),e("#name_abd_presets").on("change",function(){n.config.postprocessing.setup_abd_naming()}),e("#naming_custom_abd").on("change",function(){n.config.postprocessing.setup_abd_naming()}),e("#name_sports_presets").on("change",function(){n.config.postprocessing.setup_sports_naming()}),e("#naming_custom_sports").on("change",function(){n.config.postprocessing.setup_sports_naming()}),e("#name_anime_presets").on("change",function(){n.config.postprocessing.setup_anime_naming()}),e("#naming_custom_anime").on("change",function(){n.config.postprocessing.setup_anime_naming()}),e('input[name="naming_anime"]').on("click",function(){n.config.postprocessing.setup_anime_naming()}),e("#naming_multi_ep").change(n.config.postprocessing.fill_examples),e("#naming_pattern").focusout(n.config.postprocessing.fill_examples),e("#naming_pattern").keyup(function(){n.config.postprocessing.typewatch(function(){n.config.postprocessing.fill_examples()},500)}),e("#naming_anime_multi_ep").change(n.config.postprocessing.fill_anime_examples),e("#naming_anime_pattern").focusout(n.config.postprocessing.fill_anime_examples),e("#naming_anime_pattern").keyup(function(){n.config.postprocessing.typewatch(function(){n.config.postprocessing.fill_anime_examples()},500)}),e("#naming_abd_pattern").focusout(n.config.postprocessing.fill_examples),e("#naming_abd_pattern").keyup(function(){n.config.postprocessing.typewatch(function(){n.config.postprocessing.fill_abd_examples()},500)}),e("#naming_sports_pattern").focusout(n.config.postprocessing.fill_examples),e("#naming_sports_pattern").keyup(function(){n.config.postprocessing.typewatch(function(){n.config.postprocessing.fill_sports_examples()},500)}),e("#naming_anime_pattern").focusout(n.config.postprocessing.fill_examples),e("#naming_anime_pattern").keyup(function(){n.config.postprocessing.typewatch(function(){n.config.postprocessing.fill_anime_examples()},500)}),e("#show_naming_key").on("click",function(){e("#naming_key").toggleClass("d-none")}),e("#show_naming_abd_key").on("click",function(){e("#naming_abd_key").toggleClass("d-none")}),e("#show_naming_sports_key").on("click",function(){e("#naming_sports_key").toggleClass("d-none")}),e("#show_naming_anime_key").on("click",function(){e("#naming_anime_key").toggleClass("d-none")}),e("#do_custom").on("click",function(){e("#naming_pattern").val(e("#name_presets :selected").attr("id")),e("#naming_custom").show(),e("#naming_pattern").focus()}),n.config.postprocessing.setup_naming(),n.config.postprocessing.setup_abd_naming(),n.config.postprocessing.setup_sports_naming(),n.config.postprocessing.setup_anime_naming(),e("#metadataType").on("change keyup",function(){n.config.postprocessing.showHideMetadata()}),n.config.postprocessing.showHideMetadata(),e(".metadata_checkbox").on("click",function(){n.config.postprocessing.refreshMetadataConfig(!1)}),n.config.postprocessing.refreshMetadataConfig(!0),e("img[title]").tooltipster({position:{viewport:e(window),at:"bottom center",my:"top right"}}),e("i[title]").tooltipster({position:{viewport:e(window),at:"top center",my:"bottom center"}}),e(".custom-pattern,#unpack").tooltipster("content",f("validating...")),e("#tv_download_dir").fileBrowser({title:f("Select TV Download Directory")}),e("#unpack_dir").fileBrowser({title:f("Select UNPACK Directory")})},typewatch:function(){var e=0;return function(t,n){clearTimeout(e),e=setTimeout(t,n)}},israr_supported:function(){e.get(n.srWebRoot+"/config/postProcessing/isRarSupported",function(t){"supported"!==t&&(e("#unpack").tooltipster("content",f("Unrar Executable not found.")),e("#unpack").tooltipster("open"),e("#unpack").css("background-color","#FFFFDD"))})},fill_examples:function(){var t=e("#naming_pattern").val(),i=e("#naming_multi_ep :selected").val(),a=e('input[name="naming_anime"]:checked').val();e.get(n.srWebRoot+"/config/postProcessing/testNaming",{pattern:t,anime_type:3},function(t){t?(e("#naming_example").text(t+".ext"),e("#naming_example_div").show()):e("#naming_example_div").hide()}),e.get(n.srWebRoot+"/config/postProcessing/testNaming",{pattern:t,multi:i,anime_type:3},function(t){t?(e("#naming_example_multi").text(t+".ext"),e("#naming_example_multi_div").show()):e("#naming_example_multi_div").hide()}),e.get(n.srWebRoot+"/config/postProcessing/isNamingValid",{pattern:t,multi:i,anime_type:a},function(t){"invalid"===t?(e("#naming_pattern").tooltipster("content",f("This pattern is invalid.")),e("#naming_pattern").tooltipster("open"),e("#naming_pattern").css("background-color","#FFDDDD")):"seasonfolders"===t?(e("#naming_pattern").tooltipster("content",f('This pattern would be invalid without the folders, using it will force "Flatten" off for all shows.')),e("#naming_pattern").tooltipster("open"),e("#naming_pattern").css("background-color","#FFFFDD")):(e("#naming_pattern").tooltipster("content",f("This pattern is valid.")),e("#naming_pattern").tooltipster("close"),e("#naming_pattern").css("background-color","#FFFFFF"))})},fill_abd_examples:function(){var t=e("#naming_abd_pattern").val();e.get(n.srWebRoot+"/config/postProcessing/testNaming",{pattern:t,abd:"True"},function(t){t?(e("#naming_abd_example").text(t+".ext"),e("#naming_abd_example_div").show()):e("#naming_abd_example_div").hide()}),e.get(n.srWebRoot+"/config/postProcessing/isNamingValid",{pattern:t,abd:"True"},function(t){"invalid"===t?(e("#naming_abd_pattern").tooltipster("content",f("This pattern is invalid.")),e("#naming_abd_pattern").tooltipster("open"),e("#naming_abd_pattern").css("background-color","#FFDDDD")):"seasonfolders"===t?(e("#naming_abd_pattern").tooltipster("content",f('This pattern would be invalid without the folders, using it will force "Flatten" off for all shows.')),e("#naming_abd_pattern").tooltipster("open"),e("#naming_abd_pattern").css("background-color","#FFFFDD")):(e("#naming_abd_pattern").tooltipster("content",f("This pattern is valid.")),e("#naming_abd_pattern").tooltipster("close"),e("#naming_abd_pattern").css("background-color","#FFFFFF"))})},fill_sports_examples:function(){var t=e("#naming_sports_pattern").val();e.get(n.srWebRoot+"/config/postProcessing/testNaming",{pattern:t,sports:"True"},function(t){t?(e("#naming_sports_example").text(t+".ext"),e("#naming_sports_example_div").show()):e("#naming_sports_example_div").hide()}),e.get(n.srWebRoot+"/config/postProcessing/isNamingValid",{pattern:t,sports:"True"},function(t){"invalid"===t?(e("#naming_sports_pattern").tooltipster("content",f("This pattern is invalid.")),e("#naming_sports_pattern").tooltipster("open"),e("#naming_sports_pattern").css("background-color","#FFDDDD")):"seasonfolders"===t?(e("#naming_sports_pattern").tooltipster("content",f('This pattern would be invalid without the folders, using it will force "Flatten" off for all shows.')),e("#naming_sports_pattern").tooltipster("open"),e("#naming_sports_pattern").css("background-color","#FFFFDD")):(e("#naming_sports_pattern").tooltipster("content",f("This pattern is valid.")),e("#naming_sports_pattern").tooltipster("close"),e("#naming_sports_pattern").css("background-color","#FFFFFF"))})},fill_anime_examples:function(){var t=e("#naming_anime_pattern").val(),i=e("#naming_anime_multi_ep :selected").val(),a=e('input[name="naming_anime"]:checked').val();e.get(n.srWebRoot+"/config/postProcessing/testNaming",{pattern:t,anime_type:a},function(t){t?(e("#naming_example_anime").text(t+".ext"),e("#naming_example_anime_div").show()):e("#naming_example_anime_div").hide()}),e.get(n.srWebRoot+"/config/postProcessing/testNaming",{pattern:t,multi:i,anime_type:a},function(t){t?(e("#naming_example_multi_anime").text(t+".ext"),e("#naming_example_multi_anime_div").show()):e("#naming_example_multi_anime_div").hide()}),e.get(n.srWebRoot+"/config/postProcessing/isNamingValid",{pattern:t,multi:i,anime_type:a},function(t){"invalid"===t?(e("#naming_pattern").tooltipster("content",f("This pattern is invalid.")),e("#naming_pattern").tooltipster("open"),e("#naming_pattern").css("background-color","#FFDDDD")):"seasonfolders"===t?(e("#naming_pattern").tooltipster("content",f('This pattern would be invalid without the folders, using it will force "Flatten" off for all shows.')),e("#naming_pattern").css("background-color","#FFFFDD")):(e("#naming_pattern").tooltipster("content",f("This pattern is valid.")),e("#naming_pattern").tooltipster("close"),e("#naming_pattern").css("background-color","#FFFFFF"))})},setup_naming:function(){"Custom..."===e("#name_presets :selected").val()?e("#naming_custom").show():(e("#naming_custom").hide(),e("#naming_pattern").val(e("#name_presets :selected").attr("id"))),n.config.postprocessing.fill_examples()},setup_abd_naming:function(){"Custom..."===e("#name_abd_presets :selected").val()?e("#naming_abd_custom").show():(e("#naming_abd_custom").hide(),e("#naming_abd_pattern").val(e("#name_abd_presets :selected").attr("id"))),n.config.postprocessing.fill_abd_examples()},setup_sports_naming:function(){"Custom..."===e("#name_sports_presets :selected").val()?e("#naming_sports_custom").show():(e("#naming_sports_custom").hide(),e("#naming_sports_pattern").val(e("#name_sports_presets :selected").attr("id"))),n.config.postprocessing.fill_sports_examples()},setup_anime_naming:function(){"Custom..."===e("#name_anime_presets :selected").val()?e("#naming_anime_custom").show():(e("#naming_anime_custom").hide(),e("#naming_anime_pattern").val(e("#name_anime_presets :selected").attr("id"))),n.config.postprocessing.fill_anime_examples()},showHideMetadata:function(){e(".metadataDiv").each(function(){var t=e(this).attr("id");e("#metadataType :selected").val()===t?e(this).show():e(this).hide()})},refreshMetadataConfig:function(t){var i=0,a="";e(".metadataDiv").each(function(){var t=e(this).attr("id"),n=[],o=e("#"+t+"_show_metadata").prop("checked"),s=e("#"+t+"_episode_metadata").prop("checked"),r=e("#"+t+"_fanart").prop("checked"),l=e("#"+t+"_poster").prop("checked"),c=e("#"+t+"_banner").prop("checked"),d=e("#"+t+"_episode_thumbnails").prop("checked"),u=e("#"+t+"_season_posters").prop("checked"),h=e("#"+t+"_season_banners").prop("checked"),f=e("#"+t+"_season_all_poster").prop("checked"),m=e("#"+t+"_season_all_banner").prop("checked"),p=e("#"+t+"_enabled").prop("checked");n.push(o?"1":"0"),n.push(s?"1":"0"),n.push(r?"1":"0"),n.push(l?"1":"0"),n.push(c?"1":"0"),n.push(d?"1":"0"),n.push(u?"1":"0"),n.push(h?"1":"0"),n.push(f?"1":"0"),n.push(m?"1":"0"),n.push(p?"1":"0");for(var g=0,b=0;b<n.length;b++)g+=parseInt(n[b]);g>i&&(i=g,a=t),e("#"+t+"_eg_show_metadata").attr("class",o?"enabled":"disabled"),e("#"+t+"_eg_episode_metadata").attr("class",s?"enabled":"disabled"),e("#"+t+"_eg_fanart").attr("class",r?"enabled":"disabled"),e("#"+t+"_eg_poster").attr("class",l?"enabled":"disabled"),e("#"+t+"_eg_banner").attr("class",c?"enabled":"disabled"),e("#"+t+"_eg_episode_thumbnails").attr("class",d?"enabled":"disabled"),e("#"+t+"_eg_season_posters").attr("class",u?"enabled":"disabled"),e("#"+t+"_eg_season_banners").attr("class",h?"enabled":"disabled"),e("#"+t+"_eg_season_all_poster").attr("class",f?"enabled":"disabled"),e("#"+t+"_eg_season_all_banner").attr("class",m?"enabled":"disabled"),e("#"+t+"_data").val(n.join("|"))}),""!==a&&t&&(e("#metadataType option[value="+a+"]").attr("selected","selected"),n.config.postprocessing.showHideMetadata())}},notifications:{init:function(){e("#testGrowl").click(function(){var t=e.trim(e("#growl_host").val()),i=e.trim(e("#growl_password").val());if(!t)return e("#testGrowl-result").html(f("Please fill out the necessary fields above.")),void e("#growl_host").addClass("warning");e("#growl_host").removeClass("warning"),e(this).prop("disabled",!0),e("#testGrowl-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testGrowl",{host:t,password:i}).done(function(t){e("#testGrowl-result").html(t),e("#testGrowl").prop("disabled",!1)})}),e("#testProwl").click(function(){var t=e.trim(e("#prowl_api").val()),i=e("#prowl_priority").val();if(!t)return e("#testProwl-result").html(f("Please fill out the necessary fields above.")),void e("#prowl_api").addClass("warning");e("#prowl_api").removeClass("warning"),e(this).prop("disabled",!0),e("#testProwl-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testProwl",{prowl_api:t,prowl_priority:i}).done(function(t){e("#testProwl-result").html(t),e("#testProwl").prop("disabled",!1)})}),e("#testKODI").click(function(){var t=e.trim(e("#kodi_host").val()),i=e.trim(e("#kodi_username").val()),a=e.trim(e("#kodi_password").val());if(!t)return e("#testKODI-result").html(f("Please fill out the necessary fields above.")),void e("#kodi_host").addClass("warning");e("#kodi_host").removeClass("warning"),e(this).prop("disabled",!0),e("#testKODI-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testKODI",{host:t,username:i,password:a}).done(function(t){e("#testKODI-result").html(t),e("#testKODI").prop("disabled",!1)})}),e("#testPMC").click(function(){var t=e.trim(e("#plex_host").val()),i=e.trim(e("#plex_client_username").val()),a=e.trim(e("#plex_client_password").val());if(!t)return e("#testPMC-result").html(f("Please fill out the necessary fields above.")),void e("#plex_host").addClass("warning");e("#plex_host").removeClass("warning"),e(this).prop("disabled",!0),e("#testPMC-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testPMC",{host:t,username:i,password:a}).done(function(t){e("#testPMC-result").html(t),e("#testPMC").prop("disabled",!1)})}),e("#testPMS").click(function(){var t=e.trim(e("#plex_server_host").val()),i=e.trim(e("#plex_username").val()),a=e.trim(e("#plex_password").val()),o=e.trim(e("#plex_server_token").val());if(!t)return e("#testPMS-result").html(f("Please fill out the necessary fields above.")),void e("#plex_server_host").addClass("warning");e("#plex_server_host").removeClass("warning"),e(this).prop("disabled",!0),e("#testPMS-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testPMS",{host:t,username:i,password:a,plex_server_token:o}).done(function(t){e("#testPMS-result").html(t),e("#testPMS").prop("disabled",!1)})}),e("#testEMBY").click(function(){var t=e("#emby_host").val(),i=e("#emby_apikey").val();if(!t||!i)return e("#testEMBY-result").html(f("Please fill out the necessary fields above.")),t?e("#emby_host").removeClass("warning"):e("#emby_host").addClass("warning"),void(i?e("#emby_apikey").removeClass("warning"):e("#emby_apikey").addClass("warning"));e("#emby_host,#emby_apikey").removeClass("warning"),e(this).prop("disabled",!0),e("#testEMBY-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testEMBY",{host:t,emby_apikey:i}).done(function(t){e("#testEMBY-result").html(t),e("#testEMBY").prop("disabled",!1)})}),e("#testBoxcar2").click(function(){var t=e.trim(e("#boxcar2_accesstoken").val());if(!t)return e("#testBoxcar2-result").html(f("Please fill out the necessary fields above.")),void e("#boxcar2_accesstoken").addClass("warning");e("#boxcar2_accesstoken").removeClass("warning"),e(this).prop("disabled",!0),e("#testBoxcar2-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testBoxcar2",{accesstoken:t}).done(function(t){e("#testBoxcar2-result").html(t),e("#testBoxcar2").prop("disabled",!1)})}),e("#testPushover").click(function(){var t=e("#pushover_userkey").val(),i=e("#pushover_apikey").val();if(!t||!i)return e("#testPushover-result").html(f("Please fill out the necessary fields above.")),t?e("#pushover_userkey").removeClass("warning"):e("#pushover_userkey").addClass("warning"),void(i?e("#pushover_apikey").removeClass("warning"):e("#pushover_apikey").addClass("warning"));e("#pushover_userkey,#pushover_apikey").removeClass("warning"),e(this).prop("disabled",!0),e("#testPushover-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testPushover",{userKey:t,apiKey:i}).done(function(t){e("#testPushover-result").html(t),e("#testPushover").prop("disabled",!1)})}),e("#testLibnotify").click(function(){e("#testLibnotify-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testLibnotify",function(t){e("#testLibnotify-result").html(t)})}),e("#twitterStep1").click(function(){e("#testTwitter-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/twitterStep1",function(e){window.open(e)}).done(function(){e("#testTwitter-result").html(f("<b>Step1:</b> Confirm Authorization"))})}),e("#twitterStep2").click(function(){var t=e.trim(e("#twitter_key").val());if(!t)return e("#testTwitter-result").html(f("Please fill out the necessary fields above.")),void e("#twitter_key").addClass("warning");e("#twitter_key").removeClass("warning"),e("#testTwitter-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/twitterStep2",{key:t},function(t){e("#testTwitter-result").html(t)})}),e("#testTwitter").click(function(){e.get(n.srWebRoot+"/home/testTwitter",function(t){e("#testTwitter-result").html(t)})}),e("#testTwilio").on("click",function(){var t=e.trim(e("#twilio_account_sid").val()),i=e.trim(e("#twilio_phone_sid").val()),a=e.trim(e("#twilio_auth_token").val()),o=e.trim(e("#twilio_to_number").val());e(this).prop("disabled",!0),e("#testTwilio-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testTwilio",{account_sid:t,phone_sid:i,auth_token:a,to_number:o}).done(function(t){e("#testTwilio-result").html(t),e("#testTwilio").prop("disabled",!1)})}),e("#testSlack").on("click",function(){e.get(n.srWebRoot+"/home/testSlack",function(t){e("#testSlack-result").html(t)})}),e("#testDiscord").on("click",function(){e.get(n.srWebRoot+"/home/testDiscord",function(t){e("#testDiscord-result").html(t)})}),e("#settingsNMJ").click(function(){if(!e("#nmj_host").val())return alert(f("Please fill in the Popcorn IP address")),void e("#nmj_host").focus();e("#testNMJ-result").html(n.loadingHTML);var t=e("#nmj_host").val();e.get(n.srWebRoot+"/home/settingsNMJ",{host:t},function(t){null===t&&(e("#nmj_database").removeAttr("readonly"),e("#nmj_mount").removeAttr("readonly"));var n=e.parseJSON(t);e("#testNMJ-result").html(n.message),e("#nmj_database").val(n.database),e("#nmj_mount").val(n.mount),n.database?e("#nmj_database").attr("readonly",!0):e("#nmj_database").removeAttr("readonly"),n.mount?e("#nmj_mount").attr("readonly",!0):e("#nmj_mount").removeAttr("readonly")})}),e("#testNMJ").click(function(){var t=e.trim(e("#nmj_host").val()),i=e("#nmj_database").val(),a=e("#nmj_mount").val();if(!t)return e("#testNMJ-result").html(f("Please fill out the necessary fields above.")),void e("#nmj_host").addClass("warning");e("#nmj_host").removeClass("warning"),e(this).prop("disabled",!0),e("#testNMJ-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testNMJ",{host:t,database:i,mount:a}).done(function(t){e("#testNMJ-result").html(t),e("#testNMJ").prop("disabled",!1)})}),e("#settingsNMJv2").click(function(){if(!e("#nmjv2_host").val())return alert(f("Please fill in the Popcorn IP address")),void e("#nmjv2_host").focus();e("#testNMJv2-result").html(n.loadingHTML);for(var t,i=e("#nmjv2_host").val(),a=document.getElementsByName("nmjv2_dbloc"),o=0;o<a.length;o++)if(a[o].checked){t=a[o].value;break}var s=e("#NMJv2db_instance").val();e.get(n.srWebRoot+"/home/settingsNMJv2",{host:i,dbloc:t,instance:s},function(t){null===t&&e("#nmjv2_database").removeAttr("readonly");var n=e.parseJSON(t);e("#testNMJv2-result").html(n.message),e("#nmjv2_database").val(n.database),n.database?e("#nmjv2_database").attr("readonly",!0):e("#nmjv2_database").removeAttr("readonly")})}),e("#testNMJv2").click(function(){var t=e.trim(e("#nmjv2_host").val());if(!t)return e("#testNMJv2-result").html(f("Please fill out the necessary fields above.")),void e("#nmjv2_host").addClass("warning");e("#nmjv2_host").removeClass("warning"),e(this).prop("disabled",!0),e("#testNMJv2-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testNMJv2",{host:t}).done(function(t){e("#testNMJv2-result").html(t),e("#testNMJv2").prop("disabled",!1)})}),e("#testFreeMobile").click(function(){var t=e.trim(e("#freemobile_id").val()),i=e.trim(e("#freemobile_apikey").val());if(!t||!i)return e("#testFreeMobile-result").html(f("Please fill out the necessary fields above.")),t?e("#freemobile_id").removeClass("warning"):e("#freemobile_id").addClass("warning"),void(i?e("#freemobile_apikey").removeClass("warning"):e("#freemobile_apikey").addClass("warning"));e("#freemobile_id,#freemobile_apikey").removeClass("warning"),e(this).prop("disabled",!0),e("#testFreeMobile-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testFreeMobile",{freemobile_id:t,freemobile_apikey:i}).done(function(t){e("#testFreeMobile-result").html(t),e("#testFreeMobile").prop("disabled",!1)})}),e("#testTelegram").on("click",function(){var t={};if(t.id=e.trim(e("#telegram_id").val()),t.apikey=e.trim(e("#telegram_apikey").val()),!t.id||!t.apikey)return e("#testTelegram-result").html(f("Please fill out the necessary fields above.")),t.id?e("#telegram_id").removeClass("warning"):e("#telegram_id").addClass("warning"),void(t.apikey?e("#telegram_apikey").removeClass("warning"):e("#telegram_apikey").addClass("warning"));e("#telegram_id,#telegram_apikey").removeClass("warning"),e(this).prop("disabled",!0),e("#testTelegram-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testTelegram",{telegram_id:t.id,telegram_apikey:t.apikey}).done(function(t){e("#testTelegram-result").html(t),e("#testTelegram").prop("disabled",!1)})}),e("#TraktGetPin").click(function(){window.open(e("#trakt_pin_url").val(),"popUp","toolbar=no, scrollbars=no, resizable=no, top=200, left=200, width=650, height=550"),e("#trakt_pin").removeClass("d-none")}),e("#trakt_pin").on("keyup change",function(){0!==e("#trakt_pin").val().length?(e("#TraktGetPin").addClass("d-none"),e("#authTrakt").removeClass("d-none")):(e("#TraktGetPin").removeClass("d-none"),e("#authTrakt").addClass("d-none"))}),e("#authTrakt").click(function(){0!==e("#trakt_pin").val().length&&e.get(n.srWebRoot+"/home/getTraktToken",{trakt_pin:e("#trakt_pin").val()}).done(function(t){e("#testTrakt-result").html(t),e("#authTrakt").addClass("d-none"),e("#trakt_pin").addClass("d-none"),e("#TraktGetPin").addClass("d-none")})}),e("#testTrakt").click(function(){var t=e.trim(e("#trakt_username").val()),i=e.trim(e("#trakt_blacklist_name").val());return t?/\s/g.test(i)?(e("#testTrakt-result").html(f("Check blacklist name; the value need to be a trakt slug")),void e("#trakt_blacklist_name").addClass("warning")):(e("#trakt_username").removeClass("warning"),e("#trakt_blacklist_name").removeClass("warning"),e(this).prop("disabled",!0),e("#testTrakt-result").html(n.loadingHTML),void e.get(n.srWebRoot+"/home/testTrakt",{username:t,blacklist_name:i}).done(function(t){e("#testTrakt-result").html(t),e("#testTrakt").prop("disabled",!1)})):(e("#testTrakt-result").html(f("Please fill out the necessary fields above.")),void(t?e("#trakt_username").removeClass("warning"):e("#trakt_username").addClass("warning")))}),e("#testEmail").click(function(){var t,i,a,o,s,r,l,c,d;(t=e("#testEmail-result")).html(n.loadingHTML),i=(i=e("#email_host").val()).length>0?i:null,a=(a=e("#email_port").val()).length>0?a:null,o=e("#email_tls").prop("checked"),s=(s=e("#email_from").val()).length>0?s:"root@localhost",r=e("#email_user").val().trim(),l=e("#email_password").val(),c="",null===i&&(c+='<li style="color: red;">'+f("You must specify an SMTP hostname!")+"</li>"),null===a?c+='<li style="color: red;">'+f("You must specify an SMTP port!")+"</li>":(null===a.match(/^\d+$/)||parseInt(a,10)>65535)&&(c+='<li style="color: red;">'+f("SMTP port must be between 0 and 65535!")+"</li>"),c.length>0?(c="<ol>"+c+"</ol>",t.html(c)):null===(d=prompt(f("Enter an email address to send the test to:"),null))||0===d.length||null===d.match(/.*@.*/)?t.html('<p style="color: red;">'+f("You must provide a recipient email address!")+"</p>"):e.get(n.srWebRoot+"/home/testEmail",{host:i,port:a,smtp_from:s,use_tls:o,user:r,pwd:l,to:d},function(t){e("#testEmail-result").html(t)})}),e("#testNMA").click(function(){var t=e.trim(e("#nma_api").val()),i=e("#nma_priority").val();if(!t)return e("#testNMA-result").html(f("Please fill out the necessary fields above.")),void e("#nma_api").addClass("warning");e("#nma_api").removeClass("warning"),e(this).prop("disabled",!0),e("#testNMA-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testNMA",{nma_api:t,nma_priority:i}).done(function(t){e("#testNMA-result").html(t),e("#testNMA").prop("disabled",!1)})}),e("#testPushalot").click(function(){var t=e.trim(e("#pushalot_authorizationtoken").val());if(!t)return e("#testPushalot-result").html(f("Please fill out the necessary fields above.")),void e("#pushalot_authorizationtoken").addClass("warning");e("#pushalot_authorizationtoken").removeClass("warning"),e(this).prop("disabled",!0),e("#testPushalot-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testPushalot",{authorizationToken:t}).done(function(t){e("#testPushalot-result").html(t),e("#testPushalot").prop("disabled",!1)})}),e("#testPushbullet").click(function(){var t=e.trim(e("#pushbullet_api").val());if(!t)return e("#testPushbullet-result").html(f("Please fill out the necessary fields above.")),void e("#pushbullet_api").addClass("warning");e("#pushbullet_api").removeClass("warning"),e(this).prop("disabled",!0),e("#testPushbullet-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testPushbullet",{api:t}).done(function(t){e("#testPushbullet-result").html(t),e("#testPushbullet").prop("disabled",!1)})}),e("#getPushbulletDevices").click(function(){n.config.notifications.get_pushbullet_devices(f("Device list updated. Please choose a device to push to."))}),e("#use_pushbullet").prop("checked")&&n.config.notifications.get_pushbullet_devices(),e("#email_show").on("change",function(){var t=parseInt(e("#email_show").val(),10);e.getJSON(n.srWebRoot+"/home/loadShowNotifyLists",function(n){n._size>0&&e("#email_show_list").val(t>=0?n[t.toString()].list:"")})}),e("#prowl_show").on("change",function(){var t=parseInt(e("#prowl_show").val(),10);e.getJSON(n.srWebRoot+"/home/loadShowNotifyLists",function(n){n._size>0&&e("#prowl_show_list").val(t>=0?n[t.toString()].prowl_notify_list:"")})}),n.config.notifications.load_show_notify_lists(),e("#email_show_save").click(function(){e.post(n.srWebRoot+"/home/saveShowNotifyList",{show:e("#email_show").val(),emails:e("#email_show_list").val()},function(){n.config.notifications.load_show_notify_lists()})}),e("#use_plex").click(function(){e(this).is(":checked")?e(".plexinfo").removeClass("d-none"):e(".plexinfo").addClass("d-none")})},get_pushbullet_devices:function(t){t&&e("#testPushbullet-result").html(n.loadingHTML);var i=e("#pushbullet_api").val();if(!i)return e("#testPushbullet-result").html(f("You didn't supply a Pushbullet api key")),e("#pushbullet_api").focus(),!1;e.get(n.srWebRoot+"/home/getPushbulletDevices",{api:i},function(n){var i=e.parseJSON(n).devices,a=e("#pushbullet_device").val();e("#pushbullet_device_list").html("");for(var o=0;o<i.length;o++)!0===i[o].active&&(a===i[o].iden?e("#pushbullet_device_list").append('<option value="'+i[o].iden+'" selected>'+i[o].nickname+"</option>"):e("#pushbullet_device_list").append('<option value="'+i[o].iden+'">'+i[o].nickname+"</option>"));""===a?e("#pushbullet_device_list").prepend('<option value="" selected>All devices</option>'):e("#pushbullet_device_list").prepend('<option value="">All devices</option>'),t&&e("#testPushbullet-result").html(t)}),e("#pushbullet_device_list").change(function(){e("#pushbullet_device").val(e("#pushbullet_device_list").val()),e("#testPushbullet-result").html(f("Don't forget to save your new pushbullet settings."))})},load_show_notify_lists:function(){e.getJSON(n.srWebRoot+"/home/loadShowNotifyLists",function(t){var n,i;if(0!==t._size){var a=[];for(i in t)t.hasOwnProperty(i)&&"_"!==i.charAt(0)&&a.push(t[i]);var o=a.sort(function(e,t){return e.name<t.name?-1:e.name>t.name?1:0});for(i in n='<option value="-1">-- Select --</option>',o)o.hasOwnProperty(i)&&o[i].id&&o[i].name&&(n+='<option value="'+o[i].id+'">'+e("<div/>").text(o[i].name).html()+"</option>");e("#email_show").html(n),e("#email_show_list").val(""),e("#prowl_show").html(n),e("#prowl_show_list").val("")}})}},backup_restore:function(){e("#Backup").click(function(){e("#Backup").attr("disabled",!0),e("#Backup-result").html(n.loadingHTML);var t=e("#backupDir").val();e.get(n.srWebRoot+"/config/backuprestore/backup",{backupDir:t}).done(function(t){e("#Backup-result").html(t),e("#Backup").attr("disabled",!1)})}),e("#Restore").click(function(){e("#Restore").attr("disabled",!0),e("#Restore-result").html(n.loadingHTML),e.get(n.srWebRoot+"/config/backuprestore/restore",{backupFile:e("#backupFile").val(),restore_database:e("#restore_database").prop("checked"),restore_config:e("#restore_config").prop("checked"),restore_cache:e("#restore_cache").prop("checked")}).done(function(t){e("#Restore-result").html(t),e("#Restore").attr("disabled",!1)})}),e("#backupDir").fileBrowser({title:f("Select backup folder to save to"),key:"backupPath"}),e("#backupFile").fileBrowser({title:f("Select backup files to restore"),key:"backupFile",includeFiles:1})},providers:{newznabProviders:[],torrentRssProviders:[],newznabProvidersCapabilities:[],init:function(){e(document).on("change",".newznab_key",function(){var t=e(this).attr("id");t=t.substring(0,t.length-"_key".length);var i=e("#"+t+"_url").val(),a=e("#"+t+"_cat").val(),o=e(this).val();n.config.providers.updateNewznabProvider(t,i,o,a)}),e("#newznab_key,#newznab_url").change(function(){var t=e("#editANewznabProvider :selected").val();if("addNewznab"!==t){var i=e("#newznab_url").val(),a=e("#newznab_key").val(),o=e("#newznab_cat option").map(function(t,n){return e(n).text()}).toArray().join(",");n.config.providers.updateNewznabProvider(t,i,a,o)}}),e("#torrentrss_url,#torrentrss_cookies,#torrentrss_titleTAG").change(function(){var t=e("#editATorrentRssProvider :selected").val();if("addTorrentRss"!==t){var i=e("#torrentrss_url").val(),a=e("#torrentrss_cookies").val(),o=e("#torrentrss_titleTAG").val();n.config.providers.updateTorrentRssProvider(t,i,a,o)}}),e(document).on("change","#editAProvider",function(){n.config.providers.showHideProviders()}),e("#editANewznabProvider").change(function(){n.config.providers.populateNewznabSection()}),e("#editATorrentRssProvider").change(function(){n.config.providers.populateTorrentRssSection()}),e(document).on("click",".provider_enabler",function(){n.config.providers.refreshProviderList()}),e("#newznab_cat_update").click(function(){e("#newznab_cat option").each(function(){e(this).remove()});var t=[];e("#newznab_cap option:selected").each(function(){var n=e(this).val();t.push({text:n,value:n})}),n.config.providers.replaceProviderOptions("#newznab_cat",t);var i=e("#editANewznabProvider :selected").val();if("addNewznab"!==i){var a=e("#newznab_url").val(),o=e("#newznab_key").val(),s=e("#newznab_cat option").map(function(t,n){return e(n).text()}).toArray().join(",");e("#newznab_cat option:not([value])").remove(),n.config.providers.updateNewznabProvider(i,a,o,s)}}),e("#newznab_add").click(function(){var t=e.trim(e("#newznab_name").val()),i=e.trim(e("#newznab_url").val()),a=e.trim(e("#newznab_key").val()),o=e.trim(e("#newznab_cat option").map(function(t,n){return e(n).text()}).toArray().join(","));if(t&&i&&a){var s={name:t};e.getJSON(n.srWebRoot+"/config/providers/canAddNewznabProvider",s,function(e){void 0===e.error?(n.config.providers.addNewznabProvider(e.success,t,i,a,o,"false"),n.config.providers.refreshEditAProvider()):alert(e.error)})}}),e(".newznab_delete").click(function(){var t=e("#editANewznabProvider :selected").val();n.config.providers.deleteNewznabProvider(t)}),e("#torrentrss_add").click(function(){var t=e("#torrentrss_name").val(),i=e("#torrentrss_url").val(),a=e("#torrentrss_cookies").val(),o=e("#torrentrss_titleTAG").val(),s={name:t,url:i,cookies:a,titleTAG:o};e.getJSON(n.srWebRoot+"/config/providers/canAddTorrentRssProvider",s,function(e){void 0===e.error?(n.config.providers.addTorrentRssProvider(e.success,t,i,a,o,"false"),n.config.providers.refreshEditAProvider()):alert(e.error)})}),e(".torrentrss_delete").on("click",function(){n.config.providers.deleteTorrentRssProvider(e("#editATorrentRssProvider :selected").val()),n.config.providers.refreshEditAProvider()}),e(document).on("change","[class='providerDiv_tip'] input",function(){e("div .providerDiv [name="+e(this).attr("name")+"]").replaceWith(e(this).clone()),e("div .providerDiv [newznab_name="+e(this).attr("id")+"]").replaceWith(e(this).clone())}),e(document).on("change","[class='providerDiv_tip'] select",function(){e(this).find("option").each(function(){e(this).is(":selected")?e(this).prop("defaultSelected",!0):e(this).prop("defaultSelected",!1)}),e("div .providerDiv [name="+e(this).attr("name")+"]").empty().replaceWith(e(this).clone())}),e(document).on("change",".seed_option",function(){var t=e(this).attr("id").split("_")[0];n.config.providers.makeTorrentOptionString(t)}),e("#provider_order_list").sortable({placeholder:"ui-state-highlight",update:function(){n.config.providers.refreshProviderList()}}),e("#provider_order_list").disableSelection(),e("#editANewznabProvider").length&&n.config.providers.populateNewznabSection();for(var t=n.getMeta("NEWZNAB_PROVIDERS").split("!!!"),i=0;i<t.length;i++){var a=t[i];a.length>0&&n.config.providers.addNewznabProvider.apply(this,a.split("|"))}for(var o=n.getMeta("TORRENTRSS_PROVIDERS").split("!!!"),s=0;s<o.length;s++){var r=o[s];r.length>0&&n.config.providers.addTorrentRssProvider.apply(this,r.split("|"))}n.config.providers.showHideProviders()},showHideProviders:function(){e(".providerDiv").each(function(){var t=e(this).attr("id");e("#editAProvider :selected").val()+"Div"===t?e(this).show():e(this).hide()})},findProvider:function(e,t){var n=!1;return e.forEach(function(e){e.name===t&&(n=!0)}),n},getNewznabCategories:function(t,i){var a=i[0],o=i[1],s=i[2];if(a&&o&&s){var r={url:o,name:a,key:s};e(".updating_categories").wrapInner("<span>"+n.loadingHTML+" Updating Categories ...</span>"),e.getJSON(n.srWebRoot+"/config/providers/getNewznabCategories",r,function(e){n.config.providers.updateNewznabCaps(e,i)}).always(function(){e(".updating_categories").empty()})}},addNewznabProvider:function(t,i,a,o,s,r,l){(a=e.trim(a))&&(/^https?:\/\//i.test(a)||(a="http://"+a),null===a.match("/$")&&(a+="/"),n.config.providers.newznabProviders[t]=[r,[i,a,o,s]],"true"!==r&&(e("#editANewznabProvider").append(e("<option></option>").attr("value",t).text(i)),n.config.providers.populateNewznabSection()),0===e("#provider_order_list > #"+t).length&&"false"!==l&&(e("#provider_order_list").append('<li class="ui-state-default" id="'+t+'"> <input type="checkbox" id="enable_'+t+'" class="provider_enabler" CHECKED> <a href="'+n.anonURL+a+'" class="imgLink" target="_new"><img src="'+n.srWebRoot+'/images/providers/nzb.png" alt="'+i+'" width="16" height="16"></a> '+i+"</li>"),e("#provider_order_list").sortable("refresh")),n.config.providers.refreshProviderList())},updateNewznabProvider:function(e,t,i,a){n.config.providers.newznabProviders[e][1][1]=t,n.config.providers.newznabProviders[e][1][2]=i,n.config.providers.newznabProviders[e][1][3]=a,n.config.providers.populateNewznabSection(),n.config.providers.refreshProviderList()},deleteNewznabProvider:function(t){e("#editANewznabProvider").removeOption(t),n.config.providers.populateNewznabSection(),e("li").remove("#"+t),delete n.config.providers.newznabProviders[t],n.config.providers.refreshProviderList()},populateNewznabSection:function(){var t=e("#editANewznabProvider :selected").val(),i="",a="",o="";"addNewznab"===t?(i=["","",""],a="false",e("#newznab_add_div").show(),e("#newznab_update_div").hide(),e("#newznab_cat").attr("disabled","disabled"),e("#newznab_cap").attr("disabled","disabled"),e("#newznab_cat_update").attr("disabled","disabled"),e("#newznabcapdiv").hide(),e("#newznab_cat option").each(function(){e(this).remove()}),e("#newznab_cap option").each(function(){e(this).remove()})):(i=n.config.providers.newznabProviders[t][1],a=n.config.providers.newznabProviders[t][0],e("#newznab_add_div").hide(),e("#newznab_update_div").show(),e("#newznab_cat").removeAttr("disabled"),e("#newznab_cap").removeAttr("disabled"),e("#newznab_cat_update").removeAttr("disabled"),e("#newznabcapdiv").show()),e("#newznab_name").val(i[0]),e("#newznab_url").val(i[1]),e("#newznab_key").val(i[2]);var s=[];(o="string"==typeof i[3]?i[3].split(","):i[3])&&(o.forEach(function(e){""!==e&&s.push({text:e,value:e})}),n.config.providers.replaceProviderOptions("#newznab_cat",s)),"addNewznab"===t?(e("#newznab_name").removeAttr("disabled"),e("#newznab_url").removeAttr("disabled")):(e("#newznab_name").attr("disabled","disabled"),"true"===a?(e("#newznab_url").attr("disabled","disabled"),e("#newznab_delete").attr("disabled","disabled")):(e("#newznab_url").removeAttr("disabled"),e("#newznab_delete").removeAttr("disabled"),i[0]&&i[1]&&i[2]&&!n.config.providers.findProvider(n.config.providers.newznabProvidersCapabilities,i[0])&&n.config.providers.getNewznabCategories(a,i),n.config.providers.updateNewznabCaps(null,i)))},updateNewznabCaps:function(e,t){e&&!n.config.providers.findProvider(n.config.providers.newznabProvidersCapabilities,t[0])&&n.config.providers.newznabProvidersCapabilities.push({name:t[0],categories:e.tv_categories}),t[0]&&n.config.providers.newznabProvidersCapabilities.forEach(function(e){if(e.name&&e.name===t[0]&&e.categories instanceof Array){var i=[];e.categories.forEach(function(e){e.id&&e.name&&i.push({value:e.id,text:e.name+"("+e.id+")"})}),n.config.providers.replaceProviderOptions("#newznab_cap",i)}})},addTorrentRssProvider:function(t,i,a,o,s,r,l){n.config.providers.torrentRssProviders[t]=[i,a,o,s],"true"!==r&&(e("#editATorrentRssProvider").append(e("<option></option>").attr("value",t).text(i)),n.config.providers.populateTorrentRssSection()),0===e("#provider_order_list > #"+t).length&&"false"!==l&&(e("#provider_order_list").append('<li class="ui-state-default" id="'+t+'"> <input type="checkbox" id="enable_'+t+'" class="provider_enabler" CHECKED> <a href="'+n.anonURL+a+'" class="imgLink" target="_new"><img src="'+n.srWebRoot+'/images/providers/torrent.png" alt="'+i+'" width="16" height="16"></a> '+i+"</li>"),e("#provider_order_list").sortable("refresh")),n.config.providers.refreshProviderList()},updateTorrentRssProvider:function(e,t,i,a){n.config.providers.torrentRssProviders[e][1]=t,n.config.providers.torrentRssProviders[e][2]=i,n.config.providers.torrentRssProviders[e][3]=a,n.config.providers.populateTorrentRssSection(),n.config.providers.refreshProviderList()},deleteTorrentRssProvider:function(t){e("#editATorrentRssProvider").removeOption(t),n.config.providers.populateTorrentRssSection(),e("li").remove("#"+t),delete n.config.providers.torrentRssProviders[t],n.config.providers.refreshProviderList()},populateTorrentRssSection:function(){var t=e("#editATorrentRssProvider :selected").val(),i="";"addTorrentRss"===t?(i=["","","","title"],e("#torrentrss_add_div").show(),e("#torrentrss_update_div").hide()):(i=n.config.providers.torrentRssProviders[t],e("#torrentrss_add_div").hide(),e("#torrentrss_update_div").show()),e("#torrentrss_name").val(i[0]),e("#torrentrss_url").val(i[1]),e("#torrentrss_cookies").val(i[2]),e("#torrentrss_titleTAG").val(i[3]),"addTorrentRss"===t?(e("#torrentrss_name").removeAttr("disabled"),e("#torrentrss_url").removeAttr("disabled"),e("#torrentrss_cookies").removeAttr("disabled"),e("#torrentrss_titleTAG").removeAttr("disabled")):(e("#torrentrss_name").attr("disabled","disabled"),e("#torrentrss_url").removeAttr("disabled"),e("#torrentrss_cookies").removeAttr("disabled"),e("#torrentrss_titleTAG").removeAttr("disabled"),e("#torrentrss_delete").removeAttr("disabled"))},makeTorrentOptionString:function(t){var n=e(".providerDiv_tip #"+t+"_seed_ratio").prop("value"),i=e(".providerDiv_tip #"+t+"_seed_time").prop("value"),a=e(".providerDiv_tip #"+t+"_process_method").prop("value");e(".providerDiv_tip #"+t+"_option_string").val([n,i,a].join("|"))},refreshProviderList:function(){var t=e("#provider_order_list").sortable("toArray"),i=[],a=[];for(var o in e.each(t,function(t,n){var a=+e("#enable_"+n).prop("checked")?"1":"0";i.push(n+":"+a)}),n.config.providers.newznabProviders)n.config.providers.newznabProviders.hasOwnProperty(o)&&a.push("newznab|"+n.config.providers.newznabProviders[o][1].join("|"));for(var s in n.config.providers.torrentRssProviders)n.config.providers.torrentRssProviders.hasOwnProperty(s)&&a.push("torrentrss|"+n.config.providers.torrentRssProviders[s].join("|"));e("#provider_strings").val(a.join(" ")),e("#provider_order").val(i.join(" ")),n.config.providers.refreshEditAProvider()},refreshEditAProvider:function(){e("#editAProvider").empty();var t=e("#provider_order_list").sortable("toArray"),i=[];if(e.each(t,function(t,n){e("#enable_"+n).prop("checked")&&i.push(n)}),i.length>0){e("<select>").prop("id","editAProvider").addClass("form-control input-sm").appendTo("#provider-list");for(var a=0;a<i.length;a++){var o=i[a];e("#editAProvider").append(e("<option>").prop("value",o).text(e.trim(e("#"+o).text()).replace(/\s\*$/,"").replace(/\s\*\*$/,"")))}}else document.getElementsByClassName("component-desc")[0].innerHTML=f("No providers available to configure.");n.config.providers.showHideProviders()},replaceProviderOptions:function(t,n){e(t).empty(),e.each(n,function(n,i){e(t).append(e("<option></option>").attr("value",i.value).text(i.text))})}}},manage:{init:function(){e.backstretch(n.srWebRoot+"/images/backdrops/manage.jpg"),e(".backstretch").css("opacity",n.getMeta("sickrage.FANART_BACKGROUND_OPACITY")).fadeIn("500")},episode_statuses:function(){e(".allCheck").click(function(){var t=e(this).attr("id").split("-")[1];e("."+t+"-epcheck").prop("checked",e(this).prop("checked"))}),e(".get_more_eps").click(function(){var t=e(this).attr("id"),i=e("#allCheck-"+t).prop("checked"),a=e("tr#"+t),o=e(this).attr("data-clicked"),s=e(this).attr("value");o?"collapse"===s.toLowerCase()?(e("table tr").filter(".show-"+t).hide(),e(this).prop("value","Expand")):"expand"===s.toLowerCase()&&(e("table tr").filter(".show-"+t).show(),e(this).prop("value","Collapse")):(e.getJSON(n.srWebRoot+"/manage/showEpisodeStatuses",{indexer_id:t,whichStatus:e("#oldStatus").val()},function(n){e.each(n,function(n,o){e.each(o,function(o,s){a.after(function(t,n,i,a,o){var s="";return s+=' <tr class="text-dark '+e("#row_class").val()+" show-"+t+'">',s+='  <td align="center"><input type="checkbox" class="'+t+'-epcheck" name="'+t+"-"+n+"x"+i+'"'+(o?" checked":"")+"></td>",s+="  <td>"+n+"x"+i+"</td>",s+='  <td style="width: 100%">'+a+"</td>",s+=" </tr>"}(t,n,o,s,i))})})}),e(this).attr("data-clicked",1),e(this).prop("value","Collapse"))}),e(".selectAllShows").click(function(){e(".allCheck").each(function(){e(this).prop("checked",!0)}),e('input[class*="-epcheck"]').each(function(){e(this).prop("checked",!0)})}),e(".unselectAllShows").click(function(){e(".allCheck").each(function(){e(this).prop("checked",!1)}),e('input[class*="-epcheck"]').each(function(){e(this).prop("checked",!1)})})},mass_update:function(){e("#massUpdateTable:has(tbody tr)").tablesorter({theme:"bootstrap",sortList:[[1,0]],textExtraction:{3:function(t){return e(t).find("span").text().toLowerCase()},4:function(t){return e(t).find("span").text().toLowerCase()},5:function(t){return e(t).find("span").text().toLowerCase()},6:function(t){return e(t).find("span").text().toLowerCase()},7:function(t){return e(t).find("span").text().toLowerCase()},8:function(t){return e(t).find("span").text().toLowerCase()},9:function(t){return e(t).find("span").text().toLowerCase()},10:function(t){return e(t).find("span").text().toLowerCase()}},headers:{0:{sorter:!1},1:{sorter:"showNames"},2:{sorter:"showDirs"},3:{sorter:"quality"},4:{sorter:"sports"},5:{sorter:"scene"},6:{sorter:"anime"},7:{sorter:"flatten_folders"},8:{sorter:"skip_downloaded"},9:{sorter:"paused"},10:{sorter:"subtitle"},11:{sorter:"default_ep_status"},12:{sorter:"status"}}}),e("#submitMassEdit").on("click",function(){var t=[];e(".showCheck:checked").each(function(){t.push(e(this).attr("id"))}),0!==t.length&&(window.location.href="massEdit?toEdit="+t.join("|"))}),e("#submitMassUpdate").on("click",function(){var t=[];e(".showCheck:checked").each(function(){t.push(e(this).attr("id"))}),0!==t.length&&(window.location.href="massUpdate?toUpdate="+t.join("|"))}),e("#submitMassRescan").on("click",function(){var t=[];e(".showCheck:checked").each(function(){t.push(e(this).attr("id"))}),0!==t.length&&(window.location.href="massUpdate?toRefresh="+t.join("|"))}),e("#submitMassRename").on("click",function(){var t=[];e(".showCheck:checked").each(function(){t.push(e(this).attr("id"))}),0!==t.length&&(window.location.href="massUpdate?toRename="+t.join("|"))}),e("#submitMassDelete").on("click",function(){var t=[];e(".showCheck:checked").each(function(){t.push(e(this).attr("id"))}),0!==t.length&&e.confirm({theme:"dark",title:f("Mass Delete"),content:f("You have selected to delete "+t.length+" show(s).  Are you sure you wish to continue? All files will be removed from your system."),buttons:{confirm:function(){window.location.href="massUpdate?toDelete="+t.join("|")},cancel:{action:function(){}}}})}),e("#submitMassRemove").on("click",function(){var t=[];e(".showCheck:checked").each(function(){t.push(e(this).attr("id"))}),0!==t.length&&(window.location.href="massUpdate?toRemove="+t.join("|"))}),e(".bulkCheck").on("click",function(){e(".showCheck:visible").each(function(){e(this).disabled||e(this).prop("checked",!this.checked)})}),e("#checkboxControls input").change(function(){var t=e(this).attr("id"),i=e("#checkboxControls > input, #"+t).prop("checked");n.showHideRows(t,i)}),e("#checkboxControls input").each(function(){var t=e(this).prop("checked");e("tr."+e(this).attr("id")).each(function(){t?e(this).show():e(this).hide()})})},mass_edit:{init:function(){e(".new_root_dir").change(function(){var t=n.manage.mass_edit.findDirIndex(e(this).attr("id"));e("#display_new_root_dir_"+t).html("<b>"+e(this).val()+"</b>")}),e(".edit_root_dir").click(function(){var t=n.manage.mass_edit.findDirIndex(e(this).attr("id")),i=e("#new_root_dir_"+t).val();e(this).nFileBrowser(n.manage.mass_edit.editRootDir,{initialDir:i,whichId:t})}),e(".delete_root_dir").click(function(){var t=n.manage.mass_edit.findDirIndex(e(this).attr("id"));e("#new_root_dir_"+t).val(null),e("#display_new_root_dir_"+t).html("<b>"+f("DELETED")+"</b>")})},findDirIndex:function(e){var t=e.split("_");return t[t.length-1]},editRootDir:function(t,n){e("#new_root_dir_"+n.whichId).val(t),e("#new_root_dir_"+n.whichId).change()}},backlog_overview:function(){e("#pickShow").change(function(){var t=e(this).val();t&&e("html,body").animate({scrollTop:e("#show-"+t).offset().top-25},"slow")})},failed_downloads:function(){e("#failedTable:has(tbody tr)").tablesorter({theme:"bootstrap",sortList:[[0,0]],headers:{3:{sorter:!1}}}),e("#limit").change(function(){window.location.href=n.srWebRoot+"/manage/failedDownloads/?limit="+e(this).val()}),e("#submitMassRemove").on("click",function(){var t=[];if(e(".removeCheck").each(function(){e(this).prop("checked")&&t.push(e(this).attr("id").split("-")[1])}),0===t.length)return!1;window.location.href=n.srWebRoot+"/manage/failedDownloads?toRemove="+t.join("|")}),e(".bulkCheck").on("click",function(){var t=this,n=e(t).attr("id");e("."+n+":visible").each(function(){e(this).prop("checked",t.checked)})}),e(".removeCheck").length&&e(".removeCheck").each(function(t){var n=null;e(t).on("click",function(i){if(n&&i.shiftKey){var a=this,o=0;e(t+":visible").each(function(){if(2===o)return!1;1===o&&(this.checked=n.checked),this!==a&&this!==n||o++})}else n=this})})},subtitles_missed:function(){e(".allCheck").click(function(){var t=e(this).attr("id").split("-")[1];e("."+t+"-epcheck").prop("checked",e(this).prop("checked"))}),e(".get_more_eps").click(function(){var t=e(this).attr("id"),i=e("#allCheck-"+t).prop("checked"),a=e("tr#"+t),o=e(this).attr("data-clicked"),s=e(this).attr("value");o?"Collapse"===s?(e("table tr").filter(".show-"+t).hide(),e(this).prop("value","Expand")):"Expand"===s&&(e("table tr").filter(".show-"+t).show(),e(this).prop("value","Collapse")):(e.getJSON(n.srWebRoot+"/manage/showSubtitleMissed",{indexer_id:t,whichSubs:e("#selectSubLang").val()},function(n){e.each(n,function(n,o){e.each(o,function(e,o){a.after(function(e,t,n,i,a,o){var s="";return s+=' <tr class="good show-'+e+'">',s+='  <td align="center"><input type="checkbox" class="'+e+'-epcheck" name="'+e+"-"+t+"x"+n+'"'+(o=o?" checked":"")+"></td>",s+='  <td style="width: 1%;">'+t+"x"+n+"</td>",s+="  <td>"+i+"</td>",s+=" </tr>"}(t,n,e,o.name,o.subtitles,i))})})}),e(this).attr("data-clicked",1),e(this).prop("value","Collapse"))}),e(".selectAllShows").click(function(){e(".allCheck").each(function(){e(this).prop("checked",!0)}),e('input[class*="-epcheck"]').each(function(){e(this).prop("checked",!0)})}),e(".unselectAllShows").click(function(){e(".allCheck").each(function(){e(this).prop("checked",!1)}),e('input[class*="-epcheck"]').each(function(){e(this).prop("checked",!1)})})}},logs:{init:function(){},view:function(){e("#minLevel,#logFilter,#logSearch").on("change keyup",u.default.debounce(function(){e("#logSearch").val().length>0&&(e('#logFilter option[value="<NONE>"]').prop("selected",!0),e("#minLevel option[value=5]").prop("selected",!0)),e("#minLevel").prop("disabled",!0),e("#logFilter").prop("disabled",!0),document.body.style.cursor="wait";var t=n.srWebRoot+"/logs/viewlog/?minLevel="+e("select[name=minLevel]").val()+"&logFilter="+e("select[name=logFilter]").val()+"&logSearch="+e("#logSearch").val();e.get(t,function(n){history.pushState("data","",t),e("#loglines").html(e(n).find("#loglines").html()),e("#minLevel").prop("disabled",!1),e("#logFilter").prop("disabled",!1),document.body.style.cursor="default"})},500))}}};({init:function(){var t=document.body,n=t.getAttribute("data-controller"),i=t.getAttribute("data-action");this.exec("common"),this.exec(n),this.exec(n,i),e(".loading-spinner").hide(),e(".main-container").removeClass("d-none")},exec:function(e,i){i=void 0===i?"init":i,""!==e&&n[e]&&n[e][i]&&{object:n[e][i].init,function:n[e][i]}[t(n[e][i])]()}}).init()})}).call(this,n(0))},,function(e,t,n){},,function(e,t,n){},,function(e,t,n){},,function(e,t,n){},,function(e,t,n){},,function(e,t,n){},,,,,,,,,,,,,,,,,,,,,,,,,,,,,,,function(e,t,n){},function(e,t,n){"use strict";n(176),n(145),n(143),n(141),n(139),n(137),n(135),n(133)}]);
\ No newline at end of file
+!function(e,t,n){"use strict";function i(e,t){for(var n=0;n<t.length;n++){var i=t[n];i.enumerable=i.enumerable||!1,i.configurable=!0,"value"in i&&(i.writable=!0),Object.defineProperty(e,i.key,i)}}function a(e,t,n){return t&&i(e.prototype,t),n&&i(e,n),e}function o(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function s(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{},i=Object.keys(n);"function"==typeof Object.getOwnPropertySymbols&&(i=i.concat(Object.getOwnPropertySymbols(n).filter(function(e){return Object.getOwnPropertyDescriptor(n,e).enumerable}))),i.forEach(function(t){o(e,t,n[t])})}return e}t=t&&t.hasOwnProperty("default")?t.default:t,n=n&&n.hasOwnProperty("default")?n.default:n;var r=function(e){var t="transitionend";function n(e){return{}.toString.call(e).match(/\s([a-z]+)/i)[1].toLowerCase()}function i(t){var n=this,i=!1;return e(this).one(a.TRANSITION_END,function(){i=!0}),setTimeout(function(){i||a.triggerTransitionEnd(n)},t),this}var a={TRANSITION_END:"bsTransitionEnd",getUID:function(e){do{e+=~~(1e6*Math.random())}while(document.getElementById(e));return e},getSelectorFromElement:function(t){var n=t.getAttribute("data-target");n&&"#"!==n||(n=t.getAttribute("href")||"");try{var i=e(document).find(n);return i.length>0?n:null}catch(e){return null}},getTransitionDurationFromElement:function(t){if(!t)return 0;var n=e(t).css("transition-duration"),i=parseFloat(n);return i?(n=n.split(",")[0],1e3*parseFloat(n)):0},reflow:function(e){return e.offsetHeight},triggerTransitionEnd:function(n){e(n).trigger(t)},supportsTransitionEnd:function(){return Boolean(t)},isElement:function(e){return(e[0]||e).nodeType},typeCheckConfig:function(e,t,i){for(var o in i)if(Object.prototype.hasOwnProperty.call(i,o)){var s=i[o],r=t[o],l=r&&a.isElement(r)?"element":n(r);if(!new RegExp(s).test(l))throw new Error(e.toUpperCase()+': Option "'+o+'" provided type "'+l+'" but expected type "'+s+'".')}}};return e.fn.emulateTransitionEnd=i,e.event.special[a.TRANSITION_END]={bindType:t,delegateType:t,handle:function(t){if(e(t.target).is(this))return t.handleObj.handler.apply(this,arguments)}},a}(t),l=function(e){var t=e.fn.alert,n={CLOSE:"close.bs.alert",CLOSED:"closed.bs.alert",CLICK_DATA_API:"click.bs.alert.data-api"},i={ALERT:"alert",FADE:"fade",SHOW:"show"},o=function(){function t(e){this._element=e}var o=t.prototype;return o.close=function(e){var t=this._element;e&&(t=this._getRootElement(e));var n=this._triggerCloseEvent(t);n.isDefaultPrevented()||this._removeElement(t)},o.dispose=function(){e.removeData(this._element,"bs.alert"),this._element=null},o._getRootElement=function(t){var n=r.getSelectorFromElement(t),a=!1;return n&&(a=e(n)[0]),a||(a=e(t).closest("."+i.ALERT)[0]),a},o._triggerCloseEvent=function(t){var i=e.Event(n.CLOSE);return e(t).trigger(i),i},o._removeElement=function(t){var n=this;if(e(t).removeClass(i.SHOW),e(t).hasClass(i.FADE)){var a=r.getTransitionDurationFromElement(t);e(t).one(r.TRANSITION_END,function(e){return n._destroyElement(t,e)}).emulateTransitionEnd(a)}else this._destroyElement(t)},o._destroyElement=function(t){e(t).detach().trigger(n.CLOSED).remove()},t._jQueryInterface=function(n){return this.each(function(){var i=e(this),a=i.data("bs.alert");a||(a=new t(this),i.data("bs.alert",a)),"close"===n&&a[n](this)})},t._handleDismiss=function(e){return function(t){t&&t.preventDefault(),e.close(this)}},a(t,null,[{key:"VERSION",get:function(){return"4.1.1"}}]),t}();return e(document).on(n.CLICK_DATA_API,'[data-dismiss="alert"]',o._handleDismiss(new o)),e.fn.alert=o._jQueryInterface,e.fn.alert.Constructor=o,e.fn.alert.noConflict=function(){return e.fn.alert=t,o._jQueryInterface},o}(t),c=function(e){var t="button",n=e.fn[t],i={ACTIVE:"active",BUTTON:"btn",FOCUS:"focus"},o={DATA_TOGGLE_CARROT:'[data-toggle^="button"]',DATA_TOGGLE:'[data-toggle="buttons"]',INPUT:"input",ACTIVE:".active",BUTTON:".btn"},s={CLICK_DATA_API:"click.bs.button.data-api",FOCUS_BLUR_DATA_API:"focus.bs.button.data-api blur.bs.button.data-api"},r=function(){function t(e){this._element=e}var n=t.prototype;return n.toggle=function(){var t=!0,n=!0,a=e(this._element).closest(o.DATA_TOGGLE)[0];if(a){var s=e(this._element).find(o.INPUT)[0];if(s){if("radio"===s.type)if(s.checked&&e(this._element).hasClass(i.ACTIVE))t=!1;else{var r=e(a).find(o.ACTIVE)[0];r&&e(r).removeClass(i.ACTIVE)}if(t){if(s.hasAttribute("disabled")||a.hasAttribute("disabled")||s.classList.contains("disabled")||a.classList.contains("disabled"))return;s.checked=!e(this._element).hasClass(i.ACTIVE),e(s).trigger("change")}s.focus(),n=!1}}n&&this._element.setAttribute("aria-pressed",!e(this._element).hasClass(i.ACTIVE)),t&&e(this._element).toggleClass(i.ACTIVE)},n.dispose=function(){e.removeData(this._element,"bs.button"),this._element=null},t._jQueryInterface=function(n){return this.each(function(){var i=e(this).data("bs.button");i||(i=new t(this),e(this).data("bs.button",i)),"toggle"===n&&i[n]()})},a(t,null,[{key:"VERSION",get:function(){return"4.1.1"}}]),t}();return e(document).on(s.CLICK_DATA_API,o.DATA_TOGGLE_CARROT,function(t){t.preventDefault();var n=t.target;e(n).hasClass(i.BUTTON)||(n=e(n).closest(o.BUTTON)),r._jQueryInterface.call(e(n),"toggle")}).on(s.FOCUS_BLUR_DATA_API,o.DATA_TOGGLE_CARROT,function(t){var n=e(t.target).closest(o.BUTTON)[0];e(n).toggleClass(i.FOCUS,/^focus(in)?$/.test(t.type))}),e.fn[t]=r._jQueryInterface,e.fn[t].Constructor=r,e.fn[t].noConflict=function(){return e.fn[t]=n,r._jQueryInterface},r}(t),d=function(e){var t="carousel",n="bs.carousel",i="."+n,o=e.fn[t],l={interval:5e3,keyboard:!0,slide:!1,pause:"hover",wrap:!0},c={interval:"(number|boolean)",keyboard:"boolean",slide:"(boolean|string)",pause:"(string|boolean)",wrap:"boolean"},d={NEXT:"next",PREV:"prev",LEFT:"left",RIGHT:"right"},u={SLIDE:"slide"+i,SLID:"slid"+i,KEYDOWN:"keydown"+i,MOUSEENTER:"mouseenter"+i,MOUSELEAVE:"mouseleave"+i,TOUCHEND:"touchend"+i,LOAD_DATA_API:"load.bs.carousel.data-api",CLICK_DATA_API:"click.bs.carousel.data-api"},h={CAROUSEL:"carousel",ACTIVE:"active",SLIDE:"slide",RIGHT:"carousel-item-right",LEFT:"carousel-item-left",NEXT:"carousel-item-next",PREV:"carousel-item-prev",ITEM:"carousel-item"},f={ACTIVE:".active",ACTIVE_ITEM:".active.carousel-item",ITEM:".carousel-item",NEXT_PREV:".carousel-item-next, .carousel-item-prev",INDICATORS:".carousel-indicators",DATA_SLIDE:"[data-slide], [data-slide-to]",DATA_RIDE:'[data-ride="carousel"]'},m=function(){function o(t,n){this._items=null,this._interval=null,this._activeElement=null,this._isPaused=!1,this._isSliding=!1,this.touchTimeout=null,this._config=this._getConfig(n),this._element=e(t)[0],this._indicatorsElement=e(this._element).find(f.INDICATORS)[0],this._addEventListeners()}var m=o.prototype;return m.next=function(){this._isSliding||this._slide(d.NEXT)},m.nextWhenVisible=function(){!document.hidden&&e(this._element).is(":visible")&&"hidden"!==e(this._element).css("visibility")&&this.next()},m.prev=function(){this._isSliding||this._slide(d.PREV)},m.pause=function(t){t||(this._isPaused=!0),e(this._element).find(f.NEXT_PREV)[0]&&(r.triggerTransitionEnd(this._element),this.cycle(!0)),clearInterval(this._interval),this._interval=null},m.cycle=function(e){e||(this._isPaused=!1),this._interval&&(clearInterval(this._interval),this._interval=null),this._config.interval&&!this._isPaused&&(this._interval=setInterval((document.visibilityState?this.nextWhenVisible:this.next).bind(this),this._config.interval))},m.to=function(t){var n=this;this._activeElement=e(this._element).find(f.ACTIVE_ITEM)[0];var i=this._getItemIndex(this._activeElement);if(!(t>this._items.length-1||t<0))if(this._isSliding)e(this._element).one(u.SLID,function(){return n.to(t)});else{if(i===t)return this.pause(),void this.cycle();var a=t>i?d.NEXT:d.PREV;this._slide(a,this._items[t])}},m.dispose=function(){e(this._element).off(i),e.removeData(this._element,n),this._items=null,this._config=null,this._element=null,this._interval=null,this._isPaused=null,this._isSliding=null,this._activeElement=null,this._indicatorsElement=null},m._getConfig=function(e){return e=s({},l,e),r.typeCheckConfig(t,e,c),e},m._addEventListeners=function(){var t=this;this._config.keyboard&&e(this._element).on(u.KEYDOWN,function(e){return t._keydown(e)}),"hover"===this._config.pause&&(e(this._element).on(u.MOUSEENTER,function(e){return t.pause(e)}).on(u.MOUSELEAVE,function(e){return t.cycle(e)}),"ontouchstart"in document.documentElement&&e(this._element).on(u.TOUCHEND,function(){t.pause(),t.touchTimeout&&clearTimeout(t.touchTimeout),t.touchTimeout=setTimeout(function(e){return t.cycle(e)},500+t._config.interval)}))},m._keydown=function(e){if(!/input|textarea/i.test(e.target.tagName))switch(e.which){case 37:e.preventDefault(),this.prev();break;case 39:e.preventDefault(),this.next()}},m._getItemIndex=function(t){return this._items=e.makeArray(e(t).parent().find(f.ITEM)),this._items.indexOf(t)},m._getItemByDirection=function(e,t){var n=e===d.NEXT,i=e===d.PREV,a=this._getItemIndex(t),o=this._items.length-1,s=i&&0===a||n&&a===o;if(s&&!this._config.wrap)return t;var r=e===d.PREV?-1:1,l=(a+r)%this._items.length;return-1===l?this._items[this._items.length-1]:this._items[l]},m._triggerSlideEvent=function(t,n){var i=this._getItemIndex(t),a=this._getItemIndex(e(this._element).find(f.ACTIVE_ITEM)[0]),o=e.Event(u.SLIDE,{relatedTarget:t,direction:n,from:a,to:i});return e(this._element).trigger(o),o},m._setActiveIndicatorElement=function(t){if(this._indicatorsElement){e(this._indicatorsElement).find(f.ACTIVE).removeClass(h.ACTIVE);var n=this._indicatorsElement.children[this._getItemIndex(t)];n&&e(n).addClass(h.ACTIVE)}},m._slide=function(t,n){var i,a,o,s=this,l=e(this._element).find(f.ACTIVE_ITEM)[0],c=this._getItemIndex(l),m=n||l&&this._getItemByDirection(t,l),p=this._getItemIndex(m),g=Boolean(this._interval);if(t===d.NEXT?(i=h.LEFT,a=h.NEXT,o=d.LEFT):(i=h.RIGHT,a=h.PREV,o=d.RIGHT),m&&e(m).hasClass(h.ACTIVE))this._isSliding=!1;else{var b=this._triggerSlideEvent(m,o);if(!b.isDefaultPrevented()&&l&&m){this._isSliding=!0,g&&this.pause(),this._setActiveIndicatorElement(m);var v=e.Event(u.SLID,{relatedTarget:m,direction:o,from:c,to:p});if(e(this._element).hasClass(h.SLIDE)){e(m).addClass(a),r.reflow(m),e(l).addClass(i),e(m).addClass(i);var y=r.getTransitionDurationFromElement(l);e(l).one(r.TRANSITION_END,function(){e(m).removeClass(i+" "+a).addClass(h.ACTIVE),e(l).removeClass(h.ACTIVE+" "+a+" "+i),s._isSliding=!1,setTimeout(function(){return e(s._element).trigger(v)},0)}).emulateTransitionEnd(y)}else e(l).removeClass(h.ACTIVE),e(m).addClass(h.ACTIVE),this._isSliding=!1,e(this._element).trigger(v);g&&this.cycle()}}},o._jQueryInterface=function(t){return this.each(function(){var i=e(this).data(n),a=s({},l,e(this).data());"object"==typeof t&&(a=s({},a,t));var r="string"==typeof t?t:a.slide;if(i||(i=new o(this,a),e(this).data(n,i)),"number"==typeof t)i.to(t);else if("string"==typeof r){if(void 0===i[r])throw new TypeError('No method named "'+r+'"');i[r]()}else a.interval&&(i.pause(),i.cycle())})},o._dataApiClickHandler=function(t){var i=r.getSelectorFromElement(this);if(i){var a=e(i)[0];if(a&&e(a).hasClass(h.CAROUSEL)){var l=s({},e(a).data(),e(this).data()),c=this.getAttribute("data-slide-to");c&&(l.interval=!1),o._jQueryInterface.call(e(a),l),c&&e(a).data(n).to(c),t.preventDefault()}}},a(o,null,[{key:"VERSION",get:function(){return"4.1.1"}},{key:"Default",get:function(){return l}}]),o}();return e(document).on(u.CLICK_DATA_API,f.DATA_SLIDE,m._dataApiClickHandler),e(window).on(u.LOAD_DATA_API,function(){e(f.DATA_RIDE).each(function(){var t=e(this);m._jQueryInterface.call(t,t.data())})}),e.fn[t]=m._jQueryInterface,e.fn[t].Constructor=m,e.fn[t].noConflict=function(){return e.fn[t]=o,m._jQueryInterface},m}(t),u=function(e){var t="collapse",n="bs.collapse",i=e.fn[t],o={toggle:!0,parent:""},l={toggle:"boolean",parent:"(string|element)"},c={SHOW:"show.bs.collapse",SHOWN:"shown.bs.collapse",HIDE:"hide.bs.collapse",HIDDEN:"hidden.bs.collapse",CLICK_DATA_API:"click.bs.collapse.data-api"},d={SHOW:"show",COLLAPSE:"collapse",COLLAPSING:"collapsing",COLLAPSED:"collapsed"},u={WIDTH:"width",HEIGHT:"height"},h={ACTIVES:".show, .collapsing",DATA_TOGGLE:'[data-toggle="collapse"]'},f=function(){function i(t,n){this._isTransitioning=!1,this._element=t,this._config=this._getConfig(n),this._triggerArray=e.makeArray(e('[data-toggle="collapse"][href="#'+t.id+'"],[data-toggle="collapse"][data-target="#'+t.id+'"]'));for(var i=e(h.DATA_TOGGLE),a=0;a<i.length;a++){var o=i[a],s=r.getSelectorFromElement(o);null!==s&&e(s).filter(t).length>0&&(this._selector=s,this._triggerArray.push(o))}this._parent=this._config.parent?this._getParent():null,this._config.parent||this._addAriaAndCollapsedClass(this._element,this._triggerArray),this._config.toggle&&this.toggle()}var f=i.prototype;return f.toggle=function(){e(this._element).hasClass(d.SHOW)?this.hide():this.show()},f.show=function(){var t,a,o=this;if(!(this._isTransitioning||e(this._element).hasClass(d.SHOW)||(this._parent&&0===(t=e.makeArray(e(this._parent).find(h.ACTIVES).filter('[data-parent="'+this._config.parent+'"]'))).length&&(t=null),t&&(a=e(t).not(this._selector).data(n))&&a._isTransitioning))){var s=e.Event(c.SHOW);if(e(this._element).trigger(s),!s.isDefaultPrevented()){t&&(i._jQueryInterface.call(e(t).not(this._selector),"hide"),a||e(t).data(n,null));var l=this._getDimension();e(this._element).removeClass(d.COLLAPSE).addClass(d.COLLAPSING),this._element.style[l]=0,this._triggerArray.length>0&&e(this._triggerArray).removeClass(d.COLLAPSED).attr("aria-expanded",!0),this.setTransitioning(!0);var u=l[0].toUpperCase()+l.slice(1),f="scroll"+u,m=r.getTransitionDurationFromElement(this._element);e(this._element).one(r.TRANSITION_END,function(){e(o._element).removeClass(d.COLLAPSING).addClass(d.COLLAPSE).addClass(d.SHOW),o._element.style[l]="",o.setTransitioning(!1),e(o._element).trigger(c.SHOWN)}).emulateTransitionEnd(m),this._element.style[l]=this._element[f]+"px"}}},f.hide=function(){var t=this;if(!this._isTransitioning&&e(this._element).hasClass(d.SHOW)){var n=e.Event(c.HIDE);if(e(this._element).trigger(n),!n.isDefaultPrevented()){var i=this._getDimension();if(this._element.style[i]=this._element.getBoundingClientRect()[i]+"px",r.reflow(this._element),e(this._element).addClass(d.COLLAPSING).removeClass(d.COLLAPSE).removeClass(d.SHOW),this._triggerArray.length>0)for(var a=0;a<this._triggerArray.length;a++){var o=this._triggerArray[a],s=r.getSelectorFromElement(o);if(null!==s){var l=e(s);l.hasClass(d.SHOW)||e(o).addClass(d.COLLAPSED).attr("aria-expanded",!1)}}this.setTransitioning(!0),this._element.style[i]="";var u=r.getTransitionDurationFromElement(this._element);e(this._element).one(r.TRANSITION_END,function(){t.setTransitioning(!1),e(t._element).removeClass(d.COLLAPSING).addClass(d.COLLAPSE).trigger(c.HIDDEN)}).emulateTransitionEnd(u)}}},f.setTransitioning=function(e){this._isTransitioning=e},f.dispose=function(){e.removeData(this._element,n),this._config=null,this._parent=null,this._element=null,this._triggerArray=null,this._isTransitioning=null},f._getConfig=function(e){return(e=s({},o,e)).toggle=Boolean(e.toggle),r.typeCheckConfig(t,e,l),e},f._getDimension=function(){var t=e(this._element).hasClass(u.WIDTH);return t?u.WIDTH:u.HEIGHT},f._getParent=function(){var t=this,n=null;r.isElement(this._config.parent)?(n=this._config.parent,void 0!==this._config.parent.jquery&&(n=this._config.parent[0])):n=e(this._config.parent)[0];var a='[data-toggle="collapse"][data-parent="'+this._config.parent+'"]';return e(n).find(a).each(function(e,n){t._addAriaAndCollapsedClass(i._getTargetFromElement(n),[n])}),n},f._addAriaAndCollapsedClass=function(t,n){if(t){var i=e(t).hasClass(d.SHOW);n.length>0&&e(n).toggleClass(d.COLLAPSED,!i).attr("aria-expanded",i)}},i._getTargetFromElement=function(t){var n=r.getSelectorFromElement(t);return n?e(n)[0]:null},i._jQueryInterface=function(t){return this.each(function(){var a=e(this),r=a.data(n),l=s({},o,a.data(),"object"==typeof t&&t?t:{});if(!r&&l.toggle&&/show|hide/.test(t)&&(l.toggle=!1),r||(r=new i(this,l),a.data(n,r)),"string"==typeof t){if(void 0===r[t])throw new TypeError('No method named "'+t+'"');r[t]()}})},a(i,null,[{key:"VERSION",get:function(){return"4.1.1"}},{key:"Default",get:function(){return o}}]),i}();return e(document).on(c.CLICK_DATA_API,h.DATA_TOGGLE,function(t){"A"===t.currentTarget.tagName&&t.preventDefault();var i=e(this),a=r.getSelectorFromElement(this);e(a).each(function(){var t=e(this),a=t.data(n),o=a?"toggle":i.data();f._jQueryInterface.call(t,o)})}),e.fn[t]=f._jQueryInterface,e.fn[t].Constructor=f,e.fn[t].noConflict=function(){return e.fn[t]=i,f._jQueryInterface},f}(t),h=function(e){var t="dropdown",i="bs.dropdown",o="."+i,l=e.fn[t],c=new RegExp("38|40|27"),d={HIDE:"hide"+o,HIDDEN:"hidden"+o,SHOW:"show"+o,SHOWN:"shown"+o,CLICK:"click"+o,CLICK_DATA_API:"click.bs.dropdown.data-api",KEYDOWN_DATA_API:"keydown.bs.dropdown.data-api",KEYUP_DATA_API:"keyup.bs.dropdown.data-api"},u={DISABLED:"disabled",SHOW:"show",DROPUP:"dropup",DROPRIGHT:"dropright",DROPLEFT:"dropleft",MENURIGHT:"dropdown-menu-right",MENULEFT:"dropdown-menu-left",POSITION_STATIC:"position-static"},h={DATA_TOGGLE:'[data-toggle="dropdown"]',FORM_CHILD:".dropdown form",MENU:".dropdown-menu",NAVBAR_NAV:".navbar-nav",VISIBLE_ITEMS:".dropdown-menu .dropdown-item:not(.disabled):not(:disabled)"},f={TOP:"top-start",TOPEND:"top-end",BOTTOM:"bottom-start",BOTTOMEND:"bottom-end",RIGHT:"right-start",RIGHTEND:"right-end",LEFT:"left-start",LEFTEND:"left-end"},m={offset:0,flip:!0,boundary:"scrollParent",reference:"toggle",display:"dynamic"},p={offset:"(number|string|function)",flip:"boolean",boundary:"(string|element)",reference:"(string|element)",display:"string"},g=function(){function l(e,t){this._element=e,this._popper=null,this._config=this._getConfig(t),this._menu=this._getMenuElement(),this._inNavbar=this._detectNavbar(),this._addEventListeners()}var g=l.prototype;return g.toggle=function(){if(!this._element.disabled&&!e(this._element).hasClass(u.DISABLED)){var t=l._getParentFromElement(this._element),i=e(this._menu).hasClass(u.SHOW);if(l._clearMenus(),!i){var a={relatedTarget:this._element},o=e.Event(d.SHOW,a);if(e(t).trigger(o),!o.isDefaultPrevented()){if(!this._inNavbar){if(void 0===n)throw new TypeError("Bootstrap dropdown require Popper.js (https://popper.js.org)");var s=this._element;"parent"===this._config.reference?s=t:r.isElement(this._config.reference)&&(s=this._config.reference,void 0!==this._config.reference.jquery&&(s=this._config.reference[0])),"scrollParent"!==this._config.boundary&&e(t).addClass(u.POSITION_STATIC),this._popper=new n(s,this._menu,this._getPopperConfig())}"ontouchstart"in document.documentElement&&0===e(t).closest(h.NAVBAR_NAV).length&&e(document.body).children().on("mouseover",null,e.noop),this._element.focus(),this._element.setAttribute("aria-expanded",!0),e(this._menu).toggleClass(u.SHOW),e(t).toggleClass(u.SHOW).trigger(e.Event(d.SHOWN,a))}}}},g.dispose=function(){e.removeData(this._element,i),e(this._element).off(o),this._element=null,this._menu=null,null!==this._popper&&(this._popper.destroy(),this._popper=null)},g.update=function(){this._inNavbar=this._detectNavbar(),null!==this._popper&&this._popper.scheduleUpdate()},g._addEventListeners=function(){var t=this;e(this._element).on(d.CLICK,function(e){e.preventDefault(),e.stopPropagation(),t.toggle()})},g._getConfig=function(n){return n=s({},this.constructor.Default,e(this._element).data(),n),r.typeCheckConfig(t,n,this.constructor.DefaultType),n},g._getMenuElement=function(){if(!this._menu){var t=l._getParentFromElement(this._element);this._menu=e(t).find(h.MENU)[0]}return this._menu},g._getPlacement=function(){var t=e(this._element).parent(),n=f.BOTTOM;return t.hasClass(u.DROPUP)?(n=f.TOP,e(this._menu).hasClass(u.MENURIGHT)&&(n=f.TOPEND)):t.hasClass(u.DROPRIGHT)?n=f.RIGHT:t.hasClass(u.DROPLEFT)?n=f.LEFT:e(this._menu).hasClass(u.MENURIGHT)&&(n=f.BOTTOMEND),n},g._detectNavbar=function(){return e(this._element).closest(".navbar").length>0},g._getPopperConfig=function(){var e=this,t={};"function"==typeof this._config.offset?t.fn=function(t){return t.offsets=s({},t.offsets,e._config.offset(t.offsets)||{}),t}:t.offset=this._config.offset;var n={placement:this._getPlacement(),modifiers:{offset:t,flip:{enabled:this._config.flip},preventOverflow:{boundariesElement:this._config.boundary}}};return"static"===this._config.display&&(n.modifiers.applyStyle={enabled:!1}),n},l._jQueryInterface=function(t){return this.each(function(){var n=e(this).data(i),a="object"==typeof t?t:null;if(n||(n=new l(this,a),e(this).data(i,n)),"string"==typeof t){if(void 0===n[t])throw new TypeError('No method named "'+t+'"');n[t]()}})},l._clearMenus=function(t){if(!t||3!==t.which&&("keyup"!==t.type||9===t.which))for(var n=e.makeArray(e(h.DATA_TOGGLE)),a=0;a<n.length;a++){var o=l._getParentFromElement(n[a]),s=e(n[a]).data(i),r={relatedTarget:n[a]};if(s){var c=s._menu;if(e(o).hasClass(u.SHOW)&&!(t&&("click"===t.type&&/input|textarea/i.test(t.target.tagName)||"keyup"===t.type&&9===t.which)&&e.contains(o,t.target))){var f=e.Event(d.HIDE,r);e(o).trigger(f),f.isDefaultPrevented()||("ontouchstart"in document.documentElement&&e(document.body).children().off("mouseover",null,e.noop),n[a].setAttribute("aria-expanded","false"),e(c).removeClass(u.SHOW),e(o).removeClass(u.SHOW).trigger(e.Event(d.HIDDEN,r)))}}}},l._getParentFromElement=function(t){var n,i=r.getSelectorFromElement(t);return i&&(n=e(i)[0]),n||t.parentNode},l._dataApiKeydownHandler=function(t){if((/input|textarea/i.test(t.target.tagName)?!(32===t.which||27!==t.which&&(40!==t.which&&38!==t.which||e(t.target).closest(h.MENU).length)):c.test(t.which))&&(t.preventDefault(),t.stopPropagation(),!this.disabled&&!e(this).hasClass(u.DISABLED))){var n=l._getParentFromElement(this),i=e(n).hasClass(u.SHOW);if((i||27===t.which&&32===t.which)&&(!i||27!==t.which&&32!==t.which)){var a=e(n).find(h.VISIBLE_ITEMS).get();if(0!==a.length){var o=a.indexOf(t.target);38===t.which&&o>0&&o--,40===t.which&&o<a.length-1&&o++,o<0&&(o=0),a[o].focus()}}else{if(27===t.which){var s=e(n).find(h.DATA_TOGGLE)[0];e(s).trigger("focus")}e(this).trigger("click")}}},a(l,null,[{key:"VERSION",get:function(){return"4.1.1"}},{key:"Default",get:function(){return m}},{key:"DefaultType",get:function(){return p}}]),l}();return e(document).on(d.KEYDOWN_DATA_API,h.DATA_TOGGLE,g._dataApiKeydownHandler).on(d.KEYDOWN_DATA_API,h.MENU,g._dataApiKeydownHandler).on(d.CLICK_DATA_API+" "+d.KEYUP_DATA_API,g._clearMenus).on(d.CLICK_DATA_API,h.DATA_TOGGLE,function(t){t.preventDefault(),t.stopPropagation(),g._jQueryInterface.call(e(this),"toggle")}).on(d.CLICK_DATA_API,h.FORM_CHILD,function(e){e.stopPropagation()}),e.fn[t]=g._jQueryInterface,e.fn[t].Constructor=g,e.fn[t].noConflict=function(){return e.fn[t]=l,g._jQueryInterface},g}(t),f=function(e){var t="modal",n=".bs.modal",i=e.fn.modal,o={backdrop:!0,keyboard:!0,focus:!0,show:!0},l={backdrop:"(boolean|string)",keyboard:"boolean",focus:"boolean",show:"boolean"},c={HIDE:"hide.bs.modal",HIDDEN:"hidden.bs.modal",SHOW:"show.bs.modal",SHOWN:"shown.bs.modal",FOCUSIN:"focusin.bs.modal",RESIZE:"resize.bs.modal",CLICK_DISMISS:"click.dismiss.bs.modal",KEYDOWN_DISMISS:"keydown.dismiss.bs.modal",MOUSEUP_DISMISS:"mouseup.dismiss.bs.modal",MOUSEDOWN_DISMISS:"mousedown.dismiss.bs.modal",CLICK_DATA_API:"click.bs.modal.data-api"},d={SCROLLBAR_MEASURER:"modal-scrollbar-measure",BACKDROP:"modal-backdrop",OPEN:"modal-open",FADE:"fade",SHOW:"show"},u={DIALOG:".modal-dialog",DATA_TOGGLE:'[data-toggle="modal"]',DATA_DISMISS:'[data-dismiss="modal"]',FIXED_CONTENT:".fixed-top, .fixed-bottom, .is-fixed, .sticky-top",STICKY_CONTENT:".sticky-top",NAVBAR_TOGGLER:".navbar-toggler"},h=function(){function i(t,n){this._config=this._getConfig(n),this._element=t,this._dialog=e(t).find(u.DIALOG)[0],this._backdrop=null,this._isShown=!1,this._isBodyOverflowing=!1,this._ignoreBackdropClick=!1,this._scrollbarWidth=0}var h=i.prototype;return h.toggle=function(e){return this._isShown?this.hide():this.show(e)},h.show=function(t){var n=this;if(!this._isTransitioning&&!this._isShown){e(this._element).hasClass(d.FADE)&&(this._isTransitioning=!0);var i=e.Event(c.SHOW,{relatedTarget:t});e(this._element).trigger(i),this._isShown||i.isDefaultPrevented()||(this._isShown=!0,this._checkScrollbar(),this._setScrollbar(),this._adjustDialog(),e(document.body).addClass(d.OPEN),this._setEscapeEvent(),this._setResizeEvent(),e(this._element).on(c.CLICK_DISMISS,u.DATA_DISMISS,function(e){return n.hide(e)}),e(this._dialog).on(c.MOUSEDOWN_DISMISS,function(){e(n._element).one(c.MOUSEUP_DISMISS,function(t){e(t.target).is(n._element)&&(n._ignoreBackdropClick=!0)})}),this._showBackdrop(function(){return n._showElement(t)}))}},h.hide=function(t){var n=this;if(t&&t.preventDefault(),!this._isTransitioning&&this._isShown){var i=e.Event(c.HIDE);if(e(this._element).trigger(i),this._isShown&&!i.isDefaultPrevented()){this._isShown=!1;var a=e(this._element).hasClass(d.FADE);if(a&&(this._isTransitioning=!0),this._setEscapeEvent(),this._setResizeEvent(),e(document).off(c.FOCUSIN),e(this._element).removeClass(d.SHOW),e(this._element).off(c.CLICK_DISMISS),e(this._dialog).off(c.MOUSEDOWN_DISMISS),a){var o=r.getTransitionDurationFromElement(this._element);e(this._element).one(r.TRANSITION_END,function(e){return n._hideModal(e)}).emulateTransitionEnd(o)}else this._hideModal()}}},h.dispose=function(){e.removeData(this._element,"bs.modal"),e(window,document,this._element,this._backdrop).off(n),this._config=null,this._element=null,this._dialog=null,this._backdrop=null,this._isShown=null,this._isBodyOverflowing=null,this._ignoreBackdropClick=null,this._scrollbarWidth=null},h.handleUpdate=function(){this._adjustDialog()},h._getConfig=function(e){return e=s({},o,e),r.typeCheckConfig(t,e,l),e},h._showElement=function(t){var n=this,i=e(this._element).hasClass(d.FADE);this._element.parentNode&&this._element.parentNode.nodeType===Node.ELEMENT_NODE||document.body.appendChild(this._element),this._element.style.display="block",this._element.removeAttribute("aria-hidden"),this._element.scrollTop=0,i&&r.reflow(this._element),e(this._element).addClass(d.SHOW),this._config.focus&&this._enforceFocus();var a=e.Event(c.SHOWN,{relatedTarget:t}),o=function(){n._config.focus&&n._element.focus(),n._isTransitioning=!1,e(n._element).trigger(a)};if(i){var s=r.getTransitionDurationFromElement(this._element);e(this._dialog).one(r.TRANSITION_END,o).emulateTransitionEnd(s)}else o()},h._enforceFocus=function(){var t=this;e(document).off(c.FOCUSIN).on(c.FOCUSIN,function(n){document!==n.target&&t._element!==n.target&&0===e(t._element).has(n.target).length&&t._element.focus()})},h._setEscapeEvent=function(){var t=this;this._isShown&&this._config.keyboard?e(this._element).on(c.KEYDOWN_DISMISS,function(e){27===e.which&&(e.preventDefault(),t.hide())}):this._isShown||e(this._element).off(c.KEYDOWN_DISMISS)},h._setResizeEvent=function(){var t=this;this._isShown?e(window).on(c.RESIZE,function(e){return t.handleUpdate(e)}):e(window).off(c.RESIZE)},h._hideModal=function(){var t=this;this._element.style.display="none",this._element.setAttribute("aria-hidden",!0),this._isTransitioning=!1,this._showBackdrop(function(){e(document.body).removeClass(d.OPEN),t._resetAdjustments(),t._resetScrollbar(),e(t._element).trigger(c.HIDDEN)})},h._removeBackdrop=function(){this._backdrop&&(e(this._backdrop).remove(),this._backdrop=null)},h._showBackdrop=function(t){var n=this,i=e(this._element).hasClass(d.FADE)?d.FADE:"";if(this._isShown&&this._config.backdrop){if(this._backdrop=document.createElement("div"),this._backdrop.className=d.BACKDROP,i&&e(this._backdrop).addClass(i),e(this._backdrop).appendTo(document.body),e(this._element).on(c.CLICK_DISMISS,function(e){n._ignoreBackdropClick?n._ignoreBackdropClick=!1:e.target===e.currentTarget&&("static"===n._config.backdrop?n._element.focus():n.hide())}),i&&r.reflow(this._backdrop),e(this._backdrop).addClass(d.SHOW),!t)return;if(!i)return void t();var a=r.getTransitionDurationFromElement(this._backdrop);e(this._backdrop).one(r.TRANSITION_END,t).emulateTransitionEnd(a)}else if(!this._isShown&&this._backdrop){e(this._backdrop).removeClass(d.SHOW);var o=function(){n._removeBackdrop(),t&&t()};if(e(this._element).hasClass(d.FADE)){var s=r.getTransitionDurationFromElement(this._backdrop);e(this._backdrop).one(r.TRANSITION_END,o).emulateTransitionEnd(s)}else o()}else t&&t()},h._adjustDialog=function(){var e=this._element.scrollHeight>document.documentElement.clientHeight;!this._isBodyOverflowing&&e&&(this._element.style.paddingLeft=this._scrollbarWidth+"px"),this._isBodyOverflowing&&!e&&(this._element.style.paddingRight=this._scrollbarWidth+"px")},h._resetAdjustments=function(){this._element.style.paddingLeft="",this._element.style.paddingRight=""},h._checkScrollbar=function(){var e=document.body.getBoundingClientRect();this._isBodyOverflowing=e.left+e.right<window.innerWidth,this._scrollbarWidth=this._getScrollbarWidth()},h._setScrollbar=function(){var t=this;if(this._isBodyOverflowing){e(u.FIXED_CONTENT).each(function(n,i){var a=e(i)[0].style.paddingRight,o=e(i).css("padding-right");e(i).data("padding-right",a).css("padding-right",parseFloat(o)+t._scrollbarWidth+"px")}),e(u.STICKY_CONTENT).each(function(n,i){var a=e(i)[0].style.marginRight,o=e(i).css("margin-right");e(i).data("margin-right",a).css("margin-right",parseFloat(o)-t._scrollbarWidth+"px")}),e(u.NAVBAR_TOGGLER).each(function(n,i){var a=e(i)[0].style.marginRight,o=e(i).css("margin-right");e(i).data("margin-right",a).css("margin-right",parseFloat(o)+t._scrollbarWidth+"px")});var n=document.body.style.paddingRight,i=e(document.body).css("padding-right");e(document.body).data("padding-right",n).css("padding-right",parseFloat(i)+this._scrollbarWidth+"px")}},h._resetScrollbar=function(){e(u.FIXED_CONTENT).each(function(t,n){var i=e(n).data("padding-right");void 0!==i&&e(n).css("padding-right",i).removeData("padding-right")}),e(u.STICKY_CONTENT+", "+u.NAVBAR_TOGGLER).each(function(t,n){var i=e(n).data("margin-right");void 0!==i&&e(n).css("margin-right",i).removeData("margin-right")});var t=e(document.body).data("padding-right");void 0!==t&&e(document.body).css("padding-right",t).removeData("padding-right")},h._getScrollbarWidth=function(){var e=document.createElement("div");e.className=d.SCROLLBAR_MEASURER,document.body.appendChild(e);var t=e.getBoundingClientRect().width-e.clientWidth;return document.body.removeChild(e),t},i._jQueryInterface=function(t,n){return this.each(function(){var a=e(this).data("bs.modal"),r=s({},o,e(this).data(),"object"==typeof t&&t?t:{});if(a||(a=new i(this,r),e(this).data("bs.modal",a)),"string"==typeof t){if(void 0===a[t])throw new TypeError('No method named "'+t+'"');a[t](n)}else r.show&&a.show(n)})},a(i,null,[{key:"VERSION",get:function(){return"4.1.1"}},{key:"Default",get:function(){return o}}]),i}();return e(document).on(c.CLICK_DATA_API,u.DATA_TOGGLE,function(t){var n,i=this,a=r.getSelectorFromElement(this);a&&(n=e(a)[0]);var o=e(n).data("bs.modal")?"toggle":s({},e(n).data(),e(this).data());"A"!==this.tagName&&"AREA"!==this.tagName||t.preventDefault();var l=e(n).one(c.SHOW,function(t){t.isDefaultPrevented()||l.one(c.HIDDEN,function(){e(i).is(":visible")&&i.focus()})});h._jQueryInterface.call(e(n),o,this)}),e.fn.modal=h._jQueryInterface,e.fn.modal.Constructor=h,e.fn.modal.noConflict=function(){return e.fn.modal=i,h._jQueryInterface},h}(t),m=function(e){var t="tooltip",i=".bs.tooltip",o=e.fn[t],l=new RegExp("(^|\\s)bs-tooltip\\S+","g"),c={animation:"boolean",template:"string",title:"(string|element|function)",trigger:"string",delay:"(number|object)",html:"boolean",selector:"(string|boolean)",placement:"(string|function)",offset:"(number|string)",container:"(string|element|boolean)",fallbackPlacement:"(string|array)",boundary:"(string|element)"},d={AUTO:"auto",TOP:"top",RIGHT:"right",BOTTOM:"bottom",LEFT:"left"},u={animation:!0,template:'<div class="tooltip" role="tooltip"><div class="arrow"></div><div class="tooltip-inner"></div></div>',trigger:"hover focus",title:"",delay:0,html:!1,selector:!1,placement:"top",offset:0,container:!1,fallbackPlacement:"flip",boundary:"scrollParent"},h={SHOW:"show",OUT:"out"},f={HIDE:"hide"+i,HIDDEN:"hidden"+i,SHOW:"show"+i,SHOWN:"shown"+i,INSERTED:"inserted"+i,CLICK:"click"+i,FOCUSIN:"focusin"+i,FOCUSOUT:"focusout"+i,MOUSEENTER:"mouseenter"+i,MOUSELEAVE:"mouseleave"+i},m={FADE:"fade",SHOW:"show"},p={TOOLTIP:".tooltip",TOOLTIP_INNER:".tooltip-inner",ARROW:".arrow"},g={HOVER:"hover",FOCUS:"focus",CLICK:"click",MANUAL:"manual"},b=function(){function o(e,t){if(void 0===n)throw new TypeError("Bootstrap tooltips require Popper.js (https://popper.js.org)");this._isEnabled=!0,this._timeout=0,this._hoverState="",this._activeTrigger={},this._popper=null,this.element=e,this.config=this._getConfig(t),this.tip=null,this._setListeners()}var b=o.prototype;return b.enable=function(){this._isEnabled=!0},b.disable=function(){this._isEnabled=!1},b.toggleEnabled=function(){this._isEnabled=!this._isEnabled},b.toggle=function(t){if(this._isEnabled)if(t){var n=this.constructor.DATA_KEY,i=e(t.currentTarget).data(n);i||(i=new this.constructor(t.currentTarget,this._getDelegateConfig()),e(t.currentTarget).data(n,i)),i._activeTrigger.click=!i._activeTrigger.click,i._isWithActiveTrigger()?i._enter(null,i):i._leave(null,i)}else{if(e(this.getTipElement()).hasClass(m.SHOW))return void this._leave(null,this);this._enter(null,this)}},b.dispose=function(){clearTimeout(this._timeout),e.removeData(this.element,this.constructor.DATA_KEY),e(this.element).off(this.constructor.EVENT_KEY),e(this.element).closest(".modal").off("hide.bs.modal"),this.tip&&e(this.tip).remove(),this._isEnabled=null,this._timeout=null,this._hoverState=null,this._activeTrigger=null,null!==this._popper&&this._popper.destroy(),this._popper=null,this.element=null,this.config=null,this.tip=null},b.show=function(){var t=this;if("none"===e(this.element).css("display"))throw new Error("Please use show on visible elements");var i=e.Event(this.constructor.Event.SHOW);if(this.isWithContent()&&this._isEnabled){e(this.element).trigger(i);var a=e.contains(this.element.ownerDocument.documentElement,this.element);if(i.isDefaultPrevented()||!a)return;var o=this.getTipElement(),s=r.getUID(this.constructor.NAME);o.setAttribute("id",s),this.element.setAttribute("aria-describedby",s),this.setContent(),this.config.animation&&e(o).addClass(m.FADE);var l="function"==typeof this.config.placement?this.config.placement.call(this,o,this.element):this.config.placement,c=this._getAttachment(l);this.addAttachmentClass(c);var d=!1===this.config.container?document.body:e(this.config.container);e(o).data(this.constructor.DATA_KEY,this),e.contains(this.element.ownerDocument.documentElement,this.tip)||e(o).appendTo(d),e(this.element).trigger(this.constructor.Event.INSERTED),this._popper=new n(this.element,o,{placement:c,modifiers:{offset:{offset:this.config.offset},flip:{behavior:this.config.fallbackPlacement},arrow:{element:p.ARROW},preventOverflow:{boundariesElement:this.config.boundary}},onCreate:function(e){e.originalPlacement!==e.placement&&t._handlePopperPlacementChange(e)},onUpdate:function(e){t._handlePopperPlacementChange(e)}}),e(o).addClass(m.SHOW),"ontouchstart"in document.documentElement&&e(document.body).children().on("mouseover",null,e.noop);var u=function(){t.config.animation&&t._fixTransition();var n=t._hoverState;t._hoverState=null,e(t.element).trigger(t.constructor.Event.SHOWN),n===h.OUT&&t._leave(null,t)};if(e(this.tip).hasClass(m.FADE)){var f=r.getTransitionDurationFromElement(this.tip);e(this.tip).one(r.TRANSITION_END,u).emulateTransitionEnd(f)}else u()}},b.hide=function(t){var n=this,i=this.getTipElement(),a=e.Event(this.constructor.Event.HIDE),o=function(){n._hoverState!==h.SHOW&&i.parentNode&&i.parentNode.removeChild(i),n._cleanTipClass(),n.element.removeAttribute("aria-describedby"),e(n.element).trigger(n.constructor.Event.HIDDEN),null!==n._popper&&n._popper.destroy(),t&&t()};if(e(this.element).trigger(a),!a.isDefaultPrevented()){if(e(i).removeClass(m.SHOW),"ontouchstart"in document.documentElement&&e(document.body).children().off("mouseover",null,e.noop),this._activeTrigger[g.CLICK]=!1,this._activeTrigger[g.FOCUS]=!1,this._activeTrigger[g.HOVER]=!1,e(this.tip).hasClass(m.FADE)){var s=r.getTransitionDurationFromElement(i);e(i).one(r.TRANSITION_END,o).emulateTransitionEnd(s)}else o();this._hoverState=""}},b.update=function(){null!==this._popper&&this._popper.scheduleUpdate()},b.isWithContent=function(){return Boolean(this.getTitle())},b.addAttachmentClass=function(t){e(this.getTipElement()).addClass("bs-tooltip-"+t)},b.getTipElement=function(){return this.tip=this.tip||e(this.config.template)[0],this.tip},b.setContent=function(){var t=e(this.getTipElement());this.setElementContent(t.find(p.TOOLTIP_INNER),this.getTitle()),t.removeClass(m.FADE+" "+m.SHOW)},b.setElementContent=function(t,n){var i=this.config.html;"object"==typeof n&&(n.nodeType||n.jquery)?i?e(n).parent().is(t)||t.empty().append(n):t.text(e(n).text()):t[i?"html":"text"](n)},b.getTitle=function(){var e=this.element.getAttribute("data-original-title");return e||(e="function"==typeof this.config.title?this.config.title.call(this.element):this.config.title),e},b._getAttachment=function(e){return d[e.toUpperCase()]},b._setListeners=function(){var t=this,n=this.config.trigger.split(" ");n.forEach(function(n){if("click"===n)e(t.element).on(t.constructor.Event.CLICK,t.config.selector,function(e){return t.toggle(e)});else if(n!==g.MANUAL){var i=n===g.HOVER?t.constructor.Event.MOUSEENTER:t.constructor.Event.FOCUSIN,a=n===g.HOVER?t.constructor.Event.MOUSELEAVE:t.constructor.Event.FOCUSOUT;e(t.element).on(i,t.config.selector,function(e){return t._enter(e)}).on(a,t.config.selector,function(e){return t._leave(e)})}e(t.element).closest(".modal").on("hide.bs.modal",function(){return t.hide()})}),this.config.selector?this.config=s({},this.config,{trigger:"manual",selector:""}):this._fixTitle()},b._fixTitle=function(){var e=typeof this.element.getAttribute("data-original-title");(this.element.getAttribute("title")||"string"!==e)&&(this.element.setAttribute("data-original-title",this.element.getAttribute("title")||""),this.element.setAttribute("title",""))},b._enter=function(t,n){var i=this.constructor.DATA_KEY;(n=n||e(t.currentTarget).data(i))||(n=new this.constructor(t.currentTarget,this._getDelegateConfig()),e(t.currentTarget).data(i,n)),t&&(n._activeTrigger["focusin"===t.type?g.FOCUS:g.HOVER]=!0),e(n.getTipElement()).hasClass(m.SHOW)||n._hoverState===h.SHOW?n._hoverState=h.SHOW:(clearTimeout(n._timeout),n._hoverState=h.SHOW,n.config.delay&&n.config.delay.show?n._timeout=setTimeout(function(){n._hoverState===h.SHOW&&n.show()},n.config.delay.show):n.show())},b._leave=function(t,n){var i=this.constructor.DATA_KEY;(n=n||e(t.currentTarget).data(i))||(n=new this.constructor(t.currentTarget,this._getDelegateConfig()),e(t.currentTarget).data(i,n)),t&&(n._activeTrigger["focusout"===t.type?g.FOCUS:g.HOVER]=!1),n._isWithActiveTrigger()||(clearTimeout(n._timeout),n._hoverState=h.OUT,n.config.delay&&n.config.delay.hide?n._timeout=setTimeout(function(){n._hoverState===h.OUT&&n.hide()},n.config.delay.hide):n.hide())},b._isWithActiveTrigger=function(){for(var e in this._activeTrigger)if(this._activeTrigger[e])return!0;return!1},b._getConfig=function(n){return"number"==typeof(n=s({},this.constructor.Default,e(this.element).data(),"object"==typeof n&&n?n:{})).delay&&(n.delay={show:n.delay,hide:n.delay}),"number"==typeof n.title&&(n.title=n.title.toString()),"number"==typeof n.content&&(n.content=n.content.toString()),r.typeCheckConfig(t,n,this.constructor.DefaultType),n},b._getDelegateConfig=function(){var e={};if(this.config)for(var t in this.config)this.constructor.Default[t]!==this.config[t]&&(e[t]=this.config[t]);return e},b._cleanTipClass=function(){var t=e(this.getTipElement()),n=t.attr("class").match(l);null!==n&&n.length>0&&t.removeClass(n.join(""))},b._handlePopperPlacementChange=function(e){this._cleanTipClass(),this.addAttachmentClass(this._getAttachment(e.placement))},b._fixTransition=function(){var t=this.getTipElement(),n=this.config.animation;null===t.getAttribute("x-placement")&&(e(t).removeClass(m.FADE),this.config.animation=!1,this.hide(),this.show(),this.config.animation=n)},o._jQueryInterface=function(t){return this.each(function(){var n=e(this).data("bs.tooltip"),i="object"==typeof t&&t;if((n||!/dispose|hide/.test(t))&&(n||(n=new o(this,i),e(this).data("bs.tooltip",n)),"string"==typeof t)){if(void 0===n[t])throw new TypeError('No method named "'+t+'"');n[t]()}})},a(o,null,[{key:"VERSION",get:function(){return"4.1.1"}},{key:"Default",get:function(){return u}},{key:"NAME",get:function(){return t}},{key:"DATA_KEY",get:function(){return"bs.tooltip"}},{key:"Event",get:function(){return f}},{key:"EVENT_KEY",get:function(){return i}},{key:"DefaultType",get:function(){return c}}]),o}();return e.fn[t]=b._jQueryInterface,e.fn[t].Constructor=b,e.fn[t].noConflict=function(){return e.fn[t]=o,b._jQueryInterface},b}(t),p=function(e){var t="popover",n=".bs.popover",i=e.fn[t],o=new RegExp("(^|\\s)bs-popover\\S+","g"),r=s({},m.Default,{placement:"right",trigger:"click",content:"",template:'<div class="popover" role="tooltip"><div class="arrow"></div><h3 class="popover-header"></h3><div class="popover-body"></div></div>'}),l=s({},m.DefaultType,{content:"(string|element|function)"}),c={FADE:"fade",SHOW:"show"},d={TITLE:".popover-header",CONTENT:".popover-body"},u={HIDE:"hide"+n,HIDDEN:"hidden"+n,SHOW:"show"+n,SHOWN:"shown"+n,INSERTED:"inserted"+n,CLICK:"click"+n,FOCUSIN:"focusin"+n,FOCUSOUT:"focusout"+n,MOUSEENTER:"mouseenter"+n,MOUSELEAVE:"mouseleave"+n},h=function(i){function s(){return i.apply(this,arguments)||this}!function(e,t){e.prototype=Object.create(t.prototype),e.prototype.constructor=e,e.__proto__=t}(s,i);var h=s.prototype;return h.isWithContent=function(){return this.getTitle()||this._getContent()},h.addAttachmentClass=function(t){e(this.getTipElement()).addClass("bs-popover-"+t)},h.getTipElement=function(){return this.tip=this.tip||e(this.config.template)[0],this.tip},h.setContent=function(){var t=e(this.getTipElement());this.setElementContent(t.find(d.TITLE),this.getTitle());var n=this._getContent();"function"==typeof n&&(n=n.call(this.element)),this.setElementContent(t.find(d.CONTENT),n),t.removeClass(c.FADE+" "+c.SHOW)},h._getContent=function(){return this.element.getAttribute("data-content")||this.config.content},h._cleanTipClass=function(){var t=e(this.getTipElement()),n=t.attr("class").match(o);null!==n&&n.length>0&&t.removeClass(n.join(""))},s._jQueryInterface=function(t){return this.each(function(){var n=e(this).data("bs.popover"),i="object"==typeof t?t:null;if((n||!/destroy|hide/.test(t))&&(n||(n=new s(this,i),e(this).data("bs.popover",n)),"string"==typeof t)){if(void 0===n[t])throw new TypeError('No method named "'+t+'"');n[t]()}})},a(s,null,[{key:"VERSION",get:function(){return"4.1.1"}},{key:"Default",get:function(){return r}},{key:"NAME",get:function(){return t}},{key:"DATA_KEY",get:function(){return"bs.popover"}},{key:"Event",get:function(){return u}},{key:"EVENT_KEY",get:function(){return n}},{key:"DefaultType",get:function(){return l}}]),s}(m);return e.fn[t]=h._jQueryInterface,e.fn[t].Constructor=h,e.fn[t].noConflict=function(){return e.fn[t]=i,h._jQueryInterface},h}(t),g=function(e){var t="scrollspy",n=e.fn[t],i={offset:10,method:"auto",target:""},o={offset:"number",method:"string",target:"(string|element)"},l={ACTIVATE:"activate.bs.scrollspy",SCROLL:"scroll.bs.scrollspy",LOAD_DATA_API:"load.bs.scrollspy.data-api"},c={DROPDOWN_ITEM:"dropdown-item",DROPDOWN_MENU:"dropdown-menu",ACTIVE:"active"},d={DATA_SPY:'[data-spy="scroll"]',ACTIVE:".active",NAV_LIST_GROUP:".nav, .list-group",NAV_LINKS:".nav-link",NAV_ITEMS:".nav-item",LIST_ITEMS:".list-group-item",DROPDOWN:".dropdown",DROPDOWN_ITEMS:".dropdown-item",DROPDOWN_TOGGLE:".dropdown-toggle"},u={OFFSET:"offset",POSITION:"position"},h=function(){function n(t,n){var i=this;this._element=t,this._scrollElement="BODY"===t.tagName?window:t,this._config=this._getConfig(n),this._selector=this._config.target+" "+d.NAV_LINKS+","+this._config.target+" "+d.LIST_ITEMS+","+this._config.target+" "+d.DROPDOWN_ITEMS,this._offsets=[],this._targets=[],this._activeTarget=null,this._scrollHeight=0,e(this._scrollElement).on(l.SCROLL,function(e){return i._process(e)}),this.refresh(),this._process()}var h=n.prototype;return h.refresh=function(){var t=this,n=this._scrollElement===this._scrollElement.window?u.OFFSET:u.POSITION,i="auto"===this._config.method?n:this._config.method,a=i===u.POSITION?this._getScrollTop():0;this._offsets=[],this._targets=[],this._scrollHeight=this._getScrollHeight();var o=e.makeArray(e(this._selector));o.map(function(t){var n,o=r.getSelectorFromElement(t);if(o&&(n=e(o)[0]),n){var s=n.getBoundingClientRect();if(s.width||s.height)return[e(n)[i]().top+a,o]}return null}).filter(function(e){return e}).sort(function(e,t){return e[0]-t[0]}).forEach(function(e){t._offsets.push(e[0]),t._targets.push(e[1])})},h.dispose=function(){e.removeData(this._element,"bs.scrollspy"),e(this._scrollElement).off(".bs.scrollspy"),this._element=null,this._scrollElement=null,this._config=null,this._selector=null,this._offsets=null,this._targets=null,this._activeTarget=null,this._scrollHeight=null},h._getConfig=function(n){if("string"!=typeof(n=s({},i,"object"==typeof n&&n?n:{})).target){var a=e(n.target).attr("id");a||(a=r.getUID(t),e(n.target).attr("id",a)),n.target="#"+a}return r.typeCheckConfig(t,n,o),n},h._getScrollTop=function(){return this._scrollElement===window?this._scrollElement.pageYOffset:this._scrollElement.scrollTop},h._getScrollHeight=function(){return this._scrollElement.scrollHeight||Math.max(document.body.scrollHeight,document.documentElement.scrollHeight)},h._getOffsetHeight=function(){return this._scrollElement===window?window.innerHeight:this._scrollElement.getBoundingClientRect().height},h._process=function(){var e=this._getScrollTop()+this._config.offset,t=this._getScrollHeight(),n=this._config.offset+t-this._getOffsetHeight();if(this._scrollHeight!==t&&this.refresh(),e>=n){var i=this._targets[this._targets.length-1];this._activeTarget!==i&&this._activate(i)}else{if(this._activeTarget&&e<this._offsets[0]&&this._offsets[0]>0)return this._activeTarget=null,void this._clear();for(var a=this._offsets.length;a--;){var o=this._activeTarget!==this._targets[a]&&e>=this._offsets[a]&&(void 0===this._offsets[a+1]||e<this._offsets[a+1]);o&&this._activate(this._targets[a])}}},h._activate=function(t){this._activeTarget=t,this._clear();var n=this._selector.split(",");n=n.map(function(e){return e+'[data-target="'+t+'"],'+e+'[href="'+t+'"]'});var i=e(n.join(","));i.hasClass(c.DROPDOWN_ITEM)?(i.closest(d.DROPDOWN).find(d.DROPDOWN_TOGGLE).addClass(c.ACTIVE),i.addClass(c.ACTIVE)):(i.addClass(c.ACTIVE),i.parents(d.NAV_LIST_GROUP).prev(d.NAV_LINKS+", "+d.LIST_ITEMS).addClass(c.ACTIVE),i.parents(d.NAV_LIST_GROUP).prev(d.NAV_ITEMS).children(d.NAV_LINKS).addClass(c.ACTIVE)),e(this._scrollElement).trigger(l.ACTIVATE,{relatedTarget:t})},h._clear=function(){e(this._selector).filter(d.ACTIVE).removeClass(c.ACTIVE)},n._jQueryInterface=function(t){return this.each(function(){var i=e(this).data("bs.scrollspy"),a="object"==typeof t&&t;if(i||(i=new n(this,a),e(this).data("bs.scrollspy",i)),"string"==typeof t){if(void 0===i[t])throw new TypeError('No method named "'+t+'"');i[t]()}})},a(n,null,[{key:"VERSION",get:function(){return"4.1.1"}},{key:"Default",get:function(){return i}}]),n}();return e(window).on(l.LOAD_DATA_API,function(){for(var t=e.makeArray(e(d.DATA_SPY)),n=t.length;n--;){var i=e(t[n]);h._jQueryInterface.call(i,i.data())}}),e.fn[t]=h._jQueryInterface,e.fn[t].Constructor=h,e.fn[t].noConflict=function(){return e.fn[t]=n,h._jQueryInterface},h}(t),b=function(e){var t=e.fn.tab,n={HIDE:"hide.bs.tab",HIDDEN:"hidden.bs.tab",SHOW:"show.bs.tab",SHOWN:"shown.bs.tab",CLICK_DATA_API:"click.bs.tab.data-api"},i={DROPDOWN_MENU:"dropdown-menu",ACTIVE:"active",DISABLED:"disabled",FADE:"fade",SHOW:"show"},o={DROPDOWN:".dropdown",NAV_LIST_GROUP:".nav, .list-group",ACTIVE:".active",ACTIVE_UL:"> li > .active",DATA_TOGGLE:'[data-toggle="tab"], [data-toggle="pill"], [data-toggle="list"]',DROPDOWN_TOGGLE:".dropdown-toggle",DROPDOWN_ACTIVE_CHILD:"> .dropdown-menu .active"},s=function(){function t(e){this._element=e}var s=t.prototype;return s.show=function(){var t=this;if(!(this._element.parentNode&&this._element.parentNode.nodeType===Node.ELEMENT_NODE&&e(this._element).hasClass(i.ACTIVE)||e(this._element).hasClass(i.DISABLED))){var a,s,l=e(this._element).closest(o.NAV_LIST_GROUP)[0],c=r.getSelectorFromElement(this._element);if(l){var d="UL"===l.nodeName?o.ACTIVE_UL:o.ACTIVE;s=(s=e.makeArray(e(l).find(d)))[s.length-1]}var u=e.Event(n.HIDE,{relatedTarget:this._element}),h=e.Event(n.SHOW,{relatedTarget:s});if(s&&e(s).trigger(u),e(this._element).trigger(h),!h.isDefaultPrevented()&&!u.isDefaultPrevented()){c&&(a=e(c)[0]),this._activate(this._element,l);var f=function(){var i=e.Event(n.HIDDEN,{relatedTarget:t._element}),a=e.Event(n.SHOWN,{relatedTarget:s});e(s).trigger(i),e(t._element).trigger(a)};a?this._activate(a,a.parentNode,f):f()}}},s.dispose=function(){e.removeData(this._element,"bs.tab"),this._element=null},s._activate=function(t,n,a){var s=this,l=("UL"===n.nodeName?e(n).find(o.ACTIVE_UL):e(n).children(o.ACTIVE))[0],c=a&&l&&e(l).hasClass(i.FADE),d=function(){return s._transitionComplete(t,l,a)};if(l&&c){var u=r.getTransitionDurationFromElement(l);e(l).one(r.TRANSITION_END,d).emulateTransitionEnd(u)}else d()},s._transitionComplete=function(t,n,a){if(n){e(n).removeClass(i.SHOW+" "+i.ACTIVE);var s=e(n.parentNode).find(o.DROPDOWN_ACTIVE_CHILD)[0];s&&e(s).removeClass(i.ACTIVE),"tab"===n.getAttribute("role")&&n.setAttribute("aria-selected",!1)}if(e(t).addClass(i.ACTIVE),"tab"===t.getAttribute("role")&&t.setAttribute("aria-selected",!0),r.reflow(t),e(t).addClass(i.SHOW),t.parentNode&&e(t.parentNode).hasClass(i.DROPDOWN_MENU)){var l=e(t).closest(o.DROPDOWN)[0];l&&e(l).find(o.DROPDOWN_TOGGLE).addClass(i.ACTIVE),t.setAttribute("aria-expanded",!0)}a&&a()},t._jQueryInterface=function(n){return this.each(function(){var i=e(this),a=i.data("bs.tab");if(a||(a=new t(this),i.data("bs.tab",a)),"string"==typeof n){if(void 0===a[n])throw new TypeError('No method named "'+n+'"');a[n]()}})},a(t,null,[{key:"VERSION",get:function(){return"4.1.1"}}]),t}();return e(document).on(n.CLICK_DATA_API,o.DATA_TOGGLE,function(t){t.preventDefault(),s._jQueryInterface.call(e(this),"show")}),e.fn.tab=s._jQueryInterface,e.fn.tab.Constructor=s,e.fn.tab.noConflict=function(){return e.fn.tab=t,s._jQueryInterface},s}(t);(function(e){if(void 0===e)throw new TypeError("Bootstrap's JavaScript requires jQuery. jQuery must be included before Bootstrap's JavaScript.");var t=e.fn.jquery.split(" ")[0].split(".");if(t[0]<2&&t[1]<9||1===t[0]&&9===t[1]&&t[2]<1||t[0]>=4)throw new Error("Bootstrap's JavaScript requires at least jQuery v1.9.1 but less than v4.0.0")})(t),e.Util=r,e.Alert=l,e.Button=c,e.Carousel=d,e.Collapse=u,e.Dropdown=h,e.Modal=f,e.Popover=p,e.Scrollspy=g,e.Tab=b,e.Tooltip=m,Object.defineProperty(e,"__esModule",{value:!0})}(t,n(0),n(131))},function(e,t,n){"use strict";(function(e){var t="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e};n(132),n(130),n(129),n(128),n(127),n(126),n(125),n(124),n(48),n(123),n(122),n(121),n(111),n(109),n(108),n(107);var i=n(106),a=n(103),o=h(n(61)),s=h(n(2)),r=h(n(60)),l=h(n(59)),c=h(n(52)),d=h(n(51)),u=h(n(50));function h(e){return e&&e.__esModule?e:{default:e}}(0,r.default)("isotope",l.default,e),(0,r.default)("imagesLoaded",c.default,e);var f=function(e){return(0,i.gettext)(e)};e(document).ready(function(e){var n={ws_notifications:function(){var e="https:"===window.location.protocol?"wss:":"ws:";new WebSocket(e+"//"+window.location.hostname+":"+window.location.port+n.srWebRoot+"/ws/ui").onmessage=function(e){var t=JSON.parse(e.data);"notification"===t.event&&n.notify(t.data.type,t.data.title,t.data.body)}},notify:function(e,t,i){s.default.modules.Desktop.permission(),new s.default({stack:{dir1:"up",dir2:"left",firstpos1:25,firstpos2:25},icons:"fontawesome5",styling:"bootstrap4",addclass:"stack-bottomright",delay:5e3,hide:!0,history:!1,shadow:!1,width:"340px",target:document.body,data:{modules:{Desktop:{desktop:!0,icon:n.srWebRoot+"/images/logo-badge.png"}},type:e,title:t,text:i.replace(/<br[\s/]*(?:\s[^>]*)?>/gi,"\n").replace(/<[/]?b(?:\s[^>]*)?>/gi,"*").replace(/<i(?:\s[^>]*)?>/gi,"[").replace(/<[/]i>/gi,"]").replace(/<(?:[/]?ul|\/li)(?:\s[^>]*)?>/gi,"").replace(/<li(?:\s[^>]*)?>/gi,"\n* ")}})},isMeta:function(t,n){return new RegExp(n.length>1?n.join("|"):n).test(e('meta[data-var="'+t+'"]').data("content"))},getMeta:function(t){return e('meta[data-var="'+t+'"]').data("content")},metaToBool:function(t){var n=e('meta[data-var="'+t+'"]').data("content");return void 0===n?n:!("false"===(n=isNaN(n)?n.toLowerCase():n.toString())||"none"===n||"0"===n)},showHideRows:function(t,n){e("tr."+t).each(function(){n?e(this).show():e(this).hide()})},updateUrlParameter:function(e,t,n){var i=e.indexOf("#"),a=-1===i?"":e.substr(i);e=-1===i?e:e.substr(0,i);var o=new RegExp("([?&])"+t+"=.*?(&|$)","i"),s=-1!==e.indexOf("?")?"&":"?";return n?e=e.match(o)?e.replace(o,"$1"+t+"="+n+"$2"):e+s+t+"="+n:("?"===(e=e.replace(new RegExp("([?&]?)"+t+"=[^&]*","i"),"")).slice(-1)&&(e=e.slice(0,-1)),-1===e.indexOf("?")&&(e=e.replace(/&/,"?"))),e+a},quicksearch:function(){e.widget("custom.catcomplete",e.ui.autocomplete,{_create:function(){this._super(),this.widget().menu("option","items","> :not(.ui-autocomplete-category)")},_renderMenu:function(t,n){var i=this,a="";e.each(n,function(e,n){var o;n.category!=a&&(t.append("<li class='ui-autocomplete-category text-warning p-1'><strong class='text-uppercase'>"+n.category+"</strong></li>"),a=n.category),o=i._renderItemData(t,n),n.category&&o.attr("aria-label",n.category+" : "+n.name)})},_renderItem:function(t,i){var a=e('<li class="bg-transparent m-1">'),o=e("<img>"),s=e("<a>");return a.attr("data-value",i.name),o.attr({src:i.img,alt:i.name,class:"img-fluid w-100"}),"shows"===i.category?(s.attr({href:n.srWebRoot+"/home/displayShow?show="+i.showid,class:"btn btn-dark btn-block d-inline-block text-left"}),a.append(s),a.find("a").append(e('<div class="row"><div class="col-2"><div id="show-img"></div></div><div class="col-10"><div class="row"><strong id="show-name" class="text-white text-truncate"></strong></div><div class="row"><strong id="show-seasons" class="text-secondary"></strong></div></div></div>')),a.find("#show-img").append(o),a.find("#show-name").append(i.name),a.find("#show-seasons").append(i.seasons+" seasons")):(s.attr({href:n.srWebRoot+"/home/displayShow?show="+i.showid+"#S"+i.season+"E"+i.episode,class:"btn btn-dark btn-block d-inline-block text-left"}),a.append(s),a.find("a").append(e('<div class="row"><div class="col-2"><div id="show-img"></div></div><div class="col-10"><div class="row"><strong id="ep-name" class="text-white"></strong></div><div class="row"><strong id="show-name" class="text-secondary text-truncate"></strong></div></div></div>')),a.find("#show-img").append(o),a.find("#ep-name").append(i.name),a.find("#show-name").append(i.showname)),a.appendTo(t)}}),e("#quicksearch").catcomplete({delay:1e3,minLength:1,source:n.srWebRoot+"/quicksearch.json",focus:function(t,n){return e("#quicksearch").val(n.item.name),!1},open:function(){e("#quicksearch-icon").addClass("fas fa-times"),e("ul.ui-menu").width(e(this).innerWidth()),e("ul.ui-menu").css("border","none"),e("ul.ui-menu").css("outline","none"),e("ul.ui-menu").addClass("bg-dark shadow rounded")}}),e("#quicksearch-icon").click(function(){e("#quicksearch").catcomplete("close").val(""),e("#quicksearch-icon").removeClass()})},common:{init:function(){n.srPID=n.getMeta("srPID"),n.srWebRoot=n.getMeta("srWebRoot"),n.srDefaultPage=n.getMeta("srDefaultPage"),n.loadingHTML='<i class="fas fa-spinner fa-spin fa-fw"></i>',n.anonURL=n.getMeta("anonURL"),n.ws_notifications(),e.get(n.srWebRoot+"/messages.po",function(e){e&&((0,i.addLocale)(n.getMeta("srLocale"),a.po.parse(e)),(0,i.useLocale)(n.getMeta("srLocale")))}),n.quicksearch(),e(window).scroll(function(){e(this).scrollTop()>50?e("#back-to-top").fadeIn():e("#back-to-top").fadeOut()}),e("#back-to-top").click(function(){return e("body,html").animate({scrollTop:0},800),!1}),e('[title!=""]').tooltipster();for(var t=document.getElementsByTagName("img"),s=0;s<t.length;s++)t[s].getAttribute("data-src")&&t[s].setAttribute("src",t[s].getAttribute("data-src"));(navigator.maxTouchPoints||0)<2&&e(".dropdown-toggle").on("click",function(){"true"===e(this).attr("aria-expanded")&&(window.location.href=e(this).attr("href"))}),n.metaToBool("sickrage.FUZZY_DATING")&&(e.timeago.settings.allowFuture=!0,e.timeago.settings.strings={prefixAgo:null,prefixFromNow:"In ",suffixAgo:"ago",suffixFromNow:"",seconds:"less than a minute",minute:"about a minute",minutes:"%d minutes",hour:"an hour",hours:"%d hours",day:"a day",days:"%d days",month:"a month",months:"%d months",year:"a year",years:"%d years",wordSeparator:" ",numbers:[]},e("[datetime]").timeago()),e.tablesorter.addParser({id:"loadingNames",is:function(){return!1},format:function(e){return 0===e.indexOf("Loading...")?e.replace("Loading...","000"):n.metaToBool("sickrage.SORT_ARTICLE")?e||"":(e||"").replace(/^(The|A|An)\s/i,"")},type:"text"}),e.tablesorter.addParser({id:"quality",is:function(){return!1},format:function(e){return e.replace("hd1080p",5).replace("hd720p",4).replace("hd",3).replace("sd",2).replace("any",1).replace("best",0).replace("custom",7)},type:"numeric"}),e.tablesorter.addParser({id:"realISODate",is:function(){return!1},format:function(e){return new Date(e).getTime()},type:"numeric"}),e.tablesorter.addParser({id:"cDate",is:function(){return!1},format:function(e){return e},type:"numeric"}),e.tablesorter.addParser({id:"eps",is:function(){return!1},format:function(e){var t=e.match(/^(.*)/);if(null===t||"?"===t[1])return-10;var i=t[1].split(" / ");if(-1!==i[0].indexOf("+")){var a=i[0].split("+");i[0]=a[0]}if(i[0]=parseInt(i[0]),i[1]=parseInt(i[1]),0===i[0])return i[1];var o=parseInt(n.getMeta("max_download_count")*i[0]/i[1]),s=Math.round(i[0]/i[1]*100)/1e3;return o>0&&(o+=i[0]),o+s},type:"numeric"}),o.default.defaults={theme:"dark",type:"blue",typeAnimated:!0,confirm:function(){location.href=this.$target.attr("href")}},e("a.shutdown").confirm({theme:"dark",title:f("Shutdown"),content:f("Are you sure you want to shutdown SiCKRAGE ?")}),e("a.restart").confirm({theme:"dark",title:f("Restart"),content:f("Are you sure you want to restart SiCKRAGE ?")}),e("a.submiterrors").confirm({theme:"dark",title:f("Submit Errors"),content:f("Are you sure you want to submit these errors ?")+'<br><br><span class="text-danger">'+f("Make sure SiCKRAGE is updated and trigger")+"<br>"+f("this error with debug enabled before submitting")+"</span>"}),e("#removeW").click(function(){e("#white option:selected").remove().appendTo("#pool")}),e("#addW").click(function(){e("#pool option:selected").remove().appendTo("#white")}),e("#addB").click(function(){e("#pool option:selected").remove().appendTo("#black")}),e("#removeP").click(function(){e("#pool option:selected").remove()}),e("#removeB").click(function(){e("#black option:selected").remove().appendTo("#pool")}),e("#addToWhite").click(function(){var t=e("#addToPoolText").val();if(""!==t){var n=e("<option>");n.attr("value",t),n.html(t),n.appendTo("#white"),e("#addToPoolText").val("")}}),e("#addToBlack").click(function(){var t=e("#addToPoolText").val();if(""!==t){var n=e("<option>");n.attr("value",t),n.html(t),n.appendTo("#black"),e("#addToPoolText").val("")}}),e("input:checkbox.enabler").each(function(){e(this).prop("checked")?e("#content_"+e(this).attr("id")).show():e("#content_"+e(this).attr("id")).hide()}),e("input:checkbox.enabler").on("click",function(){e(this).prop("checked")?e("#content_"+e(this).attr("id")).fadeIn("fast","linear"):e("#content_"+e(this).attr("id")).fadeOut("fast","linear")}),e(".modal").on("shown.bs.modal",function(){e("body").addClass("modal-open"),e("body").removeAttr("style")}),n.browser.init(),n.quality_chooser.init(),e("#changelog").on("click",function(t){t.preventDefault(),e("#changelogModal").find(".modal-body").load(n.srWebRoot+"/changes"),e("#changelogModal").modal()})}},ajax_search:{searchStatusUrl:"/home/getManualSearchStatus",failedDownload:!1,qualityDownload:!1,selectedEpisode:"",manualSearches:[],init:function(){n.ajax_search.searchStatusUrl=n.srWebRoot+n.ajax_search.searchStatusUrl,n.ajax_search.ajaxEpSearch({colorRow:!0}),n.ajax_search.checkManualSearches(),n.ajax_search.ajaxEpSubtitlesSearch()},enableLink:function(e){e.on("click.disabled",!1),e.prop("enableClick","1"),e.fadeTo("fast",1)},disableLink:function(e){e.off("click.disabled"),e.prop("enableClick","0"),e.fadeTo("fast",.5)},updateImages:function(t){e.each(t.episodes,function(t,i){var a="",o=e("a[id="+i.show+"x"+i.season+"x"+i.episode+"]"),s=o.children("i"),r=o.parent();if(o){var l="";"searching"===i.searchstatus.toLowerCase()?(s.prop("title",f("Searching")),s.prop("class","fas fa-spinner fa-spin fa-fw"),n.ajax_search.disableLink(o),a=i.searchstatus):"queued"===i.searchstatus.toLowerCase()?(s.prop("title",f("Queued")),s.prop("class","fas fa-clock"),n.ajax_search.disableLink(o),a=i.searchstatus):"finished"===i.searchstatus.toLowerCase()&&(s.prop("title",f("Searching")),s.parent().prop("class","epRetry"),s.prop("class","fas fa-search"),n.ajax_search.enableLink(o),l=/(\w+)\s\((.+?)\)/,a=i.status.replace(l,'$1 <span class="badge text-white '+i.quality+'">$2</span>'),r.closest("tr").prop("class",i.overview+" season-"+i.season+" seasonstyle font-weight-bold text-dark")),r.siblings(".col-status").html(a)}var c=e("a[id=forceUpdate-"+i.show+"x"+i.season+"x"+i.episode+"]"),d=c.children("i");c&&("searching"===i.searchstatus.toLowerCase()?(d.prop("title",f("Searching")),d.prop("alt","searching"),d.prop("class","fas fa-spinner fa-spin fa-fw"),n.ajax_search.disableLink(c)):"queued"===i.searchstatus.toLowerCase()?(d.prop("title",f("Queued")),d.prop("alt","queued"),d.prop("class","fas fa-clock")):"finished"===i.searchstatus.toLowerCase()&&(d.prop("title",f("Manual Search")),d.prop("alt","[search]"),d.prop("class","fas fa-search"),"snatched"===i.overview.toLowerCase()?c.closest("tr").remove():n.ajax_search.enableLink(c)))})},manualSearch:function(t){var i,a,o,s=n.ajax_search.selectedEpisode.parent(),r=n.ajax_search.selectedEpisode,l=n.ajax_search.selectedEpisode.children("i");l.prop("title",f("loading")),l.prop("class",t.loadingIcon);var c=n.ajax_search.selectedEpisode.prop("href");return!1===n.ajax_search.failedDownload&&(c=c.replace("retryEpisode","searchEpisode")),c=c+"&downCurQuality="+(n.ajax_search.qualityDownload?"1":"0"),e.getJSON(c,function(e){if("failure"===e.result.toLowerCase())i=t.noIcon,a="failed";else{i=t.loadingIcon,a="success",t.colorRow&&s.parent().removeClass("skipped wanted qual good unaired").addClass("snatched");o=e.result.replace(/(\w+)\s\((.+?)\)/,'$1 <span class="badge text-white '+e.quality+'">$2</span>'),s.siblings(".col-status").html(o),n.ajax_search.disableLink(r)}l.prop("title",a),l.prop("height",t.size),l.prop("class",i)}),!1},checkManualSearches:function(){var t=5e3,i=e("#showID").val(),a=void 0!==i?n.ajax_search.searchStatusUrl+"?show="+i:n.ajax_search.searchStatusUrl;e.ajax({url:a,success:function(e){t=e.episodes?5e3:15e3,n.ajax_search.updateImages(e)},error:function(){t=3e4},type:"GET",dataType:"json",complete:function(){setTimeout(n.ajax_search.checkManualSearches,t)},timeout:15e3})},ajaxEpSearch:function(t){t=e.extend({},{size:16,colorRow:!1,loadingIcon:"fas fa-spinner fa-spin fa-fw",queuedIcon:"fas fa-clock",noIcon:"fas fa-times",yesIcon:"fas fa-check"},t),e(".epRetry").click(function(t){if(t.preventDefault(),"0"===e(this).prop("enableClick"))return!1;n.ajax_search.selectedEpisode=e(this),e("#manualSearchModalFailed").modal()}),e(".epSearch").click(function(i){if(i.preventDefault(),"0"===e(this).prop("enableClick"))return!1;n.ajax_search.selectedEpisode=e(this),e(this).parent().parent().children(".col-status").children(".quality").length?e("#manualSearchModalQuality").modal():n.ajax_search.manualSearch(t)}),e("#manualSearchModalFailed .btn").click(function(){n.ajax_search.failedDownload="yes"===e(this).text().toLowerCase()}),e("#manualSearchModalQuality .btn").click(function(){n.ajax_search.qualityDownload="yes"===e(this).text().toLowerCase(),n.ajax_search.manualSearch(t)})},ajaxEpSubtitlesSearch:function(){e(".epSubtitlesSearch").click(function(){var t=e(this).parent().siblings(".col-subtitles"),n=e(this);return n.empty(),n.append(e("<i/>").attr({class:"fas fa-spinner fa-spin fa-fw",title:f("loading")})),e.getJSON(e(this).attr("href"),function(i){if("failure"!==i.result.toLowerCase()&&"no subtitles downloaded"!==i.result.toLowerCase()){var a=i.subtitles.split(",");t.empty(),e.each(a,function(n,i){""!==i&&"und"!==i&&(a.length,t.append(e("<i/>").attr({class:"sickrage-flags sickrage-flags-"+i})))}),n.remove()}else n.remove()}),!1})},ajaxEpMergeSubtitles:function(){e(".epMergeSubtitles").click(function(){var t=e(this);return t.empty(),t.append(e("<i/>").attr({class:"fas fa-spinner fa-spin fa-fw",title:f("loading")})),e.getJSON(e(this).attr("href"),function(){t.remove()}),!1})}},browser:{defaults:{title:f("Choose Directory"),url:"/browser/",autocompleteURL:"/browser/complete",includeFiles:0,fileTypes:[],showBrowseButton:!0},fileBrowserDialog:null,currentBrowserPath:null,currentRequest:null,init:function(){n.browser.defaults.url=n.srWebRoot+n.browser.defaults.url,n.browser.defaults.autocomplete=n.srWebRoot+n.browser.defaults.autocompleteURL,e.fn.fileBrowser=n.browser.fileBrowser,e.fn.nFileBrowser=n.browser.nFileBrowser},browse:function(t,i,a,o){n.browser.currentBrowserPath!==t&&(n.browser.currentBrowserPath=t,n.browser.currentRequest&&n.browser.currentRequest.abort(),n.browser.currentRequest=e.getJSON(i,{path:t,includeFiles:a,fileTypes:o.join(",")},function(t){n.browser.fileBrowserDialog.find(".modal-body").empty();var s,r=t[0],l=0,c=null;t=e.grep(t,function(){return 0!=l++}),e('<input class="form-control mb-1">').val(r.currentPath).on("keypress",function(e){13===e.which&&n.browser.browse(e.target.value,i,a,o)}).appendTo(n.browser.fileBrowserDialog.find(".modal-body")).fileBrowser({showBrowseButton:!1}).on("autocompleteselect",function(e,t){n.browser.browse(t.item.value,i,a,o)}),s=e('<div class="list-group">').appendTo(n.browser.fileBrowserDialog.find(".modal-body")),e.each(t,function(t,r){if(r.isFile&&o&&(!r.isAllowed||-1!==o.indexOf("images")&&!r.isImage))return!0;c=e('<a href="javascript:void(0)">').on("click",function(){r.isFile?(n.browser.currentBrowserPath=r.path,e('.browserDialog .ui-button:contains("Ok")').click()):n.browser.browse(r.path,i,a,o)}).text(r.name),r.isImage?c.prepend('<span class="fas fa-file-image ml-1 mr-1"></span>'):r.isFile?c.prepend('<span class="fas fa-file ml-1 mr-1"></span>'):c.prepend('<span class="fas fa-folder ml-1 mr-1"></span>').on("mouseenter",function(){e("span",this).addClass("fa-folder-open")}).on("mouseleave",function(){e("span",this).removeClass("fa-folder-open")}),c.appendTo(s)}),e("a",s).wrap('<div class="list-group-item list-group-item-action list-group-item-dark p-0">')}))},nFileBrowser:function(t,i){i=e.extend({},n.browser.defaults,i),n.browser.fileBrowserDialog?n.browser.fileBrowserDialog.find(".modal-title").text(i.title):(n.browser.fileBrowserDialog=e("#fileBrowserDialog").modal(),n.browser.fileBrowserDialog.find(".modal-body").addClass("ui-front"),n.browser.fileBrowserDialog.find(".modal-title").text(i.title),n.browser.fileBrowserDialog.find(".modal-footer .btn-success").click(function(){t(n.browser.currentBrowserPath,i),n.browser.fileBrowserDialog.modal("hide")}));var a="";return i.initialDir&&(a=i.initialDir),n.browser.browse(a,i.url,i.includeFiles,i.fileTypes),n.browser.fileBrowserDialog.modal(),!1},fileBrowser:function(t){if((t=e.extend({},n.browser.defaults,t)).field=e(this),t.field.autocomplete&&t.autocompleteURL){var i="";t.field.autocomplete({position:{my:"top",at:"bottom",collision:"flipfit"},source:function(n,a){i=e.ui.autocomplete.escapeRegex(n.term,t.includeFiles),e.ajax({url:t.autocompleteURL,data:n,dataType:"json",success:function(t){var n=new RegExp("^"+i,"i"),o=e.grep(t,function(e){return n.test(e)});a(o)}})},open:function(){e(".ui-autocomplete li.ui-menu-item a").removeClass("ui-corner-all")}}).data("ui-autocomplete")._renderItem=function(t,n){var a=n.label,o=new RegExp("(?![^&;]+;)(?!<[^<>]*)("+i+")(?![^<>]*>)(?![^&;]+;)","gi");return a=a.replace(o,function(e){return"<b>"+e+"</b>"}),e("<li></li>").data("ui-autocomplete-item",n).append("<a class='text-nowrap'>"+a+"</a>").appendTo(t)}}var a,o,s=!1;try{s=!!localStorage.getItem}catch(e){s=null}return s&&t.key&&(a=localStorage["fileBrowser-"+t.key]),t.key&&0===t.field.val().length&&a&&t.field.val(a),o=function(e,t){t.field.val(e),s&&t.key&&(localStorage["fileBrowser-"+t.key]=e)},t.field.addClass("fileBrowserField"),t.showBrowseButton&&t.field.after(e('<div class="input-group-append"><span class="input-group-text"><a href="#" class="fileBrowser fas fa-search""></a></span></div>').on("click",function(){var n=t.field.val()||t.key&&a||"",i=e.extend({},t,{initialDir:n});return e(this).nFileBrowser(o,i),!1})),t.field}},root_dirs:{init:function(){for(var t=["assert","clear","count","debug","dir","dirxml","error","exception","group","groupCollapsed","groupEnd","info","log","markTimeline","profile","profileEnd","table","time","timeEnd","timeStamp","trace","warn"],i=t.length,a=window.console=window.console||{};i--;){var o=t[i];a[o]||(a[o]=function(){})}e("#addRootDir").click(function(){e(this).nFileBrowser(n.root_dirs.addRootDir)}),e("#editRootDir").click(function(){e(this).nFileBrowser(n.root_dirs.editRootDir,{initialDir:e("#rootDirs option:selected").val()})}),e("#deleteRootDir").click(function(){if(e("#rootDirs option:selected").length){var t=e("#rootDirs option:selected"),i=t.attr("id")===e("#whichDefaultRootDir").val(),o=e("#rootDirs option:selected").attr("id").substr(3);if(t.remove(),n.root_dirs.syncOptionIDs(),i)a.log("new default when deleting"),e("#whichDefaultRootDir").val(""),e("#rootDirs option").length&&n.root_dirs.setDefault(e("#rootDirs option").attr("id"));else if(e("#whichDefaultRootDir").val().length){var s=e("#whichDefaultRootDir").val().substr(3);s>o&&e("#whichDefaultRootDir").val("rd-"+(s-1))}}n.root_dirs.refreshRootDirs(),e.get(n.srWebRoot+"/config/general/saveRootDirs",{rootDirString:e("#rootDirText").val()})}),e("#defaultRootDir").click(function(){e("#rootDirs option:selected").length&&n.root_dirs.setDefault(e("#rootDirs option:selected").attr("id")),n.root_dirs.refreshRootDirs(),e.get(n.srWebRoot+"/config/general/saveRootDirs",{rootDirString:e("#rootDirText").val()})}),e("#rootDirs").click(function(){n.root_dirs.refreshRootDirs()}),n.root_dirs.syncOptionIDs(),n.root_dirs.setDefault(e("#whichDefaultRootDir").val(),!0),n.root_dirs.refreshRootDirs()},addRootDir:function(t){if(t.length){var i=!1;return e("#whichDefaultRootDir").val().length||(i=!0),e("#rootDirs").append('<option value="'+t+'">'+t+"</option>"),n.root_dirs.syncOptionIDs(),i&&n.root_dirs.setDefault(e("#rootDirs option").attr("id")),n.root_dirs.refreshRootDirs(),e.get(n.srWebRoot+"/config/general/saveRootDirs",{rootDirString:e("#rootDirText").val()}),!1}},editRootDir:function(t){t.length&&(e("#rootDirs option:selected").length&&(e("#rootDirs option:selected").attr("id")===e("#whichDefaultRootDir").val()?e("#rootDirs option:selected").text("*"+t):e("#rootDirs option:selected").text(t),e("#rootDirs option:selected").val(t)),n.root_dirs.refreshRootDirs(),e.get(n.srWebRoot+"/config/general/saveRootDirs",{rootDirString:e("#rootDirText").val()}))},setDefault:function(t,n){if((void 0===t||t.length)&&(e("#whichDefaultRootDir").val()!==t||!0===n)){if("*"!==e("#"+t).text().charAt(0)&&e("#"+t).text("*"+e("#"+t).text()),e("#whichDefaultRootDir").val()&&!0!==n){var i=e("#"+e("#whichDefaultRootDir").val());i.text(i.text().substring(1))}e("#whichDefaultRootDir").val(t)}},syncOptionIDs:function(){var t=0;e("#rootDirs option").each(function(){e(this).attr("id","rd-"+t++)})},refreshRootDirs:function(){if(e("#rootDirs").length){var t="true";n.root_dirs.syncOptionIDs(),!e("#rootDirs option:selected").length&&e("#whichDefaultRootDir").val().length&&e("#"+e("#whichDefaultRootDir").val()).prop("selected",!0),e("#rootDirs option:selected").length&&(t=""),e("#deleteRootDir").prop("disabled",t),e("#defaultRootDir").prop("disabled",t),e("#editRootDir").prop("disabled",t);var i="";e("#whichDefaultRootDir").val().length>=4&&(i=e("#whichDefaultRootDir").val().substr(3)),e("#rootDirs option").each(function(){i.length&&(i+="|"+e(this).val())}),e("#rootDirText").val(i),e("#rootDirText").change()}}},quality_chooser:{init:function(){e("#qualityPreset").change(function(){n.quality_chooser.setFromPresets(e("#qualityPreset :selected").val())}),n.quality_chooser.setFromPresets(e("#qualityPreset :selected").val())},setFromPresets:function(t){if(0===parseInt(t))return e("#qualityPreset_label").hide(),void e("#customQuality").show();e("#customQuality").hide(),e("#qualityPreset_label").show(),e("#anyQualities option").each(function(){(t&e(this).val())>0?e(this).attr("selected","selected"):e(this).attr("selected",!1)}),e("#bestQualities option").each(function(){(t&e(this).val()<<16)>0?e(this).attr("selected","selected"):e(this).attr("selected",!1)})}},root:{init:function(){},schedule:function(){if(e.backstretch(n.srWebRoot+"/images/backdrops/schedule.jpg"),e(".backstretch").css("opacity",n.getMeta("sickrage.FANART_BACKGROUND_OPACITY")).fadeIn("500"),n.isMeta("sickrage.COMING_EPS_LAYOUT",["list"])){var t={date:0,show:2,network:5},i=n.getMeta("sickrage.COMING_EPS_SORT"),a=i in t?[[t[i],0]]:[[0,0]];e("#showListTable:has(tbody tr)").tablesorter({theme:"bootstrap",widgets:["stickyHeaders","filter","columnSelector","saveSort"],sortList:a,textExtraction:{0:function(t){return e(t).find("time").attr("datetime")},1:function(t){return e(t).find("time").attr("datetime")},7:function(t){return e(t).find("span").text().toLowerCase()}},headers:{0:{sorter:"realISODate"},1:{sorter:"realISODate"},2:{sorter:"loadingNames"},4:{sorter:"loadingNames"},7:{sorter:"quality"},8:{sorter:!1},9:{sorter:!1}},widgetOptions:n.metaToBool("sickrage.FILTER_ROW")?{filter_columnFilters:!0,filter_hideFilters:!0,filter_saveFilters:!0,columnSelector_mediaquery:!1}:{filter_columnFilters:!1,columnSelector_mediaquery:!1}}),n.ajax_search.ajaxEpSearch()}n.isMeta("sickrage.COMING_EPS_LAYOUT",["banner","poster"])&&(n.ajax_search.ajaxEpSearch({size:16,loadingIcon:"fas fa-spinner fa-spin fa-fw"}),e(".ep_summary").hide(),e(".ep_summaryTrigger").click(function(){e(this).next(".ep_summary").slideToggle("normal",function(){e.prev(".ep_summaryTrigger").attr("src",function(t,n){return e(this).next(".ep_summary").is(":visible")?n.replace("plus","minus"):n.replace("minus","plus")})})})),e("#popover").popover({placement:"bottom",html:!0,content:'<div id="popover-target"></div>'}).on("shown.bs.popover",function(){e.tablesorter.columnSelector.attachTo(e("#showListTable"),"#popover-target")})},history:function(){e.backstretch(n.srWebRoot+"/images/backdrops/history.jpg"),e(".backstretch").css("opacity",n.getMeta("sickrage.FANART_BACKGROUND_OPACITY")).fadeIn("500"),e("#historyTable:has(tbody tr)").tablesorter({theme:"bootstrap",widgets:["filter"],sortList:[[0,1]],textExtraction:n.isMeta("sickrage.HISTORY_LAYOUT",["detailed"])?{0:function(t){return e(t).find("time").attr("datetime")},4:function(t){return e(t).find("span").text().toLowerCase()}}:{0:function(t){return e(t).find("time").attr("datetime")},1:function(t){return e(t).find("span").text().toLowerCase()},2:function(t){return e(t).attr("data-provider").toLowerCase()},5:function(t){return e(t).attr("data-quality").toLowerCase()}},headers:n.isMeta("sickrage.HISTORY_LAYOUT",["detailed"])?{0:{sorter:"realISODate"},4:{sorter:"data-quality"}}:{0:{sorter:"realISODate"},4:{sorter:!1},5:{sorter:"data-quality"}}}),e("#history_limit").on("change",function(){window.location.href=n.srWebRoot+"/history/?limit="+e(this).val()}),e("a.clearhistory").confirm({theme:"dark",title:f("Clear History"),content:f("Are you sure you want to clear all download history ?")}),e("a.trimhistory").confirm({theme:"dark",title:f("Trim History"),content:f("Are you sure you want to trim all download history older than 30 days ?")})},api_builder:function(){e("[data-action=api-call]").on("click",function(){var t=e("[data-command="+e(this).data("command-name")+"]"),n=e("#option-profile").is(":checked"),i=e(this).data("target"),a=e(this).data("time"),o=e("#"+e(this).data("base-url")).text(),s=e(this).data("url");e.each(t,function(t,n){var i=e(n).attr("name"),a=e(n).val();void 0!==i&&void 0!==a&&i!==a&&a&&(e.isArray(a)&&(a=a.join("|")),o+="&"+i+"="+a)}),n&&(o+="&profile=1");var r=(new Date).getTime();e.get(o,function(t,n,l){var c=(new Date).getTime()-r,d=e("#option-jsonp").is(":checked"),u=l.getResponseHeader("content-type")||"",h=e(i);if(e(a).text(c+"ms"),e(s).text(o+(d?"&jsonp=foo":"")),"image/"===u.slice(0,6))h.html(e("<img/>").attr("src",o));else{var f=JSON.stringify(t,null,4);d?h.text("foo("+f+");"):h.text(f)}h.parents(".result-wrapper").removeClass("d-none")})}),e("[data-action=clear-result]").on("click",function(){e(e(this).data("target")).html("").parents(".result-wrapper").addClass("d-none")}),e("[data-action=update-episodes]").on("change",function(){var t=e(this).data("command"),n=e("[data-command="+t+"][name=episode]"),i=e(this).val(),a=e("[data-command="+t+"][name=indexerid]").val(),o=n.val();if(void 0!==n)for(var s in n.removeClass("d-none"),n.find("option:gt(0)").remove(),o[a][i])o[a][i].hasOwnProperty(s)&&n.append(e("<option>",{value:s,label:"Episode "+s}))}),e("[data-action=update-seasons]").on("change",function(){var t=e(this).data("command"),n=e("[data-command="+t+"][name=season]"),i=e(this).val(),a=n.val();if(void 0!==n)for(var o in n.removeClass("d-none"),n.find("option:gt(0)").remove(),a[i])a[i].hasOwnProperty(o)&&n.append(e("<option>",{value:o,label:0===o?"Specials":"Season "+o}))})},status:function(){e("#schedulerStatusTable").tablesorter({theme:"bootstrap",widgets:["saveSort"]}),e("#queueStatusTable").tablesorter({theme:"bootstrap",sortList:[[3,0],[4,0],[2,1]],widgets:["saveSort"]})}},home:{init:function(){e.backstretch(n.srWebRoot+"/images/backdrops/home.jpg"),e(".backstretch").css("opacity",n.getMeta("sickrage.FANART_BACKGROUND_OPACITY")).fadeIn("500")},index:function(){function t(t){var n,i,a;t<125?a=3:t<175?(n=9,i=.6,a=4):(n=11,i=1,a=6),e("#posterPopup").remove(),void 0===n?e(".show-details").hide():(e(".show-details").show(),e(".show-dlstats, .show-quality").css("fontSize",n),e(".show-network-image").css("transform","scale("+i+")")),e(".show-container").css({width:t,borderRadius:a})}e("#posterSizeSlider").slider({min:75,max:250,value:localStorage.posterSize||188,change:function(n,i){window.localStorage&&localStorage.setItem("posterSize",i.value),t(i.value),e(".show-grid").isotope("layout")}}),t(parseInt(localStorage.posterSize||188)),e(".progress-bar").each(function(){var t=e(this).data("progress-percentage"),n=100===t?100:t>80?80:t>60?60:t>40?40:20;e(this).data("progress-text")&&e(this).append('<div class="progressbarText" title="'+e(this).data("progress-tip")+'">'+e(this).data("progress-text")+"</div>"),e(this).addClass("progress-"+n)}),e("img#network").on("error",function(){e(this).parent().text(e(this).attr("alt")),e(this).remove()}),e("#showListTableShows:has(tbody tr), #showListTableAnime:has(tbody tr)").tablesorter({theme:"bootstrap",sortList:[[7,1],[2,0]],textExtraction:{0:function(t){return e(t).find("time").attr("datetime")},1:function(t){return e(t).find("time").attr("datetime")},3:function(t){return e(t).find("span").text().toLowerCase()},4:function(t){return e(t).find("span").text().toLowerCase()},5:function(t){return e(t).find("span:first").text()},6:function(t){return e(t).data("show-size")},7:function(t){return e(t).find("span").text().toLowerCase()}},widgets:["saveSort","stickyHeaders","filter","columnSelector"],headers:n.metaToBool("sickrage.FILTER_ROW")?{0:{sorter:"realISODate"},1:{sorter:"realISODate"},2:{sorter:"loadingNames"},4:{sorter:"quality"},5:{sorter:"eps"},6:{sorter:"digit"},7:{filter:"parsed"}}:{0:{sorter:"realISODate"},1:{sorter:"realISODate"},2:{sorter:"loadingNames"},4:{sorter:"quality"},5:{sorter:"eps"},6:{sorter:"digit"}},widgetOptions:n.metaToBool("sickrage.FILTER_ROW")?{filter_columnFilters:!0,filter_hideFilters:!0,filter_functions:{5:function(e,t,n){var i=!1,a=Math.floor(t%1*1e3);if(""===n)i=!0;else{var o=n.match(/(<|<=|>=|>)\s(\d+)/i);o&&("<"===o[1]?a<parseInt(o[2])&&(i=!0):"<="===o[1]?a<=parseInt(o[2])&&(i=!0):">="===o[1]?a>=parseInt(o[2])&&(i=!0):">"===o[1]&&a>parseInt(o[2])&&(i=!0)),(o=n.match(/(\d+)\s(-|to)\s(\d+)/i))&&("-"!==o[2]&&"to"!==o[2]||a>=parseInt(o[1])&&a<=parseInt(o[3])&&(i=!0)),(o=n.match(/(=)?\s?(\d+)\s?(=)?/i))&&("="!==o[1]&&"="!==o[3]||parseInt(o[2])===a&&(i=!0)),!isNaN(parseFloat(n))&&isFinite(n)&&parseInt(n)===a&&(i=!0)}return i}},columnSelector_mediaquery:!1}:{filter_columnFilters:!1},sortStable:!0,sortAppend:[[2,0]]}),e(".show-grid").imagesLoaded(function(){e(".show-grid").isotope({itemSelector:".show-container",sortBy:n.getMeta("sickrage.POSTER_SORTBY"),sortAscending:n.getMeta("sickrage.POSTER_SORTDIR"),layoutMode:"masonry",masonry:{isFitWidth:!0},getSortData:{name:function(t){var i=e(t).attr("data-name")||"";return(n.metaToBool("sickrage.SORT_ARTICLE")?i:i.replace(/^((?:The|A|An)\s)/i,"")).toLowerCase()},network:"[data-network]",date:function(t){var n=e(t).attr("data-date");return n.length&&parseInt(n,10)||Number.POSITIVE_INFINITY},progress:function(t){var n=e(t).attr("data-progress");return n.length&&parseInt(n,10)||Number.NEGATIVE_INFINITY}}});var t=null;e(".show-container").on("mouseenter",function(){var n=e(this);"none"===n.find(".show-details").css("display")&&(t=setTimeout(function(){t=null,e("#posterPopup").remove();var i=n.clone().attr({id:"posterPopup"}),a=n.offset().left,o=n.offset().top;i.css({position:"absolute",margin:0,top:o,left:a,zIndex:9999}),i.find(".show-details").show(),i.on("mouseleave",function(){e(this).remove()}),i.appendTo("body");var s=o+n.height()/2-219,r=a+n.width()/2-125,l=e(window).scrollTop(),c=e(window).scrollLeft(),d=l+e(window).innerHeight(),u=c+e(window).innerWidth();s<l+5&&(s=l+5),r<c+5&&(r=c+5),s+438+5>d&&(s=d-438-5),r+250+5>u&&(r=u-250-5),i.animate({top:s,left:r,width:250,height:438})},300))}).on("mouseleave",function(){null!==t&&clearTimeout(t)})}),e("#postersort").on("change",function(){var t=e(this).val();e(".show-grid").isotope({sortBy:t}),e.post(e(this).find("option[value="+e(this).val()+"]").attr("data-sort"))}),e("#postersortdirection").on("change",function(){var t="true"===e(this).val();e(".show-grid").isotope({sortAscending:t}),e.post(e(this).find("option[value="+e(this).val()+"]").attr("data-sort"))}),e("#popover").popover({placement:"bottom",html:!0,content:'<div id="popover-target"></div>'}).on("shown.bs.popover",function(){e.tablesorter.columnSelector.attachTo(e("#showListTableShows"),"#popover-target"),e("#showListTableAnime").length&&n.metaToBool("sickrage.ANIME_SPLIT_HOME")&&e.tablesorter.columnSelector.attachTo(e("#showListTableAnime"),"#popover-target")})},display_show:{init:function(){n.home.display_show.imdbRating(),n.metaToBool("sickrage.FANART_BACKGROUND")&&(e.backstretch(n.srWebRoot+"/images/"+e("#showID").attr("value")+".fanart.jpg"),e(".backstretch").css("opacity",n.getMeta("sickrage.FANART_BACKGROUND_OPACITY")).fadeIn("500")),e("#showTable, #animeTable").tablesorter({theme:"bootstrap",widgets:["saveSort","columnSelector"],widgetOptions:{columnSelector_saveColumns:!0,columnSelector_layout:'<br><label><input type="checkbox">{name}</label>',columnSelector_mediaquery:!1,columnSelector_cssChecked:"checked"}}),e("#popover").popover({placement:"bottom",html:!0,content:'<div id="popover-target"></div>'}).on("shown.bs.popover",function(){e(".displayShowTable").each(function(t,n){e.tablesorter.columnSelector.attachTo(n,"#popover-target")})}),e("#seasonJump").on("change",function(){var t=e("#seasonJump option:selected").val();if(t&&"jump"!==t){var n=e("#seasonJump option:selected").data("season");e("html,body").animate({scrollTop:e('[name ="'+t.substring(1)+'"]').offset().top-50},"slow"),e("#collapseSeason-"+n).collapse("show"),location.hash=t}e(this).val("jump")}),e("#prevShow").on("click",function(){e("#pickShow option:selected").prev("option").prop("selected","selected"),e("#pickShow").change()}),e("#nextShow").on("click",function(){e("#pickShow option:selected").next("option").prop("selected","selected"),e("#pickShow").change()}),e("#changeStatus").on("click",function(){var t=[];if(e(".epCheck").each(function(){e(this).prop("checked")&&t.push(e(this).attr("id"))}),0===t.length)return!1;window.location.href=n.srWebRoot+"/home/setStatus?show="+e("#showID").attr("value")+"&eps="+t.join("|")+"&status="+e("#statusSelect").val()}),e("#deleteEpisode").on("click",function(){var t=[];if(e(".epCheck").each(function(){e(this).prop("checked")&&t.push(e(this).attr("id"))}),0===t.length)return!1;window.location.href=n.srWebRoot+"/home/deleteEpisode?show="+e("#showID").attr("value")+"&eps="+t.join("|")}),e(".seasonCheck").on("click",function(){var t=this,n=e(this).attr("id");e("#collapseSeason-"+n).collapse("show"),e(".epCheck:visible").each(function(){e(this).attr("id").split("x")[0]===n&&e(this).prop("checked",t.checked)})});var t=null;e(".epCheck").on("click",function(n){if(t&&n.shiftKey){var i=this,a=0;e(".epCheck").each(function(){switch(a){case 2:return!1;case 1:e(this).prop("checked",t.checked)}e(this)!==i&&e(this)!==t||a++})}else t=this}),e(".seriesCheck").on("click",function(){e(".epCheck:visible").each(function(){e(this).prop("checked",!0)}),e(".seasonCheck:visible").each(function(){e(this).prop("checked",!0)})}),e(".clearAll").on("click",function(){e(".epCheck:visible").each(function(){e(this).prop("checked",!1)}),e(".seasonCheck:visible").each(function(){e(this).prop("checked",!1)})}),e("#pickShow").on("change",function(){var t=e(this).val();0!==t&&(window.location.href=n.srWebRoot+"/home/displayShow?show="+t)}),e("#checkboxControls input").change(function(){var t=e(this).attr("id"),i=e("#checkboxControls > input, #"+t).prop("checked");n.showHideRows(t,i)}),e("#checkboxControls input").each(function(){var t=e(this).prop("checked");e("tr."+e(this).attr("id")).each(function(){t?e(this).show():e(this).hide()})}),e("tr.seasonheader").each(function(){var t=0,n=e(this).attr("id");e("tr."+n+" :visible").each(function(){t++}),0===t?(e(this).hide(),e("#"+n+"-cols").hide()):(e(this).show(),e("#"+n+"-cols").show())}),e(".sceneSeasonXEpisode").on("change",function(){e(this).val(e(this).val().replace(/[^0-9xX]*/g,""));var t=e(this).attr("data-for-season"),i=e(this).attr("data-for-episode"),a=e(this).val().match(/^(\d+)x(\d+)$/i),o=null,s=null;a&&(o=a[1],s=a[2]),n.home.display_show.setEpisodeSceneNumbering(t,i,o,s)}),e(".sceneAbsolute").on("change",function(){e(this).val(e(this).val().replace(/[^0-9xX]*/g,""));var t=e(this).attr("data-for-absolute"),i=e(this).val().match(/^(\d{1,3})$/i),a=null;i&&(a=i[1]),n.home.display_show.setAbsoluteSceneNumbering(t,a)}),n.ajax_search.init(),e("a.removeshow").confirm({theme:"dark",title:f("Remove Show"),content:f("Are you sure you want to remove")+'<span class="footerhighlight">'+e("#showtitle").data("showname")+"</span>"+f(" from the database?")+'<br><br><input type="checkbox" id="deleteFiles" name="deleteFiles"/>&nbsp;<label for="deleteFiles" class="text-danger">'+f("Check to delete files as well. IRREVERSIBLE")+"</label>",buttons:{confirm:function(){var e=this.$content.find("#deleteFiles").prop("checked");location.href=this.$target.attr("href")+(e?"&full=1":"")},cancel:{action:function(){}}}})},imdbRating:function(){for(var t=e("#imdbstars"),n=t.data("imdb-rating"),i=e("<i>").addClass("fas fa-star text-warning"),a=0;a<n;a++)t.append(i.clone())},setEpisodeSceneNumbering:function(t,i,a,o){var s=e("#showID").val(),r=e("#indexer").val();""===a&&(a=null),""===o&&(o=null),e.getJSON(n.srWebRoot+"/home/setSceneNumbering",{show:s,indexer:r,forSeason:t,forEpisode:i,sceneSeason:a,sceneEpisode:o},function(n){null===n.sceneSeason||null===n.sceneEpisode?e("#sceneSeasonXEpisode_"+s+"_"+t+"_"+i).val(""):e("#sceneSeasonXEpisode_"+s+"_"+t+"_"+i).val(n.sceneSeason+"x"+n.sceneEpisode),n.success||(n.errorMessage?alert(n.errorMessage):alert(f("Update failed.")))})},setAbsoluteSceneNumbering:function(t,i){var a=e("#showID").val(),o=e("#indexer").val();""===i&&(i=null),e.getJSON(n.srWebRoot+"/home/setSceneNumbering",{show:a,indexer:o,forAbsolute:t,sceneAbsolute:i},function(n){null===n.sceneAbsolute?e("#sceneAbsolute_"+a+"_"+t).val(""):e("#sceneAbsolute_"+a+"_"+t).val(n.sceneAbsolute),n.success||(n.errorMessage?alert(n.errorMessage):alert(f("Update failed.")))})}},edit_show:{init:function(){var t=[];e("#location").fileBrowser({title:f("Select Show Location")}),e("#submit").click(function(){var t=[];e("#exceptions_list option").each(function(){t.push(e(this).val())}),e("#exceptions_list").val(t),n.metaToBool("show.is_anime")&&n.home.generate_bwlist()}),e("#addSceneName").click(function(){var n=e("#SceneName").val(),i=e("<option>");if(t=[],e("#exceptions_list option").each(function(){t.push(e(this).val())}),e("#SceneName").val(""),!(e.inArray(n,t)>-1||""===n))return e("#SceneException").show(),i.attr("value",n),i.html(n),i.appendTo("#exceptions_list")}),e("#removeSceneName").click(function(){e("#exceptions_list option:selected").remove(),n.home.edit_show.toggleSceneException()}),n.home.edit_show.toggleSceneException()},toggleSceneException:function(){var t=[];e("#exceptions_list option").each(function(){t.push(e(this).val())}),""===t?e("#SceneException").hide():e("#SceneException").show()}},add_shows:function(){e.backstretch(n.srWebRoot+"/images/backdrops/addshows.jpg"),e(".backstretch").css("opacity",n.getMeta("sickrage.FANART_BACKGROUND_OPACITY")).fadeIn("500")},add_existing_shows:{init:function(){n.home.add_show_options(),n.root_dirs.init(),e("#tableDiv").on("click","#checkAll",function(){e(".dirCheck").not(this).prop("checked",this.checked)}),e("#submitShowDirs").on("click",function(){var t=!1,n=e("#addShowForm");if(e(".dirCheck").each(function(){if(!0===this.checked){var i=e(this).attr("id"),a=e(this).closest("tr").find("select").val();e("<input>",{type:"hidden",name:"shows_to_add",value:a+"|"+i}).appendTo(n),t=!0}}),!1===t)return!1;e("<input>",{type:"hidden",name:"promptForSettings",value:e("#promptForSettings").prop("checked")?"on":"off"}).appendTo(n),n.submit()});var t="";e("#rootDirText").on("change",function(){if(t===e("#rootDirText").val())return!1;t=e("#rootDirText").val(),e("#rootDirStaticList").html(""),e("#rootDirs option").each(function(t,n){e("#rootDirStaticList").append('<div class="list-group-item-dark mb-1"><div class="align-middle m-1"><label class="form-check-label" for="\' + $(w).val() + \'"><input type="checkbox" class="dir_check" id="'+e(n).val()+'" checked=checked><b>'+e(n).val()+"</b></label></div></div>")}),n.home.add_existing_shows.loadContent()}),e("#rootDirStaticList").on("click",".dir_check",n.home.add_existing_shows.loadContent),e("#tableDiv").on("click",".showManage",function(t){t.preventDefault(),e("html,body").animate({scrollTop:0},1e3)}),e("#rootDirs option").attr("selected","selected").parent().focus(),e("#rootDirs option").click()},loadContent:function(){var t="";e(".dir_check").each(function(n,i){e(i).is(":checked")&&(t.length&&(t+="&"),t+="rootDir="+encodeURIComponent(e(i).attr("id")))}),e("#tableDiv").html("<span>"+n.loadingHTML+f("loading folders...")+"</span>"),e.get(n.srWebRoot+"/home/addShows/massAddTable/",t,function(t){e("#tableDiv").html(t),e("#addRootDirTable").tablesorter({theme:"bootstrap",sortList:[[1,0]],headers:{0:{sorter:!1}}})})}},postprocess:function(){e("#episodeDir").fileBrowser({title:f("Select Unprocessed Episode Folder"),key:"postprocessPath"})},trakt_shows:{init:function(){function t(t){var n,i;t<125?i=3:t<175?(n=9,i=4):(n=11,i=6),e("#posterPopup").remove(),void 0===n?e(".show-details").hide():e(".show-details").show(),e(".show-container").css({width:t,borderRadius:i})}e("#showsort").val("original"),e("#showsortdirection").val("asc"),e("#posterSizeSlider").slider({min:75,max:250,value:localStorage.traktPosterSize||188,change:function(n,i){window.localStorage&&localStorage.setItem("traktPosterSize",i.value),t(i.value),e(".show-grid").isotope("layout")}}),t(parseInt(localStorage.traktPosterSize||188)),e(".show-grid").imagesLoaded(function(){e(".show-grid").isotope({itemSelector:".show-container",sortBy:"original-order",layoutMode:"masonry",masonry:{isFitWidth:!0},getSortData:{name:function(t){var i=e(t).attr("data-name")||"";return(n.metaToBool("sickrage.SORT_ARTICLE")?i:i.replace(/^(The|A|An)\s/i,"")).toLowerCase()},rating:"[data-rating] parseInt",votes:"[data-votes] parseInt"}})}),e("#showsort").on("change",function(){var t;switch(e(this).value){case"original":t="original-order";break;case"rating":e(".show-grid").isotope({sortBy:"random"}),t="rating";break;case"rating_votes":t=["rating","votes"];break;case"votes":t="votes";break;default:t="name"}e(".show-grid").isotope({sortBy:t})}),e("#showsortdirection").on("change",function(){e(".show-grid").isotope({sortAscending:"asc"===e(this).value})}),e("#traktlist").on("change",function(e){document.location.href=n.updateUrlParameter(document.location.href,"list",e.target.value)}),e("#limit").on("change",function(e){document.location.href=n.updateUrlParameter(document.location.href,"limit",e.target.value)})}},popular_shows:function(){function t(t){var n,i;t<125?i=3:t<175?(n=9,i=4):(n=11,i=6),e("#posterPopup").remove(),void 0===n?e(".show-details").hide():e(".show-details").show(),e(".show-container").css({width:t,borderRadius:i})}e("#posterSizeSlider").slider({min:75,max:250,value:localStorage.imdbPosterSize||188,change:function(n,i){window.localStorage&&localStorage.setItem("imdbPosterSize",i.value),t(i.value),e(".show-grid").isotope("layout")}}),t(parseInt(localStorage.traktPosterSize||188)),e(".show-grid").imagesLoaded(function(){e(".show-grid").isotope({itemSelector:".show-container",sortBy:"original-order",layoutMode:"masonry",masonry:{isFitWidth:!0},getSortData:{name:function(t){var i=e(t).attr("data-name")||"";return(n.metaToBool("sickrage.SORT_ARTICLE")?i:i.replace(/^(The|A|An)\s/i,"")).toLowerCase()},rating:"[data-rating] parseInt",votes:"[data-votes] parseInt"}})}),e("#showsort").on("change",function(){var t;switch(e(this).value){case"original":t="original-order";break;case"rating":e(".show-grid").isotope({sortBy:"random"}),t="rating";break;case"rating_votes":t=["rating","votes"];break;case"votes":t="votes";break;default:t="name"}e(".show-grid").isotope({sortBy:t})}),e("#showsortdirection").on("change",function(){e(".show-grid").isotope({sortAscending:"asc"===e(this).value})})},test_renaming:function(){e(".seriesCheck").on("click",function(){var t=this;e(".seasonCheck:visible").each(function(){e(this).prop("checked",t.checked)}),e(".epCheck:visible").each(function(){e(this).prop("checked",t.checked)})}),e(".seasonCheck").click(function(){var t=this,n=e(t).attr("id");e(".epCheck:visible").each(function(){e(this).attr("id").split("x")[0]===n&&e(this).prop("checked",t.checked)})}),e("input[type=submit]").on("click",function(){var t=[];if(e(".epCheck").each(function(){e(this).prop("checked")&&t.push(e(this).attr("id"))}),0===t.length)return!1;window.location.href=n.srWebRoot+"/home/doRename?show="+e("#showID").attr("value")+"&eps="+t.join("|")})},new_show:{init:function(){var t=e("div.setup-panel div a"),i=e(".setup-content"),a=e(".nextBtn");i.hide(),n.root_dirs.init(),n.home.add_show_options(),n.quality_chooser.init(),e("input:hidden[name=whichSeries]").length&&e("#fullShowPath").length&&(e(".setup-content #step-1").hide(),e(".setup-content #step-2").show()),e("#searchName").click(function(){!0===e("#addShowForm")[0].checkValidity()&&(e("#addShowForm")[0].classList.add("was-validated"),e(".nextBtn").removeClass("disabled"))}),e("#addShowForm").submit(function(){n.home.generate_bwlist()}),t.click(function(n){n.preventDefault();var a=e(e(this).attr("href")),o=e(this);o.hasClass("disabled")||(t.removeClass("btn-success").addClass("btn-dark"),o.removeClass("btn-dark").addClass("btn-success"),i.hide(),a.show(),a.find("input:eq(0)").focus())}),a.click(function(){var t=e(this).closest(".setup-content").attr("id"),i=e('div.setup-panel div a[href="#'+t+'"]').parent().next().children("a"),a=!0,o="";"step-1"==t&&(e("input:radio[name=whichSeries]:checked").length?o=e("input:radio[name=whichSeries]:checked").val().split("|")[4]:e("input:hidden[name=whichSeries]").length&&e("input:hidden[name=whichSeries]").val().length&&(o=e("#providedName").val()),o.length?n.home.update_bwlist(o):a=!1),a&&i.removeClass("disabled").trigger("click")}),e("div.setup-panel div a.btn-success").trigger("click"),e("#searchName").on("click",function(){e("#searchName").prop("disabled",!0),n.home.new_show.searchIndexers(),e("#searchName").prop("disabled",!1)}),e("#skipShowButton").on("click",function(){e("#skipShow").val("1"),e("#addShowForm").submit()}),e("#nameToSearch").focus(),e("#nameToSearch").keypress(function(t){13===(t.keyCode?t.keyCode:t.which)&&(t.preventDefault(),e("#searchName").click())})},searchIndexers:function(){if(e("#nameToSearch").val().length){var t="<b>"+e("#nameToSearch").val().trim()+"</b> on "+e("#providedIndexer option:selected").text()+"<br/>";e("#messages").empty().html('<i id="searchingAnim" class="fas fa-spinner fa-spin fa-fw"></i> searching for '+t),e.ajax({url:n.srWebRoot+"/home/addShows/searchIndexersForShowName",data:{search_term:e("#nameToSearch").val().trim(),lang:e("#indexerLang").val(),indexer:e("#providedIndexer").val()},timeout:1e3*parseInt(e("#indexer_timeout").val(),10),dataType:"json",error:function(){e("#messages").empty().html(f("search timed out, try increasing timeout for indexer"))},success:function(t){var i=!0,a='<legend class="legend">'+f("Search Results:")+"</legend>\n",o="";0===t.results.length?a+="<b>"+f("No results found, try a different search or language.")+"</b>":(e.each(t.results,function(e,s){i?(o=" checked",i=!1):o="";var r=s.join("|");if(a+='<input type="radio" class="pull-left" id="whichSeries" name="whichSeries" value="'+r.replace(/"/g,"")+'"'+o+" "+s[6]+" /> ",a+='<a href="'+n.anonURL+s[2]+s[3]+"&lid="+t.langid+'" onclick="window.open(this.href, \'_blank\'); return false;" ><b>'+s[4]+"</b></a>",null!==s[5]){var l=new Date(s[5]),c=new Date;a+=l>c?f(" (will debut on ")+s[5]+")":f(" (started on ")+s[5]+")"}null!==s[0]&&(a+=" ["+s[0]+"]"),"disabled"==s[6]&&(a+='<div class="d-inline text-danger font-weight-bold">'+f(" already exists in show library")+"</div>"),a+="<br/>"}),a+="</ul>"),a+="<br/>",e("#messages").html(a)}})}}},add_show_options:function(){e("#saveDefaultsButton").on("click",function(){var t=[],i=[];e("#anyQualities option:selected").each(function(n,i){t.push(e(i).val())}),e("#bestQualities option:selected").each(function(t,n){i.push(e(n).val())}),e.get(n.srWebRoot+"/config/general/saveAddShowDefaults",{defaultStatus:e("#statusSelect").val(),anyQualities:t.join(","),bestQualities:i.join(","),defaultFlattenFolders:e("#flatten_folders").prop("checked"),subtitles:e("#subtitles").prop("checked"),anime:e("#anime").prop("checked"),scene:e("#scene").prop("checked"),defaultStatusAfter:e("#statusSelectAfter").val(),skip_downloaded:e("#skip_downloaded").prop("checked")}),e(this).attr("disabled",!0),n.notify("info",f("Saved Defaults"),f('Your "add show" defaults have been set to your current selections.'))}),e("#statusSelect, #qualityPreset, #flatten_folders, #anyQualities, #bestQualities, #subtitles, #scene, #anime, #statusSelectAfter, #skip_downloaded").change(function(){e("#saveDefaultsButton").attr("disabled",!1)})},generate_bwlist:function(){var t=[];e("#white option").each(function(n,i){t[n]=e(i).val()}),e("#whitelist").val(t.join(",")),t=[],e("#black option").each(function(n,i){t[n]=e(i).val()}),e("#blacklist").val(t.join(","))},update_bwlist:function(t){e("#white").children().remove(),e("#black").children().remove(),e("#pool").children().remove(),e("#anime").prop("checked")?(e("#blackwhitelist").show(),t&&e.getJSON(n.srWebRoot+"/home/fetch_releasegroups",{show_name:t},function(t){"success"===t.result&&e.each(t.groups,function(t,n){var i=e("<option>");i.attr("value",n.name),i.html(n.name+" | "+n.rating+" | "+n.range),i.appendTo("#pool")})})):e("#blackwhitelist").hide()}},config:{init:function(){e.backstretch(n.srWebRoot+"/images/backdrops/config.jpg"),e(".backstretch").css("opacity",n.getMeta("sickrage.FANART_BACKGROUND_OPACITY")).fadeIn("500"),e("#configForm").ajaxForm({beforeSubmit:function(){e(".config_submitter .config_submitter_refresh").each(function(){e(this).attr("disabled","disabled"),e(this).after("<span>"+n.loadingHTML+f(" Saving...")+"</span>"),e(this).hide()})},success:function(){setTimeout(function(){e(".config_submitter").each(function(){e(this).removeAttr("disabled"),e(this).next().remove(),e(this).show()}),e(".config_submitter_refresh").each(function(){e(this).removeAttr("disabled"),e(this).next().remove(),e(this).show(),window.location.reload()}),e("#email_show").trigger("notify")},2e3)}}),e("#config-menus a").click(function(t){t.preventDefault(),e(this).tab("show")}),e("ul.nav-pills > li > a").on("shown.bs.tab",function(t){window.location.hash=e(t.target).attr("href").substr(1)}),e('#config-menus a[href="'+window.location.hash+'"]').tab("show"),e("a.resetConfig").confirm({theme:"dark",title:f("Reset Config to Defaults"),content:f("Are you sure you want to reset config to defaults?")})},general:function(){n.root_dirs.init(),0===e("input[name='proxy_setting']").val().length&&(e("input[id='proxy_indexers']").prop("checked",!1),e("label[for='proxy_indexers']").hide()),e("input[name='proxy_setting']").on("input",function(){0===e(this).val().length?(e("input[id='proxy_indexers']").prop("checked",!1),e("label[for='proxy_indexers']").hide()):e("label[for='proxy_indexers']").show()}),e(".viewIf").on("click",function(){e(this).prop("checked")?(e(".hide_if_"+e(this).attr("id")).css("display","none"),e(".show_if_"+e(this).attr("id")).fadeIn("fast","linear")):(e(".show_if_"+e(this).attr("id")).css("display","none"),e(".hide_if_"+e(this).attr("id")).fadeIn("fast","linear"))}),e(".datePresets").on("click",function(){var t=e("#date_presets").val();e(this).prop("checked")&&"%x"===t?(t="%a, %b %d, %Y",e("#date_use_system_default").html("1")):e(this).prop("checked")||"1"!==e("#date_use_system_default").html()||(t="%x"),e("#date_presets").attr("name","date_preset_old"),e("#date_presets").attr("id","date_presets_old"),e("#date_presets_na").attr("name","date_preset"),e("#date_presets_na").attr("id","date_presets"),e("#date_presets_old").attr("name","date_preset_na"),e("#date_presets_old").attr("id","date_presets_na"),t&&e("#date_presets").val(t)}),e("#api_key").on("click",function(){e("#api_key").select()}),e("#generate_new_apikey").on("click",function(){e.get(n.srWebRoot+"/config/general/generateApiKey",function(t){void 0===t.error?e("#api_key").val(t):alert(t.error)})}),e("#syncRemote").click(function(){function t(){e.getJSON(n.srWebRoot+"/googleDrive/getProgress",function(t){e("#current_info").html(t.current_info)}).error(function(){clearInterval(window.progressInterval),e("#current_info").html("Uh oh, something went wrong")})}e.ajax({type:"GET",url:n.srWebRoot+"/googleDrive/syncRemote",beforeSend:function(){window.progressInterval=setInterval(t,100),e("#pleaseWaitDialog").modal()},success:function(){clearInterval(window.progressInterval),e("#pleaseWaitDialog").modal("hide")}})}),e("#pip_path").fileBrowser({title:f("Select path to pip"),key:"pip_path",includeFiles:1}),e("#git_path").fileBrowser({title:f("Select path to git"),key:"git_path",includeFiles:1}),e("#verifyPipPath").click(function(){var t=e.trim(e("#pip_path").val());if(!t)return e("#testPIP-result").html(f("Please fill out the necessary fields above.")),void e("#pip_path").addClass("warning");e("#pip_path").removeClass("warning"),e(this).prop("disabled",!0),e("#testPIP-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/verifyPath",{path:t}).done(function(t){e("#testPIP-result").html(t),e("#verifyPipPath").prop("disabled",!1)})}),e("#verifyGitPath").click(function(){var t=e.trim(e("#git_path").val());if(!t)return e("#testGIT-result").html(f("Please fill out the necessary fields above.")),void e("#git_path").addClass("warning");e("#git_path").removeClass("warning"),e(this).prop("disabled",!0),e("#testGIT-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/verifyPath",{path:t}).done(function(t){e("#testGIT-result").html(t),e("#verifyGitPath").prop("disabled",!1)})}),e("#installRequirements").on("click",function(){window.location.href=n.srWebRoot+"/home/installRequirements"}),e("#branchCheckout").on("click",function(){window.location.href=n.srWebRoot+"/home/branchCheckout?branch="+e("#branchVersion").val()})},subtitles:{init:function(){e.getJSON(n.srWebRoot+"/config/subtitles/wanted_languages",function(e){new d.default({el:document.querySelector("#subtitles_languages"),remote:{url:n.srWebRoot+"/config/subtitles/get_code"},setItems:e,itemName:"subtitles_languages",newitemName:"subtitles_languages_new"})}),e("#subtitles_dir").fileBrowser({title:f("Select Subtitles Download Directory")}),e("#editAService").change(function(){n.config.subtitles.showHideServices()}),e(".service_enabler").on("click",function(){n.config.subtitles.refreshServiceList()}),n.config.subtitles.showHideServices(),e("#service_order_list").sortable({placeholder:"ui-state-highlight",update:function(){n.config.subtitles.refreshServiceList()}}),e("#service_order_list").disableSelection()},showHideServices:function(){e(".serviceDiv").each(function(){var t=e(this).attr("id");e("#editAService :selected").val()+"Div"===t?e(this).show():e(this).hide()})},addService:function(t,i,a,o,s,r){if(null===a.match("/$")&&(a+="/"),0===e("#service_order_list > #"+t).length&&!1!==r){var l='<li class="ui-state-default" id="'+t+'"> <input type="checkbox" id="enable_'+t+'" class="service_enabler" CHECKED> <a href="'+n.anonURL+a+'" class="imgLink" target="_new"><img src="'+n.srWebRoot+'/images/providers/newznab.gif" alt="'+i+'" width="16" height="16"></a> '+i+"</li>";e("#service_order_list").append(l),e("#service_order_list").sortable("refresh")}},deleteService:function(t){e("#service_order_list > #"+t).remove()},refreshServiceList:function(){var t=e("#service_order_list").sortable("toArray"),n=[];e.each(t,function(t,i){var a=+e("#enable_"+i).prop("checked")?"1":"0";n.push(i+":"+a)}),e("#service_order").val(n.join(" "))}},search:{init:function(){e("#nzb_method").change(n.config.search.nzbMethodHandler),e("#torrent_method").change(n.config.search.torrentMethodHandler),n.config.search.nzbMethodHandler(),n.config.search.torrentMethodHandler(),e("#testSABnzbd").click(function(){e("#testSABnzbd_result").html(n.loadingHTML);var t=e("#sab_host").val(),i=e("#sab_username").val(),a=e("#sab_password").val(),o=e("#sab_apikey").val();e.get(n.srWebRoot+"/home/testSABnzbd",{host:t,username:i,password:a,apikey:o},function(t){e("#testSABnzbd_result").html(t)})}),e("#use_torrents").click(function(){n.config.search.toggleTorrentTitle()}),e("#test_torrent").click(function(){e("#test_torrent_result").html(n.loadingHTML);var t=e("#torrent_method :selected").val(),i=e("#torrent_host").val(),a=e("#torrent_username").val(),o=e("#torrent_password").val();e.get(n.srWebRoot+"/home/testTorrent",{torrent_method:t,host:i,username:a,password:o},function(t){e("#test_torrent_result").html(t)})}),n.config.search.rtorrentScgi(),e("#torrent_host").change(n.config.search.rtorrentScgi),e("#nzb_dir").fileBrowser({title:f("Select .nzb blackhole/watch location")}),e("#torrent_dir").fileBrowser({title:f("Select .torrent blackhole/watch location")}),e("#torrent_path").fileBrowser({title:f("Select .torrent download location")})},toggleTorrentTitle:function(){e("#use_torrents").prop("checked")?e("#no_torrents").show():e("#no_torrents").hide()},nzbMethodHandler:function(){e("#blackhole_settings").hide(),e("#sabnzbd_settings").hide(),e("#testSABnzbd").hide(),e("#testSABnzbd_result").hide(),e("#nzbget_settings").hide(),"blackhole"===e("#nzb_method").val().toLowerCase()?e("#blackhole_settings").show():"nzbget"===e("#nzb_method").val().toLowerCase()?e("#nzbget_settings").show():(e("#sabnzbd_settings").show(),e("#testSABnzbd").show(),e("#testSABnzbd_result").show())},torrentMethodHandler:function(){e("#options_torrent_clients").hide(),e("#options_torrent_blackhole").hide();var t=e("#torrent_method").val(),n="",i="#options_torrent_blackhole";e("#torrent_method_icon").removeClass(function(e,t){return(t.match(/(^|\s)add-client-icon-\S+/g)||[]).join(" ")}),e("#torrent_method_icon").addClass("add-client-icon-"+t.replace("_","-")),"blackhole"!==t.toLowerCase()&&(e("#label_warning_deluge").hide(),e("#label_anime_warning_deluge").hide(),e("#host_desc_torrent").show(),e("#torrent_verify_cert_option").hide(),e("#torrent_verify_deluge").hide(),e("#torrent_verify_rtorrent").hide(),e("#torrent_auth_type_option").hide(),e("#torrent_path_option").show(),e("#torrent_path_option").find(".fileBrowser").show(),e("#torrent_seed_time_option").hide(),e("#torrent_high_bandwidth_option").hide(),e("#torrent_label_option").show(),e("#torrent_label_anime_option").show(),e("#path_synology").hide(),e("#torrent_paused_option").show(),e("#torrent_rpcurl_option").hide(),"utorrent"===t.toLowerCase()?(n="uTorrent",e("#torrent_path_option").hide(),e("#torrent_seed_time_label").text(f("Minimum seeding time is")),e("#torrent_seed_time_option").show(),e("#host_desc_torrent").text(f("URL to your uTorrent client (e.g. http://localhost:8000)"))):"transmission"===t.toLowerCase()?(n="Transmission",e("#torrent_seed_time_label").text(f("Stop seeding when inactive for")),e("#torrent_seed_time_option").show(),e("#torrent_high_bandwidth_option").show(),e("#torrent_label_option").hide(),e("#torrent_label_anime_option").hide(),e("#torrent_rpcurl_option").show(),e("#host_desc_torrent").text(f("URL to your Transmission client (e.g. http://localhost:9091)"))):"deluge"===t.toLowerCase()?(n="Deluge",e("#torrent_verify_cert_option").show(),e("#torrent_verify_deluge").show(),e("#torrent_verify_rtorrent").hide(),e("#label_warning_deluge").show(),e("#label_anime_warning_deluge").show(),e("#torrent_username_option").hide(),e("#torrent_username").prop("value",""),e("#host_desc_torrent").text(f("URL to your Deluge client (e.g. http://localhost:8112)"))):"deluged"===t.toLowerCase()?(n="Deluge",e("#torrent_verify_cert_option").hide(),e("#torrent_verify_deluge").hide(),e("#torrent_verify_rtorrent").hide(),e("#label_warning_deluge").show(),e("#label_anime_warning_deluge").show(),e("#torrent_username_option").show(),e("#host_desc_torrent").text(f("IP or Hostname of your Deluge Daemon (e.g. scgi://localhost:58846)"))):"download_station"===t.toLowerCase()?(n="Synology DS",e("#torrent_label_option").hide(),e("#torrent_label_anime_option").hide(),e("#torrent_paused_option").hide(),e("#torrent_path_option").find(".fileBrowser").hide(),e("#host_desc_torrent").text(f("URL to your Synology DS client (e.g. http://localhost:5000)")),e("#path_synology").show()):"rtorrent"===t.toLowerCase()?(n="rTorrent",e("#torrent_paused_option").hide(),e("#host_desc_torrent").html(f("URL to your rTorrent client (e.g. scgi://localhost:5000")+"<br>"+f(" or https://localhost/rutorrent/plugins/httprpc/action.php)")),e("#torrent_verify_cert_option").show(),e("#torrent_verify_deluge").hide(),e("#torrent_verify_rtorrent").show(),e("#torrent_auth_type_option").show()):"qbittorrent"===t.toLowerCase()?(n="qbittorrent",e("#torrent_path_option").hide(),e("#label_warning_qbittorrent").show(),e("#label_anime_warning_qbittorrent").show(),e("#host_desc_torrent").text(f("URL to your qbittorrent client (e.g. http://localhost:8080)"))):"mlnet"===t.toLowerCase()?(n="mlnet",e("#torrent_path_option").hide(),e("#torrent_label_option").hide(),e("#torrent_verify_cert_option").hide(),e("#torrent_verify_deluge").hide(),e("#torrent_verify_rtorrent").hide(),e("#torrent_label_anime_option").hide(),e("#torrent_paused_option").hide(),e("#host_desc_torrent").text(f("URL to your MLDonkey (e.g. http://localhost:4080)"))):"putio"===t.toLowerCase()&&(n="putio",e("#torrent_path_option").hide(),e("#torrent_label_option").hide(),e("#torrent_verify_cert_option").hide(),e("#torrent_verify_deluge").hide(),e("#torrent_verify_rtorrent").hide(),e("#torrent_label_anime_option").hide(),e("#torrent_paused_option").hide(),e("#torrent_host_option").hide(),e("#host_desc_torrent").text(f("URL to your putio client (e.g. http://localhost:8080)"))),e("#host_title").text(n+" host:port"),e("#username_title").text(n+" username"),e("#password_title").text(n+" password"),e("#torrent_client").text(n),e("#rpcurl_title").text(n+" RPC URL"),i="#options_torrent_clients"),e(i).show()},rtorrentScgi:function(){"rtorrent"===e("#torrent_method :selected").val().toLowerCase()&&("scgi://"===e("#torrent_host").val().substr(0,7)?(e("#torrent_username_option").hide(),e("#torrent_username").prop("value",""),e("#torrent_password_option").hide(),e("#torrent_password").prop("value",""),e("#torrent_auth_type_option").hide(),e("#torrent_auth_type option[value=none]").attr("selected","selected")):(e("#torrent_username_option").show(),e("#torrent_password_option").show(),e("#torrent_auth_type_option").show()))}},postprocessing:{init:function(){e("#unpack").on("change",function(){e(this).prop("checked")?n.config.postprocessing.israr_supported():e("#unpack").tooltipster("close")}),e("#name_presets").on("change",function(){n.config.postprocessing.setup_naming()}),e("#name_abd_presets").on("change",function(){n.config.postprocessing.setup_abd_naming()}),e("#naming_custom_abd").on("change",function(){n.config.postprocessing.setup_abd_naming()}),e("#name_sports_presets").on("change",function(){n.config.postprocessing.setup_sports_naming()}),e("#naming_custom_sports").on("change",function(){n.config.postprocessing.setup_sports_naming()}),e("#name_anime_presets").on("change",function(){n.config.postprocessing.setup_anime_naming()}),e("#naming_custom_anime").on("change",function(){n.config.postprocessing.setup_anime_naming()}),e('input[name="naming_anime"]').on("click",function(){n.config.postprocessing.setup_anime_naming()}),e("#naming_multi_ep").change(n.config.postprocessing.fill_examples),e("#naming_pattern").focusout(n.config.postprocessing.fill_examples),e("#naming_pattern").keyup(function(){n.config.postprocessing.typewatch(function(){n.config.postprocessing.fill_examples()},500)}),e("#naming_anime_multi_ep").change(n.config.postprocessing.fill_anime_examples),e("#naming_anime_pattern").focusout(n.config.postprocessing.fill_anime_examples),e("#naming_anime_pattern").keyup(function(){n.config.postprocessing.typewatch(function(){n.config.postprocessing.fill_anime_examples()},500)}),e("#naming_abd_pattern").focusout(n.config.postprocessing.fill_examples),e("#naming_abd_pattern").keyup(function(){n.config.postprocessing.typewatch(function(){n.config.postprocessing.fill_abd_examples()},500)}),e("#naming_sports_pattern").focusout(n.config.postprocessing.fill_examples),e("#naming_sports_pattern").keyup(function(){n.config.postprocessing.typewatch(function(){n.config.postprocessing.fill_sports_examples()},500)}),e("#naming_anime_pattern").focusout(n.config.postprocessing.fill_examples),e("#naming_anime_pattern").keyup(function(){n.config.postprocessing.typewatch(function(){n.config.postprocessing.fill_anime_examples()},500)}),e("#show_naming_key").on("click",function(){e("#naming_key").toggleClass("d-none")}),e("#show_naming_abd_key").on("click",function(){e("#naming_abd_key").toggleClass("d-none")}),e("#show_naming_sports_key").on("click",function(){e("#naming_sports_key").toggleClass("d-none")}),e("#show_naming_anime_key").on("click",function(){e("#naming_anime_key").toggleClass("d-none")}),e("#do_custom").on("click",function(){e("#naming_pattern").val(e("#name_presets :selected").attr("id")),e("#naming_custom").show(),e("#naming_pattern").focus()}),n.config.postprocessing.setup_naming(),n.config.postprocessing.setup_abd_naming(),n.config.postprocessing.setup_sports_naming(),n.config.postprocessing.setup_anime_naming(),e("#metadataType").on("change keyup",function(){n.config.postprocessing.showHideMetadata()}),n.config.postprocessing.showHideMetadata(),e(".metadata_checkbox").on("click",function(){n.config.postprocessing.refreshMetadataConfig(!1)}),n.config.postprocessing.refreshMetadataConfig(!0),e("img[title]").tooltipster({position:{viewport:e(window),at:"bottom center",my:"top right"}}),e("i[title]").tooltipster({position:{viewport:e(window),at:"top center",my:"bottom center"}}),e(".custom-pattern,#unpack").tooltipster("content",f("validating...")),e("#tv_download_dir").fileBrowser({title:f("Select TV Download Directory")}),e("#unpack_dir").fileBrowser({title:f("Select UNPACK Directory")})},typewatch:function(){var e=0;return function(t,n){clearTimeout(e),e=setTimeout(t,n)}},israr_supported:function(){e.get(n.srWebRoot+"/config/postProcessing/isRarSupported",function(t){"supported"!==t&&(e("#unpack").tooltipster("content",f("Unrar Executable not found.")),e("#unpack").tooltipster("open"),e("#unpack").css("background-color","#FFFFDD"))})},fill_examples:function(){var t=e("#naming_pattern").val(),i=e("#naming_multi_ep :selected").val(),a=e('input[name="naming_anime"]:checked').val();e.get(n.srWebRoot+"/config/postProcessing/testNaming",{pattern:t,anime_type:3},function(t){t?(e("#naming_example").text(t+".ext"),e("#naming_example_div").show()):e("#naming_example_div").hide()}),e.get(n.srWebRoot+"/config/postProcessing/testNaming",{pattern:t,multi:i,anime_type:3},function(t){t?(e("#naming_example_multi").text(t+".ext"),e("#naming_example_multi_div").show()):e("#naming_example_multi_div").hide()}),e.get(n.srWebRoot+"/config/postProcessing/isNamingValid",{pattern:t,multi:i,anime_type:a},function(t){"invalid"===t?(e("#naming_pattern").tooltipster("content",f("This pattern is invalid.")),e("#naming_pattern").tooltipster("open"),e("#naming_pattern").css("background-color","#FFDDDD")):"seasonfolders"===t?(e("#naming_pattern").tooltipster("content",f('This pattern would be invalid without the folders, using it will force "Flatten" off for all shows.')),e("#naming_pattern").tooltipster("open"),e("#naming_pattern").css("background-color","#FFFFDD")):(e("#naming_pattern").tooltipster("content",f("This pattern is valid.")),e("#naming_pattern").tooltipster("close"),e("#naming_pattern").css("background-color","#FFFFFF"))})},fill_abd_examples:function(){var t=e("#naming_abd_pattern").val();e.get(n.srWebRoot+"/config/postProcessing/testNaming",{pattern:t,abd:"True"},function(t){t?(e("#naming_abd_example").text(t+".ext"),e("#naming_abd_example_div").show()):e("#naming_abd_example_div").hide()}),e.get(n.srWebRoot+"/config/postProcessing/isNamingValid",{pattern:t,abd:"True"},function(t){"invalid"===t?(e("#naming_abd_pattern").tooltipster("content",f("This pattern is invalid.")),e("#naming_abd_pattern").tooltipster("open"),e("#naming_abd_pattern").css("background-color","#FFDDDD")):"seasonfolders"===t?(e("#naming_abd_pattern").tooltipster("content",f('This pattern would be invalid without the folders, using it will force "Flatten" off for all shows.')),e("#naming_abd_pattern").tooltipster("open"),e("#naming_abd_pattern").css("background-color","#FFFFDD")):(e("#naming_abd_pattern").tooltipster("content",f("This pattern is valid.")),e("#naming_abd_pattern").tooltipster("close"),e("#naming_abd_pattern").css("background-color","#FFFFFF"))})},fill_sports_examples:function(){var t=e("#naming_sports_pattern").val();e.get(n.srWebRoot+"/config/postProcessing/testNaming",{pattern:t,sports:"True"},function(t){t?(e("#naming_sports_example").text(t+".ext"),e("#naming_sports_example_div").show()):e("#naming_sports_example_div").hide()}),e.get(n.srWebRoot+"/config/postProcessing/isNamingValid",{pattern:t,sports:"True"},function(t){"invalid"===t?(e("#naming_sports_pattern").tooltipster("content",f("This pattern is invalid.")),e("#naming_sports_pattern").tooltipster("open"),e("#naming_sports_pattern").css("background-color","#FFDDDD")):"seasonfolders"===t?(e("#naming_sports_pattern").tooltipster("content",f('This pattern would be invalid without the folders, using it will force "Flatten" off for all shows.')),e("#naming_sports_pattern").tooltipster("open"),e("#naming_sports_pattern").css("background-color","#FFFFDD")):(e("#naming_sports_pattern").tooltipster("content",f("This pattern is valid.")),e("#naming_sports_pattern").tooltipster("close"),e("#naming_sports_pattern").css("background-color","#FFFFFF"))})},fill_anime_examples:function(){var t=e("#naming_anime_pattern").val(),i=e("#naming_anime_multi_ep :selected").val(),a=e('input[name="naming_anime"]:checked').val();e.get(n.srWebRoot+"/config/postProcessing/testNaming",{pattern:t,anime_type:a},function(t){t?(e("#naming_example_anime").text(t+".ext"),e("#naming_example_anime_div").show()):e("#naming_example_anime_div").hide()}),e.get(n.srWebRoot+"/config/postProcessing/testNaming",{pattern:t,multi:i,anime_type:a},function(t){t?(e("#naming_example_multi_anime").text(t+".ext"),e("#naming_example_multi_anime_div").show()):e("#naming_example_multi_anime_div").hide()}),e.get(n.srWebRoot+"/config/postProcessing/isNamingValid",{pattern:t,multi:i,anime_type:a},function(t){"invalid"===t?(e("#naming_pattern").tooltipster("content",f("This pattern is invalid.")),e("#naming_pattern").tooltipster("open"),e("#naming_pattern").css("background-color","#FFDDDD")):"seasonfolders"===t?(e("#naming_pattern").tooltipster("content",f('This pattern would be invalid without the folders, using it will force "Flatten" off for all shows.')),e("#naming_pattern").css("background-color","#FFFFDD")):(e("#naming_pattern").tooltipster("content",f("This pattern is valid.")),e("#naming_pattern").tooltipster("close"),e("#naming_pattern").css("background-color","#FFFFFF"))})},setup_naming:function(){"Custom..."===e("#name_presets :selected").val()?e("#naming_custom").show():(e("#naming_custom").hide(),e("#naming_pattern").val(e("#name_presets :selected").attr("id"))),n.config.postprocessing.fill_examples()},setup_abd_naming:function(){"Custom..."===e("#name_abd_presets :selected").val()?e("#naming_abd_custom").show():(e("#naming_abd_custom").hide(),e("#naming_abd_pattern").val(e("#name_abd_presets :selected").attr("id"))),n.config.postprocessing.fill_abd_examples()},setup_sports_naming:function(){"Custom..."===e("#name_sports_presets :selected").val()?e("#naming_sports_custom").show():(e("#naming_sports_custom").hide(),e("#naming_sports_pattern").val(e("#name_sports_presets :selected").attr("id"))),n.config.postprocessing.fill_sports_examples()},setup_anime_naming:function(){"Custom..."===e("#name_anime_presets :selected").val()?e("#naming_anime_custom").show():(e("#naming_anime_custom").hide(),e("#naming_anime_pattern").val(e("#name_anime_presets :selected").attr("id"))),n.config.postprocessing.fill_anime_examples()},showHideMetadata:function(){e(".metadataDiv").each(function(){var t=e(this).attr("id");e("#metadataType :selected").val()===t?e(this).show():e(this).hide()})},refreshMetadataConfig:function(t){var i=0,a="";e(".metadataDiv").each(function(){var t=e(this).attr("id"),n=[],o=e("#"+t+"_show_metadata").prop("checked"),s=e("#"+t+"_episode_metadata").prop("checked"),r=e("#"+t+"_fanart").prop("checked"),l=e("#"+t+"_poster").prop("checked"),c=e("#"+t+"_banner").prop("checked"),d=e("#"+t+"_episode_thumbnails").prop("checked"),u=e("#"+t+"_season_posters").prop("checked"),h=e("#"+t+"_season_banners").prop("checked"),f=e("#"+t+"_season_all_poster").prop("checked"),m=e("#"+t+"_season_all_banner").prop("checked"),p=e("#"+t+"_enabled").prop("checked");n.push(o?"1":"0"),n.push(s?"1":"0"),n.push(r?"1":"0"),n.push(l?"1":"0"),n.push(c?"1":"0"),n.push(d?"1":"0"),n.push(u?"1":"0"),n.push(h?"1":"0"),n.push(f?"1":"0"),n.push(m?"1":"0"),n.push(p?"1":"0");for(var g=0,b=0;b<n.length;b++)g+=parseInt(n[b]);g>i&&(i=g,a=t),e("#"+t+"_eg_show_metadata").attr("class",o?"enabled":"disabled"),e("#"+t+"_eg_episode_metadata").attr("class",s?"enabled":"disabled"),e("#"+t+"_eg_fanart").attr("class",r?"enabled":"disabled"),e("#"+t+"_eg_poster").attr("class",l?"enabled":"disabled"),e("#"+t+"_eg_banner").attr("class",c?"enabled":"disabled"),e("#"+t+"_eg_episode_thumbnails").attr("class",d?"enabled":"disabled"),e("#"+t+"_eg_season_posters").attr("class",u?"enabled":"disabled"),e("#"+t+"_eg_season_banners").attr("class",h?"enabled":"disabled"),e("#"+t+"_eg_season_all_poster").attr("class",f?"enabled":"disabled"),e("#"+t+"_eg_season_all_banner").attr("class",m?"enabled":"disabled"),e("#"+t+"_data").val(n.join("|"))}),""!==a&&t&&(e("#metadataType option[value="+a+"]").attr("selected","selected"),n.config.postprocessing.showHideMetadata())}},notifications:{init:function(){e("#testGrowl").click(function(){var t=e.trim(e("#growl_host").val()),i=e.trim(e("#growl_password").val());if(!t)return e("#testGrowl-result").html(f("Please fill out the necessary fields above.")),void e("#growl_host").addClass("warning");e("#growl_host").removeClass("warning"),e(this).prop("disabled",!0),e("#testGrowl-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testGrowl",{host:t,password:i}).done(function(t){e("#testGrowl-result").html(t),e("#testGrowl").prop("disabled",!1)})}),e("#testProwl").click(function(){var t=e.trim(e("#prowl_api").val()),i=e("#prowl_priority").val();if(!t)return e("#testProwl-result").html(f("Please fill out the necessary fields above.")),void e("#prowl_api").addClass("warning");e("#prowl_api").removeClass("warning"),e(this).prop("disabled",!0),e("#testProwl-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testProwl",{prowl_api:t,prowl_priority:i}).done(function(t){e("#testProwl-result").html(t),e("#testProwl").prop("disabled",!1)})}),e("#testKODI").click(function(){var t=e.trim(e("#kodi_host").val()),i=e.trim(e("#kodi_username").val()),a=e.trim(e("#kodi_password").val());if(!t)return e("#testKODI-result").html(f("Please fill out the necessary fields above.")),void e("#kodi_host").addClass("warning");e("#kodi_host").removeClass("warning"),e(this).prop("disabled",!0),e("#testKODI-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testKODI",{host:t,username:i,password:a}).done(function(t){e("#testKODI-result").html(t),e("#testKODI").prop("disabled",!1)})}),e("#testPMC").click(function(){var t=e.trim(e("#plex_host").val()),i=e.trim(e("#plex_client_username").val()),a=e.trim(e("#plex_client_password").val());if(!t)return e("#testPMC-result").html(f("Please fill out the necessary fields above.")),void e("#plex_host").addClass("warning");e("#plex_host").removeClass("warning"),e(this).prop("disabled",!0),e("#testPMC-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testPMC",{host:t,username:i,password:a}).done(function(t){e("#testPMC-result").html(t),e("#testPMC").prop("disabled",!1)})}),e("#testPMS").click(function(){var t=e.trim(e("#plex_server_host").val()),i=e.trim(e("#plex_username").val()),a=e.trim(e("#plex_password").val()),o=e.trim(e("#plex_server_token").val());if(!t)return e("#testPMS-result").html(f("Please fill out the necessary fields above.")),void e("#plex_server_host").addClass("warning");e("#plex_server_host").removeClass("warning"),e(this).prop("disabled",!0),e("#testPMS-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testPMS",{host:t,username:i,password:a,plex_server_token:o}).done(function(t){e("#testPMS-result").html(t),e("#testPMS").prop("disabled",!1)})}),e("#testEMBY").click(function(){var t=e("#emby_host").val(),i=e("#emby_apikey").val();if(!t||!i)return e("#testEMBY-result").html(f("Please fill out the necessary fields above.")),t?e("#emby_host").removeClass("warning"):e("#emby_host").addClass("warning"),void(i?e("#emby_apikey").removeClass("warning"):e("#emby_apikey").addClass("warning"));e("#emby_host,#emby_apikey").removeClass("warning"),e(this).prop("disabled",!0),e("#testEMBY-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testEMBY",{host:t,emby_apikey:i}).done(function(t){e("#testEMBY-result").html(t),e("#testEMBY").prop("disabled",!1)})}),e("#testBoxcar2").click(function(){var t=e.trim(e("#boxcar2_accesstoken").val());if(!t)return e("#testBoxcar2-result").html(f("Please fill out the necessary fields above.")),void e("#boxcar2_accesstoken").addClass("warning");e("#boxcar2_accesstoken").removeClass("warning"),e(this).prop("disabled",!0),e("#testBoxcar2-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testBoxcar2",{accesstoken:t}).done(function(t){e("#testBoxcar2-result").html(t),e("#testBoxcar2").prop("disabled",!1)})}),e("#testPushover").click(function(){var t=e("#pushover_userkey").val(),i=e("#pushover_apikey").val();if(!t||!i)return e("#testPushover-result").html(f("Please fill out the necessary fields above.")),t?e("#pushover_userkey").removeClass("warning"):e("#pushover_userkey").addClass("warning"),void(i?e("#pushover_apikey").removeClass("warning"):e("#pushover_apikey").addClass("warning"));e("#pushover_userkey,#pushover_apikey").removeClass("warning"),e(this).prop("disabled",!0),e("#testPushover-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testPushover",{userKey:t,apiKey:i}).done(function(t){e("#testPushover-result").html(t),e("#testPushover").prop("disabled",!1)})}),e("#testLibnotify").click(function(){e("#testLibnotify-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testLibnotify",function(t){e("#testLibnotify-result").html(t)})}),e("#twitterStep1").click(function(){e("#testTwitter-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/twitterStep1",function(e){window.open(e)}).done(function(){e("#testTwitter-result").html(f("<b>Step1:</b> Confirm Authorization"))})}),e("#twitterStep2").click(function(){var t=e.trim(e("#twitter_key").val());if(!t)return e("#testTwitter-result").html(f("Please fill out the necessary fields above.")),void e("#twitter_key").addClass("warning");e("#twitter_key").removeClass("warning"),e("#testTwitter-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/twitterStep2",{key:t},function(t){e("#testTwitter-result").html(t)})}),e("#testTwitter").click(function(){e.get(n.srWebRoot+"/home/testTwitter",function(t){e("#testTwitter-result").html(t)})}),e("#testTwilio").on("click",function(){var t=e.trim(e("#twilio_account_sid").val()),i=e.trim(e("#twilio_phone_sid").val()),a=e.trim(e("#twilio_auth_token").val()),o=e.trim(e("#twilio_to_number").val());e(this).prop("disabled",!0),e("#testTwilio-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testTwilio",{account_sid:t,phone_sid:i,auth_token:a,to_number:o}).done(function(t){e("#testTwilio-result").html(t),e("#testTwilio").prop("disabled",!1)})}),e("#testSlack").on("click",function(){e.get(n.srWebRoot+"/home/testSlack",function(t){e("#testSlack-result").html(t)})}),e("#testDiscord").on("click",function(){e.get(n.srWebRoot+"/home/testDiscord",function(t){e("#testDiscord-result").html(t)})}),e("#settingsNMJ").click(function(){if(!e("#nmj_host").val())return alert(f("Please fill in the Popcorn IP address")),void e("#nmj_host").focus();e("#testNMJ-result").html(n.loadingHTML);var t=e("#nmj_host").val();e.get(n.srWebRoot+"/home/settingsNMJ",{host:t},function(t){null===t&&(e("#nmj_database").removeAttr("readonly"),e("#nmj_mount").removeAttr("readonly"));var n=e.parseJSON(t);e("#testNMJ-result").html(n.message),e("#nmj_database").val(n.database),e("#nmj_mount").val(n.mount),n.database?e("#nmj_database").attr("readonly",!0):e("#nmj_database").removeAttr("readonly"),n.mount?e("#nmj_mount").attr("readonly",!0):e("#nmj_mount").removeAttr("readonly")})}),e("#testNMJ").click(function(){var t=e.trim(e("#nmj_host").val()),i=e("#nmj_database").val(),a=e("#nmj_mount").val();if(!t)return e("#testNMJ-result").html(f("Please fill out the necessary fields above.")),void e("#nmj_host").addClass("warning");e("#nmj_host").removeClass("warning"),e(this).prop("disabled",!0),e("#testNMJ-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testNMJ",{host:t,database:i,mount:a}).done(function(t){e("#testNMJ-result").html(t),e("#testNMJ").prop("disabled",!1)})}),e("#settingsNMJv2").click(function(){if(!e("#nmjv2_host").val())return alert(f("Please fill in the Popcorn IP address")),void e("#nmjv2_host").focus();e("#testNMJv2-result").html(n.loadingHTML);for(var t,i=e("#nmjv2_host").val(),a=document.getElementsByName("nmjv2_dbloc"),o=0;o<a.length;o++)if(a[o].checked){t=a[o].value;break}var s=e("#NMJv2db_instance").val();e.get(n.srWebRoot+"/home/settingsNMJv2",{host:i,dbloc:t,instance:s},function(t){null===t&&e("#nmjv2_database").removeAttr("readonly");var n=e.parseJSON(t);e("#testNMJv2-result").html(n.message),e("#nmjv2_database").val(n.database),n.database?e("#nmjv2_database").attr("readonly",!0):e("#nmjv2_database").removeAttr("readonly")})}),e("#testNMJv2").click(function(){var t=e.trim(e("#nmjv2_host").val());if(!t)return e("#testNMJv2-result").html(f("Please fill out the necessary fields above.")),void e("#nmjv2_host").addClass("warning");e("#nmjv2_host").removeClass("warning"),e(this).prop("disabled",!0),e("#testNMJv2-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testNMJv2",{host:t}).done(function(t){e("#testNMJv2-result").html(t),e("#testNMJv2").prop("disabled",!1)})}),e("#testFreeMobile").click(function(){var t=e.trim(e("#freemobile_id").val()),i=e.trim(e("#freemobile_apikey").val());if(!t||!i)return e("#testFreeMobile-result").html(f("Please fill out the necessary fields above.")),t?e("#freemobile_id").removeClass("warning"):e("#freemobile_id").addClass("warning"),void(i?e("#freemobile_apikey").removeClass("warning"):e("#freemobile_apikey").addClass("warning"));e("#freemobile_id,#freemobile_apikey").removeClass("warning"),e(this).prop("disabled",!0),e("#testFreeMobile-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testFreeMobile",{freemobile_id:t,freemobile_apikey:i}).done(function(t){e("#testFreeMobile-result").html(t),e("#testFreeMobile").prop("disabled",!1)})}),e("#testTelegram").on("click",function(){var t={};if(t.id=e.trim(e("#telegram_id").val()),t.apikey=e.trim(e("#telegram_apikey").val()),!t.id||!t.apikey)return e("#testTelegram-result").html(f("Please fill out the necessary fields above.")),t.id?e("#telegram_id").removeClass("warning"):e("#telegram_id").addClass("warning"),void(t.apikey?e("#telegram_apikey").removeClass("warning"):e("#telegram_apikey").addClass("warning"));e("#telegram_id,#telegram_apikey").removeClass("warning"),e(this).prop("disabled",!0),e("#testTelegram-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testTelegram",{telegram_id:t.id,telegram_apikey:t.apikey}).done(function(t){e("#testTelegram-result").html(t),e("#testTelegram").prop("disabled",!1)})}),e("#TraktGetPin").click(function(){window.open(e("#trakt_pin_url").val(),"popUp","toolbar=no, scrollbars=no, resizable=no, top=200, left=200, width=650, height=550"),e("#trakt_pin").removeClass("d-none")}),e("#trakt_pin").on("keyup change",function(){0!==e("#trakt_pin").val().length?(e("#TraktGetPin").addClass("d-none"),e("#authTrakt").removeClass("d-none")):(e("#TraktGetPin").removeClass("d-none"),e("#authTrakt").addClass("d-none"))}),e("#authTrakt").click(function(){0!==e("#trakt_pin").val().length&&e.get(n.srWebRoot+"/home/getTraktToken",{trakt_pin:e("#trakt_pin").val()}).done(function(t){e("#testTrakt-result").html(t),e("#authTrakt").addClass("d-none"),e("#trakt_pin").addClass("d-none"),e("#TraktGetPin").addClass("d-none")})}),e("#testTrakt").click(function(){var t=e.trim(e("#trakt_username").val()),i=e.trim(e("#trakt_blacklist_name").val());return t?/\s/g.test(i)?(e("#testTrakt-result").html(f("Check blacklist name; the value need to be a trakt slug")),void e("#trakt_blacklist_name").addClass("warning")):(e("#trakt_username").removeClass("warning"),e("#trakt_blacklist_name").removeClass("warning"),e(this).prop("disabled",!0),e("#testTrakt-result").html(n.loadingHTML),void e.get(n.srWebRoot+"/home/testTrakt",{username:t,blacklist_name:i}).done(function(t){e("#testTrakt-result").html(t),e("#testTrakt").prop("disabled",!1)})):(e("#testTrakt-result").html(f("Please fill out the necessary fields above.")),void(t?e("#trakt_username").removeClass("warning"):e("#trakt_username").addClass("warning")))}),e("#testEmail").click(function(){var t,i,a,o,s,r,l,c,d;(t=e("#testEmail-result")).html(n.loadingHTML),i=(i=e("#email_host").val()).length>0?i:null,a=(a=e("#email_port").val()).length>0?a:null,o=e("#email_tls").prop("checked"),s=(s=e("#email_from").val()).length>0?s:"root@localhost",r=e("#email_user").val().trim(),l=e("#email_password").val(),c="",null===i&&(c+='<li style="color: red;">'+f("You must specify an SMTP hostname!")+"</li>"),null===a?c+='<li style="color: red;">'+f("You must specify an SMTP port!")+"</li>":(null===a.match(/^\d+$/)||parseInt(a,10)>65535)&&(c+='<li style="color: red;">'+f("SMTP port must be between 0 and 65535!")+"</li>"),c.length>0?(c="<ol>"+c+"</ol>",t.html(c)):null===(d=prompt(f("Enter an email address to send the test to:"),null))||0===d.length||null===d.match(/.*@.*/)?t.html('<p style="color: red;">'+f("You must provide a recipient email address!")+"</p>"):e.get(n.srWebRoot+"/home/testEmail",{host:i,port:a,smtp_from:s,use_tls:o,user:r,pwd:l,to:d},function(t){e("#testEmail-result").html(t)})}),e("#testNMA").click(function(){var t=e.trim(e("#nma_api").val()),i=e("#nma_priority").val();if(!t)return e("#testNMA-result").html(f("Please fill out the necessary fields above.")),void e("#nma_api").addClass("warning");e("#nma_api").removeClass("warning"),e(this).prop("disabled",!0),e("#testNMA-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testNMA",{nma_api:t,nma_priority:i}).done(function(t){e("#testNMA-result").html(t),e("#testNMA").prop("disabled",!1)})}),e("#testPushalot").click(function(){var t=e.trim(e("#pushalot_authorizationtoken").val());if(!t)return e("#testPushalot-result").html(f("Please fill out the necessary fields above.")),void e("#pushalot_authorizationtoken").addClass("warning");e("#pushalot_authorizationtoken").removeClass("warning"),e(this).prop("disabled",!0),e("#testPushalot-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testPushalot",{authorizationToken:t}).done(function(t){e("#testPushalot-result").html(t),e("#testPushalot").prop("disabled",!1)})}),e("#testPushbullet").click(function(){var t=e.trim(e("#pushbullet_api").val());if(!t)return e("#testPushbullet-result").html(f("Please fill out the necessary fields above.")),void e("#pushbullet_api").addClass("warning");e("#pushbullet_api").removeClass("warning"),e(this).prop("disabled",!0),e("#testPushbullet-result").html(n.loadingHTML),e.get(n.srWebRoot+"/home/testPushbullet",{api:t}).done(function(t){e("#testPushbullet-result").html(t),e("#testPushbullet").prop("disabled",!1)})}),e("#getPushbulletDevices").click(function(){n.config.notifications.get_pushbullet_devices(f("Device list updated. Please choose a device to push to."))}),e("#use_pushbullet").prop("checked")&&n.config.notifications.get_pushbullet_devices(),e("#email_show").on("change",function(){var t=parseInt(e("#email_show").val(),10);e.getJSON(n.srWebRoot+"/home/loadShowNotifyLists",function(n){n._size>0&&e("#email_show_list").val(t>=0?n[t.toString()].list:"")})}),e("#prowl_show").on("change",function(){var t=parseInt(e("#prowl_show").val(),10);e.getJSON(n.srWebRoot+"/home/loadShowNotifyLists",function(n){n._size>0&&e("#prowl_show_list").val(t>=0?n[t.toString()].prowl_notify_list:"")})}),n.config.notifications.load_show_notify_lists(),e("#email_show_save").click(function(){e.post(n.srWebRoot+"/home/saveShowNotifyList",{show:e("#email_show").val(),emails:e("#email_show_list").val()},function(){n.config.notifications.load_show_notify_lists()})}),e("#use_plex").click(function(){e(this).is(":checked")?e(".plexinfo").removeClass("d-none"):e(".plexinfo").addClass("d-none")})},get_pushbullet_devices:function(t){t&&e("#testPushbullet-result").html(n.loadingHTML);var i=e("#pushbullet_api").val();if(!i)return e("#testPushbullet-result").html(f("You didn't supply a Pushbullet api key")),e("#pushbullet_api").focus(),!1;e.get(n.srWebRoot+"/home/getPushbulletDevices",{api:i},function(n){var i=e.parseJSON(n).devices,a=e("#pushbullet_device").val();e("#pushbullet_device_list").html("");for(var o=0;o<i.length;o++)!0===i[o].active&&(a===i[o].iden?e("#pushbullet_device_list").append('<option value="'+i[o].iden+'" selected>'+i[o].nickname+"</option>"):e("#pushbullet_device_list").append('<option value="'+i[o].iden+'">'+i[o].nickname+"</option>"));""===a?e("#pushbullet_device_list").prepend('<option value="" selected>All devices</option>'):e("#pushbullet_device_list").prepend('<option value="">All devices</option>'),t&&e("#testPushbullet-result").html(t)}),e("#pushbullet_device_list").change(function(){e("#pushbullet_device").val(e("#pushbullet_device_list").val()),e("#testPushbullet-result").html(f("Don't forget to save your new pushbullet settings."))})},load_show_notify_lists:function(){e.getJSON(n.srWebRoot+"/home/loadShowNotifyLists",function(t){var n,i;if(0!==t._size){var a=[];for(i in t)t.hasOwnProperty(i)&&"_"!==i.charAt(0)&&a.push(t[i]);var o=a.sort(function(e,t){return e.name<t.name?-1:e.name>t.name?1:0});for(i in n='<option value="-1">-- Select --</option>',o)o.hasOwnProperty(i)&&o[i].id&&o[i].name&&(n+='<option value="'+o[i].id+'">'+e("<div/>").text(o[i].name).html()+"</option>");e("#email_show").html(n),e("#email_show_list").val(""),e("#prowl_show").html(n),e("#prowl_show_list").val("")}})}},backup_restore:function(){e("#Backup").click(function(){e("#Backup").attr("disabled",!0),e("#Backup-result").html(n.loadingHTML);var t=e("#backupDir").val();e.get(n.srWebRoot+"/config/backuprestore/backup",{backupDir:t}).done(function(t){e("#Backup-result").html(t),e("#Backup").attr("disabled",!1)})}),e("#Restore").click(function(){e("#Restore").attr("disabled",!0),e("#Restore-result").html(n.loadingHTML),e.get(n.srWebRoot+"/config/backuprestore/restore",{backupFile:e("#backupFile").val(),restore_database:e("#restore_database").prop("checked"),restore_config:e("#restore_config").prop("checked"),restore_cache:e("#restore_cache").prop("checked")}).done(function(t){e("#Restore-result").html(t),e("#Restore").attr("disabled",!1)})}),e("#backupDir").fileBrowser({title:f("Select backup folder to save to"),key:"backupPath"}),e("#backupFile").fileBrowser({title:f("Select backup files to restore"),key:"backupFile",includeFiles:1})},providers:{newznabProviders:[],torrentRssProviders:[],newznabProvidersCapabilities:[],init:function(){e(document).on("change",".newznab_key",function(){var t=e(this).attr("id");t=t.substring(0,t.length-"_key".length);var i=e("#"+t+"_url").val(),a=e("#"+t+"_cat").val(),o=e(this).val();n.config.providers.updateNewznabProvider(t,i,o,a)}),e("#newznab_key,#newznab_url").change(function(){var t=e("#editANewznabProvider :selected").val();if("addNewznab"!==t){var i=e("#newznab_url").val(),a=e("#newznab_key").val(),o=e("#newznab_cat option").map(function(t,n){return e(n).text()}).toArray().join(",");n.config.providers.updateNewznabProvider(t,i,a,o)}}),e("#torrentrss_url,#torrentrss_cookies,#torrentrss_titleTAG").change(function(){var t=e("#editATorrentRssProvider :selected").val();if("addTorrentRss"!==t){var i=e("#torrentrss_url").val(),a=e("#torrentrss_cookies").val(),o=e("#torrentrss_titleTAG").val();n.config.providers.updateTorrentRssProvider(t,i,a,o)}}),e(document).on("change","#editAProvider",function(){n.config.providers.showHideProviders()}),e("#editANewznabProvider").change(function(){n.config.providers.populateNewznabSection()}),e("#editATorrentRssProvider").change(function(){n.config.providers.populateTorrentRssSection()}),e(document).on("click",".provider_enabler",function(){n.config.providers.refreshProviderList()}),e("#newznab_cat_update").click(function(){e("#newznab_cat option").each(function(){e(this).remove()});var t=[];e("#newznab_cap option:selected").each(function(){var n=e(this).val();t.push({text:n,value:n})}),n.config.providers.replaceProviderOptions("#newznab_cat",t);var i=e("#editANewznabProvider :selected").val();if("addNewznab"!==i){var a=e("#newznab_url").val(),o=e("#newznab_key").val(),s=e("#newznab_cat option").map(function(t,n){return e(n).text()}).toArray().join(",");e("#newznab_cat option:not([value])").remove(),n.config.providers.updateNewznabProvider(i,a,o,s)}}),e("#newznab_add").click(function(){var t=e.trim(e("#newznab_name").val()),i=e.trim(e("#newznab_url").val()),a=e.trim(e("#newznab_key").val()),o=e.trim(e("#newznab_cat option").map(function(t,n){return e(n).text()}).toArray().join(","));if(t&&i&&a){var s={name:t};e.getJSON(n.srWebRoot+"/config/providers/canAddNewznabProvider",s,function(e){void 0===e.error?(n.config.providers.addNewznabProvider(e.success,t,i,a,o,"false"),n.config.providers.refreshEditAProvider()):alert(e.error)})}}),e(".newznab_delete").click(function(){var t=e("#editANewznabProvider :selected").val();n.config.providers.deleteNewznabProvider(t)}),e("#torrentrss_add").click(function(){var t=e("#torrentrss_name").val(),i=e("#torrentrss_url").val(),a=e("#torrentrss_cookies").val(),o=e("#torrentrss_titleTAG").val(),s={name:t,url:i,cookies:a,titleTAG:o};e.getJSON(n.srWebRoot+"/config/providers/canAddTorrentRssProvider",s,function(e){void 0===e.error?(n.config.providers.addTorrentRssProvider(e.success,t,i,a,o,"false"),n.config.providers.refreshEditAProvider()):alert(e.error)})}),e(".torrentrss_delete").on("click",function(){n.config.providers.deleteTorrentRssProvider(e("#editATorrentRssProvider :selected").val()),n.config.providers.refreshEditAProvider()}),e(document).on("change","[class='providerDiv_tip'] input",function(){e("div .providerDiv [name="+e(this).attr("name")+"]").replaceWith(e(this).clone()),e("div .providerDiv [newznab_name="+e(this).attr("id")+"]").replaceWith(e(this).clone())}),e(document).on("change","[class='providerDiv_tip'] select",function(){e(this).find("option").each(function(){e(this).is(":selected")?e(this).prop("defaultSelected",!0):e(this).prop("defaultSelected",!1)}),e("div .providerDiv [name="+e(this).attr("name")+"]").empty().replaceWith(e(this).clone())}),e(document).on("change",".seed_option",function(){var t=e(this).attr("id").split("_")[0];n.config.providers.makeTorrentOptionString(t)}),e("#provider_order_list").sortable({placeholder:"ui-state-highlight",update:function(){n.config.providers.refreshProviderList()}}),e("#provider_order_list").disableSelection(),e("#editANewznabProvider").length&&n.config.providers.populateNewznabSection();for(var t=n.getMeta("NEWZNAB_PROVIDERS").split("!!!"),i=0;i<t.length;i++){var a=t[i];a.length>0&&n.config.providers.addNewznabProvider.apply(this,a.split("|"))}for(var o=n.getMeta("TORRENTRSS_PROVIDERS").split("!!!"),s=0;s<o.length;s++){var r=o[s];r.length>0&&n.config.providers.addTorrentRssProvider.apply(this,r.split("|"))}n.config.providers.showHideProviders()},showHideProviders:function(){e(".providerDiv").each(function(){var t=e(this).attr("id");e("#editAProvider :selected").val()+"Div"===t?e(this).show():e(this).hide()})},findProvider:function(e,t){var n=!1;return e.forEach(function(e){e.name===t&&(n=!0)}),n},getNewznabCategories:function(t,i){var a=i[0],o=i[1],s=i[2];if(a&&o&&s){var r={url:o,name:a,key:s};e(".updating_categories").wrapInner("<span>"+n.loadingHTML+" Updating Categories ...</span>"),e.getJSON(n.srWebRoot+"/config/providers/getNewznabCategories",r,function(e){n.config.providers.updateNewznabCaps(e,i)}).always(function(){e(".updating_categories").empty()})}},addNewznabProvider:function(t,i,a,o,s,r,l){(a=e.trim(a))&&(/^https?:\/\//i.test(a)||(a="http://"+a),null===a.match("/$")&&(a+="/"),n.config.providers.newznabProviders[t]=[r,[i,a,o,s]],"true"!==r&&(e("#editANewznabProvider").append(e("<option></option>").attr("value",t).text(i)),n.config.providers.populateNewznabSection()),0===e("#provider_order_list > #"+t).length&&"false"!==l&&(e("#provider_order_list").append('<li class="ui-state-default" id="'+t+'"> <input type="checkbox" id="enable_'+t+'" class="provider_enabler" CHECKED> <a href="'+n.anonURL+a+'" class="imgLink" target="_new"><img src="'+n.srWebRoot+'/images/providers/nzb.png" alt="'+i+'" width="16" height="16"></a> '+i+"</li>"),e("#provider_order_list").sortable("refresh")),n.config.providers.refreshProviderList())},updateNewznabProvider:function(e,t,i,a){n.config.providers.newznabProviders[e][1][1]=t,n.config.providers.newznabProviders[e][1][2]=i,n.config.providers.newznabProviders[e][1][3]=a,n.config.providers.populateNewznabSection(),n.config.providers.refreshProviderList()},deleteNewznabProvider:function(t){e("#editANewznabProvider").removeOption(t),n.config.providers.populateNewznabSection(),e("li").remove("#"+t),delete n.config.providers.newznabProviders[t],n.config.providers.refreshProviderList()},populateNewznabSection:function(){var t=e("#editANewznabProvider :selected").val(),i="",a="",o="";"addNewznab"===t?(i=["","",""],a="false",e("#newznab_add_div").show(),e("#newznab_update_div").hide(),e("#newznab_cat").attr("disabled","disabled"),e("#newznab_cap").attr("disabled","disabled"),e("#newznab_cat_update").attr("disabled","disabled"),e("#newznabcapdiv").hide(),e("#newznab_cat option").each(function(){e(this).remove()}),e("#newznab_cap option").each(function(){e(this).remove()})):(i=n.config.providers.newznabProviders[t][1],a=n.config.providers.newznabProviders[t][0],e("#newznab_add_div").hide(),e("#newznab_update_div").show(),e("#newznab_cat").removeAttr("disabled"),e("#newznab_cap").removeAttr("disabled"),e("#newznab_cat_update").removeAttr("disabled"),e("#newznabcapdiv").show()),e("#newznab_name").val(i[0]),e("#newznab_url").val(i[1]),e("#newznab_key").val(i[2]);var s=[];(o="string"==typeof i[3]?i[3].split(","):i[3])&&(o.forEach(function(e){""!==e&&s.push({text:e,value:e})}),n.config.providers.replaceProviderOptions("#newznab_cat",s)),"addNewznab"===t?(e("#newznab_name").removeAttr("disabled"),e("#newznab_url").removeAttr("disabled")):(e("#newznab_name").attr("disabled","disabled"),"true"===a?(e("#newznab_url").attr("disabled","disabled"),e("#newznab_delete").attr("disabled","disabled")):(e("#newznab_url").removeAttr("disabled"),e("#newznab_delete").removeAttr("disabled"),i[0]&&i[1]&&i[2]&&!n.config.providers.findProvider(n.config.providers.newznabProvidersCapabilities,i[0])&&n.config.providers.getNewznabCategories(a,i),n.config.providers.updateNewznabCaps(null,i)))},updateNewznabCaps:function(e,t){e&&!n.config.providers.findProvider(n.config.providers.newznabProvidersCapabilities,t[0])&&n.config.providers.newznabProvidersCapabilities.push({name:t[0],categories:e.tv_categories}),t[0]&&n.config.providers.newznabProvidersCapabilities.forEach(function(e){if(e.name&&e.name===t[0]&&e.categories instanceof Array){var i=[];e.categories.forEach(function(e){e.id&&e.name&&i.push({value:e.id,text:e.name+"("+e.id+")"})}),n.config.providers.replaceProviderOptions("#newznab_cap",i)}})},addTorrentRssProvider:function(t,i,a,o,s,r,l){n.config.providers.torrentRssProviders[t]=[i,a,o,s],"true"!==r&&(e("#editATorrentRssProvider").append(e("<option></option>").attr("value",t).text(i)),n.config.providers.populateTorrentRssSection()),0===e("#provider_order_list > #"+t).length&&"false"!==l&&(e("#provider_order_list").append('<li class="ui-state-default" id="'+t+'"> <input type="checkbox" id="enable_'+t+'" class="provider_enabler" CHECKED> <a href="'+n.anonURL+a+'" class="imgLink" target="_new"><img src="'+n.srWebRoot+'/images/providers/torrent.png" alt="'+i+'" width="16" height="16"></a> '+i+"</li>"),e("#provider_order_list").sortable("refresh")),n.config.providers.refreshProviderList()},updateTorrentRssProvider:function(e,t,i,a){n.config.providers.torrentRssProviders[e][1]=t,n.config.providers.torrentRssProviders[e][2]=i,n.config.providers.torrentRssProviders[e][3]=a,n.config.providers.populateTorrentRssSection(),n.config.providers.refreshProviderList()},deleteTorrentRssProvider:function(t){e("#editATorrentRssProvider").removeOption(t),n.config.providers.populateTorrentRssSection(),e("li").remove("#"+t),delete n.config.providers.torrentRssProviders[t],n.config.providers.refreshProviderList()},populateTorrentRssSection:function(){var t=e("#editATorrentRssProvider :selected").val(),i="";"addTorrentRss"===t?(i=["","","","title"],e("#torrentrss_add_div").show(),e("#torrentrss_update_div").hide()):(i=n.config.providers.torrentRssProviders[t],e("#torrentrss_add_div").hide(),e("#torrentrss_update_div").show()),e("#torrentrss_name").val(i[0]),e("#torrentrss_url").val(i[1]),e("#torrentrss_cookies").val(i[2]),e("#torrentrss_titleTAG").val(i[3]),"addTorrentRss"===t?(e("#torrentrss_name").removeAttr("disabled"),e("#torrentrss_url").removeAttr("disabled"),e("#torrentrss_cookies").removeAttr("disabled"),e("#torrentrss_titleTAG").removeAttr("disabled")):(e("#torrentrss_name").attr("disabled","disabled"),e("#torrentrss_url").removeAttr("disabled"),e("#torrentrss_cookies").removeAttr("disabled"),e("#torrentrss_titleTAG").removeAttr("disabled"),e("#torrentrss_delete").removeAttr("disabled"))},makeTorrentOptionString:function(t){var n=e(".providerDiv_tip #"+t+"_seed_ratio").prop("value"),i=e(".providerDiv_tip #"+t+"_seed_time").prop("value"),a=e(".providerDiv_tip #"+t+"_process_method").prop("value");e(".providerDiv_tip #"+t+"_option_string").val([n,i,a].join("|"))},refreshProviderList:function(){var t=e("#provider_order_list").sortable("toArray"),i=[],a=[];for(var o in e.each(t,function(t,n){var a=+e("#enable_"+n).prop("checked")?"1":"0";i.push(n+":"+a)}),n.config.providers.newznabProviders)n.config.providers.newznabProviders.hasOwnProperty(o)&&a.push("newznab|"+n.config.providers.newznabProviders[o][1].join("|"));for(var s in n.config.providers.torrentRssProviders)n.config.providers.torrentRssProviders.hasOwnProperty(s)&&a.push("torrentrss|"+n.config.providers.torrentRssProviders[s].join("|"));e("#provider_strings").val(a.join(" ")),e("#provider_order").val(i.join(" ")),n.config.providers.refreshEditAProvider()},refreshEditAProvider:function(){e("#editAProvider").empty();var t=e("#provider_order_list").sortable("toArray"),i=[];if(e.each(t,function(t,n){e("#enable_"+n).prop("checked")&&i.push(n)}),i.length>0){e("<select>").prop("id","editAProvider").addClass("form-control input-sm").appendTo("#provider-list");for(var a=0;a<i.length;a++){var o=i[a];e("#editAProvider").append(e("<option>").prop("value",o).text(e.trim(e("#"+o).text()).replace(/\s\*$/,"").replace(/\s\*\*$/,"")))}}else document.getElementsByClassName("component-desc")[0].innerHTML=f("No providers available to configure.");n.config.providers.showHideProviders()},replaceProviderOptions:function(t,n){e(t).empty(),e.each(n,function(n,i){e(t).append(e("<option></option>").attr("value",i.value).text(i.text))})}}},manage:{init:function(){e.backstretch(n.srWebRoot+"/images/backdrops/manage.jpg"),e(".backstretch").css("opacity",n.getMeta("sickrage.FANART_BACKGROUND_OPACITY")).fadeIn("500")},episode_statuses:function(){e(".allCheck").click(function(){var t=e(this).attr("id").split("-")[1];e("."+t+"-epcheck").prop("checked",e(this).prop("checked"))}),e(".get_more_eps").click(function(){var t=e(this).attr("id"),i=e("#allCheck-"+t).prop("checked"),a=e("tr#"+t),o=e(this).attr("data-clicked"),s=e(this).attr("value");o?"collapse"===s.toLowerCase()?(e("table tr").filter(".show-"+t).hide(),e(this).prop("value","Expand")):"expand"===s.toLowerCase()&&(e("table tr").filter(".show-"+t).show(),e(this).prop("value","Collapse")):(e.getJSON(n.srWebRoot+"/manage/showEpisodeStatuses",{indexer_id:t,whichStatus:e("#oldStatus").val()},function(n){e.each(n,function(n,o){e.each(o,function(o,s){a.after(function(t,n,i,a,o){var s="";return s+=' <tr class="text-dark '+e("#row_class").val()+" show-"+t+'">',s+='  <td align="center"><input type="checkbox" class="'+t+'-epcheck" name="'+t+"-"+n+"x"+i+'"'+(o?" checked":"")+"></td>",s+="  <td>"+n+"x"+i+"</td>",s+='  <td style="width: 100%">'+a+"</td>",s+=" </tr>"}(t,n,o,s,i))})})}),e(this).attr("data-clicked",1),e(this).prop("value","Collapse"))}),e(".selectAllShows").click(function(){e(".allCheck").each(function(){e(this).prop("checked",!0)}),e('input[class*="-epcheck"]').each(function(){e(this).prop("checked",!0)})}),e(".unselectAllShows").click(function(){e(".allCheck").each(function(){e(this).prop("checked",!1)}),e('input[class*="-epcheck"]').each(function(){e(this).prop("checked",!1)})})},mass_update:function(){e("#massUpdateTable:has(tbody tr)").tablesorter({theme:"bootstrap",sortList:[[1,0]],textExtraction:{3:function(t){return e(t).find("span").text().toLowerCase()},4:function(t){return e(t).find("span").text().toLowerCase()},5:function(t){return e(t).find("span").text().toLowerCase()},6:function(t){return e(t).find("span").text().toLowerCase()},7:function(t){return e(t).find("span").text().toLowerCase()},8:function(t){return e(t).find("span").text().toLowerCase()},9:function(t){return e(t).find("span").text().toLowerCase()},10:function(t){return e(t).find("span").text().toLowerCase()}},headers:{0:{sorter:!1},1:{sorter:"showNames"},2:{sorter:"showDirs"},3:{sorter:"quality"},4:{sorter:"sports"},5:{sorter:"scene"},6:{sorter:"anime"},7:{sorter:"flatten_folders"},8:{sorter:"skip_downloaded"},9:{sorter:"paused"},10:{sorter:"subtitle"},11:{sorter:"default_ep_status"},12:{sorter:"status"}}}),e("#submitMassEdit").on("click",function(){var t=[];e(".showCheck:checked").each(function(){t.push(e(this).attr("id"))}),0!==t.length&&(window.location.href="massEdit?toEdit="+t.join("|"))}),e("#submitMassUpdate").on("click",function(){var t=[];e(".showCheck:checked").each(function(){t.push(e(this).attr("id"))}),0!==t.length&&(window.location.href="massUpdate?toUpdate="+t.join("|"))}),e("#submitMassRescan").on("click",function(){var t=[];e(".showCheck:checked").each(function(){t.push(e(this).attr("id"))}),0!==t.length&&(window.location.href="massUpdate?toRefresh="+t.join("|"))}),e("#submitMassRename").on("click",function(){var t=[];e(".showCheck:checked").each(function(){t.push(e(this).attr("id"))}),0!==t.length&&(window.location.href="massUpdate?toRename="+t.join("|"))}),e("#submitMassDelete").on("click",function(){var t=[];e(".showCheck:checked").each(function(){t.push(e(this).attr("id"))}),0!==t.length&&e.confirm({theme:"dark",title:f("Mass Delete"),content:f("You have selected to delete "+t.length+" show(s).  Are you sure you wish to continue? All files will be removed from your system."),buttons:{confirm:function(){window.location.href="massUpdate?toDelete="+t.join("|")},cancel:{action:function(){}}}})}),e("#submitMassRemove").on("click",function(){var t=[];e(".showCheck:checked").each(function(){t.push(e(this).attr("id"))}),0!==t.length&&(window.location.href="massUpdate?toRemove="+t.join("|"))}),e(".bulkCheck").on("click",function(){e(".showCheck:visible").each(function(){e(this).disabled||e(this).prop("checked",!this.checked)})}),e("#checkboxControls input").change(function(){var t=e(this).attr("id"),i=e("#checkboxControls > input, #"+t).prop("checked");n.showHideRows(t,i)}),e("#checkboxControls input").each(function(){var t=e(this).prop("checked");e("tr."+e(this).attr("id")).each(function(){t?e(this).show():e(this).hide()})})},mass_edit:{init:function(){e(".new_root_dir").change(function(){var t=n.manage.mass_edit.findDirIndex(e(this).attr("id"));e("#display_new_root_dir_"+t).html("<b>"+e(this).val()+"</b>")}),e(".edit_root_dir").click(function(){var t=n.manage.mass_edit.findDirIndex(e(this).attr("id")),i=e("#new_root_dir_"+t).val();e(this).nFileBrowser(n.manage.mass_edit.editRootDir,{initialDir:i,whichId:t})}),e(".delete_root_dir").click(function(){var t=n.manage.mass_edit.findDirIndex(e(this).attr("id"));e("#new_root_dir_"+t).val(null),e("#display_new_root_dir_"+t).html("<b>"+f("DELETED")+"</b>")})},findDirIndex:function(e){var t=e.split("_");return t[t.length-1]},editRootDir:function(t,n){e("#new_root_dir_"+n.whichId).val(t),e("#new_root_dir_"+n.whichId).change()}},backlog_overview:function(){e("#pickShow").change(function(){var t=e(this).val();t&&e("html,body").animate({scrollTop:e("#show-"+t).offset().top-25},"slow")})},failed_downloads:function(){e("#failedTable:has(tbody tr)").tablesorter({theme:"bootstrap",sortList:[[0,0]],headers:{3:{sorter:!1}}}),e("#limit").change(function(){window.location.href=n.srWebRoot+"/manage/failedDownloads/?limit="+e(this).val()}),e("#submitMassRemove").on("click",function(){var t=[];if(e(".removeCheck").each(function(){e(this).prop("checked")&&t.push(e(this).attr("id").split("-")[1])}),0===t.length)return!1;window.location.href=n.srWebRoot+"/manage/failedDownloads?toRemove="+t.join("|")}),e(".bulkCheck").on("click",function(){var t=this,n=e(t).attr("id");e("."+n+":visible").each(function(){e(this).prop("checked",t.checked)})}),e(".removeCheck").length&&e(".removeCheck").each(function(t){var n=null;e(t).on("click",function(i){if(n&&i.shiftKey){var a=this,o=0;e(t+":visible").each(function(){if(2===o)return!1;1===o&&(this.checked=n.checked),this!==a&&this!==n||o++})}else n=this})})},subtitles_missed:function(){e(".allCheck").click(function(){var t=e(this).attr("id").split("-")[1];e("."+t+"-epcheck").prop("checked",e(this).prop("checked"))}),e(".get_more_eps").click(function(){var t=e(this).attr("id"),i=e("#allCheck-"+t).prop("checked"),a=e("tr#"+t),o=e(this).attr("data-clicked"),s=e(this).attr("value");o?"Collapse"===s?(e("table tr").filter(".show-"+t).hide(),e(this).prop("value","Expand")):"Expand"===s&&(e("table tr").filter(".show-"+t).show(),e(this).prop("value","Collapse")):(e.getJSON(n.srWebRoot+"/manage/showSubtitleMissed",{indexer_id:t,whichSubs:e("#selectSubLang").val()},function(n){e.each(n,function(n,o){e.each(o,function(e,o){a.after(function(e,t,n,i,a,o){var s="";return s+=' <tr class="good show-'+e+'">',s+='  <td align="center"><input type="checkbox" class="'+e+'-epcheck" name="'+e+"-"+t+"x"+n+'"'+(o=o?" checked":"")+"></td>",s+='  <td style="width: 1%;">'+t+"x"+n+"</td>",s+="  <td>"+i+"</td>",s+=" </tr>"}(t,n,e,o.name,o.subtitles,i))})})}),e(this).attr("data-clicked",1),e(this).prop("value","Collapse"))}),e(".selectAllShows").click(function(){e(".allCheck").each(function(){e(this).prop("checked",!0)}),e('input[class*="-epcheck"]').each(function(){e(this).prop("checked",!0)})}),e(".unselectAllShows").click(function(){e(".allCheck").each(function(){e(this).prop("checked",!1)}),e('input[class*="-epcheck"]').each(function(){e(this).prop("checked",!1)})})}},logs:{init:function(){},view:function(){e("#minLevel,#logFilter,#logSearch").on("change keyup",u.default.debounce(function(){e("#logSearch").val().length>0&&(e('#logFilter option[value="<NONE>"]').prop("selected",!0),e("#minLevel option[value=5]").prop("selected",!0)),e("#minLevel").prop("disabled",!0),e("#logFilter").prop("disabled",!0),document.body.style.cursor="wait";var t=n.srWebRoot+"/logs/viewlog/?minLevel="+e("select[name=minLevel]").val()+"&logFilter="+e("select[name=logFilter]").val()+"&logSearch="+e("#logSearch").val();e.get(t,function(n){history.pushState("data","",t);var i=e(n).find("#loglines");e("#loglines").html(i.html()).data("cursor",i.data("cursor")),e("#minLevel").prop("disabled",!1),e("#logFilter").prop("disabled",!1),document.body.style.cursor="default"})},500)),setInterval(function(){document.hidden||e("#minLevel").prop("disabled")||e.getJSON(n.srWebRoot+"/logs/tail/",{cursor:e("#loglines").data("cursor"),minLevel:e("select[name=minLevel]").val(),logFilter:e("select[name=logFilter]").val(),logSearch:e("#logSearch").val()},function(t){e("#loglines").data("cursor",t.cursor),t.logLines.length>0&&e("#loglines").prepend(document.createTextNode(t.logLines+"\n"))})},5e3)}}};({init:function(){var t=document.body,n=t.getAttribute("data-controller"),i=t.getAttribute("data-action");this.exec("common"),this.exec(n),this.exec(n,i),e(".loading-spinner").hide(),e(".main-container").removeClass("d-none")},exec:function(e,i){i=void 0===i?"init":i,""!==e&&n[e]&&n[e][i]&&{object:n[e][i].init,function:n[e][i]}[t(n[e][i])]()}}).init()})}).call(this,n(0))},,function(e,t,n){},,function(e,t,n){},,function(e,t,n){},,function(e,t,n){},,function(e,t,n){},,function(e,t,n){},,,,,,,,,,,,,,,,,,,,,,,,,,,,,,,function(e,t,n){},function(e,t,n){"use strict";n(176),n(145),n(143),n(141),n(139),n(137),n(135),n(133)}]);
\ No newline at end of file
@@ -33,14 +33,11 @@ import dateutil.tz
 import markdown2
 import tornado.locale
 from CodernityDB.database import RecordNotFound
-from concurrent.futures import ThreadPoolExecutor
 from mako.exceptions import RichTraceback
-from mako.lookup import TemplateLookup
 from requests import HTTPError
 from tornado.concurrent import run_on_executor
 from tornado.escape import json_encode, recursive_unicode
 from tornado.gen import coroutine
-from tornado.process import cpu_count
 from tornado.web import RequestHandler, authenticated
 
 import sickrage
@@ -59,7 +56,7 @@ from sickrage.core.exceptions import CantRefreshShowException, \
     CantUpdateShowException, EpisodeDeletedException, \
     NoNFOException, CantRemoveShowException
 from sickrage.core.helpers import argToBool, backupSR, chmodAsParent, findCertainShow, generateApiKey, \
-    getDiskSpaceUsage, makeDir, readFileBuffered, \
+    getDiskSpaceUsage, makeDir, \
     remove_article, restoreConfigZip, \
     sanitizeFileName, clean_url, try_int, torrent_webui_url, checkbox_to_value, clean_host, \
     clean_hosts, app_statistics
@@ -67,6 +64,7 @@ from sickrage.core.helpers.browser import foldersAtPath
 from sickrage.core.helpers.compat import cmp
 from sickrage.core.helpers.srdatetime import srDateTime
 from sickrage.core.imdb_popular import imdbPopular
+from sickrage.core.logindex import LogQuery
 from sickrage.core.nameparser import validator
 from sickrage.core.queues.search import BacklogQueueItem, FailedQueueItem, \
     MANUAL_SEARCH_HISTORY, ManualSearchQueueItem
@@ -89,21 +87,10 @@ from sickrage.providers import NewznabProvider, TorrentRssProvider
 class BaseHandler(RequestHandler):
     def __init__(self, application, request, **kwargs):
         super(BaseHandler, self).__init__(application, request, **kwargs)
-        self.executor = ThreadPoolExecutor(cpu_count())
+        self.executor = sickrage.app.wserver.executor
+        self.mako_lookup = sickrage.app.wserver.mako_lookup
         self.startTime = time.time()
 
-        # template settings
-        self.mako_lookup = TemplateLookup(
-            directories=[sickrage.app.config.gui_views_dir],
-            module_directory=os.path.join(sickrage.app.cache_dir, 'mako'),
-            filesystem_checks=True,
-            strict_undefined=True,
-            input_encoding='utf-8',
-            output_encoding='utf-8',
-            encoding_errors='replace',
-            future_imports=['unicode_literals']
-        )
-
     def get_user_locale(self):
         return tornado.locale.get(sickrage.app.config.gui_lang)
 
@@ -2006,13 +1993,8 @@ class Home(WebHandler):
             episodes += getEpisodes(searchThread, searchstatus)
 
         # Running Searches
-        searchstatus = 'searching'
-        if sickrage.app.search_queue.is_manualsearch_in_progress():
-            searchThread = sickrage.app.search_queue.currentItem
-
-            if searchThread.success:
-                searchstatus = 'finished'
-
+        for searchThread in sickrage.app.search_queue.get_running_manual_searches():
+            searchstatus = ('searching', 'finished')[bool(searchThread.success)]
             episodes += getEpisodes(searchThread, searchstatus)
 
         # Finished Searches
@@ -3937,7 +3919,8 @@ class ConfigSearch(Config):
                    nzbget_host=None, nzbget_use_https=None, backlog_frequency=None,
                    dailysearch_frequency=None, nzb_method=None, torrent_method=None, usenet_retention=None,
                    download_propers=None, check_propers_interval=None, allow_high_priority=None, sab_forced=None,
-                   randomize_providers=None, use_failed_snatcher=None, failed_snatch_age=None,
+                   randomize_providers=None, concurrent_provider_search=None, provider_search_workers=None,
+                   provider_search_timeout=None, use_failed_snatcher=None, failed_snatch_age=None,
                    torrent_dir=None, torrent_username=None, torrent_password=None, torrent_host=None,
                    torrent_label=None, torrent_label_anime=None, torrent_path=None, torrent_verify_cert=None,
                    torrent_seed_time=None, torrent_paused=None, torrent_high_bandwidth=None,
@@ -3966,6 +3949,9 @@ class ConfigSearch(Config):
         sickrage.app.config.require_words = require_words if require_words else ""
         sickrage.app.config.ignored_subs_list = ignored_subs_list if ignored_subs_list else ""
         sickrage.app.config.randomize_providers = checkbox_to_value(randomize_providers)
+        sickrage.app.config.concurrent_provider_search = checkbox_to_value(concurrent_provider_search)
+        sickrage.app.config.provider_search_workers = max(try_int(provider_search_workers, 4), 1)
+        sickrage.app.config.provider_search_timeout = max(try_int(provider_search_timeout, 60), 1)
         sickrage.app.config.enable_rss_cache = checkbox_to_value(enable_rss_cache)
         sickrage.app.config.enable_rss_cache_valid_shows = checkbox_to_value(enable_rss_cache_valid_shows)
         sickrage.app.config.torrent_file_to_magnet = checkbox_to_value(torrent_file_to_magnet)
@@ -4919,38 +4905,16 @@ class Logs(WebHandler):
 
         minLevel = minLevel or sickrage.app.log.INFO
 
-        logFiles = [sickrage.app.log.logFile] + \
-                   ["{}.{}".format(sickrage.app.log.logFile, x) for x in
-                    xrange(int(sickrage.app.log.logNr))]
-
-        levelsFiltered = b'|'.join(
-            [x for x in sickrage.app.log.logLevels.keys() if
-             sickrage.app.log.logLevels[x] >= int(minLevel)])
-
-        logRegex = re.compile(
-            r"(?P<entry>^\d+\-\d+\-\d+\s+\d+\:\d+\:\d+\s+(?:{})[\s\S]+?(?:{})[\s\S]+?$)".format(levelsFiltered,
-                                                                                                logFilter),
-            re.S + re.M)
-
-        data = []
-        try:
-            for logFile in [x for x in logFiles if os.path.isfile(x)]:
-                data += list(reversed(re.findall("((?:^.+?{}.+?$))".format(logSearch),
-                                                 "\n".join(next(readFileBuffered(logFile, reverse=True)).splitlines()),
-                                                 re.M + re.I)))
-                maxLines -= len(data)
-                if len(data) == maxLines:
-                    raise StopIteration
-
-        except StopIteration:
-            pass
+        logQuery = LogQuery(sickrage.app.log.logFile, sickrage.app.log.logNr)
+        logCursor = logQuery.cursor()
 
         return self.render(
             "/logs/view.mako",
             header="Log File",
             title="Logs",
             topmenu="system",
-            logLines="\n".join(logRegex.findall("\n".join(data))),
+            logLines="\n".join(logQuery.query(minLevel, logFilter, logSearch, maxLines)),
+            logCursor=logCursor,
             minLevel=int(minLevel),
             logNameFilters=logNameFilters,
             logFilter=logFilter,
@@ -4959,6 +4923,15 @@ class Logs(WebHandler):
             action='view'
         )
 
+    def tail(self, cursor='', minLevel=None, logFilter='', logSearch='', maxLines=500):
+        minLevel = minLevel or sickrage.app.log.INFO
+
+        logLines, cursor = LogQuery(sickrage.app.log.logFile, sickrage.app.log.logNr).tail(
+            cursor, minLevel, logFilter, logSearch, maxLines)
+
+        self.set_header('Content-Type', 'application/json')
+        return json_encode({'cursor': cursor, 'logLines': "\n".join(logLines)})
+
     def submit_errors(self):
         # submitter_result, issue_id = logging.submit_errors()
         # LOGGER.warning(submitter_result, [issue_id is None])
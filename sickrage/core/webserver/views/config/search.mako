@@ -33,6 +33,56 @@
                         </label>
                     </div>
                 </div>
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('Concurrent provider search')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <label for="concurrent_provider_search">
+                            <input type="checkbox" class="enabler toggle color-primary is-material" name="concurrent_provider_search" id="concurrent_provider_search"
+                                   ${('', 'checked')[bool(sickrage.app.config.concurrent_provider_search)]}/>
+                            ${_('search all providers at the same time instead of one after another')}
+                        </label>
+                    </div>
+                </div>
+                <div id="content_concurrent_provider_search">
+                    <div class="form-row form-group">
+                        <div class="col-lg-3 col-md-4 col-sm-5">
+                            <label class="component-title">${_('Provider search workers')}</label>
+                        </div>
+                        <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                            <input name="provider_search_workers"
+                                   id="provider_search_workers"
+                                   value="${sickrage.app.config.provider_search_workers}"
+                                   title="number of providers searched at the same time"
+                                   class="form-control"/>
+                        </div>
+                    </div>
+                    <div class="form-row form-group">
+                        <div class="col-lg-3 col-md-4 col-sm-5">
+                            <label class="component-title">${_('Provider search timeout')}</label>
+                        </div>
+                        <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                            <div class="input-group">
+                                <div class="input-group-prepend">
+                                    <span class="input-group-text">
+                                        <span class="fas fa-clock"></span>
+                                    </span>
+                                </div>
+                                <input name="provider_search_timeout"
+                                       id="provider_search_timeout"
+                                       value="${sickrage.app.config.provider_search_timeout}"
+                                       title="time allowed for each provider to return its results"
+                                       class="form-control"/>
+                                <div class="input-group-append">
+                                    <span class="input-group-text">
+                                        secs
+                                    </span>
+                                </div>
+                            </div>
+                        </div>
+                    </div>
+                </div>
                 <div class="form-row form-group">
                     <div class="col-lg-3 col-md-4 col-sm-5">
                         <label class="component-title">${_('Download propers')}</label>
@@ -37,7 +37,7 @@
                 </div>
                 <div class="card-body">
                     <div class="text-left" style="white-space: pre-line;">
-                        <div id="loglines">${logLines}</div>
+                        <div id="loglines" data-cursor="${logCursor}">${logLines}</div>
                     </div>
                 </div>
             </div>
@@ -19,17 +19,27 @@
 from __future__ import unicode_literals
 
 import io
+import os
 import ssl
+import threading
+import time
 import urllib2
+import urlparse
+from collections import OrderedDict
+from contextlib import contextmanager
 
 import certifi
 import cfscrape
 import requests
 from cachecontrol import CacheControlAdapter
+from cachecontrol.cache import BaseCache
+from cachecontrol.caches import FileCache
 from fake_useragent import UserAgent
 from requests import Session
+from requests.adapters import HTTPAdapter
 from requests.utils import dict_from_cookiejar
 from urllib3 import disable_warnings
+from urllib3.util.retry import Retry
 
 import sickrage
 from sickrage.core.helpers import chmodAsParent, remove_file_failed
@@ -45,15 +55,136 @@ def _add_proxies():
         return {"http": address, "https": address}
 
 
+class MemoryCache(BaseCache):
+    """
+    Thread-safe in-memory HTTP cache that drops the least recently used responses once full.
+    """
+
+    def __init__(self, max_entries=500):
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.data = OrderedDict()
+
+    def get(self, key):
+        with self.lock:
+            value = self.data.pop(key, None)
+            if value is not None:
+                self.data[key] = value
+            return value
+
+    def set(self, key, value):
+        with self.lock:
+            self.data.pop(key, None)
+            self.data[key] = value
+            while len(self.data) > self.max_entries:
+                self.data.popitem(last=False)
+
+    def delete(self, key):
+        with self.lock:
+            self.data.pop(key, None)
+
+
+class WebSessionManager(object):
+    """
+    Process-wide store of connection pools, one keep-alive adapter per scheme and host.
+
+    Every :class:`WebSession` borrows its adapters from here, so consecutive requests to the same host reuse open
+    connections instead of paying for a new TCP/TLS handshake each time.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.adapters = {}
+        self._cache = None
+
+    @property
+    def cache(self):
+        if self._cache is None:
+            cache_dir = sickrage.app.cache_dir
+            if sickrage.app.config.web_disk_cache and cache_dir:
+                self._cache = FileCache(os.path.join(cache_dir, 'http_cache'))
+            else:
+                self._cache = MemoryCache()
+        return self._cache
+
+    @staticmethod
+    def _retries():
+        return Retry(total=max(sickrage.app.config.web_max_retries, 0),
+                     backoff_factor=sickrage.app.config.web_retry_backoff,
+                     status_forcelist=(500, 502, 504),
+                     raise_on_status=False)
+
+    def _new_adapter(self, cache):
+        kwargs = dict(pool_connections=max(sickrage.app.config.web_pool_connections, 1),
+                      pool_maxsize=max(sickrage.app.config.web_pool_maxsize, 1),
+                      max_retries=self._retries())
+
+        if cache:
+            return CacheControlAdapter(cache=self.cache, **kwargs)
+        return HTTPAdapter(**kwargs)
+
+    def get_adapter(self, url, cache=True):
+        """
+        Returns the shared adapter for the host of url, creating it on first use.
+
+        :param url: request url
+        :param cache: use the caching adapter for this host
+        :return: adapter or None if url is not a http(s) url
+        """
+        parsed = urlparse.urlsplit(url)
+        scheme = parsed.scheme.lower()
+        if scheme not in ('http', 'https'):
+            return None
+
+        key = (scheme, parsed.netloc.lower(), bool(cache))
+
+        adapter = self.adapters.get(key)
+        if adapter is None:
+            with self.lock:
+                adapter = self.adapters.get(key)
+                if adapter is None:
+                    adapter = self.adapters[key] = self._new_adapter(cache)
+
+        return adapter
+
+    def clear(self):
+        """
+        Closes all pooled connections, new adapters pick up the current config on next use.
+        """
+        with self.lock:
+            adapters, self.adapters = self.adapters, {}
+            self._cache = None
+
+        for adapter in adapters.values():
+            adapter.close()
+
+
+session_manager = WebSessionManager()
+
+_deadlines = threading.local()
+
+
+@contextmanager
+def deadline(seconds):
+    """
+    Limits the requests made by the current thread to a total of seconds, the timeout of every request is cut to the
+    time left and requests made after the deadline fail with a Timeout.
+
+    :param seconds: time allowed for all requests inside the with block
+    """
+    _deadlines.time = time.time() + seconds
+    try:
+        yield
+    finally:
+        _deadlines.time = None
+
+
 class WebSession(Session):
     def __init__(self, proxies=None, cache=True):
         super(WebSession, self).__init__()
 
-        # setup caching adapter
-        if cache:
-            adapter = CacheControlAdapter()
-            self.mount('http://', adapter)
-            self.mount('https://', adapter)
+        # use shared connection pools, with caching adapters when enabled
+        self.cache = cache
 
         # add proxies
         self.proxies = proxies or _add_proxies()
@@ -71,12 +202,22 @@ class WebSession(Session):
         """
         return certifi.where() if all([sickrage.app.config.ssl_verify, verify]) else False
 
+    def get_adapter(self, url):
+        return session_manager.get_adapter(url, self.cache) or super(WebSession, self).get_adapter(url)
+
     def request(self, method, url, verify=False, random_ua=False, *args, **kwargs):
         self.headers.update({'Accept-Encoding': 'gzip, deflate',
-                             'User-Agent': (sickrage.app.user_agent, UserAgent().random)[random_ua]})
+                             'User-Agent': UserAgent().random if random_ua else sickrage.app.user_agent})
 
         if not verify: disable_warnings()
 
+        deadline_time = getattr(_deadlines, 'time', None)
+        if deadline_time is not None:
+            remaining = deadline_time - time.time()
+            if remaining <= 0:
+                raise requests.exceptions.Timeout("Deadline passed before requesting url: '{}'".format(url))
+            kwargs['timeout'] = min(kwargs.get('timeout') or remaining, remaining)
+
         response = super(WebSession, self).request(method, url, verify=self._get_ssl_cert(verify), *args, **kwargs)
 
         try:
@@ -20,6 +20,7 @@ from __future__ import print_function, unicode_literals
 
 import functools
 import json
+import os
 import re
 import time
 import urlparse
@@ -28,12 +29,14 @@ from collections import OrderedDict
 from datetime import datetime
 from operator import itemgetter
 
+from concurrent.futures import ThreadPoolExecutor
 from requests import RequestException
 from simplejson import JSONDecodeError
 from six import text_type
 
 import sickrage
 from sickrage.core.websession import WebSession
+from sickrage.indexers.thetvdb.cache import ResponseCache
 
 try:
     import gzip
@@ -420,20 +423,52 @@ class Tvdb:
         finally:
             return result
 
-    def _request(self, method, url, lang=None, **kwargs):
-        self.config['headers'].update({'Content-type': 'application/json'})
-        self.config['headers']['Authorization'] = 'Bearer {}'.format(self.jwt_token)
-        self.config['headers'].update({'Accept-Language': lang or self.config['language']})
+    @property
+    def cache(self):
+        if not getattr(self, '_cache', None):
+            self._cache = ResponseCache(os.path.join(sickrage.app.cache_dir, 'indexers', 'thetvdb'))
+        return self._cache
+
+    def _request(self, method, url, lang=None, cache_id=None, **kwargs):
+        """
+        :param cache_id: series id to keep the response on disk under, cached responses are served without a
+                         request when the cache is enabled and nothing changed since, otherwise revalidated
+        """
+
+        lang = lang or self.config['language']
+
+        # headers are built per request, episode pages are fetched from several threads at once
+        headers = self.config['headers'].copy()
+        headers.update({'Content-type': 'application/json',
+                        'Authorization': 'Bearer {}'.format(self.jwt_token),
+                        'Accept-Language': lang})
+
+        entry = None
+        if cache_id:
+            entry = self.cache.get(cache_id, url, kwargs.get('params'), lang)
+            if entry:
+                if self.config['cache_enabled'] and self.cache.is_fresh(cache_id, entry):
+                    return to_lowercase(entry['body'])
+
+                if entry['etag']:
+                    headers['If-None-Match'] = entry['etag']
+                if entry['last_modified']:
+                    headers['If-Modified-Since'] = entry['last_modified']
 
         # get response from theTVDB
         try:
-            resp = WebSession(cache=self.config['cache_enabled']).request(
-                method, urlparse.urljoin(self.config['api']['base'], url), headers=self.config['headers'],
+            resp = WebSession(cache=self.config['cache_enabled'] and not cache_id).request(
+                method, urlparse.urljoin(self.config['api']['base'], url), headers=headers,
                 timeout=sickrage.app.config.indexer_timeout, **kwargs
             )
         except Exception as e:
             raise tvdb_error(str(e))
 
+        # cached response is still current
+        if entry and resp.status_code == 304:
+            self.cache.touch(cache_id, url, kwargs.get('params'), lang, entry)
+            return to_lowercase(entry['body'])
+
         # handle requests exceptions
         try:
             if resp.status_code == 401:
@@ -446,7 +481,16 @@ class Tvdb:
             except RequestException as e:
                 raise tvdb_error(str(e))
 
-        return to_lowercase(resp.json())
+        data = resp.json()
+
+        if cache_id:
+            try:
+                self.cache.set(cache_id, url, kwargs.get('params'), lang, data, resp.headers.get('ETag'),
+                               resp.headers.get('Last-Modified'))
+            except (IOError, OSError) as e:
+                sickrage.app.log.debug('[{}]: Unable to cache response for {}: {}'.format(cache_id, url, e))
+
+        return to_lowercase(data)
 
     def _setItem(self, sid, seas, ep, attrib, value):
         """Creates a new episode, creating Show(), Season() and
@@ -524,6 +568,61 @@ class Tvdb:
 
         return ui.selectSeries(allSeries, series)
 
+    def _getEpisodePage(self, sid, page, lang=None):
+        start_time = time.time()
+
+        r = self._request('get', self.config['api']['episodes'].format(id=sid), lang=lang, cache_id=sid,
+                          params={'page': page})
+
+        sickrage.app.log.debug('[{}]: Episode page {} ({}) took {:.2f}s'.format(
+            sid, page, lang or self.config['language'], time.time() - start_time))
+
+        return r
+
+    def _getEpisodePages(self, sid):
+        """Yields the episode list of every page of a series in page order,
+        translated to the configured language when it isn't english.
+
+        The first page tells how many pages there are, the rest of them and
+        all translations are then fetched on indexer_workers threads.
+        """
+
+        translate = not self.config['language'] == self.config['api']['lang']
+
+        first_page = self._getEpisodePage(sid, 1, self.config['api']['lang'])
+        pages = first_page['links']['last'] or 1
+
+        executor = ThreadPoolExecutor(max(sickrage.app.config.indexer_workers, 1))
+
+        jobs = {}
+        try:
+            for page in range(1, pages + 1):
+                if page > 1:
+                    jobs[page, self.config['api']['lang']] = executor.submit(
+                        self._getEpisodePage, sid, page, self.config['api']['lang'])
+                if translate:
+                    jobs[page, None] = executor.submit(self._getEpisodePage, sid, page)
+
+            for page in range(1, pages + 1):
+                episode_info = (jobs[page, self.config['api']['lang']].result() if page > 1 else first_page)['data']
+
+                # translate if required to provided language
+                if translate:
+                    try:
+                        intl_episode_info = jobs[page, None].result()
+                    except tvdb_error:
+                        break
+
+                    for i, x in enumerate(episode_info):
+                        x.update((k, v) for k, v in intl_episode_info['data'][i].iteritems() if v)
+                        episode_info[i] = x
+
+                yield episode_info
+        finally:
+            for job in jobs.values():
+                job.cancel()
+            executor.shutdown(wait=False)
+
     @login_required
     def _getShowData(self, sid):
         """Takes a series ID, gets the episodes URL and parses the TVDB
@@ -538,13 +637,15 @@ class Tvdb:
             # get series info in english
             series_info = self._request('get',
                                         self.config['api']['series'].format(id=sid),
-                                        lang=self.config['api']['lang']
+                                        lang=self.config['api']['lang'],
+                                        cache_id=sid
                                         )['data']
 
             # translate if required to provided language
             if not self.config['language'] == self.config['api']['lang']:
                 series_info.update((k, v) for k, v in self._request('get',
-                                                                    self.config['api']['series'].format(id=sid)
+                                                                    self.config['api']['series'].format(id=sid),
+                                                                    cache_id=sid
                                                                     )['data'].iteritems() if v)
         except Exception:
             sickrage.app.log.debug("[{}]: Series result returned zero".format(sid))
@@ -565,36 +666,13 @@ class Tvdb:
         # Parse episode data
         sickrage.app.log.debug('Getting all episode data for {}'.format(sid))
 
-        episodes = []
-        page = pages = 1
-
-        while True:
-            if page > pages:
-                break
-
-            r = self._request('get', self.config['api']['episodes'].format(id=sid),
-                              lang=self.config['api']['lang'],
-                              params={'page': page})
+        start_time = time.time()
 
-            pages = r['links']['last']
-
-            try:
-                episode_info = r['data']
-
-                # translate if required to provided language
-                if not self.config['language'] == self.config['api']['lang']:
-                    intl_episode_info = self._request('get', self.config['api']['episodes'].format(id=sid),
-                                                      params={'page': page})
-
-                    for i, x in enumerate(episode_info):
-                        x.update((k, v) for k, v in intl_episode_info['data'][i].iteritems() if v)
-                        episode_info[i] = x
-
-                episodes += episode_info
+        episodes = []
+        for episode_info in self._getEpisodePages(sid):
+            episodes += episode_info
 
-                page += 1
-            except tvdb_error:
-                break
+        sickrage.app.log.debug('[{}]: Got {} episodes in {:.2f}s'.format(sid, len(episodes), time.time() - start_time))
 
         if not len(episodes):
             sickrage.app.log.debug('Series results incomplete')
@@ -647,10 +725,10 @@ class Tvdb:
         try:
             if not season:
                 images = self._request('get', self.config['api']['images'][key_type].format(id=sid),
-                                       self.config['api']['lang'])['data']
+                                       self.config['api']['lang'], cache_id=sid)['data']
             else:
                 images = self._request('get', self.config['api']['images'][key_type].format(id=sid, season=season),
-                                       self.config['api']['lang'])['data']
+                                       self.config['api']['lang'], cache_id=sid)['data']
         except tvdb_error:
             return []
 
@@ -671,7 +749,7 @@ class Tvdb:
         cur_actors = Actors()
 
         try:
-            for cur_actor in self._request('get', self.config['api']['actors'].format(id=sid))['data']:
+            for cur_actor in self._request('get', self.config['api']['actors'].format(id=sid), cache_id=sid)['data']:
                 curActor = Actor()
                 for k, v in cur_actor.items():
                     if not all([k, v]): continue
@@ -686,7 +764,14 @@ class Tvdb:
 
     @login_required
     def updated(self, fromTime):
-        return self._request('get', self.config['api']['updated'].format(time=fromTime))['data']
+        updates = self._request('get', self.config['api']['updated'].format(time=fromTime))['data'] or []
+
+        # revalidate what we have of the changed shows on their next request
+        self.cache.invalidate(dict((x['id'], x['lastupdated']) for x in updates))
+        for x in updates:
+            self.shows.pop(x['id'], None)
+
+        return updates
 
     @property
     def languages(self):
@@ -0,0 +1,129 @@
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import hashlib
+import io
+import json
+import os
+import shutil
+import threading
+import time
+
+# responses older than this are revalidated even when theTVDB hasn't reported a change
+MAX_AGE = 7 * 24 * 60 * 60
+
+
+class ResponseCache(object):
+    """
+    Raw theTVDB api responses kept on disk, one folder per series.
+
+    A cached response is served as is while it is younger than MAX_AGE and newer than the last change
+    theTVDB reported for its series, otherwise it is revalidated with If-None-Match/If-Modified-Since.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+
+    def _series_path(self, sid):
+        return os.path.join(self.path, str(sid))
+
+    def _entry_path(self, sid, url, params, lang):
+        key = json.dumps([url, sorted((params or {}).items()), lang])
+        return os.path.join(self._series_path(sid), hashlib.sha1(key.encode('utf-8')).hexdigest() + '.json')
+
+    def _updated_path(self, sid):
+        return os.path.join(self._series_path(sid), 'updated')
+
+    @staticmethod
+    def _write(filename, data):
+        if not os.path.isdir(os.path.dirname(filename)):
+            try:
+                os.makedirs(os.path.dirname(filename))
+            except OSError:
+                pass
+
+        tmp_filename = '{}.{}.tmp'.format(filename, threading.currentThread().ident)
+        with io.open(tmp_filename, 'wb') as f:
+            f.write(json.dumps(data).encode('utf-8'))
+
+        try:
+            os.rename(tmp_filename, filename)
+        except OSError:
+            # windows won't rename over an existing file
+            os.remove(filename)
+            os.rename(tmp_filename, filename)
+
+    @staticmethod
+    def _read(filename):
+        try:
+            with io.open(filename, 'rb') as f:
+                return json.loads(f.read().decode('utf-8'))
+        except (IOError, OSError, ValueError):
+            return None
+
+    def updated_time(self, sid):
+        """
+        Time of the last change to a series theTVDB has told us about, 0 if none.
+        """
+        return self._read(self._updated_path(sid)) or 0
+
+    def get(self, sid, url, params=None, lang=None):
+        """
+        :return: cached entry dict with body, time, etag and last_modified keys, or None
+        """
+        return self._read(self._entry_path(sid, url, params, lang))
+
+    def is_fresh(self, sid, entry):
+        return time.time() - entry['time'] < MAX_AGE and entry['time'] >= self.updated_time(sid)
+
+    def set(self, sid, url, params, lang, body, etag=None, last_modified=None):
+        self._write(self._entry_path(sid, url, params, lang), {
+            'url': url,
+            'lang': lang,
+            'time': time.time(),
+            'etag': etag,
+            'last_modified': last_modified,
+            'body': body
+        })
+
+    def touch(self, sid, url, params, lang, entry):
+        """
+        Marks a cached response as current again after the server confirmed it hasn't changed.
+        """
+        entry['time'] = time.time()
+        self._write(self._entry_path(sid, url, params, lang), entry)
+
+    def invalidate(self, updates):
+        """
+        Records the changes reported by theTVDB so cached responses from before them get revalidated.
+
+        :param updates: dict of series id to time of its last change
+        """
+        with self.lock:
+            for sid, updated in updates.items():
+                if not os.path.isdir(self._series_path(sid)):
+                    continue
+
+                if updated > self.updated_time(sid):
+                    self._write(self._updated_path(sid), updated)
+
+    def clear(self, sid=None):
+        shutil.rmtree(self._series_path(sid) if sid else self.path, ignore_errors=True)
@@ -53,47 +53,46 @@ class Notifiers(object):
     def id(self):
         return str(re.sub(r"[^\w\d_]", "_", str(re.sub(r"[+]", "plus", self.name))).lower())
 
+    @staticmethod
+    def dispatch(notifier, func, args=(), key=None, failed=None):
+        """
+        Hands a notifier call to the notification dispatcher, see NotificationDispatcher.dispatch
+        """
+        if sickrage.app.notification_dispatcher:
+            sickrage.app.notification_dispatcher.dispatch(notifier, func, args, key=key, failed=failed)
+            return
+
+        try:
+            func(*args)
+        except Exception:
+            pass
+
     @staticmethod
     def mass_notify_download(ep_name):
         for n in sickrage.app.notifier_providers.values():
-            try:
-                n.notify_download(ep_name)
-            except Exception:
-                continue
+            Notifiers.dispatch(n.id, n.notify_download, (ep_name,))
 
     @staticmethod
     def mass_notify_subtitle_download(ep_name, lang):
         for n in sickrage.app.notifier_providers.values():
-            try:
-                n.notify_subtitle_download(ep_name, lang)
-            except Exception:
-                continue
+            Notifiers.dispatch(n.id, n.notify_subtitle_download, (ep_name, lang))
 
     @staticmethod
     def mass_notify_snatch(ep_name):
         for n in sickrage.app.notifier_providers.values():
-            try:
-                n.notify_snatch(ep_name)
-            except Exception:
-                continue
+            Notifiers.dispatch(n.id, n.notify_snatch, (ep_name,))
 
     @staticmethod
     def mass_notify_version_update(new_version=""):
         if sickrage.app.config.notify_on_update:
             for n in sickrage.app.notifier_providers.values():
-                try:
-                    n.notify_version_update(new_version)
-                except Exception:
-                    continue
+                Notifiers.dispatch(n.id, n.notify_version_update, (new_version,))
 
     @staticmethod
     def mass_notify_login(ipaddress):
         if sickrage.app.config.notify_on_login and not is_ip_private(ipaddress):
             for n in sickrage.app.notifier_providers.values():
-                try:
-                    n.notify_login(ipaddress)
-                except Exception:
-                    continue
+                Notifiers.dispatch(n.id, n.notify_login, (ipaddress,))
 
 
 class NotifierProviders(dict):
@@ -0,0 +1,204 @@
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import threading
+import time
+
+import sickrage
+
+# seconds before the first retry of a failed job, doubled for every retry after it
+RETRY_BACKOFF = 10
+
+# a coalesced job is held back at most this many times the library update delay
+MAX_DELAY_FACTOR = 10
+
+
+class NotificationJob(object):
+    def __init__(self, notifier, func, args=(), key=None, failed=None, delay=0):
+        self.notifier = notifier
+        self.func = func
+        self.args = args
+        self.key = key
+        self.failed = failed
+        self.created = time.time()
+        self.due = self.created + delay
+        self.attempts = 0
+
+    @property
+    def name(self):
+        return '{}.{}'.format(self.notifier, getattr(self.func, '__name__', 'job'))
+
+
+class NotifierWorker(object):
+    """
+    Runs the jobs of one notifier in order of their due time, so a slow or unreachable server only holds up its
+    own notifications.
+    """
+
+    def __init__(self, dispatcher, notifier):
+        self.dispatcher = dispatcher
+        self.name = "NOTIFIER-{}".format(notifier.upper())
+        self.condition = threading.Condition()
+        self.jobs = []
+        self.stopping = False
+
+        self.thread = threading.Thread(target=self.run, name=self.name)
+        self.thread.setDaemon(True)
+        self.thread.start()
+
+    def put(self, job):
+        """
+        :return: False when the job was merged into one that is already waiting
+        """
+        with self.condition:
+            if job.key is not None:
+                for cur_job in self.jobs:
+                    if cur_job.key == job.key and not cur_job.attempts:
+                        # newest arguments win, the window restarts but is never stretched past the cap
+                        cur_job.args = job.args
+                        cur_job.due = min(job.due, cur_job.created + (job.due - job.created) * MAX_DELAY_FACTOR)
+                        return False
+
+            self.jobs.append(job)
+            self.condition.notify()
+            return True
+
+    def _next(self):
+        now = time.time()
+        for job in sorted(self.jobs, key=lambda x: x.due):
+            if self.stopping or job.due <= now:
+                self.jobs.remove(job)
+                return job
+
+    def run(self):
+        while True:
+            with self.condition:
+                job = self._next()
+                while job is None:
+                    if self.stopping:
+                        return
+
+                    timeout = min(x.due for x in self.jobs) - time.time() if self.jobs else 1
+                    self.condition.wait(min(max(timeout, 0.01), 1))
+                    job = self._next()
+
+            if not self.dispatcher.execute(job) and not self.stopping and \
+                    job.attempts < sickrage.app.config.notifier_retries:
+                job.attempts += 1
+                job.due = time.time() + RETRY_BACKOFF * 2 ** (job.attempts - 1)
+                sickrage.app.log.debug("Retrying {} in {}s".format(job.name, int(job.due - time.time())))
+                self.put(job)
+
+    def shutdown(self):
+        with self.condition:
+            self.stopping = True
+            self.condition.notify()
+
+
+class NotificationDispatcher(object):
+    """
+    Sends notifications and media library updates in the background, on a worker per notifier with a timeout per
+    job and retries with backoff. Library updates for the same show are coalesced for library_update_delay seconds,
+    so a season pack causes one refresh per media server.
+    """
+
+    def __init__(self):
+        self.name = "NOTIFIER"
+        self.lock = threading.Lock()
+        self.workers = {}
+        self.started = False
+
+    def start(self):
+        self.started = True
+
+    def shutdown(self):
+        """
+        Sends whatever is still waiting without retrying, then stops the workers
+        """
+        self.started = False
+
+        with self.lock:
+            workers, self.workers = self.workers.values(), {}
+
+        for worker in workers:
+            worker.shutdown()
+        for worker in workers:
+            worker.thread.join(10)
+
+    def dispatch(self, notifier, func, args=(), key=None, failed=None):
+        """
+        Queues a call of func(*args) on the worker of notifier, runs it right away when the dispatcher isn't running.
+
+        :param notifier: id of the notifier
+        :param key: jobs of a notifier with the same key are merged into one after a library_update_delay window
+        :param failed: tells from the return value of func if the job failed and should be retried, jobs that raise
+                       are always retried
+        """
+        job = NotificationJob(notifier, func, args, key, failed,
+                              sickrage.app.config.library_update_delay if key is not None else 0)
+
+        if not self.started:
+            self.execute(job)
+            return
+
+        with self.lock:
+            worker = self.workers.get(notifier)
+            if not worker:
+                worker = self.workers[notifier] = NotifierWorker(self, notifier)
+
+        if not worker.put(job):
+            sickrage.app.log.debug("Merged {} into the update already waiting for {}".format(job.name, key))
+
+    def execute(self, job):
+        """
+        Runs a job, giving up on it after notifier_timeout seconds
+
+        :return: True if the job succeeded
+        """
+        outcome = {}
+
+        def target():
+            try:
+                outcome['result'] = job.func(*job.args)
+            except Exception as e:
+                outcome['error'] = e
+
+        if not self.started:
+            target()
+        else:
+            # a hung call is left behind on its own thread, the worker moves on to the next job
+            thread = threading.Thread(target=target, name=threading.currentThread().getName())
+            thread.setDaemon(True)
+            thread.start()
+            thread.join(max(sickrage.app.config.notifier_timeout, 1))
+
+            if thread.is_alive():
+                sickrage.app.log.warning("{} timed out after {}s".format(job.name, sickrage.app.config.notifier_timeout))
+                return False
+
+        if 'error' in outcome:
+            sickrage.app.log.warning("{} failed: {}".format(job.name, outcome['error']))
+            return False
+
+        if job.failed and job.failed(outcome.get('result')):
+            sickrage.app.log.debug("{} failed".format(job.name))
+            return False
+
+        return True
@@ -42,6 +42,7 @@ from sickrage.core.classes import NZBSearchResult, SearchResult, TorrentSearchRe
 from sickrage.core.common import MULTI_EP_RESULT, Quality, SEASON_RESULT, cpu_presets
 from sickrage.core.helpers import chmodAsParent, findCertainShow, sanitizeFileName, clean_url, bs4_parser, validate_url, \
     try_int, convert_size
+from sickrage.core.helpers.feeds import FeedParseError, RSSFeed
 from sickrage.core.helpers.show_names import allPossibleShowNames
 from sickrage.core.nameparser import InvalidNameException, InvalidShowException, NameParser
 from sickrage.core.scene_exceptions import get_scene_exceptions
@@ -329,7 +330,7 @@ class GenericProvider(object):
                 continue
 
             try:
-                parse_result = NameParser().parse(result.name)
+                parse_result = NameParser(remote_lookups=not sickrage.app.config.defer_show_lookups).parse(result.name)
             except (InvalidNameException, InvalidShowException) as e:
                 sickrage.app.log.debug("{}".format(e))
                 continue
@@ -382,8 +383,8 @@ class GenericProvider(object):
                     continue
                 else:
                     airdate = parse_result.air_date.toordinal()
-                    dbData = [x for x in sickrage.app.main_db.get_many('tv_episodes', result.show.indexerid)
-                              if x['airdate'] == airdate]
+                    dbData = list(sickrage.app.main_db.get_many('tv_episodes_airdate',
+                                                                (result.show.indexerid, airdate)))
 
                     if len(dbData) != 1:
                         sickrage.app.log.warning(
@@ -1166,6 +1167,75 @@ class NewznabProvider(NZBProvider):
         return results
 
     def parse(self, data, mode, **kwargs):
+        try:
+            return self._parse_feed(data, mode)
+        except FeedParseError as e:
+            sickrage.app.log.debug('Unable to stream parse results from {}, retrying with bs4: {}'.format(self.name, e))
+            return self._parse_soup(data, mode)
+
+    def _parse_feed(self, data, mode):
+        results = []
+
+        if not self._check_auth():
+            return results
+
+        feed = RSSFeed(data)
+
+        found = False
+        for item in feed:
+            found = True
+            self.torznab = feed.torznab
+
+            try:
+                title = item['title']
+                download_url = None
+                for url in (item['link'], item['enclosure']):
+                    if validate_url(url) or url.startswith('magnet'):
+                        download_url = url
+                        break
+
+                if not (title and download_url):
+                    continue
+
+                seeders = leechers = -1
+                if 'gingadaddy' in self.urls['base_url']:
+                    size_regex = re.search(r'\d*.?\d* [KMGT]B', item['description'])
+                    item_size = size_regex.group() if size_regex else -1
+                else:
+                    item_size = item['size'] if item['size'] is not None else -1
+                    for name, value in item['attrs']:
+                        item_size = value if name == 'size' else item_size
+                        seeders = try_int(value) if name == 'seeders' else seeders
+                        peers = try_int(value) if name == 'peers' else None
+                        leechers = peers - seeders if peers else leechers
+
+                if not item_size or (self.torznab and (seeders is -1 or leechers is -1)):
+                    continue
+
+                size = convert_size(item_size, -1)
+
+                results += [
+                    {'title': title, 'link': download_url, 'size': size, 'seeders': seeders, 'leechers': leechers}
+                ]
+
+                if mode != 'RSS':
+                    sickrage.app.log.debug('Found result: {}'.format(title))
+            except (AttributeError, TypeError, KeyError, ValueError, IndexError):
+                sickrage.app.log.error('Failed parsing provider')
+
+        self.torznab = feed.torznab
+
+        if not found:
+            if feed.error and not feed.categories:
+                sickrage.app.log.info(feed.error)
+            else:
+                sickrage.app.log.debug('No results returned from provider. Check chosen Newznab '
+                                       'search categories in provider settings and/or usenet '
+                                       'retention')
+
+        return results
+
+    def _parse_soup(self, data, mode):
         results = []
 
         with bs4_parser(data) as html:
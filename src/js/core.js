@@ -5483,12 +5483,32 @@ $(document).ready(function ($) {
                     var url = SICKRAGE.srWebRoot + '/logs/viewlog/?minLevel=' + $('select[name=minLevel]').val() + '&logFilter=' + $('select[name=logFilter]').val() + '&logSearch=' + $('#logSearch').val();
                     $.get(url, function (data) {
                         history.pushState('data', '', url);
-                        $('#loglines').html($(data).find('#loglines').html());
+                        var loglines = $(data).find('#loglines');
+                        $('#loglines').html(loglines.html()).data('cursor', loglines.data('cursor'));
                         $('#minLevel').prop('disabled', false);
                         $('#logFilter').prop('disabled', false);
                         document.body.style.cursor = 'default';
                     });
                 }, 500));
+
+                // follow the log, new lines are added to the top
+                setInterval(function () {
+                    if (document.hidden || $('#minLevel').prop('disabled')) {
+                        return;
+                    }
+
+                    $.getJSON(SICKRAGE.srWebRoot + '/logs/tail/', {
+                        cursor: $('#loglines').data('cursor'),
+                        minLevel: $('select[name=minLevel]').val(),
+                        logFilter: $('select[name=logFilter]').val(),
+                        logSearch: $('#logSearch').val()
+                    }, function (data) {
+                        $('#loglines').data('cursor', data.cursor);
+                        if (data.logLines.length > 0) {
+                            $('#loglines').prepend(document.createTextNode(data.logLines + '\n'));
+                        }
+                    });
+                }, 5000);
             }
         }
     };
@@ -0,0 +1,78 @@
+#!/usr/bin/env python2.7
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Micro-benchmark of single episode lookups, scanning a whole show vs the (showid, season, episode) index.
+
+Run from the repository root: python -m tests.benchmarks.benchmark_episode_lookup
+"""
+
+from __future__ import print_function, unicode_literals
+
+import timeit
+import unittest
+
+import sickrage
+import tests
+
+SHOW_SIZES = [100, 1000, 3000]
+LOOKUPS = 200
+
+
+class EpisodeLookupBenchmark(tests.SiCKRAGETestDBCase):
+    def fill_show(self, showid, size):
+        for i in range(size):
+            sickrage.app.main_db.insert({
+                '_t': 'tv_episodes',
+                'showid': showid,
+                'indexerid': showid * 100000 + i,
+                'indexer': 1,
+                'season': i // 100 + 1,
+                'episode': i % 100 + 1,
+                'airdate': 733832 + i,
+                'status': 1,
+                'location': '',
+                'file_size': 0,
+            })
+
+    def test_episode_lookup(self):
+        print()
+        print("{:>10} {:>14} {:>14}".format("episodes", "scan (ms)", "index (ms)"))
+
+        for showid, size in enumerate(SHOW_SIZES, start=1):
+            self.fill_show(showid, size)
+            season, episode = size // 100 or 1, size % 100 or 1
+
+            def scan():
+                return [x for x in sickrage.app.main_db.get_many('tv_episodes', showid)
+                        if x['season'] == season and x['episode'] == episode]
+
+            def point():
+                return list(sickrage.app.main_db.get_many('tv_episodes_season_episode', (showid, season, episode)))
+
+            self.assertEqual(scan(), point())
+
+            scan_time = timeit.timeit(scan, number=LOOKUPS) / LOOKUPS * 1000
+            point_time = timeit.timeit(point, number=LOOKUPS) / LOOKUPS * 1000
+
+            print("{:>10} {:>14.3f} {:>14.3f}".format(size, scan_time, point_time))
+
+
+if __name__ == '__main__':
+    unittest.main()
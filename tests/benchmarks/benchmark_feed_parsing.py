@@ -0,0 +1,136 @@
+#!/usr/bin/env python2.7
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Benchmark of NewznabProvider.parse, streaming lxml path against the previous html5lib bs4 path, reporting items/sec
+and the peak memory of a child process that parses the feed once.
+
+Saved provider responses are read from tests/providers/feeds/*.xml when present, otherwise newznab and torznab feeds
+of 100 and 5000 items are generated.
+
+Run from the repository root: python -m tests.benchmarks.benchmark_feed_parsing
+"""
+
+from __future__ import print_function, unicode_literals
+
+import glob
+import io
+import os
+import timeit
+import unittest
+
+import tests
+from sickrage.providers import NewznabProvider
+
+NAMESPACES = {
+    'newznab': 'http://www.newznab.com/DTD/2010/feeds/attributes/',
+    'torznab': 'http://torznab.com/schemas/2015/feed'
+}
+
+ITEM = """    <item>
+      <title>Show.Name.S{season:02d}E{episode:02d}.720p.HDTV.x264-GROUP{i}</title>
+      <guid isPermaLink="true">https://test.example/details/{i}</guid>
+      <link>https://test.example/getnzb/{i}.nzb?apikey=0123456789abcdef</link>
+      <comments>https://test.example/details/{i}#comments</comments>
+      <pubDate>Mon, 01 Jan 2018 00:00:00 +0000</pubDate>
+      <category>TV &gt; HD</category>
+      <description>Show.Name.S{season:02d}E{episode:02d}.720p.HDTV.x264-GROUP{i}</description>
+      <enclosure url="https://test.example/getnzb/{i}.nzb?apikey=0123456789abcdef" length="{size}"
+                 type="application/x-nzb" />
+      <{ns}:attr name="category" value="5000" />
+      <{ns}:attr name="category" value="5040" />
+      <{ns}:attr name="size" value="{size}" />
+      <{ns}:attr name="seeders" value="{seeders}" />
+      <{ns}:attr name="peers" value="{peers}" />
+      <{ns}:attr name="tvdbid" value="82066" />
+      <{ns}:attr name="season" value="S{season:02d}" />
+      <{ns}:attr name="episode" value="E{episode:02d}" />
+    </item>
+"""
+
+
+def generate_feed(count, ns='newznab'):
+    items = ''.join(ITEM.format(i=i, ns=ns, season=i % 10 + 1, episode=i % 24 + 1, size=1073741824 + i,
+                                seeders=i % 50 + 1, peers=i % 50 + 5) for i in range(count))
+
+    return ('<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom" xmlns:{ns}="{uri}">\n'
+            '  <channel>\n'
+            '    <title>Test</title>\n'
+            '{items}'
+            '  </channel>\n'
+            '</rss>\n').format(ns=ns, uri=NAMESPACES[ns], items=items)
+
+
+def saved_feeds():
+    feeds = []
+    for filename in sorted(glob.glob(os.path.join(os.path.dirname(__file__), '..', 'providers', 'feeds', '*.xml'))):
+        with io.open(filename, encoding='utf-8') as f:
+            feeds.append((os.path.basename(filename), f.read()))
+
+    return feeds or [('{} x{}'.format(ns, count), generate_feed(count, ns))
+                     for ns in ('newznab', 'torznab') for count in (100, 5000)]
+
+
+def peak_memory(func):
+    """
+    Runs func in a forked child and returns how far it raised the child's peak resident memory, in MB.
+    """
+    pid = os.fork()
+    if not pid:
+        try:
+            func()
+        finally:
+            os._exit(0)
+
+    _, _, rusage = os.wait4(pid, 0)
+    return rusage.ru_maxrss / 1024.0
+
+
+def memory_delta(func):
+    return peak_memory(func) - peak_memory(lambda: None)
+
+
+class FeedParsingBenchmark(tests.SiCKRAGETestDBCase):
+    def test_feed_parsing(self):
+        provider = NewznabProvider('Benchmark', 'https://test.example/')
+
+        print()
+        print("{:>16} {:>8} {:>14} {:>14} {:>12} {:>12}".format(
+            "feed", "items", "bs4 (it/s)", "lxml (it/s)", "bs4 (MB)", "lxml (MB)"))
+
+        for name, data in saved_feeds():
+            results = provider.parse(data, 'RSS')
+            self.assertEqual(results, provider._parse_soup(data, 'RSS'))
+
+            items = data.count('<item>')
+            number = max(1, 2000 // max(items, 1))
+
+            soup_time = timeit.timeit(lambda: provider._parse_soup(data, 'RSS'), number=number) / number
+            feed_time = timeit.timeit(lambda: provider.parse(data, 'RSS'), number=number) / number
+
+            soup_memory = memory_delta(lambda: provider._parse_soup(data, 'RSS'))
+            feed_memory = memory_delta(lambda: provider.parse(data, 'RSS'))
+
+            print("{:>16} {:>8} {:>14.0f} {:>14.0f} {:>12.1f} {:>12.1f}".format(
+                name, items, items / soup_time, items / feed_time, soup_memory, feed_memory))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python2.7
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+Benchmark of records/sec through Logger with debug logging on and off, compared with the previous makeRecord that
+built the censor regex and ran unidecode for every record, including debug records nobody was going to write.
+
+Run from the repository root: python -m tests.benchmarks.benchmark_logger
+"""
+
+from __future__ import print_function, unicode_literals
+
+import os
+import re
+import shutil
+import tempfile
+import timeit
+import unittest
+
+from unidecode import unidecode
+
+import tests
+from sickrage.core.logger import Logger
+
+RECORDS = 20000
+
+
+class LegacyLogger(Logger):
+    def start(self):
+        super(LegacyLogger, self).start()
+        self.setLevel(self.DB)
+
+    def makeRecord(self, name, level, fn, lno, msg, args, exc_info, func=None, extra=None):
+        if (False, True)[name in self.loggers]:
+            record = super(Logger, self).makeRecord(name, level, fn, lno, msg, args, exc_info, func, extra)
+
+            try:
+                record.msg = re.sub(
+                    r"(.*)\b({})\b(.*)".format(
+                        '|'.join([x for x in self.CENSORED_ITEMS.values() if len(x)])), r"\1\3",
+                    record.msg)
+
+                record.msg = re.sub(r"([&?]r|[&?]apikey|[&?]api_key)=[^&]*([&\w]?)", r"\1=**********\2", record.msg)
+                record.msg = unidecode(record.msg)
+            except:
+                pass
+
+            return record
+
+
+def log_records(log):
+    for i in range(RECORDS):
+        if i % 5:
+            log.debug("Checking https://test.example/api?t=tvsearch&apikey=0123456789abcdef&q=show for %s", i)
+        else:
+            log.info("Found result Show.Name.S01E%02d.720p.HDTV.x264-GROUP", i % 24 + 1)
+
+
+class LoggerBenchmark(tests.SiCKRAGETestCase):
+    def test_logger(self):
+        log_dir = tempfile.mkdtemp()
+
+        print()
+        print("{:>8} {:>10} {:>16} {:>16} {:>20}".format(
+            "debug", "records", "legacy (rec/s)", "sync (rec/s)", "background (rec/s)"))
+
+        try:
+            for debug in (False, True):
+                results = []
+                for logger_class, background in ((LegacyLogger, False), (Logger, False), (Logger, True)):
+                    log = logger_class(consoleLogging=False, debugLogging=debug,
+                                       logFile=os.path.join(log_dir, 'sickrage.log'), logSize=0)
+                    log.CENSORED_ITEMS.update({('General', 'api_key'): 'fedcba9876543210',
+                                               ('General', 'web_password'): 'hunter2'})
+                    log.backgroundLogging = background
+                    log.start()
+
+                    # include draining the queue so background logging isn't credited for writes it hasn't done
+                    results.append(RECORDS / timeit.timeit(lambda: log_records(log) or log.start(), number=1))
+                    log.handlers = []
+
+                print("{:>8} {:>10} {:>16.0f} {:>16.0f} {:>20.0f}".format(str(debug), RECORDS, *results))
+        finally:
+            shutil.rmtree(log_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python2.7
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Benchmark of NameParser regex matching over a generated corpus of 20k release titles, with a new parser per title
+the way search results are parsed, compared with the previous implementation that compiled the patterns for every
+parser and tried all of them on every title.
+
+Run from the repository root: python -m tests.benchmarks.benchmark_name_parser
+"""
+
+from __future__ import print_function, unicode_literals
+
+import random
+import timeit
+import unittest
+
+import tests
+from sickrage.core.nameparser import NameParser
+
+CORPUS_SIZE = 20000
+
+FORMATS = ['{show}.S{season:02d}E{episode:02d}.{tokens}-GROUP',
+           '{show}.S{season:02d}E{episode:02d}E{next:02d}.{tokens}-GROUP',
+           '{show} - {season}x{episode:02d} - Ep Name',
+           '{show}.2010.{season:02d}.{episode:02d}.{tokens}-GROUP',
+           '{show}.S{season:02d}.{tokens}-GROUP',
+           '{show}.Part.{episode}.{tokens}-GROUP',
+           '[SubGroup] {show} - {absolute:03d} [{tokens}]',
+           '{show} - {absolute:03d} - Ep Name']
+
+TOKENS = ['720p', '1080p', 'HDTV', 'WEB-DL', 'WEBRip', 'BluRay', 'x264', 'x265', 'AAC2.0', 'REPACK', 'PROPER']
+
+
+class LegacyNameParser(NameParser):
+    """
+    NameParser as it was, patterns compiled for every parser and all of them tried on every title
+    """
+
+    def _compile_regexes(self, regexMode):
+        self.compiled_regexes = [x[:3] + (float('inf'),) for x in self._build_regex_set(regexMode)]
+
+    def _regex_order(self, name):
+        return range(len(self.compiled_regexes))
+
+
+def release_titles(count):
+    rand = random.Random(count)
+
+    titles = []
+    for i in range(count):
+        titles.append(rand.choice(FORMATS).format(
+            show=rand.choice(['Show.Name', 'Show Name', 'The.Show.Name.2010', 'Show_Name']),
+            season=i % 20 + 1, episode=i % 24 + 1, next=i % 24 + 2, absolute=i % 500 + 1,
+            tokens='.'.join(rand.sample(TOKENS, rand.randint(1, 3)))))
+
+    return titles
+
+
+def parsed(parser, titles):
+    results = []
+    for title in titles:
+        result = parser(naming_pattern=True)._match(title)
+        results.append(result and (result.which_regex, result.score, result.series_name, result.season_number,
+                                   result.episode_numbers, result.ab_episode_numbers, result.air_date,
+                                   result.extra_info, result.release_group, result.version))
+    return results
+
+
+class NameParserBenchmark(tests.SiCKRAGETestCase):
+    def test_name_parser(self):
+        titles = release_titles(CORPUS_SIZE)
+
+        self.assertEqual(parsed(LegacyNameParser, titles), parsed(NameParser, titles))
+
+        legacy_time = timeit.timeit(lambda: parsed(LegacyNameParser, titles), number=1)
+        shared_time = timeit.timeit(lambda: parsed(NameParser, titles), number=1)
+
+        print()
+        print("{:>10} {:>18} {:>18}".format("titles", "legacy (titles/s)", "shared (titles/s)"))
+        print("{:>10} {:>18.0f} {:>18.0f}".format(len(titles), len(titles) / legacy_time, len(titles) / shared_time))
+
+
+if __name__ == '__main__':
+    unittest.main()
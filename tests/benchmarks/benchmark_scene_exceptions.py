@@ -0,0 +1,90 @@
+#!/usr/bin/env python2.7
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Benchmark of scene exception name lookups for a batch of RSS release titles, scanning the scene_exceptions
+table per title vs the in-memory name index.
+
+Run from the repository root: python -m tests.benchmarks.benchmark_scene_exceptions
+"""
+
+from __future__ import print_function, unicode_literals
+
+import time
+import unittest
+
+import sickrage
+import tests
+from sickrage.core.helpers import sanitizeSceneName
+from sickrage.core.nameparser import NameParser, InvalidNameException, InvalidShowException
+from sickrage.core.scene_exceptions import get_scene_exception_by_name_multiple
+
+EXCEPTIONS = 5000
+TITLES = 1000
+
+
+def scan_lookup(show_name):
+    # lookup as done before the name index, kept here as the baseline
+    exception_result = [x for x in sorted(sickrage.app.cache_db.all('scene_exceptions'), key=lambda d: d['season'])
+                        if x['show_name'].lower() == show_name.lower()]
+    if exception_result:
+        return [(int(x['indexer_id']), int(x['season'])) for x in exception_result]
+
+    out = []
+    for cur_exception in sorted(sickrage.app.cache_db.all('scene_exceptions'), key=lambda d: d['season']):
+        if show_name.lower() in (cur_exception['show_name'].lower(),
+                                 sanitizeSceneName(cur_exception['show_name']).lower().replace('.', ' ')):
+            out.append((int(cur_exception['indexer_id']), int(cur_exception['season'])))
+
+    return out or [(None, None)]
+
+
+class SceneExceptionLookupBenchmark(tests.SiCKRAGETestDBCase):
+    def test_rss_lookup(self):
+        for i in range(EXCEPTIONS):
+            sickrage.app.cache_db.insert({
+                '_t': 'scene_exceptions',
+                'indexer_id': i + 1,
+                'show_name': 'Exception Show {}'.format(i),
+                'season': -1
+            })
+
+        series_names = []
+        for i in range(TITLES):
+            try:
+                name = 'Exception.Show.{}.S01E{:02d}.720p.HDTV.x264-GRP'.format(i * 7, i % 24 + 1)
+                series_names.append(NameParser(False, validate_show=False).parse(name, cache_result=False).series_name)
+            except (InvalidNameException, InvalidShowException):
+                continue
+
+        print()
+        for label, lookup in [('scan', scan_lookup), ('index', get_scene_exception_by_name_multiple)]:
+            start = time.time()
+            results = [lookup(name) for name in series_names]
+            elapsed = time.time() - start
+
+            print("{:>6}: {} titles in {:.3f}s, {:.1f} titles/s".format(label, len(results), elapsed,
+                                                                      len(results) / elapsed))
+
+        self.assertEqual([scan_lookup(name) for name in series_names[:50]],
+                         [get_scene_exception_by_name_multiple(name) for name in series_names[:50]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python2.7
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Benchmark of Quality.sceneQuality over a generated corpus of 100k release titles, compared with the previous
+implementation that ran every regex separately on each call.
+
+Run from the repository root: python -m tests.benchmarks.benchmark_scene_quality
+"""
+
+from __future__ import print_function, unicode_literals
+
+import os
+import random
+import re
+import timeit
+import unittest
+
+import tests
+from sickrage.core.common import Quality
+
+CORPUS_SIZE = 100000
+
+TOKENS = ['480p', '720p', '1080p', '1080i', '2160p', '4320p', 'HDTV', 'PDTV', 'DSR', 'TVRip', 'SATRip', 'WEB',
+          'WEB-DL', 'WEBRip', 'iTunes', 'AMZN', 'BluRay', 'Blu-Ray', 'HDDVD', 'BDRip', 'DVDRip', 'x264', 'H.264',
+          'H 264', 'x265', 'HEVC', 'XviD', 'DivX', 'MPEG2', 'HR.WS.PDTV.x264', 'AAC2.0', 'DD5.1', 'REPACK', 'PROPER']
+
+
+def legacy_scene_quality(name, anime=False):
+    ret = Quality.UNKNOWN
+    if not name:
+        return ret
+
+    name = os.path.basename(name)
+
+    check_name = lambda l, func: func([re.search(x, name, re.I) for x in l])
+
+    if anime:
+        dvdOptions = check_name([r"dvd", r"dvdrip"], any)
+        blueRayOptions = check_name([r"BD", r"blue?-?ray"], any)
+        sdOptions = check_name([r"360p", r"480p", r"848x480", r"XviD"], any)
+        hdOptions = check_name([r"720p", r"1280x720", r"960x720"], any)
+        fullHD = check_name([r"1080p", r"1920x1080"], any)
+
+        if sdOptions and not blueRayOptions and not dvdOptions:
+            ret = Quality.SDTV
+        elif dvdOptions:
+            ret = Quality.SDDVD
+        elif hdOptions and not blueRayOptions and not fullHD:
+            ret = Quality.HDTV
+        elif fullHD and not blueRayOptions and not hdOptions:
+            ret = Quality.FULLHDTV
+        elif blueRayOptions and hdOptions and not fullHD:
+            ret = Quality.HDBLURAY
+        elif blueRayOptions and fullHD and not hdOptions:
+            ret = Quality.FULLHDBLURAY
+
+        return ret
+
+    if (check_name(
+            [r"480p|\bweb\b|web.?dl|web(rip|mux|hd)|[sph]d.?tv|dsr|tv(rip|mux)|satrip", r"xvid|divx|[xh].?26[45]"],
+            all)
+            and not check_name([r"(720|1080)[pi]"], all)
+            and not check_name([r"hr.ws.pdtv.[xh].?26[45]"], any)):
+        ret = Quality.SDTV
+    elif (check_name([r"dvd(rip|mux)|b[rd](rip|mux)|blue?-?ray", r"xvid|divx|[xh].?26[45]"], all)
+          and not check_name([r"(720|1080)[pi]"], all)
+          and not check_name([r"hr.ws.pdtv.[xh].?26[45]"], any)):
+        ret = Quality.SDDVD
+    elif (check_name([r"720p", r"hd.?tv", r"[xh].?26[45]"], all)
+          or check_name([r"720p", r"hevc", r"[xh].?26[45]"], all)
+          or check_name([r"hr.ws.pdtv.[xh].?26[45]"], any) and not check_name([r"1080[pi]"], all)):
+        ret = Quality.HDTV
+    elif (check_name([r"720p|1080i", r"hd.?tv", r"mpeg-?2"], all)
+          or check_name([r"1080[pi].hdtv", r"h.?26[45]"], all)):
+        ret = Quality.RAWHDTV
+    elif (check_name([r"1080p", r"hd.?tv", r"[xh].?26[45]"], all)
+          or check_name([r"1080p", r"hevc", r"[xh].?26[45]"], all)):
+        ret = Quality.FULLHDTV
+    elif (check_name([r"720p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
+          or check_name([r"720p", r"itunes", r"[xh].?26[45]"], all)):
+        ret = Quality.HDWEBDL
+    elif (check_name([r"1080p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
+          or check_name([r"1080p", r"itunes", r"[xh].?26[45]"], all)):
+        ret = Quality.FULLHDWEBDL
+    elif check_name([r"720p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
+        ret = Quality.HDBLURAY
+    elif check_name([r"1080p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
+        ret = Quality.FULLHDBLURAY
+    elif check_name([r"2160p", r"hd.?tv", r"[xh].?26[45]"], all):
+        ret = Quality.UHD_4K_TV
+    elif check_name([r"4320p", r"hd.?tv", r"[xh].?26[45]"], all):
+        ret = Quality.UHD_8K_TV
+    elif (check_name([r"2160p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
+          or check_name([r"2160p", r"itunes", r"[xh].?26[45]"], all)):
+        ret = Quality.UHD_4K_WEBDL
+    elif (check_name([r"4320p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
+          or check_name([r"4320p", r"itunes", r"[xh].?26[45]"], all)):
+        ret = Quality.UHD_8K_WEBDL
+    elif check_name([r"2160p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
+        ret = Quality.UHD_4K_BLURAY
+    elif check_name([r"4320p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
+        ret = Quality.UHD_8K_BLURAY
+
+    return ret
+
+
+def release_titles(count):
+    rand = random.Random(count)
+
+    titles = []
+    for i in range(count):
+        sep = rand.choice(['.', ' ', '_'])
+        tokens = rand.sample(TOKENS, rand.randint(0, 4))
+        titles.append(sep.join(['Show', 'Name', 'S{:02d}E{:02d}'.format(i % 20 + 1, i % 24 + 1)] + tokens) + '-GROUP')
+
+    return titles
+
+
+class SceneQualityBenchmark(tests.SiCKRAGETestCase):
+    def test_scene_quality(self):
+        titles = release_titles(CORPUS_SIZE)
+
+        self.assertEqual([legacy_scene_quality(x) for x in titles], Quality.sceneQualities(titles))
+
+        legacy_time = timeit.timeit(lambda: [legacy_scene_quality(x) for x in titles], number=1)
+        single_time = timeit.timeit(lambda: [Quality.sceneQuality(x) for x in titles], number=1)
+        batch_time = timeit.timeit(lambda: Quality.sceneQualities(titles), number=1)
+
+        print()
+        print("{:>10} {:>12} {:>12} {:>12}".format("titles", "legacy (s)", "single (s)", "batch (s)"))
+        print("{:>10} {:>12.3f} {:>12.3f} {:>12.3f}".format(len(titles), legacy_time, single_time, batch_time))
+
+
+if __name__ == '__main__':
+    unittest.main()
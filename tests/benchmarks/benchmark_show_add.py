@@ -0,0 +1,84 @@
+#!/usr/bin/env python2.7
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+Benchmark of saving every episode of a large show, as adding or updating a show does, with a write per
+TVEpisode.saveToDB against the same saves queued in a main database batch.
+
+Run from the repository root: python -m tests.benchmarks.benchmark_show_add
+"""
+
+from __future__ import print_function, unicode_literals
+
+import datetime
+import timeit
+import unittest
+
+import sickrage
+import tests
+from sickrage.core import TVShow
+from sickrage.core.common import UNAIRED, WANTED
+from sickrage.core.tv.episode import TVEpisode
+
+SHOW_SIZES = [500, 2000]
+
+
+class ShowAddBenchmark(tests.SiCKRAGETestDBCase):
+    def save_episodes(self, showid, size, status, batch):
+        show = TVShow(showid, 1, "en")
+
+        def save():
+            for i in range(size):
+                ep = TVEpisode(show, i // 100 + 1, i % 100 + 1)
+                ep.indexerid = showid * 100000 + i
+                ep.name = "episode {}".format(i)
+                ep.airdate = datetime.date.fromordinal(733832 + i)
+                ep.status = status
+                ep.saveToDB(force_save=True)
+
+        if batch:
+            with sickrage.app.main_db.batch():
+                save()
+        else:
+            save()
+
+    def test_show_add(self):
+        print()
+        print("{:>10} {:>14} {:>14} {:>16} {:>16}".format(
+            "episodes", "add (s)", "add batch (s)", "update (s)", "update batch (s)"))
+
+        for showid, size in enumerate(SHOW_SIZES, start=1):
+            times = []
+            for batch in (False, True):
+                indexerid = showid * 10 + batch
+
+                times.append((timeit.timeit(lambda: self.save_episodes(indexerid, size, UNAIRED, batch), number=1),
+                              timeit.timeit(lambda: self.save_episodes(indexerid, size, WANTED, batch), number=1)))
+
+                episodes = list(sickrage.app.main_db.get_many('tv_episodes', indexerid))
+                self.assertEqual(len(episodes), size)
+                self.assertTrue(all(x['status'] == WANTED for x in episodes))
+
+            print("{:>10} {:>14.3f} {:>14.3f} {:>16.3f} {:>16.3f}".format(
+                size, times[0][0], times[1][0], times[0][1], times[1][1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
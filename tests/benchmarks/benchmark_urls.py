@@ -0,0 +1,96 @@
+#!/usr/bin/env python2.7
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Benchmark of the download url check done for every feed item and cached result over 100k generated urls, compared
+with the previous validate_url/is_ip_private pair that compiled its regexes on every call.
+
+Run from the repository root: python -m tests.benchmarks.benchmark_urls
+"""
+
+from __future__ import print_function, unicode_literals
+
+import random
+import re
+import timeit
+import unittest
+
+import tests
+from sickrage.core.helpers.urls import download_urls, is_download_url
+
+CORPUS_SIZE = 100000
+
+HOSTS = ['www.example.com', 'tracker.example.org', 'api.indexer.example.net', 'dl.example.io', '8.8.8.8',
+         '93.184.216.34', '192.168.1.10', '10.0.0.5', '127.0.0.1', 'localhost']
+
+
+def legacy_validate_url(value):
+    regex = (
+        r'^[a-z]+://([^/:]+{tld}|([0-9]{{1,3}}\.)'
+        r'{{3}}[0-9]{{1,3}})(:[0-9]+)?(\/.*)?$'
+    )
+
+    return (True, False)[not re.compile(regex.format(tld=r'\.[a-z]{2,10}')).match(value)]
+
+
+def legacy_is_ip_private(ip):
+    priv_lo = re.compile(r"^127\.\d{1,3}\.\d{1,3}\.\d{1,3}$")
+    priv_24 = re.compile(r"^10\.\d{1,3}\.\d{1,3}\.\d{1,3}$")
+    priv_20 = re.compile(r"^192\.168\.\d{1,3}.\d{1,3}$")
+    priv_16 = re.compile(r"^172.(1[6-9]|2[0-9]|3[0-1]).[0-9]{1,3}.[0-9]{1,3}$")
+    return priv_lo.match(ip) or priv_24.match(ip) or priv_20.match(ip) or priv_16.match(ip)
+
+
+def legacy_is_download_url(url):
+    return not (not legacy_validate_url(url) and not url.startswith('magnet')
+                or legacy_is_ip_private(url.split(r'//')[-1].split(r'/')[0]))
+
+
+def result_urls(count):
+    rand = random.Random(count)
+
+    urls = []
+    for i in range(count):
+        if not i % 10:
+            urls.append('magnet:?xt=urn:btih:{:040x}&dn=Show.Name.S01E{:02d}'.format(i, i % 24 + 1))
+        else:
+            urls.append('{}://{}/download/{}.torrent?passkey={:x}'.format(
+                rand.choice(['http', 'https']), rand.choice(HOSTS), i, rand.getrandbits(64)))
+
+    return urls
+
+
+class UrlsBenchmark(tests.SiCKRAGETestCase):
+    def test_download_urls(self):
+        urls = result_urls(CORPUS_SIZE)
+
+        self.assertEqual([legacy_is_download_url(x) for x in urls], [is_download_url(x) for x in urls])
+        self.assertEqual([is_download_url(x) for x in urls], download_urls(urls))
+
+        legacy_time = timeit.timeit(lambda: [legacy_is_download_url(x) for x in urls], number=1)
+        single_time = timeit.timeit(lambda: [is_download_url(x) for x in urls], number=1)
+        batch_time = timeit.timeit(lambda: download_urls(urls), number=1)
+
+        print()
+        print("{:>10} {:>12} {:>12} {:>12}".format("urls", "legacy (s)", "single (s)", "batch (s)"))
+        print("{:>10} {:>12.3f} {:>12.3f} {:>12.3f}".format(len(urls), legacy_time, single_time, batch_time))
+
+
+if __name__ == '__main__':
+    unittest.main()
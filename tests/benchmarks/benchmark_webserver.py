@@ -0,0 +1,142 @@
+#!/usr/bin/env python2.7
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Load test of the web server, requests/sec and RSS memory for /home and /api under concurrent clients.
+
+Run from the repository root: python -m tests.benchmarks.benchmark_webserver
+"""
+
+from __future__ import print_function, unicode_literals
+
+import shutil
+import socket
+import tempfile
+import threading
+import time
+import unittest
+
+import psutil
+import requests
+from tornado.ioloop import IOLoop
+
+import sickrage
+import tests
+from sickrage.core.tv.show import TVShow
+from sickrage.core.webserver import WebServer
+from sickrage.core.webserver.views import BaseHandler
+
+CLIENTS = [1, 10, 50]
+DURATION = 5
+API_KEY = 'benchmark'
+
+
+class WebServerBenchmark(tests.SiCKRAGETestDBCase):
+    def setUp(self):
+        super(WebServerBenchmark, self).setUp()
+
+        sock = socket.socket()
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+        sock.close()
+
+        self.base_url = 'http://127.0.0.1:{}'.format(port)
+
+        sickrage.app.cache_dir = tempfile.mkdtemp()
+        sickrage.app.no_launch = True
+        sickrage.app.config.web_port = port
+        sickrage.app.config.api_key = API_KEY
+        sickrage.app.config.launch_browser = False
+        sickrage.app.config.view_changelog = False
+        sickrage.app.config.web_production_mode = True
+
+        show = TVShow(1, 0001, "en")
+        show.name = "show name"
+        show.saveToDB()
+        sickrage.app.showlist.append(show)
+
+        # skip the login round trip, every request is treated as logged in
+        self.get_current_user = BaseHandler.get_current_user
+        BaseHandler.get_current_user = lambda handler: {'preferred_username': 'benchmark'}
+
+        started = threading.Event()
+
+        def serve():
+            self.io_loop = IOLoop()
+            self.io_loop.make_current()
+            sickrage.app.wserver = WebServer()
+            sickrage.app.wserver.start()
+            self.io_loop.add_callback(started.set)
+            self.io_loop.start()
+
+        server_thread = threading.Thread(target=serve, name='BENCHMARK-WEBSERVER')
+        server_thread.daemon = True
+        server_thread.start()
+        started.wait(30)
+
+    def tearDown(self):
+        self.io_loop.add_callback(sickrage.app.wserver.shutdown)
+        self.io_loop.add_callback(self.io_loop.stop)
+        BaseHandler.get_current_user = self.get_current_user
+        shutil.rmtree(sickrage.app.cache_dir, ignore_errors=True)
+        super(WebServerBenchmark, self).tearDown()
+
+    @staticmethod
+    def load(url, clients):
+        lock = threading.Lock()
+        completed = [0]
+        stop = time.time() + DURATION
+
+        def client():
+            session = requests.Session()
+            count = 0
+            while time.time() < stop:
+                session.get(url, allow_redirects=False)
+                count += 1
+
+            with lock:
+                completed[0] += count
+
+        threads = [threading.Thread(target=client) for __ in range(clients)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return completed[0] / float(DURATION)
+
+    def test_load(self):
+        process = psutil.Process()
+        endpoints = [('/home', '{}/home/'.format(self.base_url)),
+                     ('/api', '{}/api/{}/?cmd=sr.ping'.format(self.base_url, API_KEY))]
+
+        print()
+        print("{:>8} {:>8} {:>8} {:>12} {:>10}".format("endpoint", "status", "clients", "requests/s", "rss (MB)"))
+
+        for name, url in endpoints:
+            status = requests.get(url, allow_redirects=False).status_code
+
+            for clients in CLIENTS:
+                rate = self.load(url, clients)
+                rss = process.memory_info().rss / 1024.0 / 1024.0
+                print("{:>8} {:>8} {:>8} {:>12.1f} {:>10.1f}".format(name, status, clients, rate, rss))
+
+
+if __name__ == '__main__':
+    unittest.main()
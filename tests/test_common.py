@@ -113,6 +113,27 @@ class QualityTests(tests.SiCKRAGETestCase):
         from sickrage.core.common import Quality
         self.assertEqual(Quality.UNKNOWN, Quality.nameQuality("Test.Show.S01E02-SICKRAGE"))
 
+    def test_sceneQualities(self):
+        from sickrage.core.common import Quality
+        names = ["Test.Show.S01E02.PDTV.XViD-GROUP",
+                 "Test.Show.S01E02.720p.HDTV.x264-GROUP",
+                 "Test.Show.S01E02.1080p.WEB-DL-GROUP",
+                 "Test.Show.S01E02-SICKRAGE",
+                 ""]
+        self.assertEqual([Quality.SDTV, Quality.HDTV, Quality.FULLHDWEBDL, Quality.UNKNOWN, Quality.UNKNOWN],
+                         Quality.sceneQualities(names))
+        self.assertEqual([Quality.sceneQuality(x, True) for x in names], Quality.sceneQualities(names, True))
+
+    def test_anime_sceneQuality(self):
+        from sickrage.core.common import Quality
+        self.assertEqual(Quality.SDTV, Quality.sceneQuality("[Group] Test Show - 02 [480p].mkv", True))
+        self.assertEqual(Quality.SDDVD, Quality.sceneQuality("[Group] Test Show - 02 [DVD 480p].mkv", True))
+        self.assertEqual(Quality.HDTV, Quality.sceneQuality("[Group] Test Show - 02 [720p].mkv", True))
+        self.assertEqual(Quality.FULLHDTV, Quality.sceneQuality("[Group] Test Show - 02 [1080p].mkv", True))
+        self.assertEqual(Quality.HDBLURAY, Quality.sceneQuality("[Group] Test Show - 02 [BD 720p].mkv", True))
+        self.assertEqual(Quality.FULLHDBLURAY, Quality.sceneQuality("[Group] Test Show - 02 [BD 1080p].mkv", True))
+        self.assertEqual(Quality.UNKNOWN, Quality.sceneQuality("[Group] Test Show - 02.mkv", True))
+
 
 # def test_reverse_parsing(self):
 #        self.assertEqual(Quality.SDTV, Quality.nameQuality("Test Show - S01E02 - SDTV - GROUP"))
@@ -25,7 +25,7 @@ import unittest
 import sickrage
 import tests
 from sickrage.core import TVShow, helpers
-from sickrage.core.common import UNAIRED
+from sickrage.core.common import UNAIRED, WANTED
 from sickrage.core.tv.episode import TVEpisode
 
 
@@ -74,6 +74,101 @@ class DBBasicTests(tests.SiCKRAGETestDBCase):
 
         self.assertEqual(count, 3)
 
+    def test_season_episode_index(self):
+        dbData = list(sickrage.app.main_db.get_many('tv_episodes_season_episode', (1, 1, 2)))
+        self.assertEqual(len(dbData), 1)
+        self.assertEqual(dbData[0]['name'], "test episode 2")
+
+        self.assertEqual(len(list(sickrage.app.main_db.get_many('tv_episodes_season_episode', (1, 1, 4)))), 0)
+        self.assertEqual(len(list(sickrage.app.main_db.get_many('tv_episodes_season_episode', (2, 1, 2)))), 0)
+
+    def test_airdate_index(self):
+        dbData = list(sickrage.app.main_db.get_many('tv_episodes_airdate', (1, 733832)))
+        self.assertEqual(sorted(x['episode'] for x in dbData), [1, 2, 3])
+        self.assertEqual(len(list(sickrage.app.main_db.get_many('tv_episodes_airdate', (1, 733833)))), 0)
+
+    def test_status_airdate_index(self):
+        def episodes(statuses, start=None, end=None):
+            return sorted(x['episode'] for x in sickrage.app.main_db.get_episodes_by_status(statuses, start, end))
+
+        self.assertEqual(episodes([UNAIRED]), [1, 2, 3])
+        self.assertEqual(episodes([UNAIRED], 733832, 733832), [1, 2, 3])
+        self.assertEqual(episodes([UNAIRED], 733833), [])
+        self.assertEqual(episodes([UNAIRED], end=733831), [])
+        self.assertEqual(episodes([WANTED]), [])
+
+        ep = TVEpisode(helpers.findCertainShow(1), 1, 2)
+        ep.indexerid = 2
+        ep.name = "test episode 2"
+        ep.airdate = datetime.date.fromordinal(733832)
+        ep.status = WANTED
+        ep.saveToDB()
+
+        self.assertEqual(episodes([UNAIRED]), [1, 3])
+        self.assertEqual(episodes([WANTED], 733832), [2])
+        self.assertEqual(episodes([UNAIRED, WANTED], 733800, 733900), [1, 2, 3])
+
+    def test_batch(self):
+        def names():
+            return {x['episode']: x['name'] for x in sickrage.app.main_db.get_many('tv_episodes', 1)}
+
+        show = helpers.findCertainShow(1)
+
+        with sickrage.app.main_db.batch():
+            ep = TVEpisode(show, 1, 2)
+            ep.indexerid = 2
+            ep.name = "renamed episode 2"
+            ep.saveToDB()
+
+            ep = TVEpisode(show, 1, 4)
+            ep.indexerid = 4
+            ep.name = "test episode 4"
+            ep.airdate = datetime.date.fromordinal(733833)
+            ep.saveToDB()
+            ep.status = WANTED
+            ep.saveToDB()
+
+            # nothing written until the batch exits
+            self.assertEqual(names(), {1: "test episode 1", 2: "test episode 2", 3: "test episode 3"})
+
+            with sickrage.app.main_db.batch():
+                ep = TVEpisode(show, 1, 3)
+                ep.indexerid = 3
+                ep.name = "renamed episode 3"
+                ep.saveToDB()
+
+            # inner batches flush everything queued so far on exit
+            self.assertEqual(names()[3], "renamed episode 3")
+
+        self.assertEqual(names(), {1: "test episode 1", 2: "renamed episode 2", 3: "renamed episode 3",
+                                   4: "test episode 4"})
+        self.assertEqual([x['status'] for x in sickrage.app.main_db.get_many('tv_episodes', 1)
+                          if x['episode'] == 4], [WANTED])
+        self.assertIsNone(sickrage.app.main_db.current_batch)
+
+    def test_providers_cache_indexes(self):
+        sickrage.app.cache_db.insert({
+            '_t': 'providers',
+            'provider': 'testprovider',
+            'name': 'show.name.S01E01E02.720p.HDTV.x264-GRP',
+            'season': 1,
+            'episodes': [1, 2],
+            'indexerid': 1,
+            'url': 'http://test.com/1',
+            'quality': 4,
+        })
+
+        self.assertEqual(len(list(sickrage.app.cache_db.get_many('providers_url',
+                                                                 ('testprovider', 'http://test.com/1')))), 1)
+        self.assertEqual(len(list(sickrage.app.cache_db.get_many('providers_url',
+                                                                 ('testprovider', 'http://test.com/2')))), 0)
+
+        for episode in [1, 2]:
+            self.assertEqual(len(list(sickrage.app.cache_db.get_many('providers_episodes',
+                                                                     ('testprovider', 1, 1, episode)))), 1)
+        self.assertEqual(len(list(sickrage.app.cache_db.get_many('providers_episodes',
+                                                                 ('testprovider', 1, 1, 3)))), 0)
+
 if __name__ == '__main__':
     print("==================")
     print("STARTING - DB TESTS")
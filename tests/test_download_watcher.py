@@ -0,0 +1,140 @@
+#!/usr/bin/env python2.7
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import print_function, unicode_literals
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+import sickrage
+import tests
+from sickrage.core.processors.download_watcher import DownloadWatcher, Inotify, Poller
+
+
+class DownloadWatcherTests(tests.SiCKRAGETestCase):
+    def setUp(self, **kwargs):
+        super(DownloadWatcherTests, self).setUp(**kwargs)
+        self.download_dir = tempfile.mkdtemp()
+
+        sickrage.app.config.sync_files = '!sync,lftp-pget-status,part,bts,!qb'
+        sickrage.app.config.postpone_if_sync_files = True
+        sickrage.app.config.autopostprocessor_settle = 60
+
+    def tearDown(self):
+        shutil.rmtree(self.download_dir, ignore_errors=True)
+        super(DownloadWatcherTests, self).tearDown()
+
+    def write(self, *path):
+        filename = os.path.join(self.download_dir, *path)
+        if not os.path.isdir(os.path.dirname(filename)):
+            os.makedirs(os.path.dirname(filename))
+
+        with io.open(filename, 'wb') as f:
+            f.write(b'foo bar')
+
+        return filename
+
+    def test_ready(self):
+        watcher = DownloadWatcher()
+        watcher.path = self.download_dir
+
+        watcher.changed([
+            self.write('Show.Name.S01E01', 'show.name.s01e01.mkv'),
+            self.write('Show.Name.S01E02.mkv'),
+            self.write('notes.txt'),
+            self.write('Show.Name.S01E03', 'show.name.s01e03.mkv.part'),
+            self.write('Show.Name.S01E04', 'show.name.s01e04.mkv'),
+            self.write('Show.Name.S01E04', 'show.name.s01e05.mkv.part'),
+        ], now=100)
+
+        # still being written
+        self.assertEqual(watcher.ready(now=150), [])
+
+        # sync files alone don't make a download and hold back the folder they are in
+        self.assertEqual(sorted(watcher.ready(now=160)), [
+            (self.download_dir, 'Show.Name.S01E02.mkv'),
+            (os.path.join(self.download_dir, 'Show.Name.S01E01'), None),
+        ])
+        self.assertEqual(watcher.pending.keys(), [os.path.join(self.download_dir, 'Show.Name.S01E04')])
+
+        os.remove(os.path.join(self.download_dir, 'Show.Name.S01E04', 'show.name.s01e05.mkv.part'))
+        self.assertEqual(watcher.ready(now=220), [(os.path.join(self.download_dir, 'Show.Name.S01E04'), None)])
+        self.assertEqual(watcher.pending, {})
+
+    def test_ready_files(self):
+        watcher = DownloadWatcher()
+        watcher.path = self.download_dir
+
+        # files in the download folder itself share a queue item
+        watcher.changed([self.write('Show.Name.S01E01.mkv'), self.write('Show.Name.S01E02.mkv')], now=100)
+        self.assertEqual(watcher.ready(now=200), [(self.download_dir, None)])
+
+    def test_inotify(self):
+        try:
+            backend = Inotify(self.download_dir)
+        except OSError as e:
+            raise unittest.SkipTest("inotify not available: {}".format(e))
+
+        try:
+            filename = self.write('Show.Name.S01E01', 'show.name.s01e01.mkv')
+
+            paths = []
+            for __ in range(5):
+                paths += backend.read(1)
+                if filename in paths:
+                    break
+
+            self.assertIn(os.path.join(self.download_dir, 'Show.Name.S01E01'), paths)
+            self.assertIn(filename, paths)
+
+            # losing the download folder ends the watch
+            shutil.rmtree(self.download_dir)
+            for __ in range(5):
+                paths = backend.read(1)
+                if paths is None:
+                    break
+
+            self.assertIsNone(paths)
+        finally:
+            backend.close()
+
+    def test_poller(self):
+        backend = Poller(self.download_dir)
+        filename = self.write('Show.Name.S01E01', 'show.name.s01e01.mkv')
+
+        # scans are spaced out
+        self.assertEqual(backend.read(0), [])
+
+        backend.last_scan = 0
+        self.assertEqual(backend.read(0), [filename])
+
+        shutil.rmtree(self.download_dir)
+        backend.last_scan = 0
+        self.assertIsNone(backend.read(0))
+
+
+if __name__ == '__main__':
+    print("==================")
+    print("STARTING - DOWNLOAD WATCHER TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
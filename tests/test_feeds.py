@@ -0,0 +1,98 @@
+#!/usr/bin/env python2.7
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import print_function, unicode_literals
+
+import unittest
+
+import tests
+from sickrage.core.helpers.feeds import FeedParseError, RSSFeed
+from sickrage.providers import NewznabProvider
+
+TORZNAB_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom" xmlns:torznab="http://torznab.com/schemas/2015/feed">
+  <channel>
+    <title>Test</title>
+    <item>
+      <title>Show.Name.S01E01.720p.HDTV.x264-GRP</title>
+      <link>https://test.example/download/1.torrent</link>
+      <size>1073741824</size>
+      <torznab:attr name="seeders" value="10" />
+      <torznab:attr name="peers" value="15" />
+    </item>
+    <item>
+      <title>Show.Name.S01E02.720p.HDTV.x264-GRP</title>
+      <enclosure url="magnet:?xt=urn:btih:0123456789abcdef0123456789abcdef01234567" length="0" />
+      <torznab:attr name="size" value="2147483648" />
+      <torznab:attr name="seeders" value="3" />
+      <torznab:attr name="peers" value="4" />
+    </item>
+    <item>
+      <title>Show.Name.S01E03.720p.HDTV.x264-GRP</title>
+      <link>https://test.example/download/3.torrent</link>
+      <size>1073741824</size>
+    </item>
+  </channel>
+</rss>"""
+
+ERROR_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<error code="100" description="Incorrect user credentials"/>"""
+
+
+class FeedTests(tests.SiCKRAGETestDBCase):
+    def setUp(self):
+        super(FeedTests, self).setUp()
+        self.provider = NewznabProvider('Test', 'https://test.example/')
+
+    def test_rss_feed(self):
+        feed = RSSFeed(TORZNAB_FEED)
+        items = list(feed)
+
+        self.assertTrue(feed.torznab)
+        self.assertEqual([x['title'][:15] for x in items], ['Show.Name.S01E0'] * 3)
+        self.assertEqual(items[0]['link'], 'https://test.example/download/1.torrent')
+        self.assertEqual(items[0]['attrs'], [('seeders', '10'), ('peers', '15')])
+        self.assertTrue(items[1]['enclosure'].startswith('magnet:'))
+        self.assertIsNone(items[1]['size'])
+
+    def test_rss_feed_error(self):
+        feed = RSSFeed(ERROR_FEED)
+        self.assertEqual(list(feed), [])
+        self.assertEqual(feed.error, 'Incorrect user credentials')
+
+        with self.assertRaises(FeedParseError):
+            list(RSSFeed('<rss><channel><item><title>broken</channel></rss>'))
+
+    def test_newznab_parse(self):
+        self.assertEqual(self.provider.parse(TORZNAB_FEED, 'Episode'), [
+            {'title': 'Show.Name.S01E01.720p.HDTV.x264-GRP', 'link': 'https://test.example/download/1.torrent',
+             'size': 1073741824, 'seeders': 10, 'leechers': 5},
+            {'title': 'Show.Name.S01E02.720p.HDTV.x264-GRP',
+             'link': 'magnet:?xt=urn:btih:0123456789abcdef0123456789abcdef01234567',
+             'size': 2147483648, 'seeders': 3, 'leechers': 1},
+        ])
+        self.assertEqual(self.provider.parse(ERROR_FEED, 'RSS'), [])
+
+
+if __name__ == '__main__':
+    print("==================")
+    print("STARTING - FEED TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
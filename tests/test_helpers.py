@@ -82,6 +82,30 @@ def test_generator(test_strings):
 for name, test_data in test_cases.items():
     setattr(HelpersTests, 'test_%s' % name, test_generator(test_data))
 
+
+class UrlsTests(tests.SiCKRAGETestCase):
+    def test_validate_url(self):
+        from sickrage.core.helpers.urls import validate_url
+        self.assertTrue(validate_url('https://www.example.com/download/1.torrent'))
+        self.assertTrue(validate_url('http://8.8.8.8:8080/api'))
+        self.assertFalse(validate_url('www.example.com/download'))
+        self.assertFalse(validate_url('http://localhost/api'))
+
+    def test_is_ip_private(self):
+        from sickrage.core.helpers.urls import is_ip_private
+        for ip in ['127.0.0.1', '10.1.2.3', '172.16.0.1', '172.31.255.255', '192.168.1.1']:
+            self.assertTrue(is_ip_private(ip), ip)
+        for ip in ['8.8.8.8', '172.32.0.1', '192.169.1.1', 'www.example.com', '']:
+            self.assertFalse(is_ip_private(ip), ip)
+
+    def test_download_urls(self):
+        from sickrage.core.helpers.urls import download_urls, is_download_url
+        urls = ['https://www.example.com/download/1.torrent', 'magnet:?xt=urn:btih:0123456789abcdef',
+                'http://192.168.1.10/download/1.torrent', 'http://10.0.0.1:8080/download/1.torrent',
+                'ftp//broken']
+        self.assertEqual([is_download_url(x) for x in urls], [True, True, False, False, False])
+        self.assertEqual(download_urls(urls), [True, True, False, False, False])
+
 if __name__ == '__main__':
     print "=================="
     print "STARTING - Helpers TESTS"
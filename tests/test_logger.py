@@ -0,0 +1,196 @@
+#!/usr/bin/env python2.7
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+
+from __future__ import unicode_literals
+
+import io
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+import tests
+from sickrage.core.logger import Logger
+from sickrage.core.logindex import IndexedRotatingFileHandler, LogIndex, LogQuery
+
+
+class LoggerTests(tests.SiCKRAGETestCase):
+    def setUp(self, **kwargs):
+        super(LoggerTests, self).setUp(**kwargs)
+        self.log_dir = tempfile.mkdtemp()
+        self.log_file = os.path.join(self.log_dir, 'sickrage.log')
+
+    def tearDown(self):
+        shutil.rmtree(self.log_dir, ignore_errors=True)
+        super(LoggerTests, self).tearDown()
+
+    def read_log(self, log):
+        for handler in log.handlers:
+            handler.flush()
+
+        with io.open(self.log_file, encoding='utf-8') as f:
+            return f.read()
+
+    def test_censor(self):
+        log = Logger(consoleLogging=False, logFile=self.log_file)
+
+        log.CENSORED_ITEMS['General', 'api_key'] = 'abcdef123'
+        log.CENSORED_ITEMS['General', 'web_password'] = 'abc'
+        self.assertEqual(log.censor('key abcdef123 pass abc abcd'), 'key  pass  abcd')
+
+        log.CENSORED_ITEMS['General', 'web_password'] = 'hunter2'
+        self.assertEqual(log.censor('pass abc hunter2 hunter2'), 'pass abc  ')
+
+        del log.CENSORED_ITEMS['General', 'web_password']
+        self.assertEqual(log.censor('pass hunter2'), 'pass hunter2')
+
+        self.assertEqual(log.censor('https://test.example/api?t=search&apikey=0123&q=show'),
+                         'https://test.example/api?t=search&apikey=**********&q=show')
+
+        log.info('api key %s', 'abcdef123')
+        self.assertIn('INFO::TESTS::api key \n', self.read_log(log))
+
+    def test_level(self):
+        log = Logger(consoleLogging=False, logFile=self.log_file)
+        self.assertFalse(log.isEnabledFor(log.DEBUG))
+        self.assertTrue(log.isEnabledFor(log.INFO))
+
+        log.debug('debug %s', 'message')
+        log.info('info %s', 'message')
+        self.assertNotIn('debug message', self.read_log(log))
+        self.assertIn('info message', self.read_log(log))
+
+        log.debugLogging = True
+        log.start()
+        self.assertTrue(log.isEnabledFor(log.DEBUG))
+
+    def test_background(self):
+        log = Logger(consoleLogging=False, logFile=self.log_file)
+        log.backgroundLogging = True
+        log.start()
+
+        self.assertEqual([x.name for x in log.handlers], ['background'])
+
+        for i in range(100):
+            log.info('background %d', i)
+
+        # close waits for the queue to drain
+        log.handlers[0].close()
+        self.assertIn('background 99', self.read_log(log))
+
+
+class LogIndexTests(tests.SiCKRAGETestCase):
+    def setUp(self, **kwargs):
+        super(LogIndexTests, self).setUp(**kwargs)
+        self.log_dir = tempfile.mkdtemp()
+        self.log_file = os.path.join(self.log_dir, 'sickrage.log')
+
+        self.handler = IndexedRotatingFileHandler(self.log_file, maxBytes=4096, backupCount=2)
+        self.handler.setFormatter(
+            logging.Formatter('%(asctime)s %(levelname)s::%(threadName)s::%(message)s', '%Y-%m-%d %H:%M:%S'))
+
+        self.log = logging.getLogger('sickrage.tests.logindex')
+        self.log.propagate = False
+        self.log.setLevel(logging.DEBUG)
+        self.log.addHandler(self.handler)
+
+    def tearDown(self):
+        self.log.removeHandler(self.handler)
+        self.handler.close()
+        shutil.rmtree(self.log_dir, ignore_errors=True)
+        super(LogIndexTests, self).tearDown()
+
+    def write(self, count, start=0):
+        for i in range(start, start + count):
+            if i % 10 == 9:
+                try:
+                    raise ValueError('record {}'.format(i))
+                except ValueError:
+                    self.log.error('record %d failed', i, exc_info=True)
+            else:
+                self.log.log((logging.DEBUG, logging.INFO)[i % 2], 'record %d', i)
+        self.handler.flush()
+
+    def test_query(self):
+        self.write(200)
+
+        # rolled over into both backups, each with its own index
+        for log_file in [self.log_file, self.log_file + '.1', self.log_file + '.2']:
+            self.assertTrue(os.path.isfile(LogIndex.index_path(log_file)))
+
+        query = LogQuery(self.log_file, 2)
+
+        lines = query.query(logging.DEBUG, max_lines=5)
+        self.assertEqual(len(lines), 5)
+        self.assertIn('record 199 failed\nTraceback', lines[0])
+        self.assertTrue(lines[1].endswith('record 198'))
+
+        lines = query.query(logging.ERROR, max_lines=500)
+        self.assertTrue(lines)
+        self.assertTrue(all('ERROR::' in x for x in lines))
+
+        self.assertEqual(len(query.query(logging.DEBUG, search='RECORD 142')), 1)
+        self.assertEqual(len(query.query(logging.DEBUG, search='record 197')), 1)
+        self.assertEqual(query.query(logging.DEBUG, thread='NOSUCHTHREAD'), [])
+
+    def test_stale_index(self):
+        self.write(5)
+
+        # records the index has not seen yet, then an index that doesn't match the log
+        with io.open(self.log_file, 'ab') as f:
+            f.write(b'2018-01-01 00:00:00 WARNING::OTHER::written elsewhere\n')
+
+        lines = LogQuery(self.log_file).query(logging.DEBUG)
+        self.assertEqual(len(lines), 6)
+        self.assertIn('written elsewhere', lines[0])
+
+        # log replaced under the index
+        with io.open(self.log_file, 'wb') as f:
+            f.write(b'2018-01-01 00:00:00 INFO::OTHER::replaced\n')
+
+        self.assertEqual(len(LogQuery(self.log_file).query(logging.DEBUG)), 1)
+
+    def test_tail(self):
+        query = LogQuery(self.log_file, 2)
+
+        self.write(3)
+        cursor = query.cursor()
+        self.assertEqual(query.tail(cursor), ([], cursor))
+
+        self.write(2, 3)
+        lines, cursor = query.tail(cursor, logging.DEBUG)
+        self.assertEqual(len(lines), 2)
+        self.assertIn('record 4', lines[0])
+
+        # following the log across a rollover
+        self.write(60, 5)
+        lines, cursor = query.tail(cursor, logging.DEBUG, max_lines=1000)
+        self.assertIn('record 64', lines[0])
+        self.assertIn('record 5', lines[-1])
+        self.assertEqual(query.tail(cursor), ([], cursor))
+
+
+if __name__ == '__main__':
+    print("==================")
+    print("STARTING - LOGGER TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
@@ -21,12 +21,15 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import os.path
+import time
 import unittest
 from datetime import date
 
 import sickrage
 import tests
-from sickrage.core.nameparser import ParseResult, NameParser, InvalidNameException, InvalidShowException
+from sickrage.core.helpers import full_sanitizeSceneName
+from sickrage.core.nameparser import ParseResult, NameParser, InvalidNameException, InvalidShowException, \
+    NameParserCache, name_parser_cache, show_lookup_stats
 from sickrage.core.tv.show import TVShow
 
 sickrage.app.sys_encoding = 'UTF-8'
@@ -444,6 +447,137 @@ class BasicTests(tests.SiCKRAGETestDBCase):
         pass
 
 
+
+class NameParserCacheTests(tests.SiCKRAGETestDBCase):
+    def test_lru_eviction(self):
+        cache = NameParserCache(max_size=2)
+        cache.add('a', 1)
+        cache.add('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+
+        cache.add('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+
+        stats = cache.stats()
+        self.assertEqual(stats['size'], 2)
+        self.assertEqual(stats['hits'], 3)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['evictions'], 1)
+
+    def test_ttl(self):
+        cache = NameParserCache(max_size=2, ttl=0.01)
+        cache.add('a', 1)
+        time.sleep(0.02)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+    def test_cache_key(self):
+        sickrage.app.showlist.append(TVShow(1, 1, 'en'))
+
+        # a show that isn't in the showlist, the parser builds its own show object for it without validate_show
+        show = TVShow(1, 2, 'en')
+        show.name = 'show name'
+        sickrage.app.name_cache.put(show.name, show.indexerid)
+
+        name = 'Show.Name.S01E02.HDTV.x264-GROUP'
+        result = NameParser(validate_show=False).parse(name)
+        self.assertEqual(result.show.indexerid, show.indexerid)
+        self.assertIs(NameParser(validate_show=False).parse(name), result)
+        self.assertIsNot(NameParser(showObj=show, validate_show=False).parse(name), result)
+
+    def test_cleared_on_showlist_change(self):
+        name_parser_cache.add('a', 1)
+        show = TVShow(1, 1, 'en')
+        sickrage.app.showlist.append(show)
+        self.assertIsNone(name_parser_cache.get('a'))
+
+        name_parser_cache.add('a', 1)
+        sickrage.app.showlist.remove(show)
+        self.assertIsNone(name_parser_cache.get('a'))
+
+
+class NameCacheTests(tests.SiCKRAGETestDBCase):
+    def test_negative_ttl(self):
+        sickrage.app.config.name_cache_negative_ttl = 60
+        sickrage.app.name_cache.put('Unknown Show', 0)
+        self.assertEqual(sickrage.app.name_cache.get('Unknown Show'), 0)
+
+        sickrage.app.name_cache.load()
+        self.assertEqual(sickrage.app.name_cache.get('Unknown Show'), 0)
+
+        sickrage.app.name_cache.expires[full_sanitizeSceneName('Unknown Show')] = time.time() - 1
+        self.assertIsNone(sickrage.app.name_cache.get('Unknown Show'))
+
+        # expired unknown names aren't loaded again
+        sickrage.app.name_cache.put('Unknown Show', 0)
+        sickrage.app.name_cache.expires[full_sanitizeSceneName('Unknown Show')] = time.time() - 1
+        sickrage.app.name_cache.save()
+        sickrage.app.name_cache.load()
+        self.assertIsNone(sickrage.app.name_cache.get('Unknown Show'))
+        self.assertEqual(list(sickrage.app.cache_db.all('scene_names')), [])
+
+    def test_legacy_unknown(self):
+        # unknown names stored without an expiry are dropped on load
+        sickrage.app.cache_db.insert({'_t': 'scene_names', 'indexer_id': 0, 'name': 'unknown show'})
+        sickrage.app.name_cache.load()
+        self.assertIsNone(sickrage.app.name_cache.get('Unknown Show'))
+        self.assertEqual(list(sickrage.app.cache_db.all('scene_names')), [])
+
+    def test_clear(self):
+        sickrage.app.config.name_cache_negative_ttl = 60
+        sickrage.app.name_cache.put('Unknown Show', 0)
+        sickrage.app.name_cache.put('Show Name', 1)
+        sickrage.app.name_cache.clear(0)
+        self.assertIsNone(sickrage.app.name_cache.get('Unknown Show'))
+        self.assertEqual(sickrage.app.name_cache.expires, {})
+        self.assertEqual(sickrage.app.name_cache.get('Show Name'), 1)
+
+    def test_resolved(self):
+        sickrage.app.name_cache.put('Show Name', 0)
+        sickrage.app.name_cache.put('Show Name', 1)
+        self.assertEqual(sickrage.app.name_cache.get('Show Name'), 1)
+
+        sickrage.app.name_cache.load()
+        self.assertEqual(sickrage.app.name_cache.get('Show Name'), 1)
+
+
+class DeferredLookupTests(tests.SiCKRAGETestDBCase):
+    def setUp(self):
+        super(DeferredLookupTests, self).setUp()
+        self.show = TVShow(1, 1, 'en')
+        self.show.name = 'show name'
+        self.show.saveToDB()
+        sickrage.app.showlist.append(self.show)
+        sickrage.app.name_cache.put(self.show.name, self.show.indexerid)
+
+        self.deferred = []
+        sickrage.app.show_resolver = type(str('Resolver'), (object,), {'put': lambda _, x: self.deferred.append(x)})()
+        show_lookup_stats.clear()
+
+    def tearDown(self):
+        sickrage.app.show_resolver = None
+        super(DeferredLookupTests, self).tearDown()
+
+    def test_deferred(self):
+        np = NameParser(remote_lookups=False)
+        self.assertRaises(InvalidShowException, np.parse, 'Other.Show.S01E02.HDTV.x264-GROUP')
+        self.assertEqual(self.deferred, ['Other Show'])
+
+        # left for the resolver to answer instead of being cached as unknown
+        self.assertIsNone(sickrage.app.name_cache.get('Other Show'))
+
+        self.assertEqual(np.parse('Show.Name.S01E02.HDTV.x264-GROUP').show, self.show)
+        self.assertEqual(self.deferred, ['Other Show'])
+
+        stats = show_lookup_stats.stats()
+        self.assertEqual(stats['deferred'], 1)
+        self.assertEqual(stats['sources']['name_cache']['lookups'], 2)
+        self.assertEqual(stats['sources']['name_cache']['answered'], 1)
+        self.assertNotIn('indexer', stats['sources'])
+
+
 if __name__ == '__main__':
     print("==================")
     print("STARTING - NAME PARSER TESTS")
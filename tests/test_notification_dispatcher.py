@@ -0,0 +1,117 @@
+#!/usr/bin/env python2.7
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import print_function, unicode_literals
+
+import threading
+import time
+import unittest
+
+import sickrage
+import tests
+from sickrage.notifiers import dispatcher
+from sickrage.notifiers.dispatcher import NotificationDispatcher
+
+
+class NotificationDispatcherTests(tests.SiCKRAGETestCase):
+    def setUp(self, **kwargs):
+        super(NotificationDispatcherTests, self).setUp(**kwargs)
+        sickrage.app.config.notifier_timeout = 1
+        sickrage.app.config.notifier_retries = 2
+        sickrage.app.config.library_update_delay = 0.2
+
+        self.retry_backoff = dispatcher.RETRY_BACKOFF
+        dispatcher.RETRY_BACKOFF = 0.1
+
+        self.dispatcher = NotificationDispatcher()
+        self.dispatcher.start()
+        self.calls = []
+
+    def tearDown(self):
+        self.dispatcher.shutdown()
+        dispatcher.RETRY_BACKOFF = self.retry_backoff
+        super(NotificationDispatcherTests, self).tearDown()
+
+    def call(self, *args):
+        self.calls.append(args)
+        return True
+
+    def wait_for(self, count, timeout=5):
+        end = time.time() + timeout
+        while len(self.calls) < count and time.time() < end:
+            time.sleep(0.05)
+
+    def test_inline(self):
+        self.dispatcher.shutdown()
+        self.dispatcher.dispatch('kodi', self.call, ('show name',), key=1)
+        self.assertEqual(self.calls, [('show name',)])
+
+    def test_coalesce(self):
+        for episode in range(24):
+            self.dispatcher.dispatch('plex', self.call, ('show name', episode), key=1)
+        self.dispatcher.dispatch('plex', self.call, ('other show', 1), key=2)
+        self.dispatcher.dispatch('kodi', self.call, ('show name', 23), key=1)
+
+        self.wait_for(3)
+        time.sleep(0.5)
+        self.assertEqual(sorted(self.calls), [('other show', 1), ('show name', 23), ('show name', 23)])
+
+    def test_retry(self):
+        def flaky(*args):
+            self.calls.append(args)
+            if len(self.calls) < 3:
+                raise IOError('connection refused')
+
+        self.dispatcher.dispatch('emby', flaky, ('show name',))
+        self.wait_for(3)
+        time.sleep(0.5)
+        self.assertEqual(len(self.calls), 3)
+
+        # a failure from the return value, given up after notifier_retries
+        del self.calls[:]
+        self.dispatcher.dispatch('emby', self.call, ('show name',), failed=lambda x: x is True)
+        self.wait_for(3)
+        time.sleep(0.5)
+        self.assertEqual(len(self.calls), 3)
+
+    def test_timeout(self):
+        hung = threading.Event()
+
+        def hang(*args):
+            hung.wait(5)
+
+        self.dispatcher.dispatch('plex', hang, ())
+        self.dispatcher.dispatch('plex', self.call, ('show name',))
+        self.dispatcher.dispatch('kodi', self.call, ('show name',))
+
+        # other notifiers go on at once, the hung one after notifier_timeout
+        self.wait_for(1)
+        self.assertEqual(self.calls, [('show name',)])
+
+        self.wait_for(2)
+        self.assertEqual(len(self.calls), 2)
+        hung.set()
+
+
+if __name__ == '__main__':
+    print("==================")
+    print("STARTING - NOTIFICATION DISPATCHER TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
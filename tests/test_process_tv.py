@@ -0,0 +1,180 @@
+#!/usr/bin/env python2.7
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import print_function, unicode_literals
+
+import io
+import os
+import shutil
+import threading
+import time
+import unittest
+
+import sickrage
+import tests
+from sickrage.core import process_tv
+from sickrage.core.process_tv import ProcessLimits, ProcessResult
+from sickrage.core.queues.postprocessor import PostProcessorQueue
+from sickrage.core.tv.show import TVShow
+
+
+class FakePostProcessor(object):
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def __init__(self, file_path, nzb_name=None, process_method=None, is_priority=None):
+        self.log = ''
+
+    @property
+    def process(self):
+        with self.lock:
+            FakePostProcessor.running += 1
+            FakePostProcessor.peak = max(FakePostProcessor.peak, FakePostProcessor.running)
+        time.sleep(0.2)
+        with self.lock:
+            FakePostProcessor.running -= 1
+        return True
+
+
+class ProcessLimitsTests(tests.SiCKRAGETestCase):
+    def setUp(self, **kwargs):
+        super(ProcessLimitsTests, self).setUp(**kwargs)
+        sickrage.app.config.postprocessor_device_limit = 2
+
+    def run_jobs(self, jobs):
+        """
+        Runs a job per (show, device) at the same time
+
+        :return: highest number of jobs that held a slot together, per show and per device
+        """
+        limits = ProcessLimits()
+        lock = threading.Lock()
+        running = {'show': {}, 'device': {}}
+        peak = {'show': {}, 'device': {}}
+
+        def job(show, device):
+            with limits.slot(show, device):
+                with lock:
+                    for kind, key in (('show', show), ('device', device)):
+                        running[kind][key] = running[kind].get(key, 0) + 1
+                        peak[kind][key] = max(peak[kind].get(key, 0), running[kind][key])
+                time.sleep(0.05)
+                with lock:
+                    running['show'][show] -= 1
+                    running['device'][device] -= 1
+
+        threads = [threading.Thread(target=job, args=x) for x in jobs]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        return peak
+
+    def test_show_limit(self):
+        peak = self.run_jobs([(1, 1)] * 4 + [(2, 2)] * 4)
+        self.assertEqual(peak['show'], {1: 1, 2: 1})
+
+    def test_device_limit(self):
+        peak = self.run_jobs([(x, 1) for x in range(6)] + [(x, 2) for x in range(6, 8)])
+        self.assertEqual(peak['device'], {1: 2, 2: 2})
+
+        sickrage.app.config.postprocessor_device_limit = 1
+        peak = self.run_jobs([(x, 1) for x in range(4)])
+        self.assertEqual(peak['device'], {1: 1})
+
+
+class PostProcessorQueueTests(tests.SiCKRAGETestDBCase):
+    def setUp(self):
+        super(PostProcessorQueueTests, self).setUp()
+        sickrage.app.config.postprocessor_queue_workers = 2
+        sickrage.app.config.postprocessor_workers = 1
+
+        self.post_processor = process_tv.post_processor.PostProcessor
+        self.destination = process_tv.destination
+        process_tv.post_processor.PostProcessor = FakePostProcessor
+        process_tv.destination = lambda *args: (1, None)
+        FakePostProcessor.peak = 0
+
+        show = TVShow(1, 3)
+        show.name = self.SHOWNAME
+        show.location = self.SHOWDIR
+        show.saveToDB()
+        sickrage.app.showlist = [show]
+        sickrage.app.name_cache.put('show name', 3)
+
+        self.download_dirs = []
+        for name in ('show name - s04e02 - one', 'show name - s04e02 - two'):
+            download_dir = os.path.join(sickrage.app.config.tv_download_dir, name)
+            if not os.path.exists(download_dir):
+                os.makedirs(download_dir)
+            with io.open(os.path.join(download_dir, self.FILENAME), 'wb') as f:
+                f.write(b"foo bar")
+            self.download_dirs.append(download_dir)
+
+        self.queue = PostProcessorQueue()
+        self.queue.start()
+
+    def tearDown(self):
+        self.queue.shutdown()
+        process_tv.post_processor.PostProcessor = self.post_processor
+        process_tv.destination = self.destination
+        shutil.rmtree(sickrage.app.config.tv_download_dir, ignore_errors=True)
+        super(PostProcessorQueueTests, self).tearDown()
+
+    def test_same_show_serialized(self):
+        # two downloads of the same episode on two queue workers, with a single worker per download
+        for download_dir in self.download_dirs:
+            self.queue.put(download_dir, process_method='copy', proc_type='manual')
+
+        end = time.time() + 10
+        while self.queue.all_items and time.time() < end:
+            time.sleep(0.05)
+
+        self.assertEqual(self.queue.all_items, [])
+        self.assertEqual(FakePostProcessor.peak, 1)
+
+
+class ProcessResultTests(tests.SiCKRAGETestCase):
+    def test_merge(self):
+        result = ProcessResult()
+        result.output = 'first\n'
+
+        other = ProcessResult()
+        other.output = 'second\n'
+        other.result = other.agg_result = False
+        other.missed_files = ['foo.mkv : Processing failed']
+        other.processed_files = 1
+        other.processed_bytes = 1048576
+
+        result.merge(other)
+        self.assertEqual(result.output, 'first\nsecond\n')
+        self.assertFalse(result.result)
+        self.assertFalse(result.agg_result)
+        self.assertEqual(result.missed_files, ['foo.mkv : Processing failed'])
+        self.assertIn('Processed 1 files (1.0 MB)', result.throughput())
+
+
+if __name__ == '__main__':
+    print("==================")
+    print("STARTING - PROCESS TV TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
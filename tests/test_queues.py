@@ -0,0 +1,148 @@
+#!/usr/bin/env python2.7
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import print_function, unicode_literals
+
+import threading
+import time
+import unittest
+
+import tests
+from sickrage.core.queues import srQueue, srQueueItem, srQueuePriorities
+
+
+class FakeShow(object):
+    def __init__(self, indexerid):
+        self.indexerid = indexerid
+
+
+class FakeQueue(srQueue):
+    @property
+    def workers(self):
+        return 2
+
+
+class FakeQueueItem(srQueueItem):
+    def __init__(self, show, priority=srQueuePriorities.NORMAL):
+        super(FakeQueueItem, self).__init__('Fake')
+        self.show = show
+        self.priority = priority
+        self.release = threading.Event()
+
+    def run(self):
+        self.release.wait(5)
+
+
+class FakeAddQueueItem(FakeQueueItem):
+    def __init__(self, indexer_id, showDir):
+        super(FakeAddQueueItem, self).__init__(None)
+        self.indexer_id = indexer_id
+        self.showDir = showDir
+
+
+class QueueTests(tests.SiCKRAGETestCase):
+    def setUp(self):
+        super(QueueTests, self).setUp()
+        self.queue = FakeQueue()
+        self.queue.start()
+
+    def tearDown(self):
+        self.queue.shutdown()
+        super(QueueTests, self).tearDown()
+
+    def wait_for(self, condition, timeout=5):
+        end = time.time() + timeout
+        while not condition() and time.time() < end:
+            time.sleep(0.01)
+        return condition()
+
+    def test_workers_and_show_exclusion(self):
+        first = self.queue.put(FakeQueueItem(FakeShow(1)))
+        same_show = self.queue.put(FakeQueueItem(FakeShow(1)))
+        other_show = self.queue.put(FakeQueueItem(FakeShow(2)))
+        third_show = self.queue.put(FakeQueueItem(FakeShow(3)))
+
+        self.assertTrue(self.wait_for(lambda: len(self.queue.running) == 2))
+        self.assertItemsEqual(self.queue.running, [first, other_show])
+        self.assertFalse(same_show.is_alive())
+
+        first.release.set()
+        self.assertTrue(self.wait_for(lambda: same_show.is_alive()))
+        self.assertFalse(third_show.is_alive())
+
+        for item in (same_show, other_show, third_show):
+            item.release.set()
+
+        self.assertTrue(self.wait_for(lambda: not self.queue.all_items))
+
+    def test_add_show_exclusion(self):
+        add = self.queue.put(FakeAddQueueItem(1, '/tv/Show Name'))
+        same_show = self.queue.put(FakeQueueItem(FakeShow(1)))
+        same_dir = self.queue.put(FakeAddQueueItem(2, '/tv/Show Name'))
+        other_show = self.queue.put(FakeQueueItem(FakeShow(3)))
+
+        self.assertTrue(self.wait_for(lambda: len(self.queue.running) == 2))
+        self.assertItemsEqual(self.queue.running, [add, other_show])
+
+        add.release.set()
+        other_show.release.set()
+        self.assertTrue(self.wait_for(lambda: same_show.is_alive() and same_dir.is_alive()))
+
+        for item in (same_show, same_dir):
+            item.release.set()
+
+        self.assertTrue(self.wait_for(lambda: not self.queue.all_items))
+
+    def test_higher_priority_preempts(self):
+        low = [self.queue.put(FakeQueueItem(FakeShow(x), srQueuePriorities.LOW)) for x in (1, 2)]
+        self.assertTrue(self.wait_for(lambda: len(self.queue.running) == 2))
+
+        high = self.queue.put(FakeQueueItem(FakeShow(3), srQueuePriorities.EXTREME))
+        self.assertTrue(self.wait_for(lambda: high.is_alive()))
+
+        for item in low + [high]:
+            item.release.set()
+
+        self.assertTrue(self.wait_for(lambda: not self.queue.all_items))
+
+    def test_stats(self):
+        item = self.queue.put(FakeQueueItem(FakeShow(1)))
+        self.queue.put(FakeQueueItem(FakeShow(1)))
+
+        self.assertTrue(self.wait_for(lambda: item.is_alive()))
+        stats = self.queue.get_stats()['FakeQueueItem']
+        self.assertEqual(stats['queued'], 1)
+        self.assertEqual(stats['running'], 1)
+
+        for cur_item in self.queue.all_items:
+            cur_item.release.set()
+
+        self.assertTrue(self.wait_for(lambda: self.queue.get_stats()['FakeQueueItem']['completed'] == 2))
+        stats = self.queue.get_stats()['FakeQueueItem']
+        self.assertEqual(stats['queued'], 0)
+        self.assertGreaterEqual(stats['max_wait'], 0)
+        self.assertGreaterEqual(stats['avg_run'], 0)
+
+
+if __name__ == '__main__':
+    print("==================")
+    print("STARTING - QUEUE TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
@@ -117,6 +117,14 @@ class SceneTests(tests.SiCKRAGETestDBCase):
         self._test_filterBadReleases('Show.S02.Some.German.Stuff-Grp', False)
         self._test_filterBadReleases('Show.S02.This.Is.German', False)
 
+    def test_sceneExceptionByNameUpdate(self):
+        scene_exceptions.update_scene_exceptions(1, ['Exception Test', 'Exception: Test (2010)'])
+        self.assertEqual(get_scene_exception_by_name('exception test'), (1, -1))
+        self.assertEqual(get_scene_exception_by_name('exception test 2010'), (1, -1))
+
+        scene_exceptions.update_scene_exceptions(1, [])
+        self.assertEqual(get_scene_exception_by_name('exception test'), (None, None))
+
 
 class SceneExceptionTestCase(tests.SiCKRAGETestDBCase):
     def setUp(self):
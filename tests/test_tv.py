@@ -19,12 +19,18 @@
 
 from __future__ import unicode_literals
 
+import datetime
 import unittest
 
 import sickrage
 import tests
+from sickrage.core import helpers
+from sickrage.core.common import DOWNLOADED, Quality, SKIPPED, UNAIRED, WANTED
 from sickrage.core.tv.episode import TVEpisode
 from sickrage.core.tv.show import TVShow
+from sickrage.core.tv.show.stats import ShowStats
+from sickrage.indexers.thetvdb.api import Show, Season, Episode
+from sickrage.notifiers.trakt import TraktNotifier
 
 
 class TVShowTests(tests.SiCKRAGETestDBCase):
@@ -64,6 +70,26 @@ class TVEpisodeTests(tests.SiCKRAGETestDBCase):
         ep.loadFromDB(1, 1)
         self.assertEqual(ep.name, "asdasdasdajkaj")
 
+    def test_save_moved(self):
+        show = TVShow(1, 0001, "en")
+        show.saveToDB()
+        ep = TVEpisode(show, 1, 1)
+        ep.indexerid = 5
+        ep.saveToDB()
+
+        # the row stored at the old season/episode is updated, not duplicated
+        ep.season, ep.episode = 2, 3
+        ep.saveToDB()
+        self.assertEqual([(x['season'], x['episode']) for x in sickrage.app.main_db.get_many('tv_episodes', 0001)],
+                         [(2, 3)])
+
+        # a new episode object for an indexer id stored at another season/episode moves the row
+        ep = TVEpisode(show, 3, 4)
+        ep.indexerid = 5
+        ep.saveToDB()
+        self.assertEqual([(x['season'], x['episode'], x['indexerid'])
+                          for x in sickrage.app.main_db.get_many('tv_episodes', 0001)], [(3, 4, 5)])
+
 
 class TVTests(tests.SiCKRAGETestDBCase):
     def test_getEpisode(self):
@@ -79,6 +105,150 @@ class TVTests(tests.SiCKRAGETestDBCase):
         show.saveToDB()
         sickrage.app.showlist = [show]
 
+    def test_showlist_registry(self):
+        show = TVShow(1, 0001, "en")
+        show.name = "show name"
+        show.saveToDB()
+        sickrage.app.showlist += [show]
+
+        self.assertEqual(helpers.findCertainShow(0001), show)
+        self.assertEqual(sickrage.app.showlist.find_by_indexer(1, 0001), [show])
+        self.assertEqual(sickrage.app.showlist.find_by_name("Show.Name"), [show])
+
+        show.name = "new name"
+        self.assertEqual(sickrage.app.showlist.find_by_name("show name"), [])
+        self.assertEqual(sickrage.app.showlist.find_by_name("new name"), [show])
+
+        sickrage.app.showlist.remove(show)
+        self.assertIsNone(helpers.findCertainShow(0001))
+        self.assertEqual(sickrage.app.showlist, [])
+
+
+class TVShowUpdateTests(tests.SiCKRAGETestDBCase):
+    def setUp(self):
+        super(TVShowUpdateTests, self).setUp()
+        sickrage.app.notifier_providers = {'trakt': TraktNotifier()}
+
+        self.show = TVShow(1, 0001, "en")
+        self.show.location = self.SHOWDIR
+        self.show.saveToDB()
+        sickrage.app.showlist = [self.show]
+
+    def indexer_data(self, names):
+        show = Show()
+        show[1] = Season()
+        for i, name in enumerate(names, start=1):
+            show[1][i] = Episode()
+            show[1][i].update({'id': i, 'episodename': name, 'absolutenumber': i, 'overview': '',
+                               'firstaired': '2010-01-{:02d}'.format(i)})
+
+        return {self.show.indexerid: show}
+
+    def stored_names(self):
+        return dict((x['episode'], x['name']) for x in sickrage.app.main_db.get_many('tv_episodes', 0001))
+
+    def test_update_episodes_from_indexer(self):
+        counts = self.show.updateEpisodesFromIndexer(tvapi=self.indexer_data(['One', 'Two', 'Three']))
+        self.assertEqual(counts, {'unchanged': 0, 'updated': 0, 'added': 3, 'removed': 0})
+        self.assertEqual(self.stored_names(), {1: 'One', 2: 'Two', 3: 'Three'})
+
+        counts = self.show.updateEpisodesFromIndexer(tvapi=self.indexer_data(['One', 'Two', 'Three']))
+        self.assertEqual(counts, {'unchanged': 3, 'updated': 0, 'added': 0, 'removed': 0})
+
+        counts = self.show.updateEpisodesFromIndexer(tvapi=self.indexer_data(['One', 'Second']))
+        self.assertEqual(counts, {'unchanged': 1, 'updated': 1, 'added': 0, 'removed': 1})
+        self.assertEqual(self.stored_names(), {1: 'One', 2: 'Second'})
+
+        # an empty answer from the indexer leaves the stored episodes alone
+        counts = self.show.updateEpisodesFromIndexer(tvapi={self.show.indexerid: Show()})
+        self.assertEqual(counts, {'unchanged': 0, 'updated': 0, 'added': 0, 'removed': 0})
+        self.assertEqual(self.stored_names(), {1: 'One', 2: 'Second'})
+
+
+class ShowStatsTests(tests.SiCKRAGETestDBCase):
+    def setUp(self):
+        super(ShowStatsTests, self).setUp()
+        self.show = TVShow(1, 0001, "en")
+        self.show.saveToDB()
+        sickrage.app.showlist = [self.show]
+
+        self.today = datetime.date.today()
+        self.episodes = []
+        for i, status in enumerate([SKIPPED, Quality.compositeStatus(DOWNLOADED, Quality.HDTV), WANTED, WANTED,
+                                    UNAIRED, UNAIRED], start=1):
+            ep = TVEpisode(self.show, 1, i)
+            ep.indexerid = i
+            ep.airdate = self.today + datetime.timedelta(days=i - 3)
+            ep.status = status
+            ep.file_size = i * 100
+            ep.saveToDB(True)
+            self.episodes.append(ep)
+
+    def assertStatsMatchScan(self):
+        entry = sickrage.app.show_stats.get(self.show.indexerid)
+        self.assertEqual(entry.to_dict(self.today.toordinal()), ShowStats.scan(self.show.indexerid))
+        self.assertEqual(sickrage.app.show_stats.check_consistency(), [])
+
+    def test_load(self):
+        stats = sickrage.app.show_stats.get(self.show.indexerid).to_dict(self.today.toordinal())
+        self.assertEqual(stats['ep_downloaded'], 1)
+        self.assertEqual(stats['ep_total'], 3)
+        self.assertEqual(stats['ep_airs_prev'], (self.today - datetime.timedelta(days=1)).toordinal())
+        self.assertEqual(stats['ep_airs_next'], self.today.toordinal())
+        self.assertEqual(stats['total_size'], 2100)
+        self.assertStatsMatchScan()
+
+    def test_incremental_updates(self):
+        sickrage.app.show_stats.get(self.show.indexerid)
+
+        self.episodes[2].status = Quality.compositeStatus(DOWNLOADED, Quality.FULLHDTV)
+        self.episodes[2].saveToDB(True)
+        self.episodes[4].airdate = self.today - datetime.timedelta(days=5)
+        self.episodes[4].status = WANTED
+        self.episodes[4].saveToDB(True)
+        self.assertStatsMatchScan()
+
+        ep = TVEpisode(self.show, 2, 1)
+        ep.indexerid = 7
+        ep.airdate = self.today
+        ep.status = SKIPPED
+        ep.saveToDB(True)
+        self.assertStatsMatchScan()
+
+        for x in sickrage.app.main_db.get_many('tv_episodes_season_episode', (self.show.indexerid, 1, 2)):
+            sickrage.app.main_db.delete(x)
+            sickrage.app.show_stats.update_episode(self.show.indexerid, old=x)
+        self.assertStatsMatchScan()
+
+    def test_loaded_mid_batch(self):
+        sickrage.app.show_stats.clear()
+
+        with sickrage.app.main_db.batch():
+            self.episodes[2].status = Quality.compositeStatus(DOWNLOADED, Quality.FULLHDTV)
+            self.episodes[2].saveToDB(True)
+
+            # loaded without the queued write, counted again once the batch is flushed
+            self.assertTrue(sickrage.app.show_stats.get(self.show.indexerid).stale)
+
+            ep = TVEpisode(self.show, 2, 1)
+            ep.indexerid = 7
+            ep.airdate = self.today
+            ep.status = SKIPPED
+            ep.saveToDB(True)
+
+        self.assertEqual(sickrage.app.show_stats.unflushed, {})
+        self.assertStatsMatchScan()
+
+    def test_check_consistency(self):
+        sickrage.app.show_stats.get(self.show.indexerid)
+
+        for x in sickrage.app.main_db.get_many('tv_episodes_season_episode', (self.show.indexerid, 1, 1)):
+            x['file_size'] = 0
+            sickrage.app.main_db.update(x)
+
+        self.assertEqual(sickrage.app.show_stats.check_consistency(), [self.show.indexerid])
+        self.assertStatsMatchScan()
+
 
 if __name__ == '__main__':
     print "=================="
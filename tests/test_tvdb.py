@@ -0,0 +1,223 @@
+#!/usr/bin/env python2.7
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+
+from __future__ import print_function, unicode_literals
+
+import json
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+import urlparse
+from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+from SocketServer import ThreadingMixIn
+
+import sickrage
+import tests
+from sickrage.indexers.thetvdb.api import Tvdb
+
+PAGES = 6
+PAGE_SIZE = 100
+LATENCY = 0.1
+
+
+class StubTVDBHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def respond(self, data):
+        etag = '"{}-{}"'.format(self.path, self.server.versions.get(self.path.split('?')[0], 1))
+        if self.headers.get('If-None-Match') == etag:
+            self.server.not_modified += 1
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        body = json.dumps(data)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.respond({'token': 'stub'})
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+
+        try:
+            time.sleep(LATENCY)
+
+            url = urlparse.urlparse(self.path)
+            lang = self.headers.get('Accept-Language')
+
+            if url.path == '/series/1':
+                self.respond({'data': {
+                    'id': 1,
+                    'seriesName': 'Stub Show' if lang == 'en' else 'Stub Sendung',
+                    'network': 'Network {}'.format(server.versions.get(url.path, 1))
+                }})
+            elif url.path == '/series/1/episodes':
+                page = int(urlparse.parse_qs(url.query)['page'][0])
+                self.respond({
+                    'links': {'first': 1, 'last': PAGES},
+                    'data': [{
+                        'id': i,
+                        'airedSeason': i // PAGE_SIZE + 1,
+                        'airedEpisodeNumber': i % PAGE_SIZE + 1,
+                        'episodeName': ('Episode {}' if lang == 'en' else 'Folge {}').format(i),
+                        'overview': 'Overview {}'.format(i) if lang == 'en' else None,
+                    } for i in range((page - 1) * PAGE_SIZE, page * PAGE_SIZE)]
+                })
+            elif url.path == '/updated/query':
+                self.respond({'data': [{'id': int(x.split('/')[2]), 'lastUpdated': int(time.time())}
+                                       for x in server.versions]})
+            else:
+                self.send_error(404)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+
+class StubTVDBServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        HTTPServer.__init__(self, ('127.0.0.1', 0), StubTVDBHandler)
+        self.lock = threading.Lock()
+        self.requests = []
+        self.active = self.max_active = 0
+        self.versions = {}
+        self.not_modified = 0
+
+
+class TVDBTests(tests.SiCKRAGETestCase):
+    def setUp(self, **kwargs):
+        super(TVDBTests, self).setUp(**kwargs)
+
+        sickrage.app.cache_dir = tempfile.mkdtemp()
+
+        self.server = StubTVDBServer()
+        threading.Thread(target=self.server.serve_forever).start()
+
+        self.tvdb = self.new_tvdb()
+
+    def new_tvdb(self, **settings):
+        tvdb = Tvdb()
+        tvdb.config['api']['base'] = 'http://127.0.0.1:{}'.format(self.server.server_port)
+        if settings:
+            tvdb.settings(**settings)
+        return tvdb
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(sickrage.app.cache_dir, ignore_errors=True)
+        super(TVDBTests, self).tearDown()
+
+    def test_episode_pages(self):
+        sickrage.app.config.indexer_workers = 4
+        self.tvdb.settings(cache=False, language='de')
+
+        start_time = time.time()
+        show = self.tvdb[1]
+        elapsed = time.time() - start_time
+
+        self.assertEqual(show['seriesname'], 'Stub Sendung')
+
+        # every page in order, translated where the translation has a value
+        episodes = [show[s][e] for s in sorted(show) for e in sorted(show[s])]
+        self.assertEqual(len(episodes), PAGES * PAGE_SIZE)
+        self.assertEqual([int(x['id']) for x in episodes], range(PAGES * PAGE_SIZE))
+        self.assertEqual(show[1][1]['episodename'], 'Folge 0')
+        self.assertEqual(show[PAGES][PAGE_SIZE]['episodename'], 'Folge {}'.format(PAGES * PAGE_SIZE - 1))
+        self.assertEqual(show[PAGES][PAGE_SIZE]['overview'], 'Overview {}'.format(PAGES * PAGE_SIZE - 1))
+
+        # series and first page up front, the other pages and all translations concurrently
+        episode_requests = [x for x in self.server.requests if x.startswith('/series/1/episodes')]
+        self.assertEqual(len(episode_requests), PAGES * 2)
+        self.assertGreater(self.server.max_active, 1)
+        self.assertLessEqual(self.server.max_active, 4)
+        self.assertLess(elapsed, (len(self.server.requests)) * LATENCY)
+
+    def test_episode_pages_english(self):
+        sickrage.app.config.indexer_workers = 1
+        self.tvdb.settings(cache=False, language='en')
+
+        show = self.tvdb[1]
+
+        self.assertEqual(show[1][1]['episodename'], 'Episode 0')
+        self.assertEqual(len([x for x in self.server.requests if x.startswith('/series/1/episodes')]), PAGES)
+        self.assertEqual(self.server.max_active, 1)
+
+    def test_response_cache(self):
+        sickrage.app.config.indexer_workers = 4
+        self.tvdb.settings(cache=True, language='en')
+
+        self.assertEqual(self.tvdb[1]['network'], 'Network 1')
+        self.assertEqual(len(self.server.requests), PAGES + 1)
+
+        # a restart serves everything from disk
+        tvdb = self.new_tvdb(cache=True, language='en')
+        show = tvdb[1]
+        self.assertEqual(show['network'], 'Network 1')
+        self.assertEqual(show[PAGES][PAGE_SIZE]['episodename'], 'Episode {}'.format(PAGES * PAGE_SIZE - 1))
+        self.assertEqual(len(self.server.requests), PAGES + 1)
+
+        # series changes, only its data is transferred again
+        time.sleep(1)
+        self.server.versions['/series/1'] = 2
+        self.assertEqual([x['id'] for x in tvdb.updated(0)], [1])
+        del self.server.requests[:]
+
+        show = tvdb[1]
+        self.assertEqual(show['network'], 'Network 2')
+        self.assertEqual(show[1][1]['episodename'], 'Episode 0')
+        self.assertEqual(len(self.server.requests), PAGES + 1)
+        self.assertEqual(self.server.not_modified, PAGES)
+
+        # revalidated responses are fresh again
+        self.new_tvdb(cache=True, language='en')[1]
+        self.assertEqual(len(self.server.requests), PAGES + 1)
+
+    def test_response_cache_disabled(self):
+        self.tvdb.settings(cache=False, language='en')
+
+        self.tvdb[1]
+        self.tvdb[1]
+
+        # with the cache disabled every response is revalidated
+        self.assertEqual(len(self.server.requests), (PAGES + 1) * 2)
+        self.assertEqual(self.server.not_modified, PAGES + 1)
+
+
+if __name__ == '__main__':
+    print("==================")
+    print("STARTING - TVDB TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
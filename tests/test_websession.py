@@ -0,0 +1,94 @@
+#!/usr/bin/env python2.7
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import print_function, unicode_literals
+
+import socket
+import time
+import unittest
+
+import requests
+
+import tests
+from cachecontrol import CacheControlAdapter
+from requests.adapters import HTTPAdapter
+from sickrage.core.websession import MemoryCache, WebSession, WebSessionManager, deadline
+
+
+class WebSessionTests(tests.SiCKRAGETestCase):
+    def test_adapters_pooled_per_host(self):
+        manager = WebSessionManager()
+
+        adapter = manager.get_adapter('https://example.com/rss?page=1')
+        self.assertIsInstance(adapter, CacheControlAdapter)
+        self.assertIs(adapter, manager.get_adapter('https://EXAMPLE.com/api'))
+        self.assertIsNot(adapter, manager.get_adapter('http://example.com/rss'))
+        self.assertIsNot(adapter, manager.get_adapter('https://example.org/rss'))
+
+        uncached = manager.get_adapter('https://example.com/rss', cache=False)
+        self.assertNotIsInstance(uncached, CacheControlAdapter)
+        self.assertIsInstance(uncached, HTTPAdapter)
+
+        self.assertIsNone(manager.get_adapter('file:///tmp/foo'))
+
+        manager.clear()
+        self.assertIsNot(adapter, manager.get_adapter('https://example.com/rss'))
+
+    def test_sessions_share_adapters(self):
+        self.assertIs(WebSession().get_adapter('https://example.com/a'),
+                      WebSession().get_adapter('https://example.com/b'))
+
+    def test_memory_cache_eviction(self):
+        cache = MemoryCache(max_entries=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.set('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+        cache.delete('a')
+        self.assertIsNone(cache.get('a'))
+
+    def test_deadline(self):
+        # a server that accepts connections but never answers
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.bind(('127.0.0.1', 0))
+        server.listen(5)
+        url = 'http://127.0.0.1:{}/'.format(server.getsockname()[1])
+
+        try:
+            start_time = time.time()
+            with deadline(0.5):
+                with self.assertRaises(requests.exceptions.RequestException):
+                    WebSession(cache=False).get(url, timeout=30)
+                time.sleep(0.5)
+                with self.assertRaises(requests.exceptions.Timeout):
+                    WebSession(cache=False).get(url)
+            self.assertLess(time.time() - start_time, 10)
+        finally:
+            server.close()
+
+
+if __name__ == '__main__':
+    print("==================")
+    print("STARTING - WEBSESSION TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()